@@ -1,6 +1,14 @@
-import re
+import sys
+from pathlib import Path
 from typing import Dict, List, Literal, Optional, Set
 
+# Add project root to path
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.append(str(PROJECT_ROOT))
+
+from poker.ranges import Range
+
 # GTO TABLE 2
 
 YOKOSAWA_RANGE_DATA_2: Dict[str, Set[str]] = {
@@ -343,6 +351,11 @@ YOKOSAWA_RANGE_DATA: Dict[str, Set[str]] = {
     }
 }
 
+# 判定用に 1326 通りの組み合わせの重み配列へ変換（メンバーシップは配列参照1回）
+YOKOSAWA_RANGES_2: Dict[str, Range] = {
+    position: Range.from_hands(hands) for position, hands in YOKOSAWA_RANGE_DATA_2.items()
+}
+
 # --- 可変人数 (2-6人) 対応のポジション計算 ---
 
 def calculate_position(
@@ -476,67 +489,6 @@ def _normalize_hand_notation(hand: str) -> str:
         # suffix_raw は 's' または 'o' が入る
         return f"{c1}{c2}{suffix_raw}" # 例: "AKs", "T9o"
 
-# --- [新規追加] カードリストを正規化するヘルパー関数 ---
-def _normalize_card_list(cards: List[str]) -> str:
-    """
-    ["2♣", "J♣"] や ["As", "Kd"] のようなカードリストを 
-    "J2s" や "AKo" のような標準形に正規化する。
-    """
-    if len(cards) != 2:
-        raise ValueError(f"カードリストは2枚である必要があります: {cards}")
-
-    card1 = cards[0].strip()
-    card2 = cards[1].strip()
-
-    if len(card1) < 2 or len(card2) < 2:
-        raise ValueError(f"不正なカード形式です (短すぎます): {cards}")
-
-    # ランクとスートを抽出 (例: "10h" -> rank="10", suit="h")
-    rank1_raw = card1[:-1]
-    suit1_raw = card1[-1]
-    rank2_raw = card2[:-1]
-    suit2_raw = card2[-1]
-    
-    # ランクのマッピング (10に対応)
-    rank_map = {
-        "A": "A", "K": "K", "Q": "Q", "J": "J", "T": "T",
-        "10": "T", "9": "9", "8": "8", "7": "7", "6": "6",
-        "5": "5", "4": "4", "3": "3", "2": "2"
-    }
-    
-    r1 = rank_map.get(rank1_raw.upper())
-    r2 = rank_map.get(rank2_raw.upper())
-    
-    if not r1 or not r2:
-        raise ValueError(f"不正なランクが含まれています: {cards} (raw: {rank1_raw}, {rank2_raw})")
-
-    # スートの正規化 (Unicodeとアルファベット両対応)
-    suit_map = {
-        '♣': 'c', 'c': 'c', 'C': 'c',
-        '♦': 'd', 'd': 'd', 'D': 'd',
-        '♥': 'h', 'h': 'h', 'H': 'h',
-        '♠': 's', 's': 's', 'S': 's'
-    }
-    
-    s1 = suit_map.get(suit1_raw)
-    s2 = suit_map.get(suit2_raw)
-    
-    if not s1 or not s2:
-        raise ValueError(f"不正なスートが含まれています: {cards} (raw: {suit1_raw}, {suit2_raw})")
-
-    suffix = 's' if s1 == s2 else 'o'
-    
-    ranks_order = "AKQJT98765432"
-    
-    # ランク順を正規化 (例: "2J" -> "J2")
-    if ranks_order.find(r1) > ranks_order.find(r2):
-        r1, r2 = r2, r1 # スワップ
-
-    if r1 == r2:
-        return f"{r1}{r2}" # ペア (例: "AA")
-    else:
-        return f"{r1}{r2}{suffix}" # 例: "J2s", "AKo"
-
 # --- ADKツールとして公開する関数 1 ---
 
 def judge_preflop_range(
@@ -569,17 +521,11 @@ def judge_preflop_range(
               is invalid (e.g., "AXs", "T", ["2c"]) and cannot be normalized.
     """
     
-    if position not in YOKOSAWA_RANGE_DATA_2:
+    target_range = YOKOSAWA_RANGES_2.get(position)
+    if target_range is None:
         # print(f"Warning: Range data for position '{position}' is not defined.")
         return False
-    try:
-        # 'isinstance' チェックを削除し、list 専用にする
-        normalized_hand = _normalize_card_list(hand_input)
-    except ValueError as e:
-        # print(f"Hand normalization error: {e}")
+    if not isinstance(hand_input, list) or len(hand_input) != 2:
         return False
-    target_range: Set[str] = YOKOSAWA_RANGE_DATA_2.get(position, set())
-    if normalized_hand in target_range:
-        return True
-    return False
-    
\ No newline at end of file
+    # 不正なカード表記は Range 側で False になる
+    return [str(card).strip() for card in hand_input] in target_range
@@ -29,7 +29,7 @@ from agents.team4_agent.config.ranges import (
     PREMIUM_HANDS, STRONG_HANDS
 )
 from agents.team4_agent.tools.equity_calculator import (
-    quick_equity_estimate, get_preflop_equity_estimate,
+    quick_equity_estimate,
     calculate_pot_odds, calculate_spr
 )
 
@@ -81,9 +81,8 @@ class MathBrain:
 
         # Calculate equity with adaptive simulations
         if phase == "preflop":
-            hand_notation = hand_to_notation(hero_cards)
-            hand_category = get_hand_strength_category(hand_notation)
-            equity = get_preflop_equity_estimate(hand_category, opponent_count)
+            # Precomputed preflop table lookup (no simulation)
+            equity = quick_equity_estimate(hero_cards, opponent_count)
         else:
             # Adaptive simulations based on importance
             sim_count = self._get_simulation_count(phase, pot, to_call)
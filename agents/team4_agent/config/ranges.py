@@ -5,49 +5,49 @@ Standard poker hand ranges for different positions and situations.
 Based on GTO principles but adapted for exploitative play.
 """
 
+import sys
+from pathlib import Path
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.append(str(PROJECT_ROOT))
+
+from poker.ranges import Range, parse_range
+
+# Ranges are poker.ranges.Range objects (1326-combo weight arrays):
+# `notation in RANGE` / `cards in RANGE` is an O(1) array lookup.
+
 # Premium hands (top ~5% of hands)
-PREMIUM_HANDS = {
-    "AA", "KK", "QQ", "JJ", "TT",
-    "AKs", "AQs", "AJs", "AKo"
-}
+PREMIUM_HANDS = parse_range("TT+, AJs+, AKo")
 
 # Strong hands (top ~10-12% of hands)
-STRONG_HANDS = {
-    "99", "88", "77",
-    "ATs", "KQs", "KJs", "QJs", "JTs",
-    "AQo", "AJo", "KQo"
-}
+STRONG_HANDS = parse_range("77-99, ATs, KJs+, QJs, JTs, AJo-AQo, KQo")
 
 # Value hands (playable from good position)
-VALUE_HANDS = {
-    "66", "55", "44", "33", "22",
-    "A9s", "A8s", "A7s", "A6s", "A5s", "A4s", "A3s", "A2s",
-    "KTs", "K9s", "QTs", "Q9s", "T9s", "98s", "87s", "76s", "65s",
-    "ATo", "KJo", "KTo", "QJo", "QTo", "JTo"
-}
+VALUE_HANDS = parse_range(
+    "22-66, A2s-A9s, K9s-KTs, Q9s-QTs, T9s-65s, ATo, KTo-KJo, QTo-QJo, JTo"
+)
 
 # Speculative hands (suited connectors, small pairs)
-SPECULATIVE_HANDS = {
-    "T8s", "97s", "86s", "75s", "64s", "54s",
-    "J9s", "T9s", "98s", "87s", "76s", "65s", "54s",
-}
+SPECULATIVE_HANDS = parse_range("J9s, T8s-64s, T9s-54s")
 
 # Opening ranges by position (5-max)
 OPENING_RANGES = {
-    "UTG": PREMIUM_HANDS | STRONG_HANDS | {"66", "55", "A9s", "KTs", "QJs"},
-    "HJ": PREMIUM_HANDS | STRONG_HANDS | {"66", "55", "44", "A9s", "A8s", "KTs", "K9s", "QTs", "JTs", "T9s"},
+    "UTG": PREMIUM_HANDS | STRONG_HANDS | parse_range("55-66, A9s, KTs, QJs"),
+    "HJ": PREMIUM_HANDS | STRONG_HANDS | parse_range("44-66, A8s-A9s, K9s-KTs, QTs, JTs, T9s"),
     "CO": PREMIUM_HANDS | STRONG_HANDS | VALUE_HANDS,
     "BTN": PREMIUM_HANDS | STRONG_HANDS | VALUE_HANDS | SPECULATIVE_HANDS,
-    "SB": PREMIUM_HANDS | STRONG_HANDS | {"66", "55", "A9s", "A8s", "KTs", "QJs", "JTs"},
+    "SB": PREMIUM_HANDS | STRONG_HANDS | parse_range("55-66, A8s-A9s, KTs, QJs, JTs"),
 }
 
 # 3-bet ranges by position
 THREE_BET_RANGES = {
     "UTG": PREMIUM_HANDS,
-    "HJ": PREMIUM_HANDS | {"99", "88", "ATs", "KQs"},
-    "CO": PREMIUM_HANDS | {"99", "88", "77", "ATs", "A9s", "KQs", "KJs"},
-    "BTN": PREMIUM_HANDS | STRONG_HANDS | {"A9s", "A8s", "A5s", "KTs", "QJs", "JTs", "T9s"},  # Wide button 3-bet
-    "SB": PREMIUM_HANDS | {"99", "88", "ATs", "KQs"},
+    "HJ": PREMIUM_HANDS | parse_range("88-99, ATs, KQs"),
+    "CO": PREMIUM_HANDS | parse_range("77-99, A9s-ATs, KJs+"),
+    "BTN": PREMIUM_HANDS | STRONG_HANDS | parse_range("A8s-A9s, A5s, KTs, QJs, JTs, T9s"),  # Wide button 3-bet
+    "SB": PREMIUM_HANDS | parse_range("88-99, ATs, KQs"),
 }
 
 def hand_to_notation(cards):
@@ -132,11 +132,11 @@ def get_hand_strength_category(hand_notation):
 
 def should_open_from_position(hand_notation, position):
     """Determine if we should open raise from this position"""
-    opening_range = OPENING_RANGES.get(position, set())
+    opening_range = OPENING_RANGES.get(position, Range())
     return is_hand_in_range(hand_notation, opening_range)
 
 
 def should_3bet(hand_notation, position):
     """Determine if we should 3-bet from this position"""
-    three_bet_range = THREE_BET_RANGES.get(position, set())
+    three_bet_range = THREE_BET_RANGES.get(position, Range())
     return is_hand_in_range(hand_notation, three_bet_range)
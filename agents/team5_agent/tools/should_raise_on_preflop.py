@@ -1,7 +1,52 @@
+import sys
+from pathlib import Path
+
 from google.adk.tools.tool_context import ToolContext
 from ..agents.preflop_range import range_0_open, range_1_open, range_3_open, range_4_open,range_3bet, range_4bet, range_5bet
 
-from typing import List, Dict, Any, Tuple
+from typing import List, Dict, Any, Optional
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.append(str(PROJECT_ROOT))
+
+from poker.game_models import Card, Suit
+from poker.ranges import Range
+
+_SUITS = {'S': Suit.SPADES, 'H': Suit.HEARTS, 'D': Suit.DIAMONDS, 'C': Suit.CLUBS}
+
+
+def _compile_range(hand_range: List[Dict[Any, bool]]) -> Range:
+    """[{((rank, suit), (rank, suit)): bool}, ...] 形式のレンジを Range（1326通りの配列）に変換"""
+    combos = [
+        (Card(r1, _SUITS[s1]), Card(r2, _SUITS[s2]))
+        for d in hand_range
+        for ((r1, s1), (r2, s2)), value in d.items()
+        if value
+    ]
+    return Range.from_combos(combos)
+
+
+# レンジはモジュール読み込み時に1回だけ変換し、判定は配列参照1回で行う
+SRP_RANGES = {
+    0: _compile_range(range_0_open),
+    1: _compile_range(range_1_open),
+    3: _compile_range(range_3_open),
+    4: _compile_range(range_4_open),
+}
+NRP_RANGES = {
+    1: _compile_range(range_3bet),
+    2: _compile_range(range_4bet),
+    3: _compile_range(range_5bet),
+}
+
+
+def _select_range(position: int, raise_cnt: int) -> Optional[Range]:
+    """get_preflop_hand_range と同じ規則で変換済みのレンジを選ぶ"""
+    if raise_cnt >= 1:
+        return NRP_RANGES.get(raise_cnt)
+    return SRP_RANGES.get(position)
 
 def should_raise_on_preflop(cards: List[str], position: int, raise_cnt: int, tool_context: ToolContext) -> bool:
     """
@@ -15,25 +60,13 @@ def should_raise_on_preflop(cards: List[str], position: int, raise_cnt: int, too
 
     hand_range = get_preflop_hand_range(position, raise_cnt, tool_context)
 
-    # 正規化: your_cards を強い順（ランクの降順）にソートしてからマッチング
-    parsed: Tuple[Tuple[int, str], Tuple[int, str]] = (
-        parse_card(cards[0]),
-        parse_card(cards[1]),
-    )
-    sorted_pair: Tuple[Tuple[int, str], Tuple[int, str]] = tuple(sorted(parsed, key=lambda x: x[0], reverse=True))  # type: ignore
-
-    # 一部のレンジデータではキーのタプル順序が一定でない可能性があるため、
-    # 念のため逆順もチェックして堅牢性を上げる
-    candidates = [sorted_pair, (sorted_pair[1], sorted_pair[0])]
-
-    for d in hand_range["hand_range"]:
-        if not isinstance(d, dict):
-            continue
-        for key, value in d.items():
-            if key in candidates:
-                return value
-
-    return False
+    # parse_card で表記を検証・正規化してから組み合わせの配列を参照する
+    (r1, s1), (r2, s2) = parse_card(cards[0]), parse_card(cards[1])
+
+    compiled = _select_range(position, raise_cnt)
+    if compiled is None or not hand_range["hand_range"]:
+        return False
+    return (Card(r1, _SUITS[s1]), Card(r2, _SUITS[s2])) in compiled
 
 def parse_card(token):
     # 例: 'A♥', '10♣', 'T♣', 'AH', 'Ts', 'qd' などを受け付ける
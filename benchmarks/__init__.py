@@ -0,0 +1,5 @@
+"""
+Performance benchmarks for the poker package
+
+リポジトリのルートから `uv run python -m benchmarks.<name>` で実行する。
+"""
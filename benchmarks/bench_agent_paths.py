@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+HTTP（api_server 経由）とプロセス内実行の意思決定レイテンシの比較
+
+同じエージェントに同じゲーム状態を送り、LLMApiPlayer（HTTP）と
+LocalAgentPlayer（プロセス内の ADK Runner）の1回あたりの所要時間を測る。
+
+    # LLM を使わない決定的なエージェントで経路のオーバーヘッドだけを測る（既定）
+    uv run python -m benchmarks.bench_agent_paths --decisions 500
+
+    # 実際のエージェント（HTTP 側は起動済みの adk api_server を使う。APIキーが必要）
+    uv run python -m benchmarks.bench_agent_paths --agent beginner_agent \\
+        --url http://localhost:8000 --decisions 20
+
+既定では HTTP 側にスタブの api_server（benchmarks.stub_agent）を立て、/run で
+同じエージェントを ADK の Runner で実行する。差は HTTP・JSON の往復と
+サーバー側の処理の分になる。
+"""
+
+import argparse
+import logging
+import statistics
+import time
+from typing import Dict, List
+
+from benchmarks.stub_agent import CheckAgent, StubAgentServer
+from poker.agent_runtime import load_agent
+from poker.agent_transport import AgentTransport
+from poker.game import PokerGame
+from poker.player_models import LLMApiPlayer, LocalAgentPlayer, RandomPlayer
+
+
+def game_state_for(player):
+    """player の手番のゲーム状態"""
+    game = PokerGame(headless=True, seed=0)
+    game.add_player(player)
+    game.add_player(RandomPlayer(1, "CPU1", 1000))
+    game.start_new_hand()
+    return game.get_llm_game_state(0)
+
+
+def measure(player, decisions: int, warmup: int, per_hand: int) -> List[float]:
+    """
+    warmup 回空回ししてから decisions 回意思決定させ、1回ごとの秒数を返す
+
+    per_hand 回ごとに reset_for_new_hand でセッションを替える（ハンドごとのセッション）。
+    同じセッションに履歴が溜まり続けると、その処理が経路の差を覆い隠すため。
+    """
+    state = game_state_for(player)
+    for _ in range(warmup):
+        player.make_decision(state)
+    samples = []
+    for i in range(decisions):
+        if i % per_hand == 0:
+            player.reset_for_new_hand()
+        start = time.perf_counter()
+        player.make_decision(state)
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def summarize(samples: List[float]) -> Dict[str, float]:
+    ordered = sorted(samples)
+    return {
+        "mean": statistics.fmean(ordered),
+        "p50": ordered[len(ordered) // 2],
+        "p95": ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="HTTP とプロセス内実行の意思決定レイテンシの比較")
+    parser.add_argument(
+        "--agent", type=str, default="check", help="エージェント（check なら LLM を使わない決定的なもの）"
+    )
+    parser.add_argument("--url", type=str, default=None, help="HTTP 側の api_server（省略時はスタブ）")
+    parser.add_argument("--decisions", type=int, default=200, help="計測する意思決定の回数（デフォルト: 200）")
+    parser.add_argument("--warmup", type=int, default=5, help="計測前に空回しする回数（デフォルト: 5）")
+    parser.add_argument(
+        "--per-hand", type=int, default=8, help="何回の意思決定ごとにセッションを替えるか（デフォルト: 8）"
+    )
+    args = parser.parse_args()
+
+    # 応答のパースで出る大量のデバッグログを計測に含めない
+    logging.getLogger("poker_game").disabled = True
+
+    agent = CheckAgent(name="check_agent") if args.agent == "check" else load_agent(args.agent)
+    stub = None
+    url = args.url
+    if url is None:
+        stub = StubAgentServer(agent=agent).start()
+        url = stub.url
+    try:
+        transport = AgentTransport(url)
+        http_player = LLMApiPlayer(
+            0, "Agent0", args.agent, "bench_http", url=url, transport=transport, session_scope="hand"
+        )
+        local_player = LocalAgentPlayer(
+            0, "Agent0", args.agent, "bench_local", agent=agent, session_scope="hand"
+        )
+
+        results = {}
+        for label, player in (("http", http_player), ("in-process", local_player)):
+            results[label] = summarize(measure(player, args.decisions, args.warmup, args.per_hand))
+        transport.close()
+    finally:
+        if stub is not None:
+            stub.stop()
+
+    print(f"{args.agent}: {args.decisions}回の意思決定（HTTP 側: {args.url or 'スタブ'}）")
+    print(f"{'経路':<12} {'平均ms':>9} {'p50ms':>9} {'p95ms':>9}")
+    for label, stats in results.items():
+        print(
+            f"{label:<12} {stats['mean'] * 1000:>9.2f} {stats['p50'] * 1000:>9.2f} "
+            f"{stats['p95'] * 1000:>9.2f}"
+        )
+    saved = results["http"]["mean"] - results["in-process"]["mean"]
+    print(f"\nプロセス内実行で1回あたり {saved * 1000:.2f}ms 短縮")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+LLMApiPlayer の HTTP 通信のベンチマーク
+
+ローカルのスタブ api_server（benchmarks.stub_agent）に対して、意思決定1回あたりの
+通信のオーバーヘッドを測る。エージェントの思考時間は含まない（--delay で足せる）。
+ループバックでは接続の確立がほぼ無料なので、リモートのサーバーや TLS の
+ハンドシェイクに相当する待ちを --connect-delay で足せる。
+
+    uv run python -m benchmarks.bench_agent_transport
+    uv run python -m benchmarks.bench_agent_transport --decisions 2000 --concurrency 16
+    uv run python -m benchmarks.bench_agent_transport --connect-delay 0.005
+
+比較する方式:
+    legacy   以前の make_decision（requests.post を2回・毎回 ThreadPoolExecutor を作って
+             0.2秒ごとに結果をポーリング。接続は毎回張り直す）
+    pooled   共有の AgentTransport（keep-alive の接続プール）を使う make_decision
+             （セッションは使い回すので、温まった接続への /run 1回だけ）
+    async    同じプールを使う decide を --concurrency 個ずつ並行に await
+"""
+
+import argparse
+import asyncio
+import concurrent.futures as cf
+import json
+import logging
+import time
+import uuid
+
+import requests
+
+from benchmarks.stub_agent import StubAgentServer
+from poker.agent_transport import AgentTransport
+from poker.game import PokerGame
+from poker.player_models import LLMApiPlayer, RandomPlayer
+
+
+def legacy_decision(player: LLMApiPlayer, game_state) -> dict:
+    """以前の LLMApiPlayer.make_decision の通信部分"""
+    session_id = str(uuid.uuid4())
+    input_json = json.dumps(game_state.to_dict(), ensure_ascii=False, indent=2)
+    headers = {"Content-Type": "application/json"}
+    requests.post(
+        f"{player.url}{player._session_path(session_id)}", json={}, headers=headers, timeout=5
+    )
+
+    def run_request():
+        return requests.post(
+            f"{player.url}/run",
+            json=player._run_payload(session_id, input_json),
+            headers=headers,
+            timeout=44,
+        )
+
+    with cf.ThreadPoolExecutor(max_workers=1) as executor:
+        future = executor.submit(run_request)
+        while True:
+            try:
+                response = future.result(timeout=0.2)
+                break
+            except cf.TimeoutError:
+                pass
+    return player._decision_from_response(response, game_state, session_id, input_json)
+
+
+def make_state(url: str, pool_size: int):
+    """スタブに向いた LLMApiPlayer と、その手番のゲーム状態"""
+    player = LLMApiPlayer(
+        0, "Agent", "team1_agent", "u0", url=url, transport=AgentTransport(url, pool_size)
+    )
+    game = PokerGame(headless=True, seed=0)
+    game.add_player(player)
+    game.add_player(RandomPlayer(1, "CPU1", 1000))
+    game.start_new_hand()
+    return player, game.get_llm_game_state(0)
+
+
+def bench(
+    mode: str,
+    decisions: int,
+    concurrency: int,
+    pool_size: int,
+    delay: float = 0.0,
+    connect_delay: float = 0.0,
+) -> dict:
+    """1つの方式で decisions 回意思決定し、所要時間と張った接続の数を返す"""
+    with StubAgentServer(delay=delay, connect_delay=connect_delay) as server:
+        player, state = make_state(server.url, pool_size)
+        start = time.perf_counter()
+        if mode == "legacy":
+            for _ in range(decisions):
+                legacy_decision(player, state)
+        elif mode == "pooled":
+            for _ in range(decisions):
+                player.make_decision(state)
+        else:
+
+            async def run_all():
+                for done in range(0, decisions, concurrency):
+                    batch = min(concurrency, decisions - done)
+                    await asyncio.gather(*(player.decide(state) for _ in range(batch)))
+                await player.transport.aclose()
+
+            asyncio.run(run_all())
+        elapsed = time.perf_counter() - start
+        player.transport.close()
+        return {
+            "mode": mode,
+            "elapsed": elapsed,
+            "connections": server.connections,
+            "requests": server.requests,
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="LLMApiPlayer の HTTP 通信のベンチマーク")
+    parser.add_argument("--decisions", type=int, default=500, help="意思決定の回数（デフォルト: 500）")
+    parser.add_argument("--concurrency", type=int, default=8, help="async で並行に待つ数（デフォルト: 8）")
+    parser.add_argument("--pool-size", type=int, default=8, help="接続プールの大きさ（デフォルト: 8）")
+    parser.add_argument("--delay", type=float, default=0.0, help="スタブの /run の応答時間（秒）")
+    parser.add_argument(
+        "--connect-delay", type=float, default=0.0, help="スタブが新しい接続を受け付ける時間（秒）"
+    )
+    parser.add_argument(
+        "--modes", nargs="+", default=["legacy", "pooled", "async"], help="比較する方式"
+    )
+    args = parser.parse_args()
+
+    # 応答のパースで出る大量のデバッグログを計測に含めない
+    logging.getLogger("poker_game").disabled = True
+
+    print(
+        f"{args.decisions}回の意思決定（スタブの応答時間 {args.delay * 1000:.0f}ms、"
+        f"接続の確立 {args.connect_delay * 1000:.0f}ms）"
+    )
+    print(f"{'方式':<8} {'ms/決定':>9} {'決定/秒':>10} {'接続数':>8} {'リクエスト数':>12}")
+    for mode in args.modes:
+        result = bench(
+            mode, args.decisions, args.concurrency, args.pool_size, args.delay, args.connect_delay
+        )
+        per_decision = result["elapsed"] / args.decisions
+        print(
+            f"{mode:<8} {per_decision * 1000:>9.2f} {1 / per_decision:>10,.0f} "
+            f"{result['connections']:>8} {result['requests']:>12}"
+        )
+
+
+if __name__ == "__main__":
+    main()
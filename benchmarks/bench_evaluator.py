@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+ハンド評価のベンチマーク
+
+スカラー評価（evaluate_ids）とバッチ評価（evaluate_batch）の hands/sec を測定する。
+
+    uv run python -m benchmarks.bench_evaluator
+    uv run python -m benchmarks.bench_evaluator --sizes 1000 100000 --repeat 5
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from poker.evaluator import HandEvaluator
+from poker.hand_tables import get_tables
+
+
+def random_hands(rng: np.random.Generator, count: int) -> np.ndarray:
+    """重複のない7枚のカードIDを count 組作成（shape: [count, 7]）"""
+    return np.argsort(rng.random((count, 52)), axis=1)[:, :7]
+
+
+def bench_batch(cards: np.ndarray, repeat: int) -> float:
+    """evaluate_batch の hands/sec（repeat 回の最速値）"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        HandEvaluator.evaluate_batch(cards[:, :2], cards[:, 2:])
+        best = min(best, time.perf_counter() - start)
+    return len(cards) / best
+
+
+def bench_scalar(cards: np.ndarray) -> float:
+    """evaluate_ids の hands/sec"""
+    rows = cards.tolist()
+    start = time.perf_counter()
+    for row in rows:
+        HandEvaluator.evaluate_ids(row)
+    return len(rows) / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ハンド評価のベンチマーク")
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[1_000, 10_000, 100_000, 1_000_000],
+        help="バッチサイズ（デフォルト: 1k 10k 100k 1M）",
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="各サイズの試行回数")
+    parser.add_argument("--seed", type=int, default=0, help="乱数シード")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+
+    start = time.perf_counter()
+    get_tables().numpy_arrays()
+    print(f"テーブル構築: {time.perf_counter() - start:.2f}s")
+
+    scalar_rate = bench_scalar(random_hands(rng, 50_000))
+    print(f"{'scalar':>10s}: {scalar_rate:>14,.0f} hands/sec")
+
+    for size in args.sizes:
+        cards = random_hands(rng, size)
+        rate = bench_batch(cards, args.repeat)
+        print(
+            f"{size:>10,d}: {rate:>14,.0f} hands/sec (x{rate / scalar_rate:.1f} vs scalar)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+評価バックエンドの差分検証
+
+同じランダムな7枚のハンドを各バックエンド（poker.evaluator_backends）で評価し、
+先頭のバックエンドを基準に強さの大小関係が食い違うハンドの組と、
+バックエンドごとの hands/sec（1プロセスあたり）を報告する。
+
+ハンドはチャンクに分けて複数プロセスで評価する。各チャンク内では基準の強さで
+並べた隣同士の関係（<, =）を比べるため、チャンク内の全ての組の順序を検証したことになる。
+
+    uv run python -m benchmarks.diff_evaluators
+    uv run python -m benchmarks.diff_evaluators --hands 5000000 --backends lookup treys pokerkit
+"""
+
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Optional, Sequence
+
+import numpy as np
+
+from poker.evaluator_backends import BACKENDS, CARD_SHORT_STRS, get_backend
+
+from .bench_evaluator import random_hands
+
+DEFAULT_BACKENDS = ("lookup", "treys", "reference")
+DEFAULT_CHUNK_SIZE = 50_000
+# 報告する食い違いの例の数（バックエンドごと）
+MAX_EXAMPLES = 5
+
+
+def _hand_str(row: Sequence[int]) -> str:
+    return " ".join(CARD_SHORT_STRS[card_id] for card_id in row)
+
+
+def check_chunk(backends: Sequence[str], size: int, seed) -> Dict[str, dict]:
+    """1チャンク分のハンドを全バックエンドで評価し、基準との食い違いを数える"""
+    rows = random_hands(np.random.default_rng(seed), size).tolist()
+
+    scores: Dict[str, np.ndarray] = {}
+    seconds: Dict[str, float] = {}
+    for name in backends:
+        evaluate = get_backend(name).evaluate_ids
+        evaluate(rows[0])  # テーブル構築などの初回コストを計測から除く
+        start = time.perf_counter()
+        scores[name] = np.fromiter(
+            (evaluate(row) for row in rows), dtype=np.int64, count=len(rows)
+        )
+        seconds[name] = time.perf_counter() - start
+
+    base_name = backends[0]
+    order = np.argsort(scores[base_name], kind="stable")
+    base_steps = np.sign(np.diff(scores[base_name][order]))
+
+    report = {}
+    for name in backends:
+        steps = np.sign(np.diff(scores[name][order]))
+        bad = np.flatnonzero(steps != base_steps)
+        mismatches = 0
+        if get_backend(name).strength_scale and get_backend(base_name).strength_scale:
+            mismatches = int(np.count_nonzero(scores[name] != scores[base_name]))
+        examples = []
+        for position in bad[:MAX_EXAMPLES].tolist():
+            a, b = int(order[position]), int(order[position + 1])
+            examples.append(
+                {
+                    "hands": (_hand_str(rows[a]), _hand_str(rows[b])),
+                    base_name: (int(scores[base_name][a]), int(scores[base_name][b])),
+                    name: (int(scores[name][a]), int(scores[name][b])),
+                }
+            )
+        report[name] = {
+            "hands": len(rows),
+            "seconds": seconds[name],
+            "ordering_disagreements": len(bad),
+            "value_mismatches": mismatches,
+            "examples": examples,
+        }
+    return report
+
+
+def run_differential(
+    hands: int = 1_000_000,
+    backends: Sequence[str] = DEFAULT_BACKENDS,
+    processes: Optional[int] = None,
+    seed: int = 0,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Dict[str, dict]:
+    """
+    ランダムな7枚のハンドを複数プロセスで評価し、バックエンドごとの結果をまとめる
+
+    Args:
+        hands: 評価するハンドの総数
+        backends: 比較するバックエンド名（先頭が基準）
+        processes: ワーカープロセス数（None なら CPU 数、1 ならこのプロセスで実行）
+        seed: 乱数シード
+        chunk_size: 1タスクあたりのハンド数
+
+    Returns:
+        バックエンド名 -> hands, seconds, hands_per_sec, ordering_disagreements,
+        value_mismatches, examples の辞書
+    """
+    backends = list(backends)
+    if not backends:
+        raise ValueError("at least one backend is required")
+    for name in backends:
+        get_backend(name)  # 未知の名前や未インストールのパッケージはここでエラー
+
+    sizes = [chunk_size] * (hands // chunk_size)
+    if hands % chunk_size:
+        sizes.append(hands % chunk_size)
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+
+    processes = processes or os.cpu_count() or 1
+    if processes == 1:
+        chunks = [check_chunk(backends, size, child) for size, child in zip(sizes, seeds)]
+    else:
+        with ProcessPoolExecutor(max_workers=processes) as pool:
+            futures = [
+                pool.submit(check_chunk, backends, size, child)
+                for size, child in zip(sizes, seeds)
+            ]
+            chunks = [future.result() for future in futures]
+
+    summary = {}
+    for name in backends:
+        parts = [chunk[name] for chunk in chunks]
+        total_hands = sum(part["hands"] for part in parts)
+        total_seconds = sum(part["seconds"] for part in parts)
+        summary[name] = {
+            "hands": total_hands,
+            "seconds": total_seconds,
+            "hands_per_sec": total_hands / total_seconds if total_seconds else 0.0,
+            "ordering_disagreements": sum(part["ordering_disagreements"] for part in parts),
+            "value_mismatches": sum(part["value_mismatches"] for part in parts),
+            "examples": [ex for part in parts for ex in part["examples"]][:MAX_EXAMPLES],
+        }
+    return summary
+
+
+def print_report(summary: Dict[str, dict], base_name: str):
+    """run_differential の結果を表形式で表示"""
+    print(f"基準: {base_name}")
+    print(f"{'backend':>10s} {'hands':>12s} {'hands/sec':>14s} {'order diff':>11s} {'value diff':>11s}")
+    for name, row in summary.items():
+        print(
+            f"{name:>10s} {row['hands']:>12,d} {row['hands_per_sec']:>14,.0f} "
+            f"{row['ordering_disagreements']:>11,d} {row['value_mismatches']:>11,d}"
+        )
+    for name, row in summary.items():
+        for example in row["examples"]:
+            print(f"  [{name}] {example}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="評価バックエンドの差分検証")
+    parser.add_argument("--hands", type=int, default=1_000_000, help="評価するハンド数")
+    parser.add_argument(
+        "--backends",
+        nargs="+",
+        choices=list(BACKENDS),
+        default=list(DEFAULT_BACKENDS),
+        help="比較するバックエンド（先頭が基準。デフォルト: lookup treys reference）",
+    )
+    parser.add_argument("--processes", type=int, default=None, help="ワーカープロセス数")
+    parser.add_argument("--seed", type=int, default=0, help="乱数シード")
+    parser.add_argument(
+        "--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="1タスクあたりのハンド数"
+    )
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    summary = run_differential(
+        args.hands, args.backends, args.processes, args.seed, args.chunk_size
+    )
+    print_report(summary, args.backends[0])
+    print(f"経過時間: {time.perf_counter() - start:.1f}s")
+
+    failed = any(
+        row["ordering_disagreements"] or row["value_mismatches"] for row in summary.values()
+    )
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,219 @@
+"""
+ADK api_server のスタブ
+
+セッションの作成・削除（POST / DELETE /apps/<app>/users/<user>/sessions/<id>）と
+/run だけに応えるローカルサーバー。/run はゲーム状態を読んで check（できなければ fold）を返す。
+本物と同じく、作成されていないセッションへの /run には 404 を返す。
+agent を渡すと /run はそのエージェントを ADK の Runner で実行して応答する
+（HTTP 経由とプロセス内実行の比較用。CheckAgent は LLM を使わない決定的なエージェント）。
+HTTP/1.1 の keep-alive に対応し、張られた接続の数とリクエスト数を数える。
+
+    with StubAgentServer(delay=0.0) as server:
+        player = LLMApiPlayer(0, "Agent", "team1_agent", "u0", url=server.url)
+        ...
+        print(server.connections, server.requests)
+"""
+
+import json
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from google.adk.agents import BaseAgent
+from google.adk.events import Event
+from google.genai import types
+
+from poker.agent_runtime import AgentRuntime
+
+
+class CheckAgent(BaseAgent):
+    """ゲーム状態のJSONを読んで check（できなければ fold）を返すだけのエージェント"""
+
+    async def _run_async_impl(self, ctx):
+        state = json.loads(ctx.user_content.parts[0].text)
+        action = "check" if "check" in state["actions"] else "fold"
+        text = json.dumps({"action": action, "amount": 0})
+        yield Event(
+            author=self.name,
+            invocation_id=ctx.invocation_id,
+            content=types.Content(role="model", parts=[types.Part(text=text)]),
+        )
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # ヘッダと本文を別々に書くので、Nagle で keep-alive の応答が遅れないようにする
+    # （本物の api_server の uvicorn も TCP_NODELAY）
+    disable_nagle_algorithm = True
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+        if self.server.connect_delay > 0:
+            time.sleep(self.server.connect_delay)
+
+    def do_POST(self):  # noqa: N802
+        length = int(self.headers.get("Content-Length", 0))
+        body = json.loads(self.rfile.read(length) or b"{}")
+        with self.server.lock:
+            self.server.requests += 1
+            self.server.paths.append(self.path)
+        status = 200
+        if self.path == "/run":
+            with self.server.lock:
+                self.server.runs.append(body.get("session_id"))
+                known = body.get("session_id") in self.server.sessions
+                slow_every = self.server.slow_every
+                slow = slow_every > 0 and len(self.server.runs) % slow_every == 0
+            delay = self.server.delay + (self.server.slow_delay if slow else 0.0)
+            if delay > 0:
+                time.sleep(delay)
+            if known:
+                prompt = body["new_message"]["parts"][0]["text"]
+                runtime = self.server.runtime
+                if runtime is not None:
+                    text = runtime.call(runtime.ask(prompt, body["session_id"]))
+                else:
+                    state = json.loads(prompt)
+                    action = "check" if "check" in state["actions"] else "fold"
+                    text = json.dumps({"action": action, "amount": 0})
+                payload = [{"content": {"parts": [{"text": text}]}}]
+            else:
+                status, payload = 404, {"detail": "Session not found"}
+        else:
+            session_id = self.path.rsplit("/", 1)[-1]
+            if self.server.session_delay > 0:
+                time.sleep(self.server.session_delay)
+            with self.server.lock:
+                if self.server.fail_sessions > 0:
+                    self.server.fail_sessions -= 1
+                    status, payload = 500, {"detail": "Internal Server Error"}
+                else:
+                    self.server.sessions.add(session_id)
+                    payload = {"id": session_id}
+        data = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_DELETE(self):  # noqa: N802
+        session_id = self.path.rsplit("/", 1)[-1]
+        with self.server.lock:
+            self.server.requests += 1
+            self.server.paths.append(self.path)
+            self.server.sessions.discard(session_id)
+            self.server.deleted.append(session_id)
+        self.send_response(204)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+class _Server(ThreadingHTTPServer):
+    def handle_error(self, request, client_address):
+        # 取り消された（ヘッジに負けた・タイムアウトした）リクエストの接続はクライアントが閉じる
+        if isinstance(sys.exc_info()[1], ConnectionError):
+            return
+        super().handle_error(request, client_address)
+
+
+class StubAgentServer:
+    """
+    別スレッドで動くスタブサーバー
+
+    Args:
+        delay: /run の応答までの待ち時間（秒。エージェントの思考時間の代わり）
+        connect_delay: 新しい接続を受け付けるたびの待ち時間（秒。TLS やリモート接続の
+            ハンドシェイクの代わり）
+        session_delay: セッション作成の応答までの待ち時間（秒）
+        fail_sessions: 最初の何回のセッション作成を 500 で失敗させるか
+        slow_every: /run の slow_every 回に1回だけ slow_delay 秒余計に待たせる（応答時間の裾）
+        slow_delay: 遅い /run の追加の待ち時間（秒）
+        agent: /run で実行する ADK エージェント（None なら固定の応答を返す）
+        keep_alive: False なら応答ごとに接続を閉じる（HTTP/1.0）
+    """
+
+    def __init__(
+        self,
+        delay: float = 0.0,
+        connect_delay: float = 0.0,
+        session_delay: float = 0.0,
+        fail_sessions: int = 0,
+        keep_alive: bool = True,
+        agent=None,
+        slow_every: int = 0,
+        slow_delay: float = 0.0,
+    ):
+        handler = _Handler if keep_alive else type(
+            "_CloseHandler", (_Handler,), {"protocol_version": "HTTP/1.0"}
+        )
+        self._server = _Server(("127.0.0.1", 0), handler)
+        self._server.daemon_threads = True
+        self._server.lock = threading.Lock()
+        self._server.delay = delay
+        self._server.connect_delay = connect_delay
+        self._server.session_delay = session_delay
+        self._server.fail_sessions = fail_sessions
+        self._server.slow_every = slow_every
+        self._server.slow_delay = slow_delay
+        self._server.sessions = set()
+        self._server.deleted = []
+        self._server.runs = []
+        self._server.runtime = (
+            AgentRuntime(agent, "stub_agent", "stub_user") if agent is not None else None
+        )
+        self._server.connections = 0
+        self._server.requests = 0
+        self._server.paths = []
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self.url = f"http://127.0.0.1:{self._server.server_address[1]}"
+
+    @property
+    def connections(self) -> int:
+        """これまでに張られた接続の数"""
+        return self._server.connections
+
+    @property
+    def requests(self) -> int:
+        """これまでに受けたリクエストの数"""
+        return self._server.requests
+
+    @property
+    def sessions(self) -> set:
+        """作成されたセッションの ID"""
+        return self._server.sessions
+
+    @property
+    def deleted(self) -> list:
+        """削除されたセッションの ID（順番通り）"""
+        return self._server.deleted
+
+    @property
+    def runs(self) -> list:
+        """/run を受けたセッションの ID（順番通り）"""
+        return self._server.runs
+
+    @property
+    def paths(self) -> list:
+        """受けたリクエストのパス（順番通り）"""
+        return self._server.paths
+
+    def start(self) -> "StubAgentServer":
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "StubAgentServer":
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
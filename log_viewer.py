@@ -28,6 +28,16 @@ class LogEventType(Enum):
     OTHER = "other"
 
 
+# ActionEvent.kind -> 表示用のアクション名
+ACTION_KIND_LABELS = {
+    "fold": "folds",
+    "check": "checks",
+    "call": "calls",
+    "raise": "raises to",
+    "all_in": "goes all-in",
+}
+
+
 class GameState:
     """現在のゲーム状態を保持するクラス"""
 
@@ -52,12 +62,15 @@ class LogParser:
         self.players = {}
         self.game_state = GameState()
         self.last_file_position = 0
+        # プレイヤーID -> アクションイベントのリスト（古い順）
+        self.actions_by_player: Dict[int, List[Dict[str, Any]]] = {}
 
     def parse_file(self, filepath: str) -> List[Dict[str, Any]]:
         """ログファイルを解析してイベントリストを返す"""
         self.events = []
         self.current_hand = None
         self.players = {}
+        self.actions_by_player = {}
 
         with open(filepath, "r", encoding="utf-8") as f:
             lines = f.readlines()
@@ -183,6 +196,7 @@ class LogParser:
                         f"DEBUG: Created player from action: P{player_id} ({self.game_state.players[player_id]['name']})"
                     )
                 # プレイヤーのアクション履歴を更新
+                self.actions_by_player.setdefault(player_id, []).append(event)
                 self.game_state.players[player_id]["last_action"] = event["action"]
                 self.game_state.players[player_id]["last_amount"] = event.get(
                     "amount", 0
@@ -573,6 +587,30 @@ class LogParser:
         self, message: str, timestamp: datetime
     ) -> Optional[Dict[str, Any]]:
         """アクションメッセージを解析"""
+        # ACTION_EXECUTED: Player 3 raised to 120 {"seq": 12, "hand": 4, "player": 3, "kind": "raise", ...}
+        # 末尾の JSON（poker.action_log.ActionEvent.to_dict）があればそれを使う
+        json_start = message.find("{")
+        if json_start != -1:
+            try:
+                record = json.loads(message[json_start:])
+            except json.JSONDecodeError:
+                record = None
+            if record and record.get("kind") in ACTION_KIND_LABELS:
+                player_id = record["player"]
+                player_info = self.game_state.players.get(player_id, {})
+                return {
+                    "type": LogEventType.PLAYER_ACTION,
+                    "timestamp": timestamp,
+                    "hand_number": record.get("hand", self.current_hand),
+                    "player_id": player_id,
+                    "player_name": player_info.get("name", f"Player {player_id}"),
+                    "action": ACTION_KIND_LABELS[record["kind"]],
+                    "amount": record.get("amount", 0),
+                    "pot_after": record.get("pot_after"),
+                    "message": message,
+                }
+
+        # 旧形式のログ
         # ACTION_EXECUTED: Player 0 (You) calls 20
         # ACTION_EXECUTED: Player 1 (Agent1) folds
         # ACTION_EXECUTED: Player 2 (Agent2) raises to 50
@@ -10,6 +10,7 @@ import os
 from datetime import datetime
 from poker.cli_ui import PokerUI
 from poker.flet_ui import run_flet_poker_app
+from poker.scheduler import DEFAULT_MAX_CONCURRENCY, report_summary, report_table, run_scheduled_tables
 
 
 def setup_logging(uuid_suffix: str = None):
@@ -93,11 +94,33 @@ def main():
         default="team1_agent:2,team2_agent:2",
         help="使用するエージェントと人数を指定（例: team1_agent:2,team2_agent:1,beginner_agent:1）",
     )
+    parser.add_argument(
+        "--tables",
+        type=int,
+        default=1,
+        help="エージェント専用モードで同時に進めるテーブル数（2以上ならテーブルごとに --max-hands ハンド）",
+    )
+    parser.add_argument(
+        "--max-concurrency",
+        type=int,
+        default=DEFAULT_MAX_CONCURRENCY,
+        help=f"複数テーブル時のエージェントごとの同時リクエスト数の上限（デフォルト: {DEFAULT_MAX_CONCURRENCY}）",
+    )
+    parser.add_argument(
+        "--in-process",
+        action="store_true",
+        help="エージェント専用モードでエージェントを api_server を介さずプロセス内で実行",
+    )
+    parser.add_argument(
+        "--turbo",
+        action="store_true",
+        help="ヘッドレス高速シミュレーション（CPU専用、スリープ/ログ/DBなし。hands/secを表示）",
+    )
     parser.add_argument(
         "--max-hands",
         type=int,
-        default=10,
-        help="CPU専用・エージェント専用モードでの最大ハンド数（CPU専用:10、エージェント専用:20）",
+        default=None,
+        help="CPU専用・エージェント専用・ターボモードでの最大ハンド数（CPU専用:10、エージェント専用:20、ターボ:10000）",
     )
     parser.add_argument(
         "--display-interval",
@@ -107,6 +130,12 @@ def main():
     )
     args = parser.parse_args()
 
+    if args.turbo:
+        # ターボモードはログファイルを作らずに実行
+        max_hands = args.max_hands if args.max_hands is not None else 10000
+        PokerUI().run_turbo_game(max_hands=max_hands)
+        return
+
     # ログ設定をセットアップ（常にデバッグモード）
     setup_logging(unified_uuid)
 
@@ -118,8 +147,9 @@ def main():
             if args.cpu_only:
                 # CPU専用モードを実行
                 print("CPU専用モードで実行します...")
+                max_hands = args.max_hands if args.max_hands is not None else 10
                 ui.run_cpu_only_game(
-                    max_hands=args.max_hands, display_interval=args.display_interval
+                    max_hands=max_hands, display_interval=args.display_interval
                 )
             elif args.agent_only:
                 # エージェント専用モードを実行
@@ -127,7 +157,24 @@ def main():
                 max_hands = (
                     args.max_hands if args.max_hands is not None else 20
                 )  # エージェント専用モードのデフォルトは20
-                ui.run_agent_only_mode(max_hands=max_hands, agents_config=args.agents, uuid_suffix=unified_uuid)
+                if args.tables > 1:
+                    # 複数テーブルを1プロセスで同時に進める
+                    summary = run_scheduled_tables(
+                        seats=args.agents,
+                        tables=args.tables,
+                        hands_per_table=max_hands,
+                        max_concurrency=args.max_concurrency,
+                        on_result=report_table,
+                        in_process=args.in_process,
+                    )
+                    report_summary(summary)
+                else:
+                    ui.run_agent_only_mode(
+                        max_hands=max_hands,
+                        agents_config=args.agents,
+                        uuid_suffix=unified_uuid,
+                        in_process=args.in_process,
+                    )
             else:
                 # 通常のゲームを実行
                 ui.run_game()
@@ -0,0 +1,359 @@
+"""
+Typed action event log
+
+PokerGame のアクション履歴を文字列ではなく ActionEvent（__slots__ のレコード）で
+ハンドごとの配列に保持する。"Player 3 raised to 120" のような文字列は
+LLM のプロンプトや画面表示で必要になったときに初めて組み立て、結果をキャッシュする。
+プレイヤーごとの索引を持つので、最新のアクションを文字列から探し直す必要はない。
+
+進行中のハンドと終わったハンドのアーカイブは分けて持つ。アーカイブは depth ハンド分の
+リングバッファで、あふれた古いハンドは on_evict に渡して（PokerGame は履歴DBへ）書き出し、
+メモリからは捨てる。長いセッションでも保持するイベント数は一定に収まる。
+
+    log = ActionLog(depth=10, on_evict=lambda hand, events: ...)
+    log.start_hand(1)
+    log.add(1, "preflop", "raise", player=3, amount=120, pot_after=150)
+    log.latest_for_player(3)      # ActionEvent(kind="raise", amount=120, ...)
+    log.tail(20)                  # 直近20件の文字列（LLM プロンプト用）
+"""
+
+import json
+from collections import deque
+from collections.abc import Sequence as SequenceABC
+from itertools import chain
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .game_models import CARD_STRS
+
+# プレイヤーのベッティングアクション（PokerGame.process_player_action の action と同じ）
+BETTING_KINDS = frozenset({"fold", "check", "call", "raise", "all_in"})
+
+# アーカイブに残す終わったハンドの数の既定値
+DEFAULT_HISTORY_DEPTH = 10
+
+
+class ActionEvent:
+    """
+    アクション履歴の1件
+
+    Attributes:
+        seq: ログ全体での通し番号
+        hand: ハンド番号
+        phase: フェーズ（"preflop" など）
+        player: プレイヤーID（カードの配布などプレイヤーに依らないイベントは None）
+        kind: "small_blind" / "big_blind" / "fold" / "check" / "call" / "raise" /
+            "all_in" / "deal" / "showdown_none" / "showdown_win" / "showdown_hand" /
+            "pot_award" / "pot_return" / "note"
+        amount: 額（raise はレイズ後の総額、all_in は投入額）
+        pot_after: イベント後のポット
+        detail: 文字列化に使う追加情報（配られたカードID、役など）
+    """
+
+    __slots__ = ("seq", "hand", "phase", "player", "kind", "amount", "pot_after", "detail", "_text")
+
+    def __init__(
+        self,
+        seq: int,
+        hand: int,
+        phase: str,
+        kind: str,
+        player: Optional[int] = None,
+        amount: int = 0,
+        pot_after: int = 0,
+        detail: Any = None,
+    ):
+        self.seq = seq
+        self.hand = hand
+        self.phase = phase
+        self.player = player
+        self.kind = kind
+        self.amount = amount
+        self.pot_after = pot_after
+        self.detail = detail
+        self._text: Optional[str] = None
+
+    @property
+    def text(self) -> str:
+        """従来の action_history と同じ表記（初回アクセス時に組み立てる）"""
+        if self._text is None:
+            self._text = _render(self)
+        return self._text
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON 用の辞書（detail は含めない）"""
+        return {
+            "seq": self.seq,
+            "hand": self.hand,
+            "phase": self.phase,
+            "player": self.player,
+            "kind": self.kind,
+            "amount": self.amount,
+            "pot_after": self.pot_after,
+        }
+
+    def __str__(self) -> str:
+        return self.text
+
+    def __repr__(self) -> str:
+        return (
+            f"ActionEvent(seq={self.seq}, hand={self.hand}, phase={self.phase!r}, "
+            f"player={self.player}, kind={self.kind!r}, amount={self.amount}, "
+            f"pot_after={self.pot_after})"
+        )
+
+
+class EventJson:
+    """ログ出力用に ActionEvent を JSON にする遅延オブジェクト（出力されるときだけ整形）"""
+
+    __slots__ = ("event",)
+
+    def __init__(self, event: ActionEvent):
+        self.event = event
+
+    def __str__(self) -> str:
+        return json.dumps(self.event.to_dict())
+
+
+def _render(event: ActionEvent) -> str:
+    kind = event.kind
+    player = event.player
+    amount = event.amount
+    if kind == "fold":
+        return f"Player {player} folded"
+    if kind == "check":
+        return f"Player {player} checked"
+    if kind == "call":
+        return f"Player {player} called {amount}"
+    if kind == "raise":
+        return f"Player {player} raised to {amount}"
+    if kind == "all_in":
+        return f"Player {player} went all-in with {amount}"
+    if kind == "small_blind":
+        return f"Player {player} posted small blind {amount}"
+    if kind == "big_blind":
+        return f"Player {player} posted big blind {amount}"
+    if kind == "deal":
+        cards = [CARD_STRS[card_id] for card_id in event.detail]
+        if event.phase == "flop":
+            return f"Flop dealt: {', '.join(cards)}"
+        return f"{event.phase.capitalize()} dealt: {cards[-1]}"
+    if kind == "showdown_none":
+        return "Showdown: no remaining players"
+    if kind == "showdown_win":
+        return f"Showdown: Player {player} won {amount}"
+    if kind == "showdown_hand":
+        hand, hole = event.detail
+        cards = ", ".join(CARD_STRS[card_id] for card_id in hole)
+        return f"Showdown: Player {player} hand={hand} cards={cards}"
+    if kind == "pot_return":
+        layer, contributors = event.detail
+        return f"Side pot layer {layer}: amount={amount} returned to " + ", ".join(
+            str(pid) for pid in contributors
+        )
+    if kind == "pot_award":
+        layer, winners, best_hand = event.detail
+        text = f"Side pot layer {layer}: amount={amount}, winners=" + ", ".join(
+            str(pid) for pid in winners
+        )
+        if best_hand is not None:
+            text += f" best_hand={best_hand}"
+        return text
+    return str(event.detail)
+
+
+class ActionLog:
+    """
+    進行中のハンドの ActionEvent の配列、終わったハンドのアーカイブ、プレイヤーごとの索引
+
+    Args:
+        depth: アーカイブに残す終わったハンドの数（None なら無制限）
+        on_evict: アーカイブからあふれたハンドを受け取るコールバック（hand, events）
+    """
+
+    def __init__(
+        self,
+        depth: Optional[int] = DEFAULT_HISTORY_DEPTH,
+        on_evict: Optional[Callable[[int, List[ActionEvent]], None]] = None,
+    ):
+        if depth is not None and depth < 0:
+            raise ValueError("depth must be non-negative")
+        self.depth = depth
+        self.on_evict = on_evict
+        self.archive: Deque[Tuple[int, List[ActionEvent]]] = deque()
+        self.current: List[ActionEvent] = []
+        self.hand = 0
+        self._by_player: Dict[int, Deque[ActionEvent]] = {}
+        self._seq = 0
+        self._count = 0
+
+    @classmethod
+    def from_strings(cls, texts: Iterable[str], **kwargs) -> "ActionLog":
+        """文字列のリストから作成（各要素は "note" イベントになる）"""
+        log = cls(**kwargs)
+        for text in texts:
+            log.add(0, "", "note", detail=str(text))
+        return log
+
+    def start_hand(self, hand: int):
+        """進行中のハンドをアーカイブに移し、新しいハンドの配列を用意する"""
+        if hand == self.hand:
+            return
+        if self.current:
+            self.archive.append((self.hand, self.current))
+            while self.depth is not None and len(self.archive) > self.depth:
+                self._evict()
+        self.hand = hand
+        self.current = []
+
+    def flush(self):
+        """アーカイブ中のハンドをすべて on_evict に渡して空にする（セッション終了時など）"""
+        while self.archive:
+            self._evict()
+
+    def _evict(self):
+        """アーカイブの最も古いハンドを捨てる（索引からも取り除く）"""
+        hand, events = self.archive.popleft()
+        self._count -= len(events)
+        last_seq = events[-1].seq
+        for player in {event.player for event in events if event.player is not None}:
+            player_events = self._by_player[player]
+            while player_events and player_events[0].seq <= last_seq:
+                player_events.popleft()
+            if not player_events:
+                del self._by_player[player]
+        if self.on_evict is not None:
+            self.on_evict(hand, events)
+
+    def add(
+        self,
+        hand: int,
+        phase: str,
+        kind: str,
+        player: Optional[int] = None,
+        amount: int = 0,
+        pot_after: int = 0,
+        detail: Any = None,
+    ) -> ActionEvent:
+        """イベントを現在のハンドに追加して返す"""
+        self._seq += 1
+        event = ActionEvent(self._seq, hand, phase, kind, player, amount, pot_after, detail)
+        self.current.append(event)
+        self._count += 1
+        if player is not None:
+            self._by_player.setdefault(player, deque()).append(event)
+        return event
+
+    def hand_events(self, hand: int) -> List[ActionEvent]:
+        """保持しているハンドのイベント（アーカイブから捨てたハンドは空）"""
+        if hand == self.hand:
+            return self.current
+        for archived_hand, events in self.archive:
+            if archived_hand == hand:
+                return events
+        return []
+
+    def events_for_player(self, player: int) -> List[ActionEvent]:
+        """プレイヤーのイベント（古い順）"""
+        return list(self._by_player.get(player, ()))
+
+    def latest_for_player(
+        self, player: int, kinds: frozenset = BETTING_KINDS
+    ) -> Optional[ActionEvent]:
+        """プレイヤーの最新のイベント（既定ではベッティングアクションのみ）"""
+        for event in reversed(self._by_player.get(player, ())):
+            if event.kind in kinds:
+                return event
+        return None
+
+    def events(self) -> Iterator[ActionEvent]:
+        """保持している全イベント（古い順）"""
+        return chain(
+            chain.from_iterable(events for _, events in self.archive), self.current
+        )
+
+    def reversed_events(self) -> Iterator[ActionEvent]:
+        """保持している全イベント（新しい順）"""
+        return chain(
+            reversed(self.current),
+            chain.from_iterable(reversed(events) for _, events in reversed(self.archive)),
+        )
+
+    def event_at(self, index: int) -> ActionEvent:
+        """
+        保持している全イベントの index 番目（古い順。負なら後ろから）
+
+        全体をコピーせず、ハンドごとの配列をたどって探す。
+
+        Raises:
+            IndexError: 範囲外
+        """
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("action history index out of range")
+        archived = self._count - len(self.current)
+        if index >= archived:
+            return self.current[index - archived]
+        for _, events in self.archive:
+            if index < len(events):
+                return events[index]
+            index -= len(events)
+        raise IndexError("action history index out of range")
+
+    def tail(self, count: int) -> List[str]:
+        """直近 count 件の文字列（古い順）"""
+        if count <= 0:
+            return []
+        picked: List[ActionEvent] = []
+        hands = chain((self.current,), (events for _, events in reversed(self.archive)))
+        for events in hands:
+            need = count - len(picked)
+            picked.extend(reversed(events[-need:]))
+            if len(picked) >= count:
+                break
+        return [event.text for event in reversed(picked)]
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self) -> Iterator[ActionEvent]:
+        return self.events()
+
+
+class ActionHistoryView(SequenceABC):
+    """
+    ActionLog を従来の action_history（文字列のリスト）として読むためのビュー
+
+    要素にアクセスしたときにだけ文字列化する。
+    """
+
+    __slots__ = ("_log",)
+
+    def __init__(self, log: ActionLog):
+        self._log = log
+
+    def __len__(self) -> int:
+        return len(self._log)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, stride = index.indices(len(self._log))
+            if stride == 1 and stop == len(self._log):
+                return self._log.tail(stop - start)
+            return [self._log.event_at(i).text for i in range(start, stop, stride)]
+        return self._log.event_at(index).text
+
+    def __iter__(self) -> Iterator[str]:
+        return (event.text for event in self._log.events())
+
+    def __reversed__(self) -> Iterator[str]:
+        return (event.text for event in self._log.reversed_events())
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (SequenceABC, list, tuple)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
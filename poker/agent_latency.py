@@ -0,0 +1,108 @@
+"""
+Per-agent decision latency statistics
+
+エージェント（app_name）ごとに、最近の意思決定の所要時間を記録して
+p50 / p95 / p99 を求める。LLMApiPlayer はこの分布からヘッジ（応答が遅いときに
+同じリクエストをもう1本送る）の時点を決める。
+
+    tracker = get_tracker("team1_agent")
+    tracker.record(3.2)
+    tracker.percentile(95)    # 十分な記録がなければ None
+    latency_stats()           # {"team1_agent": {"count": ..., "p50": ..., ...}}
+
+記録はプロセス内で共有され、エージェントごとに直近 window 件だけを保持する。
+"""
+
+import math
+import threading
+from collections import deque
+from typing import Dict, Optional
+
+# 保持する直近の記録の数
+DEFAULT_WINDOW = 500
+# percentile を返すのに必要な最小の記録数（少ない記録の裾はあてにならない）
+MIN_SAMPLES = 20
+
+
+class LatencyTracker:
+    """
+    1つのエージェントの所要時間の記録
+
+    Args:
+        window: 保持する直近の記録の数
+    """
+
+    def __init__(self, window: int = DEFAULT_WINDOW):
+        if window < 1:
+            raise ValueError("window must be at least 1")
+        self._samples: deque = deque(maxlen=window)
+        self._lock = threading.Lock()
+        self.hedged = 0  # ヘッジのリクエストを送った回数
+        self.hedge_wins = 0  # ヘッジのほうが先に応答した回数
+
+    def record(self, seconds: float):
+        """所要時間（秒）を記録する"""
+        with self._lock:
+            self._samples.append(seconds)
+
+    def record_hedge(self, won: bool):
+        """ヘッジを送ったこと（と、それが先に応答したか）を記録する"""
+        with self._lock:
+            self.hedged += 1
+            if won:
+                self.hedge_wins += 1
+
+    @property
+    def count(self) -> int:
+        return len(self._samples)
+
+    def percentile(self, p: float, min_samples: int = MIN_SAMPLES) -> Optional[float]:
+        """
+        直近の記録の p パーセンタイル（秒。最近傍順位法）
+
+        記録が min_samples 件に満たなければ None。
+        """
+        if not 0 < p <= 100:
+            raise ValueError(f"percentile must be in (0, 100]: {p}")
+        with self._lock:
+            ordered = sorted(self._samples)
+        if not ordered or len(ordered) < min_samples:
+            return None
+        return ordered[max(0, math.ceil(p / 100 * len(ordered)) - 1)]
+
+    def stats(self) -> Dict[str, float]:
+        """記録数と p50 / p95 / p99（記録がなければ記録数だけ）、ヘッジの回数"""
+        result: Dict[str, float] = {"count": self.count}
+        for p in (50, 95, 99):
+            value = self.percentile(p, min_samples=1)
+            if value is not None:
+                result[f"p{p}"] = value
+        result["hedged"] = self.hedged
+        result["hedge_wins"] = self.hedge_wins
+        return result
+
+
+_trackers: Dict[str, LatencyTracker] = {}
+_trackers_lock = threading.Lock()
+
+
+def get_tracker(agent: str) -> LatencyTracker:
+    """エージェントごとに共有される LatencyTracker を返す"""
+    with _trackers_lock:
+        tracker = _trackers.get(agent)
+        if tracker is None:
+            tracker = _trackers[agent] = LatencyTracker()
+        return tracker
+
+
+def latency_stats() -> Dict[str, Dict[str, float]]:
+    """記録のある全エージェントの stats()"""
+    with _trackers_lock:
+        trackers = dict(_trackers)
+    return {agent: tracker.stats() for agent, tracker in trackers.items()}
+
+
+def reset_latency():
+    """全エージェントの記録を破棄する"""
+    with _trackers_lock:
+        _trackers.clear()
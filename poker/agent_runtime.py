@@ -0,0 +1,163 @@
+"""
+Long-lived in-process ADK runtime
+
+ADK エージェントをプロセス内で動かすための Runner とセッションサービスを、
+プレイヤーが存在する間ずっと使い回す。エージェントの実行はプロセスで1つの
+バックグラウンドのイベントループ（デーモンスレッド）で行い、同期側・非同期側の
+どちらからも意思決定をそのループに投げて結果を待つ。
+
+    runtime = AgentRuntime(agent, app_name="poker_game", user_id="player_0")
+    text = runtime.call(runtime.ask(prompt, "session_0"), timeout=40)   # 同期
+    text = await runtime.acall(runtime.ask(prompt, "session_0"))        # 非同期
+
+意思決定のたびに Runner やセッションサービス・イベントループを作り直さないので、
+準備の待ち時間がなく、エージェントが内部で持つ HTTP クライアントなども
+同じループの上で使い回される。
+
+agents/ 以下のエージェントは load_agent("team1_agent") で root_agent を読み込める
+（adk api_server と同じく、パッケージか その agent モジュールの root_agent を使う）。
+"""
+
+import asyncio
+import concurrent.futures as cf
+import importlib
+import os
+import threading
+from typing import Any, Awaitable, Optional
+
+from google.adk.runners import Runner
+from google.adk.sessions import InMemorySessionService
+from google.genai import types
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_thread: Optional[threading.Thread] = None
+_loop_lock = threading.Lock()
+
+
+def agent_loop() -> asyncio.AbstractEventLoop:
+    """エージェントを実行するバックグラウンドのイベントループ（初回に起動）"""
+    global _loop, _loop_thread
+    with _loop_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            _loop_thread = threading.Thread(
+                target=_loop.run_forever, name="agent-loop", daemon=True
+            )
+            _loop_thread.start()
+        return _loop
+
+
+def load_agent(app_name: str, package: str = "agents") -> Any:
+    """
+    package.app_name の root_agent を読み込む
+
+    Raises:
+        ImportError: パッケージがないか、root_agent が定義されていない
+    """
+    module = importlib.import_module(f"{package}.{app_name}")
+    agent = getattr(module, "root_agent", None)
+    if agent is None:
+        agent = getattr(importlib.import_module(f"{package}.{app_name}.agent"), "root_agent", None)
+    if agent is None:
+        raise ImportError(f"{package}.{app_name} does not define root_agent")
+    return agent
+
+
+def _forget_loop_after_fork():
+    # fork した子プロセスにループのスレッドは引き継がれないので、必要になったら作り直す
+    global _loop, _loop_thread, _loop_lock
+    _loop = None
+    _loop_thread = None
+    _loop_lock = threading.Lock()
+
+
+os.register_at_fork(after_in_child=_forget_loop_after_fork)
+
+
+def _on_agent_loop() -> bool:
+    return _loop_thread is not None and threading.current_thread() is _loop_thread
+
+
+class AgentRuntime:
+    """
+    1つの ADK エージェントの Runner とセッションサービス
+
+    Args:
+        agent: ADK のエージェント（Agent / BaseAgent）
+        app_name: Runner とセッションのアプリ名
+        user_id: セッションのユーザーID
+    """
+
+    def __init__(self, agent: Any, app_name: str, user_id: str):
+        self.agent = agent
+        self.app_name = app_name
+        self.user_id = user_id
+        self.session_service = InMemorySessionService()
+        self.runner = Runner(
+            agent=agent, app_name=app_name, session_service=self.session_service
+        )
+        self._sessions: set = set()
+
+    async def ask(self, prompt: str, session_id: str) -> Optional[str]:
+        """
+        session_id のセッション（なければ作成）でプロンプトを送り、最終レスポンスのテキストを返す
+
+        バックグラウンドのループの上で実行すること（call / acall に渡す）。
+        """
+        if session_id not in self._sessions:
+            await self.session_service.create_session(
+                app_name=self.app_name, user_id=self.user_id, session_id=session_id
+            )
+            self._sessions.add(session_id)
+
+        # Content型のメッセージを作成
+        content = types.Content(role="user", parts=[types.Part(text=prompt)])
+
+        # run_asyncはイベントストリームを返すので、最終レスポンスを取得
+        # （途中で抜けるとトレースのコンテキストが外せずにエラーログが出るので最後まで読む）
+        final_response_text = None
+        async for event in self.runner.run_async(
+            user_id=self.user_id, session_id=session_id, new_message=content
+        ):
+            if final_response_text is None and event.is_final_response():
+                if event.content and event.content.parts:
+                    final_response_text = event.content.parts[0].text
+        return final_response_text
+
+    async def delete_session(self, session_id: str):
+        """セッションを削除する（作成していなければ何もしない）"""
+        if session_id in self._sessions:
+            self._sessions.discard(session_id)
+            await self.session_service.delete_session(
+                app_name=self.app_name, user_id=self.user_id, session_id=session_id
+            )
+
+    @property
+    def session_count(self) -> int:
+        """削除されずに残っているセッションの数"""
+        return len(self._sessions)
+
+    def submit(self, coro: Awaitable) -> cf.Future:
+        """コルーチンをバックグラウンドのループに投げる"""
+        return asyncio.run_coroutine_threadsafe(coro, agent_loop())
+
+    def call(self, coro: Awaitable, timeout: Optional[float] = None) -> Any:
+        """
+        コルーチンをバックグラウンドのループで実行して結果を待つ
+
+        timeout 秒で終わらなければ実行を取り消して TimeoutError を送出する。
+        """
+        if _on_agent_loop():
+            raise RuntimeError("call() cannot be used on the agent loop; await the coroutine")
+        future = self.submit(coro)
+        try:
+            return future.result(timeout)
+        except cf.TimeoutError:
+            future.cancel()
+            raise TimeoutError(f"agent did not respond within {timeout} seconds")
+
+    async def acall(self, coro: Awaitable) -> Any:
+        """call の非同期版（呼び出し側のループを塞がない。取り消しはエージェント側にも伝わる）"""
+        if _on_agent_loop():
+            return await coro
+        return await asyncio.wrap_future(self.submit(coro))
@@ -0,0 +1,162 @@
+"""
+Pooled keep-alive HTTP transport for the ADK api_server
+
+LLMApiPlayer は意思決定のたびにセッション作成と /run の2回のリクエストを送る。
+接続を毎回張り直さないよう、エージェントサーバーの URL ごとに1つの
+AgentTransport を共有し、keep-alive の接続プールから再利用する。
+
+    transport = get_transport("http://localhost:8000")
+    response = transport.post("/run", payload, timeout=40)           # 同期
+    response = await transport.apost("/run", payload, timeout=40)    # 非同期
+
+同期側は1つの httpx.Client（スレッドセーフ）を共有する。httpx.AsyncClient の
+接続はイベントループに結び付くため、非同期側はイベントループごとに
+クライアントを持つ（LLMApiPlayer は同期の意思決定もバックグラウンドのループの
+非同期クライアントで送る）。プールの大きさは pool_size（既定は環境変数
+AGENT_POOL_SIZE、なければ 32）で、同じサーバーへ同時に張る接続の上限になる。
+"""
+
+import asyncio
+import os
+import threading
+from typing import Any, Dict, Optional
+
+import httpx
+
+DEFAULT_POOL_SIZE = int(os.getenv("AGENT_POOL_SIZE", "32"))
+# 使われていない keep-alive 接続を閉じるまでの秒数
+DEFAULT_KEEPALIVE_EXPIRY = 60.0
+# 接続確立の制限時間（秒）
+CONNECT_TIMEOUT = 5.0
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+class AgentTransport:
+    """
+    1つのエージェントサーバーへの接続プール
+
+    Args:
+        url: エージェントサーバーの URL（http://localhost:8000 など）
+        pool_size: 同時に張る接続の上限（keep-alive で保持する数も同じ）
+        keepalive_expiry: 使われていない接続を閉じるまでの秒数
+    """
+
+    def __init__(
+        self,
+        url: str,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        keepalive_expiry: float = DEFAULT_KEEPALIVE_EXPIRY,
+    ):
+        if pool_size < 1:
+            raise ValueError("pool_size must be at least 1")
+        self.url = url.rstrip("/")
+        self.pool_size = pool_size
+        self.limits = httpx.Limits(
+            max_connections=pool_size,
+            max_keepalive_connections=pool_size,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self._lock = threading.Lock()
+        self._client: Optional[httpx.Client] = None
+        self._async_clients: Dict[asyncio.AbstractEventLoop, httpx.AsyncClient] = {}
+
+    def _timeout(self, timeout: Optional[float]) -> httpx.Timeout:
+        return httpx.Timeout(timeout, connect=min(CONNECT_TIMEOUT, timeout or CONNECT_TIMEOUT))
+
+    @property
+    def client(self) -> httpx.Client:
+        """同期クライアント（初回に作成）"""
+        with self._lock:
+            if self._client is None:
+                self._client = httpx.Client(base_url=self.url, limits=self.limits)
+            return self._client
+
+    def async_client(self) -> httpx.AsyncClient:
+        """実行中のイベントループ用の非同期クライアント（初回に作成）"""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            client = self._async_clients.get(loop)
+            if client is None:
+                # 終了したループのクライアントはもう使えないので手放す
+                for old in [old for old in self._async_clients if old.is_closed()]:
+                    del self._async_clients[old]
+                client = self._async_clients[loop] = httpx.AsyncClient(
+                    base_url=self.url, limits=self.limits
+                )
+            return client
+
+    def post(self, path: str, payload: Any, timeout: Optional[float] = None) -> httpx.Response:
+        """JSON を POST する（接続はプールから再利用）"""
+        return self.client.post(
+            path, json=payload, headers=_JSON_HEADERS, timeout=self._timeout(timeout)
+        )
+
+    async def apost(
+        self, path: str, payload: Any, timeout: Optional[float] = None
+    ) -> httpx.Response:
+        """post の非同期版"""
+        return await self.async_client().post(
+            path, json=payload, headers=_JSON_HEADERS, timeout=self._timeout(timeout)
+        )
+
+    async def adelete(self, path: str, timeout: Optional[float] = None) -> httpx.Response:
+        """DELETE を送る（非同期。セッションの削除など）"""
+        return await self.async_client().delete(path, timeout=self._timeout(timeout))
+
+    def close(self):
+        """
+        同期クライアントと、他のスレッドで動き続けているループ（LLMApiPlayer の
+        バックグラウンドのループなど）の非同期クライアントを閉じる
+
+        終了したループのクライアントはそのまま手放す。
+        """
+        with self._lock:
+            client, self._client = self._client, None
+            async_clients, self._async_clients = self._async_clients, {}
+        if client is not None:
+            client.close()
+        try:
+            current = asyncio.get_running_loop()
+        except RuntimeError:
+            current = None
+        for loop, async_client in async_clients.items():
+            if loop is not current and loop.is_running():
+                asyncio.run_coroutine_threadsafe(async_client.aclose(), loop).result(CONNECT_TIMEOUT)
+
+    async def aclose(self):
+        """実行中のイベントループの非同期クライアントを閉じる"""
+        with self._lock:
+            client = self._async_clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
+
+
+_transports: Dict[str, AgentTransport] = {}
+_transports_lock = threading.Lock()
+
+
+def get_transport(url: str, pool_size: Optional[int] = None) -> AgentTransport:
+    """
+    URL ごとに共有される AgentTransport を返す
+
+    pool_size を指定すると、次にその URL の AgentTransport を作るときの上限になる
+    （作成済みなら変わらない）。
+    """
+    key = url.rstrip("/")
+    with _transports_lock:
+        transport = _transports.get(key)
+        if transport is None:
+            transport = _transports[key] = AgentTransport(
+                key, pool_size if pool_size is not None else DEFAULT_POOL_SIZE
+            )
+        return transport
+
+
+def close_transports():
+    """共有している全ての AgentTransport を閉じて破棄する"""
+    with _transports_lock:
+        transports = list(_transports.values())
+        _transports.clear()
+    for transport in transports:
+        transport.close()
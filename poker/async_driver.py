@@ -0,0 +1,166 @@
+"""
+Asyncio game driver
+
+PokerGame.play_hand は各プレイヤーの make_decision を同期的に呼ぶため、
+ネットワーク越しのエージェントや人間の入力を待つ間はスレッドが塞がる。
+このモジュールは同じ進行を asyncio で行い、プレイヤーの async decide(state) を
+await する。待ちの間は他のテーブルが進むので、1プロセス・1スレッドで
+多数のテーブルを同時に動かせる。
+
+    game = PokerGame(headless=True)
+    game.setup_configurable_game_with_models(configs)
+    result = asyncio.run(play_hand_async(game, decision_timeout=40))
+
+    # 複数テーブルを同時に進める
+    asyncio.run(run_games_async(games, hands=100))
+
+decide を持たないプレイヤーは make_decision をそのまま呼ぶ。Player は既定で
+make_decision を呼ぶだけの decide を持ち、LLMApiPlayer / LLMPlayer / HumanPlayer は
+応答や入力を await する decide を実装している。
+
+limiter を渡すと、意思決定の前に limiter.slot(player) で枠を確保する
+（エージェントごとの同時リクエスト数の制限。poker.scheduler.AgentLimiter を参照）。
+"""
+
+import asyncio
+import inspect
+from typing import Any, Dict, List, Optional, Protocol, Sequence, runtime_checkable
+
+from .game import GamePhase, PokerGame
+from .game_models import GameState
+from .player_models import PlayerStatus
+from .runner import HandTally
+
+
+@runtime_checkable
+class AsyncPlayer(Protocol):
+    """非同期に意思決定するプレイヤー"""
+
+    async def decide(self, game_state: GameState) -> Dict[str, Any]:
+        """{"action": "fold|check|call|raise|all_in", "amount": int} を返す"""
+        ...
+
+
+async def decide(
+    player: Any,
+    game_state: GameState,
+    timeout: Optional[float] = None,
+    limiter: Optional[Any] = None,
+) -> Dict[str, Any]:
+    """
+    プレイヤーの意思決定を待つ
+
+    timeout 秒で決まらなければフォールドする（None なら無制限）。limiter があれば
+    先に枠を確保し、timeout は枠を確保してから数える。
+    """
+    if limiter is not None:
+        async with limiter.slot(player):
+            return await decide(player, game_state, timeout)
+    method = getattr(player, "decide", None)
+    if method is None:
+        return player.make_decision(game_state)
+    decision = method(game_state)
+    if not inspect.isawaitable(decision):
+        return decision
+    try:
+        return await asyncio.wait_for(decision, timeout)
+    except asyncio.TimeoutError:
+        return {"action": "fold", "amount": 0}
+
+
+async def prepare_sessions_async(game: PokerGame):
+    """PokerGame.prepare_sessions の非同期版（スレッドを使わずに並行に作成）"""
+    pending = game.pending_sessions()
+    if pending:
+        await asyncio.gather(*(player.acreate_session() for player in pending))
+    for player in pending:
+        if player.session_pending:
+            game.logger.error("Session creation failed for %s", player.name)
+
+
+async def play_hand_async(
+    game: PokerGame,
+    decision_timeout: Optional[float] = None,
+    action_delay: float = 0.0,
+    limiter: Optional[Any] = None,
+) -> Optional[Dict[str, Any]]:
+    """
+    PokerGame.play_hand の非同期版
+
+    Args:
+        decision_timeout: 1回の意思決定の制限時間（秒）。超えたらフォールド
+        action_delay: アクションごとの待ち時間（観戦用の演出。await するのでブロックしない）
+        limiter: 意思決定の同時実行数を制限するもの（slot(player) が async コンテキストマネージャを返す）
+
+    Returns:
+        ショーダウン結果（プレイヤー不足でハンドを開始できない場合は None）
+    """
+    game.start_new_hand(prepare_sessions=False)
+    if game.current_phase == GamePhase.FINISHED:
+        return None
+    await prepare_sessions_async(game)
+
+    while game.current_phase not in (GamePhase.SHOWDOWN, GamePhase.FINISHED):
+        while not game.betting_round_complete:
+            player = game.players[game.current_player_index]
+            if player.status != PlayerStatus.ACTIVE:
+                game._advance_to_next_player()
+                continue
+
+            decision = await decide(
+                player, game.get_llm_game_state(player.id), decision_timeout, limiter
+            )
+            if not game.process_player_action(
+                player.id, decision["action"], decision.get("amount", 0)
+            ):
+                game.process_player_action(player.id, "fold", 0)
+            if action_delay > 0:
+                await asyncio.sleep(action_delay)
+
+        if not game.advance_to_next_phase():
+            break
+
+    if game.current_phase == GamePhase.SHOWDOWN:
+        return game.conduct_showdown()
+    return None
+
+
+async def play_hands_async(
+    game: PokerGame,
+    max_hands: int,
+    decision_timeout: Optional[float] = None,
+    action_delay: float = 0.0,
+    limiter: Optional[Any] = None,
+) -> Dict[str, Any]:
+    """
+    poker.runner.play_hands の非同期版（チップが尽きたら全員を初期値に戻して続ける）
+
+    Returns:
+        hands, games, net_chips（player.id -> 累計収支）
+    """
+    tally = HandTally(game)
+    try:
+        while tally.hands < max_hands:
+            tally.start_hand()
+            await play_hand_async(game, decision_timeout, action_delay, limiter)
+            tally.hands += 1
+    finally:
+        tally.settle()
+    return tally.result()
+
+
+async def run_games_async(
+    games: Sequence[PokerGame],
+    hands: int,
+    decision_timeout: Optional[float] = None,
+    limiter: Optional[Any] = None,
+) -> List[Dict[str, Any]]:
+    """複数のテーブルを同じイベントループで同時に進め、テーブルごとの結果を返す"""
+    return list(
+        await asyncio.gather(
+            *(
+                play_hands_async(game, hands, decision_timeout, limiter=limiter)
+                for game in games
+            )
+        )
+    )
@@ -0,0 +1,140 @@
+"""
+Shared equity / hand-strength cache
+
+スート同型な局面を同じキー（isomorphism.canonical_key）にまとめ、
+上限付きの LRU キャッシュに計算結果を保存する。長時間の agent-only 対局で
+同じ（スート違いの）フロップが繰り返し出ても、シミュレーションを再実行しない。
+
+    from poker.cache import cached_equity, get_cache_stats
+
+    result = cached_equity(["A♥", "K♥"], ["2♥", "7♦", "9♣"], num_opponents=2)
+    get_cache_stats()["equity"]  # {"hits": ..., "misses": ..., "evictions": ...}
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Sequence
+
+from .equity import CardLike, EquityResult, calculate_equity, to_card_ids
+from .evaluator import HandEvaluator
+from .isomorphism import canonical_cards, canonical_key
+
+DEFAULT_EQUITY_CACHE_SIZE = 4096
+DEFAULT_STRENGTH_CACHE_SIZE = 65536
+
+_MISSING = object()
+
+
+class LRUCache:
+    """
+    上限付き LRU キャッシュ（スレッドセーフ）
+
+    上限を超えると最も長く参照されていないエントリから削除する。
+    hits / misses / evictions で利用状況を確認できる。
+    """
+
+    def __init__(self, maxsize: int):
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._data: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._data
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """値を取得（参照したエントリは最新扱いになる）"""
+        with self._lock:
+            value = self._data.get(key, _MISSING)
+            if value is _MISSING:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any):
+        """値を保存（上限を超えた分は古い順に削除）"""
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """キャッシュにあれば返し、なければ compute() の結果を保存して返す"""
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            # 計算中はロックを保持しない（同じキーを並行して計算することはあり得る）
+            value = compute()
+            self.put(key, value)
+        return value
+
+    def clear(self):
+        """エントリと統計をリセット"""
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """統計情報を辞書形式で取得"""
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+
+equity_cache = LRUCache(DEFAULT_EQUITY_CACHE_SIZE)
+strength_cache = LRUCache(DEFAULT_STRENGTH_CACHE_SIZE)
+
+
+def cached_equity(
+    hole: Sequence[CardLike],
+    board: Sequence[CardLike] = (),
+    num_opponents: int = 1,
+    dead: Sequence[CardLike] = (),
+    cache: Optional[LRUCache] = None,
+) -> EquityResult:
+    """
+    calculate_equity の結果をスート同型なキーでキャッシュ
+
+    同じ局面（スートの付け替えを含む）と相手人数なら、2回目以降は計算しない。
+    """
+    cache = equity_cache if cache is None else cache
+    key = (canonical_key(hole, board, dead), num_opponents)
+    return cache.get_or_compute(
+        key, lambda: calculate_equity(hole, board, num_opponents, dead)
+    )
+
+
+def cached_strength(cards: Sequence[CardLike], cache: Optional[LRUCache] = None) -> int:
+    """5〜7枚のカードの strength をスート同型なキーでキャッシュ"""
+    cache = strength_cache if cache is None else cache
+    ids = to_card_ids(cards)
+    return cache.get_or_compute(
+        canonical_cards(ids), lambda: HandEvaluator.evaluate_ids(ids)
+    )
+
+
+def get_cache_stats() -> Dict[str, Dict[str, Any]]:
+    """共有キャッシュの統計情報"""
+    return {"equity": equity_cache.stats(), "strength": strength_cache.stats()}
+
+
+def clear_caches():
+    """共有キャッシュをすべてクリア"""
+    equity_cache.clear()
+    strength_cache.clear()
@@ -182,9 +182,7 @@ class PokerUI:
 
             # 現在の最強ハンドを表示
             if len(self.game.community_cards) >= 3:
-                hand_result = HandEvaluator.evaluate_hand(
-                    player.hole_cards, self.game.community_cards
-                )
+                hand_result = self.game.get_hand_tracker(player.id).hand_result()
                 print(
                     f"  現在のハンド: {HandEvaluator.get_hand_strength_description(hand_result)}"
                 )
@@ -513,9 +511,15 @@ class PokerUI:
         except Exception as e:
             print(f"\nエラーが発生しました: {e}")
             print("ゲームを終了します。")
+        finally:
+            self.game.close()
 
     def run_agent_only_mode(
-        self, max_hands: int = 20, agents_config: str = "team1_agent:2,team2_agent:2", uuid_suffix: str = None
+        self,
+        max_hands: int = 20,
+        agents_config: str = "team1_agent:2,team2_agent:2",
+        uuid_suffix: str = None,
+        in_process: bool = False,
     ):
         """
         エージェント専用モード - LLMエージェントのみで完全自動進行ゲーム
@@ -524,6 +528,7 @@ class PokerUI:
             max_hands: 最大ハンド数（デフォルト20）
             agents_config: エージェント設定（例: "team1_agent:2,team2_agent:1,beginner_agent:1"）
             uuid_suffix: 統一UUID（DB、ログ、結果ファイルで使用）
+            in_process: エージェントを api_server を介さずプロセス内で実行する
         """
         print("=== エージェント専用モード ===")
         print("LLMエージェントのみで完全自動進行します")
@@ -532,7 +537,7 @@ class PokerUI:
 
         # エージェント設定を解析
         try:
-            player_configs = self._parse_agents_config(agents_config)
+            player_configs = self._parse_agents_config(agents_config, in_process)
             print(f"プレイヤー構成: {len(player_configs)}人")
             for i, config in enumerate(player_configs):
                 print(f"  Player {i}: {config['agent_id']} ({config['type']})")
@@ -752,6 +757,7 @@ class PokerUI:
 
             traceback.print_exc()
         finally:
+            self.game.close()
             # 結果をテキストファイルに保存
             self._save_agent_only_results(player_stats, agents_config, hand_count, uuid_suffix)
 
@@ -848,12 +854,15 @@ class PokerUI:
         except Exception as e:
             print(f"\n結果の保存に失敗しました: {e}")
 
-    def _parse_agents_config(self, agents_config: str) -> List[Dict[str, Any]]:
+    def _parse_agents_config(
+        self, agents_config: str, in_process: bool = False
+    ) -> List[Dict[str, Any]]:
         """
         エージェント設定文字列を解析してプレイヤー設定リストを作成
 
         Args:
             agents_config: "team1_agent:2,team2_agent:1,beginner_agent:1" のような形式
+            in_process: True なら LocalAgentPlayer（llm_local）、False なら LLMApiPlayer（llm_api）
 
         Returns:
             プレイヤー設定のリスト
@@ -903,7 +912,7 @@ class PokerUI:
             for i in range(count):
                 player_configs.append(
                     {
-                        "type": "llm_api",
+                        "type": "llm_local" if in_process else "llm_api",
                         "agent_id": agent_name,
                         "user_id": f"player_{player_id}",
                     }
@@ -1086,3 +1095,67 @@ class PokerUI:
         except Exception as e:
             print(f"\nエラーが発生しました: {e}")
             print("ゲームを終了します。")
+        finally:
+            self.game.close()
+
+    def run_turbo_game(self, max_hands: int = 10000) -> Dict[str, Any]:
+        """
+        ヘッドレスの高速シミュレーション（CPU専用、スリープ/ログ/DBなし）
+
+        誰かがチップを全て失ってゲームが終わった場合は全員のチップを初期値に戻して
+        続行し、max_hands ハンドに達するまで進める。最後に hands/sec を表示する。
+
+        Args:
+            max_hands: 実行するハンド数
+
+        Returns:
+            hands, games, elapsed, hands_per_sec, net_chips（プレイヤー名 -> 累計収支）
+        """
+        import time
+
+        print("=== ターボモード ===")
+        print(f"CPU専用のヘッドレス対戦を{max_hands}ハンド実行します\n")
+
+        self.game = PokerGame(headless=True)
+        self.game.setup_cpu_only_game()
+        initial_chips = self.game.initial_chips
+        net_chips = {player.name: 0 for player in self.game.players}
+
+        def settle():
+            for player in self.game.players:
+                net_chips[player.name] += player.chips - initial_chips
+
+        hands = 0
+        games = 1
+        start = time.perf_counter()
+        try:
+            while hands < max_hands:
+                if self.game.is_game_over():
+                    # 全員のチップを初期値に戻して次のゲームへ
+                    settle()
+                    for player in self.game.players:
+                        player.chips = initial_chips
+                        player.status = PlayerStatus.ACTIVE
+                    games += 1
+                self.game.play_hand()
+                hands += 1
+        except KeyboardInterrupt:
+            print("\n\nターボモードを中断しました。")
+        elapsed = time.perf_counter() - start
+        settle()
+
+        hands_per_sec = hands / elapsed if elapsed > 0 else 0.0
+        print(f"実行ハンド数: {hands}（{games}ゲーム）")
+        print(f"経過時間: {elapsed:.2f}秒")
+        print(f"速度: {hands_per_sec:,.0f} hands/sec")
+        print("\n累計収支:")
+        for name, net in net_chips.items():
+            print(f"  {name}: {net:+d}チップ")
+
+        return {
+            "hands": hands,
+            "games": games,
+            "elapsed": elapsed,
+            "hands_per_sec": hands_per_sec,
+            "net_chips": net_chips,
+        }
@@ -0,0 +1,416 @@
+"""
+Equity calculation built on the integer hand evaluator
+
+ホールカードとボードから、ランダムな相手に対する勝率（win/tie/lose）を計算する。
+
+- enumerate_equity: 残りのボードと相手ハンドを全列挙する厳密計算（ヘッズアップ）
+- monte_carlo_equity: 標準誤差が目標値を下回るまでサンプリングする近似計算
+- calculate_equity: 状況に応じて上記を使い分けるエージェント向けの入口
+
+カードは Card / カードID（0..51）/ 文字列（"A♠", "Td" など）のいずれでも指定できる。
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from itertools import combinations
+from math import comb, sqrt
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Union
+
+import numpy as np
+
+from .evaluator import HandEvaluator
+from .game_models import Card
+
+CardLike = Union[Card, int, str]
+
+# 1回のバッチで評価する最大試行数（メモリ使用量の上限）
+DEFAULT_BATCH_SIZE = 4096
+# calculate_equity が厳密計算を選ぶ評価回数の上限
+DEFAULT_EXACT_LIMIT = 250_000
+# プロセスプールに分割する試行数の下限
+DEFAULT_PARALLEL_THRESHOLD = 200_000
+
+
+@dataclass
+class EquityResult:
+    """エクイティ計算結果"""
+
+    win: float  # 単独で勝った割合
+    tie: float  # 引き分け（最強ハンドを複数人で分け合った）割合
+    lose: float  # 負けた割合
+    equity: float  # 引き分けを人数で按分した期待取り分（0.0〜1.0）
+    samples: int  # 評価したシナリオ数
+    std_error: float  # equity の標準誤差（厳密計算では0）
+    exact: bool  # 全列挙による厳密値かどうか
+
+    def to_dict(self) -> Dict[str, Any]:
+        """辞書形式に変換"""
+        return {
+            "win": self.win,
+            "tie": self.tie,
+            "lose": self.lose,
+            "equity": self.equity,
+            "samples": self.samples,
+            "std_error": self.std_error,
+            "exact": self.exact,
+        }
+
+
+def to_card_ids(cards: Iterable[CardLike]) -> List[int]:
+    """Card / カードID / 文字列の列をカードIDのリストに変換"""
+    ids = []
+    for card in cards:
+        if isinstance(card, Card):
+            ids.append(card.id)
+        elif isinstance(card, str):
+            ids.append(Card.from_str(card).id)
+        else:
+            ids.append(int(card))
+    return ids
+
+
+def _validate(hole: List[int], board: List[int], dead: List[int], num_opponents: int):
+    """入力の整合性をチェック"""
+    if len(hole) != 2:
+        raise ValueError("hole must contain exactly 2 cards")
+    if len(board) > 5:
+        raise ValueError("board must contain at most 5 cards")
+    if num_opponents < 1:
+        raise ValueError("num_opponents must be at least 1")
+    known = hole + board + dead
+    if len(set(known)) != len(known):
+        raise ValueError("duplicate cards in hole/board/dead")
+    needed = (5 - len(board)) + 2 * num_opponents
+    if 52 - len(known) < needed:
+        raise ValueError("not enough cards left in the deck")
+
+
+class _Tally:
+    """勝敗の集計（equity の分散計算用に二乗和も持つ）"""
+
+    def __init__(self):
+        self.win = 0
+        self.tie = 0
+        self.total = 0  # 重みの合計（重みなしならシナリオ数と同じ）
+        self.count = 0  # 評価したシナリオ数
+        self.share = 0.0
+        self.share_sq = 0.0
+
+    def add(
+        self,
+        hero: np.ndarray,
+        villains: np.ndarray,
+        weights: Optional[np.ndarray] = None,
+    ):
+        """hero: [B], villains: [B, K] の強さを集計（weights: [B] は各シナリオの重み）"""
+        best = villains.max(axis=1)
+        wins = hero > best
+        ties = hero == best
+        # 引き分けは同じ強さの人数で按分
+        tied_count = (villains == hero[:, None]).sum(axis=1) + 1
+        share = np.where(wins, 1.0, np.where(ties, 1.0 / tied_count, 0.0))
+        self.count += len(hero)
+        if weights is None:
+            self.win += int(wins.sum())
+            self.tie += int(ties.sum())
+            self.total += len(hero)
+            self.share += float(share.sum())
+            self.share_sq += float((share * share).sum())
+        else:
+            self.win += float(weights[wins].sum())
+            self.tie += float(weights[ties].sum())
+            self.total += float(weights.sum())
+            self.share += float((share * weights).sum())
+            self.share_sq += float((share * share * weights).sum())
+
+    def merge(self, other: "_Tally"):
+        self.win += other.win
+        self.tie += other.tie
+        self.total += other.total
+        self.count += other.count
+        self.share += other.share
+        self.share_sq += other.share_sq
+
+    @property
+    def std_error(self) -> float:
+        if self.count < 2:
+            return float("inf")
+        mean = self.share / self.total
+        variance = max(0.0, self.share_sq / self.total - mean * mean)
+        return sqrt(variance / (self.count - 1))
+
+    def result(self, exact: bool) -> EquityResult:
+        if self.total == 0:
+            return EquityResult(0.0, 0.0, 0.0, 0.0, 0, 0.0, exact)
+        win = self.win / self.total
+        tie = self.tie / self.total
+        return EquityResult(
+            win=win,
+            tie=tie,
+            lose=max(0.0, 1.0 - win - tie),
+            equity=self.share / self.total,
+            samples=self.count,
+            std_error=0.0 if exact else self.std_error,
+            exact=exact,
+        )
+
+
+def exact_evaluation_count(board_size: int, num_opponents: int = 1, known: int = 2) -> int:
+    """全列挙で評価するシナリオ数（ヘッズアップ以外は対象外として0を返す）"""
+    if num_opponents != 1:
+        return 0
+    remaining = 52 - known - board_size
+    return comb(remaining, 5 - board_size) * comb(remaining - (5 - board_size), 2)
+
+
+def _enumerate_chunk(
+    hole: List[int], board: List[int], runouts: np.ndarray, remaining: List[int]
+) -> _Tally:
+    """ボードの残り札 runouts（[M, r]）について相手ハンドを全列挙して集計"""
+    tally = _Tally()
+    villain_combos = np.array(list(combinations(remaining, 2)), dtype=np.intp)
+    board_arr = np.array(board, dtype=np.intp)
+
+    for runout in runouts:
+        full_board = np.concatenate([board_arr, runout])
+        # ランアウトと重なる相手ハンドを除外
+        mask = ~np.isin(villain_combos, runout).any(axis=1)
+        villains = villain_combos[mask]
+        boards = np.broadcast_to(full_board, (len(villains), 5))
+        hero_strength = HandEvaluator.evaluate_ids(hole + full_board.tolist())
+        villain_strength = HandEvaluator.evaluate_batch(villains, boards)
+        tally.add(
+            np.full(len(villains), hero_strength, dtype=np.int64),
+            villain_strength[:, None],
+        )
+    return tally
+
+
+def enumerate_equity(
+    hole: Sequence[CardLike],
+    board: Sequence[CardLike] = (),
+    dead: Sequence[CardLike] = (),
+    processes: Optional[int] = None,
+) -> EquityResult:
+    """
+    ランダムな相手1人に対するエクイティを全列挙で厳密に計算
+
+    ターン・リバーでは数万通り以下なので数ミリ秒で終わる。
+    フロップ（約90万通り）は processes を指定するとプロセスプールで分割する。
+
+    Args:
+        hole: 自分のホールカード（2枚）
+        board: コミュニティカード（0〜5枚）
+        dead: 除外するカード（公開されたフォールドカードなど）
+        processes: 並列ワーカー数（None/1 ならシングルプロセス）
+    """
+    hole_ids, board_ids, dead_ids = to_card_ids(hole), to_card_ids(board), to_card_ids(dead)
+    _validate(hole_ids, board_ids, dead_ids, 1)
+
+    known = set(hole_ids + board_ids + dead_ids)
+    remaining = [card_id for card_id in range(52) if card_id not in known]
+    runout_size = 5 - len(board_ids)
+    runouts = np.array(
+        list(combinations(remaining, runout_size)), dtype=np.intp
+    ).reshape(comb(len(remaining), runout_size), runout_size)
+
+    if processes and processes > 1 and len(runouts) > 1:
+        chunks = np.array_split(runouts, processes * 4)
+        tally = _Tally()
+        pool = _get_pool(processes)
+        futures = [
+            pool.submit(_enumerate_chunk, hole_ids, board_ids, chunk, remaining)
+            for chunk in chunks
+            if len(chunk)
+        ]
+        for future in futures:
+            tally.merge(future.result())
+        return tally.result(exact=True)
+
+    return _enumerate_chunk(hole_ids, board_ids, runouts, remaining).result(exact=True)
+
+
+def _sample_chunk(
+    hole: List[int],
+    board: List[int],
+    remaining: List[int],
+    num_opponents: int,
+    samples: int,
+    seed: Any,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    target_std_error: Optional[float] = None,
+    min_samples: int = 0,
+) -> _Tally:
+    """Monte Carlo サンプリングを samples 回（または標準誤差の目標到達まで）実行"""
+    rng = np.random.default_rng(seed)
+    deck = np.array(remaining, dtype=np.intp)
+    board_arr = np.array(board, dtype=np.intp)
+    hole_arr = np.array(hole, dtype=np.intp)
+    runout_size = 5 - len(board)
+    needed = runout_size + 2 * num_opponents
+    tally = _Tally()
+
+    while tally.count < samples:
+        size = min(batch_size, samples - tally.count)
+        # 各行で残りデッキから needed 枚を重複なしで抽出
+        picks = deck[np.argsort(rng.random((size, len(deck))), axis=1)[:, :needed]]
+        boards = np.concatenate(
+            [np.broadcast_to(board_arr, (size, len(board))), picks[:, :runout_size]],
+            axis=1,
+        )
+        hero = HandEvaluator.evaluate_batch(
+            np.broadcast_to(hole_arr, (size, 2)), boards
+        )
+        villain_holes = picks[:, runout_size:].reshape(size, num_opponents, 2)
+        villains = np.stack(
+            [
+                HandEvaluator.evaluate_batch(villain_holes[:, v], boards)
+                for v in range(num_opponents)
+            ],
+            axis=1,
+        )
+        tally.add(hero, villains)
+
+        if (
+            target_std_error is not None
+            and tally.count >= min_samples
+            and tally.std_error < target_std_error
+        ):
+            break
+    return tally
+
+
+def monte_carlo_equity(
+    hole: Sequence[CardLike],
+    board: Sequence[CardLike] = (),
+    num_opponents: int = 1,
+    dead: Sequence[CardLike] = (),
+    target_std_error: Optional[float] = 0.005,
+    min_samples: int = 1_000,
+    max_samples: int = 100_000,
+    seed: Optional[int] = None,
+    processes: Optional[int] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> EquityResult:
+    """
+    ランダムな相手 num_opponents 人に対するエクイティを Monte Carlo で計算
+
+    target_std_error を指定すると、equity の標準誤差がその値を下回った時点で
+    打ち切る（デフォルト 0.5%）。None の場合は max_samples 回すべて実行する。
+
+    Args:
+        hole: 自分のホールカード（2枚）
+        board: コミュニティカード（0〜5枚）
+        num_opponents: 相手の人数
+        dead: 除外するカード
+        target_std_error: 打ち切りに使う標準誤差の目標値
+        min_samples: 打ち切り判定を始める最小試行数
+        max_samples: 最大試行数
+        seed: 乱数シード（再現性が必要な場合）
+        processes: 並列ワーカー数。max_samples が大きい場合にプロセスプールで分割する
+        batch_size: 1回のバッチで評価する試行数
+    """
+    hole_ids, board_ids, dead_ids = to_card_ids(hole), to_card_ids(board), to_card_ids(dead)
+    _validate(hole_ids, board_ids, dead_ids, num_opponents)
+
+    known = set(hole_ids + board_ids + dead_ids)
+    remaining = [card_id for card_id in range(52) if card_id not in known]
+
+    if (
+        processes
+        and processes > 1
+        and target_std_error is None
+        and max_samples >= DEFAULT_PARALLEL_THRESHOLD
+    ):
+        seeds = np.random.SeedSequence(seed).spawn(processes)
+        per_worker = -(-max_samples // processes)
+        pool = _get_pool(processes)
+        futures = [
+            pool.submit(
+                _sample_chunk,
+                hole_ids,
+                board_ids,
+                remaining,
+                num_opponents,
+                per_worker,
+                child,
+                batch_size,
+            )
+            for child in seeds
+        ]
+        tally = _Tally()
+        for future in futures:
+            tally.merge(future.result())
+        return tally.result(exact=False)
+
+    tally = _sample_chunk(
+        hole_ids,
+        board_ids,
+        remaining,
+        num_opponents,
+        max_samples,
+        seed,
+        batch_size,
+        target_std_error,
+        min_samples,
+    )
+    return tally.result(exact=False)
+
+
+def calculate_equity(
+    hole: Sequence[CardLike],
+    board: Sequence[CardLike] = (),
+    num_opponents: int = 1,
+    dead: Sequence[CardLike] = (),
+    target_std_error: float = 0.005,
+    exact_limit: int = DEFAULT_EXACT_LIMIT,
+    seed: Optional[int] = None,
+) -> EquityResult:
+    """
+    エージェント向けのエクイティ計算
+
+    ヘッズアップで全列挙が exact_limit 通り以下（ターン・リバー）なら厳密計算、
+    それ以外（プリフロップ、フロップ、マルチウェイ）は標準誤差 target_std_error で
+    打ち切る Monte Carlo を使う。いずれも数ミリ秒〜数十ミリ秒で返る。
+
+    Args:
+        hole: 自分のホールカード（2枚）
+        board: コミュニティカード（0〜5枚）
+        num_opponents: 相手の人数
+        dead: 除外するカード
+        target_std_error: Monte Carlo の打ち切りに使う標準誤差
+        exact_limit: 厳密計算を選ぶ評価回数の上限
+        seed: 乱数シード
+
+    Returns:
+        EquityResult: win/tie/lose の割合と equity
+    """
+    known = len(hole) + len(dead)
+    count = exact_evaluation_count(len(board), num_opponents, known)
+    if 0 < count <= exact_limit:
+        return enumerate_equity(hole, board, dead)
+    return monte_carlo_equity(
+        hole,
+        board,
+        num_opponents,
+        dead,
+        target_std_error=target_std_error,
+        seed=seed,
+    )
+
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_size = 0
+
+
+def _get_pool(processes: int) -> ProcessPoolExecutor:
+    """大きな計算用のプロセスプールを取得（同じワーカー数なら使い回す）"""
+    global _pool, _pool_size
+    processes = min(processes, os.cpu_count() or 1)
+    if _pool is None or _pool_size != processes:
+        if _pool is not None:
+            _pool.shutdown(wait=False)
+        _pool = ProcessPoolExecutor(max_workers=processes)
+        _pool_size = processes
+    return _pool
@@ -2,10 +2,17 @@
 Poker hand evaluation system
 """
 
-from typing import List, Tuple, Optional
+from typing import List, Tuple, Optional, Sequence
 from enum import Enum
 from collections import Counter
 from .game_models import Card
+from .evaluator_backends import (
+    DEFAULT_BACKEND,
+    EvaluatorBackend,
+    configured_backend_name,
+    get_backend,
+)
+from .hand_tables import CATEGORY_SHIFT, pack_strength, unpack_strength
 
 
 class HandRank(Enum):
@@ -54,6 +61,11 @@ class HandResult:
         """ハンドの強さが同じかチェック"""
         return self.rank == other.rank and self.kickers == other.kickers
 
+    @property
+    def strength(self) -> int:
+        """HandEvaluator.evaluate_strength と同じ尺度の強さ"""
+        return pack_strength(self.rank.value, self.kickers)
+
     def __str__(self):
         return f"{self.description} - {', '.join(str(card) for card in self.cards)}"
 
@@ -61,6 +73,73 @@ class HandResult:
 class HandEvaluator:
     """ハンド評価クラス"""
 
+    # evaluate_ids / evaluate_batch が使う実装（poker.evaluator_backends）
+    backend: EvaluatorBackend = get_backend(DEFAULT_BACKEND)
+
+    @staticmethod
+    def evaluate_strength(
+        hole_cards: List[Card], community_cards: List[Card] = ()
+    ) -> int:
+        """
+        ホールカードとコミュニティカードから最強ハンドの強さを整数で評価
+
+        HandResult を作らずにルックアップテーブルだけで評価するため、
+        勝敗判定やエクイティ計算など比較だけが必要な場面ではこちらを使う。
+
+        Args:
+            hole_cards: プレイヤーの手札（2枚）
+            community_cards: コミュニティカード（最大5枚）
+
+        Returns:
+            int: ハンドの強さ（大きいほど強い。同じ値なら引き分け）
+        """
+        return HandEvaluator.evaluate_ids(
+            [card.id for card in hole_cards] + [card.id for card in community_cards]
+        )
+
+    @staticmethod
+    def evaluate_ids(card_ids: Sequence[int]) -> int:
+        """
+        カードID（0..51）の列から最強ハンドの強さを整数で評価
+
+        Args:
+            card_ids: 評価するカードIDの列（通常5〜7枚）
+
+        Returns:
+            int: evaluate_strength と同じ尺度の強さ
+        """
+        return HandEvaluator.backend.evaluate_ids(card_ids)
+
+    @staticmethod
+    def evaluate_batch(hole, board):
+        """
+        複数ハンドをまとめて評価（NumPy によるベクトル化）
+
+        Monte Carlo のエクイティ計算やレンジ同士の対戦表など、
+        大量のハンドを一度に評価する場面で使う。結果は evaluate_ids と完全に一致する。
+
+        Args:
+            hole: ホールカードのカードID配列（shape: [N, 2]）
+            board: ボードのカードID配列（shape: [N, 3〜5]）
+
+        Returns:
+            numpy.ndarray: 各ハンドの強さ（shape: [N], dtype: int64）
+        """
+        return HandEvaluator.backend.evaluate_batch(hole, board)
+
+    @staticmethod
+    def set_backend(name: str) -> EvaluatorBackend:
+        """
+        評価バックエンドを切り替える（"lookup" / "reference" / "treys"）
+
+        起動時のバックエンドは環境変数 POKER_EVALUATOR_BACKEND で指定できる。
+        """
+        backend = get_backend(name)
+        if not backend.strength_scale:
+            raise ValueError(f"{name} backend can only be used for differential testing")
+        HandEvaluator.backend = backend
+        return backend
+
     @staticmethod
     def evaluate_hand(
         hole_cards: List[Card], community_cards: List[Card]
@@ -76,6 +155,104 @@ class HandEvaluator:
             HandResult: 最強ハンドの評価結果
         """
         all_cards = hole_cards + community_cards
+        strength = HandEvaluator.evaluate_strength(hole_cards, community_cards)
+        return HandEvaluator.hand_result_from_strength(strength, all_cards)
+
+    @staticmethod
+    def hand_rank_of(strength: int) -> HandRank:
+        """強さの整数から役を取得"""
+        return HandRank(strength >> CATEGORY_SHIFT)
+
+    @staticmethod
+    def hand_result_from_strength(strength: int, cards: List[Card]) -> HandResult:
+        """
+        evaluate_strength の結果から HandResult（最強の5枚と説明）を組み立てる
+
+        説明文やベストハンドの表示が必要なときだけ呼び出す。
+
+        Args:
+            strength: evaluate_strength の戻り値
+            cards: 評価に使った全カード（ホールカード + コミュニティカード）
+        """
+        category, kickers = unpack_strength(strength)
+        rank = HandRank(category)
+
+        if len(cards) < 5:
+            sorted_cards = sorted(cards, key=lambda c: c.rank, reverse=True)
+            return HandResult(
+                rank, sorted_cards, kickers, f"High Card: {sorted_cards[0]}"
+            )
+
+        # 必要なランクと枚数を役から復元する
+        pool = cards
+        if rank in (HandRank.ROYAL_FLUSH, HandRank.STRAIGHT_FLUSH, HandRank.FLUSH):
+            suit_counts = Counter(c.suit for c in cards)
+            flush_suit = max(suit_counts, key=suit_counts.get)
+            pool = [c for c in cards if c.suit == flush_suit]
+
+        if rank in (
+            HandRank.ROYAL_FLUSH,
+            HandRank.STRAIGHT_FLUSH,
+            HandRank.STRAIGHT,
+        ):
+            high = kickers[0]
+            needed = {(r if r >= 2 else 14): 1 for r in range(high - 4, high + 1)}
+        elif rank == HandRank.FOUR_OF_A_KIND:
+            needed = {kickers[0]: 4, kickers[1]: 1}
+        elif rank == HandRank.FULL_HOUSE:
+            needed = {kickers[0]: 3, kickers[1]: 2}
+        elif rank == HandRank.THREE_OF_A_KIND:
+            needed = {kickers[0]: 3, kickers[1]: 1, kickers[2]: 1}
+        elif rank == HandRank.TWO_PAIR:
+            needed = {kickers[0]: 2, kickers[1]: 2, kickers[2]: 1}
+        elif rank == HandRank.ONE_PAIR:
+            needed = {kickers[0]: 2}
+            needed.update({k: 1 for k in kickers[1:]})
+        else:
+            needed = {k: 1 for k in kickers}
+
+        # 同じランクが複数ある場合は後ろのカードを優先する（総当たり版と同じ選び方）
+        chosen = []
+        for card in reversed(pool):
+            if needed.get(card.rank, 0) > 0:
+                needed[card.rank] -= 1
+                chosen.append(card)
+        chosen.reverse()
+        sorted_cards = sorted(chosen, key=lambda c: c.rank, reverse=True)
+
+        if rank == HandRank.ROYAL_FLUSH:
+            description = "Royal Flush"
+        elif rank == HandRank.STRAIGHT_FLUSH:
+            description = f"Straight Flush: {sorted_cards[0]}-high"
+        elif rank == HandRank.FOUR_OF_A_KIND:
+            description = f"Four of a Kind: {Card.RANK_NAMES[kickers[0]]}s"
+        elif rank == HandRank.FULL_HOUSE:
+            description = f"Full House: {Card.RANK_NAMES[kickers[0]]}s over {Card.RANK_NAMES[kickers[1]]}s"
+        elif rank == HandRank.FLUSH:
+            description = f"Flush: {sorted_cards[0]}-high"
+        elif rank == HandRank.STRAIGHT:
+            description = f"Straight: {Card.RANK_NAMES[kickers[0]]}-high"
+        elif rank == HandRank.THREE_OF_A_KIND:
+            description = f"Three of a Kind: {Card.RANK_NAMES[kickers[0]]}s"
+        elif rank == HandRank.TWO_PAIR:
+            description = f"Two Pair: {Card.RANK_NAMES[kickers[0]]}s and {Card.RANK_NAMES[kickers[1]]}s"
+        elif rank == HandRank.ONE_PAIR:
+            description = f"One Pair: {Card.RANK_NAMES[kickers[0]]}s"
+        else:
+            description = f"High Card: {sorted_cards[0]}"
+
+        return HandResult(rank, sorted_cards, kickers, description)
+
+    @staticmethod
+    def _evaluate_hand_reference(
+        hole_cards: List[Card], community_cards: List[Card]
+    ) -> HandResult:
+        """
+        全21通りの5枚の組み合わせを総当たりする参照実装
+
+        ルックアップテーブル版の検証用に残している。
+        """
+        all_cards = hole_cards + community_cards
 
         if len(all_cards) < 5:
             # 5枚未満の場合はハイカードとして評価
@@ -122,7 +299,7 @@ class HandEvaluator:
         is_straight = HandEvaluator._is_straight(ranks)
 
         # ロイヤルフラッシュ
-        if is_flush and is_straight and ranks[0] == 14:  # A-K-Q-J-10
+        if is_flush and is_straight and ranks[:2] == [14, 13]:  # A-K-Q-J-10（A-5は除く）
             return HandResult(HandRank.ROYAL_FLUSH, sorted_cards, [14], "Royal Flush")
 
         # ストレートフラッシュ
@@ -277,3 +454,7 @@ class HandEvaluator:
             HandRank.HIGH_CARD: "ハイカード",
         }
         return descriptions.get(hand.rank, "不明なハンド")
+
+
+if configured_backend_name() != DEFAULT_BACKEND:
+    HandEvaluator.set_backend(configured_backend_name())
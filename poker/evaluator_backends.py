@@ -0,0 +1,232 @@
+"""
+Pluggable hand evaluator backends
+
+HandEvaluator.evaluate_ids / evaluate_batch が実際の評価に使う実装を切り替える。
+どのバックエンドも HandEvaluator.evaluate_strength と同じ尺度の strength を返す。
+
+- "lookup": ルックアップテーブル（デフォルト。バッチ評価は NumPy）
+- "reference": 21通りの5枚を総当たりする純 Python の参照実装（検証用）
+- "treys": treys の評価値（1〜7462、小さいほど強い）を strength に変換するアダプタ
+
+差分検証専用に、順位だけを返す "pokerkit"（strength の尺度ではない）も登録している。
+
+    HandEvaluator.set_backend("treys")
+    POKER_EVALUATOR_BACKEND=reference uv run python main.py   # 環境変数でも指定可能
+
+差分検証と速度比較は benchmarks/diff_evaluators.py を参照。
+"""
+
+import os
+from typing import Callable, Dict, List, Optional, Sequence
+
+from .game_models import CARD_RANKS, CARD_SUITS, CARDS
+from .hand_tables import (
+    CARD_PRIMES,
+    CARD_RANK_BITS,
+    HIGH_CARD,
+    PRIMES,
+    get_tables,
+    pack_strength,
+)
+
+DEFAULT_BACKEND = "lookup"
+BACKEND_ENV_VAR = "POKER_EVALUATOR_BACKEND"
+
+# treys / pokerkit のカード表記（カードIDの順。スートは SUIT_ORDER = ♥♦♣♠）
+_RANK_CHARS = "23456789TJQKA"
+_SUIT_CHARS = "hdcs"
+CARD_SHORT_STRS = tuple(
+    _RANK_CHARS[CARD_RANKS[card_id] - 2] + _SUIT_CHARS[CARD_SUITS[card_id]]
+    for card_id in range(52)
+)
+
+
+def _high_card_strength(card_ids: Sequence[int]) -> int:
+    """5枚未満のハンドの強さ（ランクの高い順にハイカードとして比較）"""
+    return pack_strength(
+        HIGH_CARD, sorted((CARD_RANKS[card_id] for card_id in card_ids), reverse=True)
+    )
+
+
+class EvaluatorBackend:
+    """評価バックエンドの基底クラス"""
+
+    name = ""
+    # evaluate_strength と同じ尺度か（False なら大小関係だけが意味を持つ）
+    strength_scale = True
+
+    def evaluate_ids(self, card_ids: Sequence[int]) -> int:
+        """カードIDの列（5〜7枚）の強さ（大きいほど強い）"""
+        raise NotImplementedError
+
+    def evaluate_batch(self, hole, board):
+        """複数ハンドをまとめて評価（デフォルトは evaluate_ids のループ）"""
+        import numpy as np
+
+        cards = np.concatenate(
+            [np.asarray(hole, dtype=np.intp), np.asarray(board, dtype=np.intp)],
+            axis=1,
+        )
+        if cards.shape[1] < 5 or cards.shape[1] > 7:
+            raise ValueError("evaluate_batch requires 5 to 7 cards per hand")
+        evaluate = self.evaluate_ids
+        return np.fromiter(
+            (evaluate(row) for row in cards.tolist()), dtype=np.int64, count=len(cards)
+        )
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}()"
+
+
+class LookupBackend(EvaluatorBackend):
+    """素数の積とスート別ランクマスクのルックアップテーブルによる評価"""
+
+    name = "lookup"
+
+    def evaluate_ids(self, card_ids: Sequence[int]) -> int:
+        if len(card_ids) < 5:
+            return _high_card_strength(card_ids)
+
+        tables = get_tables()
+        product = 1
+        suit_masks = [0, 0, 0, 0]
+        for card_id in card_ids:
+            product *= CARD_PRIMES[card_id]
+            suit_masks[CARD_SUITS[card_id]] |= CARD_RANK_BITS[card_id]
+
+        strength = tables.nonflush[product]
+        flush = tables.flush
+        for mask in suit_masks:
+            if flush[mask] > strength:
+                strength = flush[mask]
+        return strength
+
+    def evaluate_batch(self, hole, board):
+        import numpy as np
+
+        arrays = get_tables().numpy_arrays()
+        cards = np.concatenate(
+            [np.asarray(hole, dtype=np.intp), np.asarray(board, dtype=np.intp)],
+            axis=1,
+        )
+        if cards.shape[1] < 5 or cards.shape[1] > 7:
+            raise ValueError("evaluate_batch requires 5 to 7 cards per hand")
+
+        products = arrays["card_primes"][cards].prod(axis=1)
+        keys = arrays["nonflush_keys"]
+        strengths = arrays["nonflush_values"][np.searchsorted(keys, products)]
+
+        # スートごとのフラッシュ系の強さと比べて大きい方を採用する
+        # （カードは重複しないのでビットの合計がスート別ランクマスクの連結になる）
+        suit_bits = arrays["card_suit_bits"][cards].sum(axis=1)
+        for suit in range(4):
+            suit_masks = (suit_bits >> (13 * suit)) & 0x1FFF
+            np.maximum(strengths, arrays["flush"][suit_masks], out=strengths)
+        return strengths
+
+
+class ReferenceBackend(EvaluatorBackend):
+    """HandEvaluator._evaluate_hand_reference（総当たり）による評価"""
+
+    name = "reference"
+
+    def evaluate_ids(self, card_ids: Sequence[int]) -> int:
+        from .evaluator import HandEvaluator
+
+        cards = [CARDS[card_id] for card_id in card_ids]
+        return HandEvaluator._evaluate_hand_reference(cards[:2], cards[2:]).strength
+
+
+class TreysBackend(EvaluatorBackend):
+    """
+    treys.Evaluator のアダプタ
+
+    treys の評価値（1 = ロイヤルフラッシュ 〜 7462 = 7-5-4-3-2）から strength への
+    変換表を、treys の5枚の役表を参照実装で評価して初回使用時に作る。
+    """
+
+    name = "treys"
+
+    def __init__(self):
+        from treys import Card as TreysCard
+        from treys import Evaluator
+
+        self._evaluator = Evaluator()
+        self._cards = tuple(TreysCard.new(text) for text in CARD_SHORT_STRS)
+        self._strengths: Optional[List[int]] = None
+
+    def _build_strengths(self) -> List[int]:
+        from .evaluator import HandEvaluator
+
+        strengths = [0] * 7463
+        lookup = self._evaluator.table
+        for table, suited in ((lookup.flush_lookup, True), (lookup.unsuited_lookup, False)):
+            for product, treys_rank in table.items():
+                ranks = []
+                for prime_index in range(12, -1, -1):
+                    while product % PRIMES[prime_index] == 0:
+                        product //= PRIMES[prime_index]
+                        ranks.append(prime_index + 2)
+                # フラッシュは同じスート、それ以外は同じランクが同じスートにならないよう順に割り当てる
+                card_ids = [
+                    (rank - 2) * 4 + (3 if suited else position % 4)
+                    for position, rank in enumerate(ranks)
+                ]
+                strengths[treys_rank] = HandEvaluator._evaluate_five_cards(
+                    [CARDS[card_id] for card_id in card_ids]
+                ).strength
+        return strengths
+
+    def evaluate_ids(self, card_ids: Sequence[int]) -> int:
+        if len(card_ids) < 5:
+            return _high_card_strength(card_ids)
+        if self._strengths is None:
+            self._strengths = self._build_strengths()
+        cards = self._cards
+        return self._strengths[
+            self._evaluator.evaluate([cards[card_id] for card_id in card_ids], [])
+        ]
+
+
+class PokerkitBackend(EvaluatorBackend):
+    """pokerkit.StandardHighHand の順位（0〜7461、大きいほど強い）。差分検証専用"""
+
+    name = "pokerkit"
+    strength_scale = False
+
+    def __init__(self):
+        from pokerkit import StandardHighHand
+
+        self._hand_type = StandardHighHand
+
+    def evaluate_ids(self, card_ids: Sequence[int]) -> int:
+        if len(card_ids) < 5:
+            raise ValueError("pokerkit backend requires 5 to 7 cards")
+        text = "".join(CARD_SHORT_STRS[card_id] for card_id in card_ids)
+        return self._hand_type.from_game(text[:4], text[4:]).entry.index
+
+
+BACKENDS: Dict[str, Callable[[], EvaluatorBackend]] = {
+    "lookup": LookupBackend,
+    "reference": ReferenceBackend,
+    "treys": TreysBackend,
+    "pokerkit": PokerkitBackend,
+}
+
+_instances: Dict[str, EvaluatorBackend] = {}
+
+
+def get_backend(name: str) -> EvaluatorBackend:
+    """名前からバックエンドを取得（プロセス内で1つのインスタンスを共有）"""
+    if name not in BACKENDS:
+        raise ValueError(
+            f"Unknown evaluator backend: {name} (choose from {', '.join(BACKENDS)})"
+        )
+    if name not in _instances:
+        _instances[name] = BACKENDS[name]()
+    return _instances[name]
+
+
+def configured_backend_name() -> str:
+    """環境変数 POKER_EVALUATOR_BACKEND で指定されたバックエンド名（未指定なら lookup）"""
+    return os.getenv(BACKEND_ENV_VAR, DEFAULT_BACKEND) or DEFAULT_BACKEND
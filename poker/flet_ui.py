@@ -75,6 +75,10 @@ class PokerFletUI:
 
     def start_game(self):
         """ゲームを開始"""
+        # 前のゲームの履歴を書き出して閉じる
+        if self.game is not None:
+            self.game.close()
+
         # ゲームセットアップ
         self.game = PokerGame()
         self.game.setup_configurable_game_with_models(self.player_configs)
@@ -110,6 +114,10 @@ class PokerFletUI:
 
     def start_new_game(self):
         """新しいゲームを開始"""
+        # 前のゲームの履歴を書き出して閉じる
+        if self.game is not None:
+            self.game.close()
+
         # ゲームセットアップ
         self.game = PokerGame()
         self.game.setup_configurable_game_with_models(self.player_configs)
@@ -147,7 +155,14 @@ class PokerFletUI:
         threading.Thread(target=self.game_loop, daemon=True).start()
 
     def game_loop(self):
-        """メインゲームループ"""
+        """メインゲームループ（終わったらゲームを閉じ、アクション履歴を履歴DBに書き出す）"""
+        game = self.game
+        try:
+            self._run_game_loop()
+        finally:
+            game.close()
+
+    def _run_game_loop(self):
         while not self.game.is_game_over():
             # 新しいハンドを開始
             self.game.start_new_hand()
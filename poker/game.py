@@ -5,20 +5,33 @@ Texas Hold'em Poker Game Management
 import json
 import random
 import logging
+import concurrent.futures as cf
 from typing import List, Dict, Any, Optional, Tuple
 from enum import Enum
 
-from .game_models import Deck, GamePhase, GameState, PlayerInfo
+from .game_models import CARDS, Deck, GamePhase, GameState, PlayerInfo, hand_seed
 from .player_models import (
     Player,
     HumanPlayer,
     RandomPlayer,
     LLMPlayer,
     LLMApiPlayer,
+    LocalAgentPlayer,
     PlayerStatus,
 )
-from .evaluator import HandEvaluator, HandResult
+from .evaluator import HandResult
+from .hand_tracker import HandTracker
 from .game_history import GameHistoryDB
+from .table_state import TableState
+from .seat_ring import SeatRing
+from .pot_ledger import Pot, PotLedger
+from .action_log import (
+    DEFAULT_HISTORY_DEPTH,
+    ActionEvent,
+    ActionHistoryView,
+    ActionLog,
+    EventJson,
+)
 
 # ゲーム専用のロガーを設定
 game_logger = logging.getLogger("poker_game")
@@ -33,29 +46,60 @@ if not game_logger.handlers:
     handler.setFormatter(formatter)
     game_logger.addHandler(handler)
 
+# ヘッドレスモード用のロガー（何も出力せず、%形式の引数も文字列化されない）
+headless_logger = logging.getLogger("poker_game.headless")
+headless_logger.setLevel(logging.CRITICAL + 1)
+headless_logger.propagate = False
+
 
 class PokerGame:
     """テキサスホールデムゲーム管理クラス"""
 
     def __init__(
-        self, small_blind: int = 10, big_blind: int = 20, initial_chips: int = 2000, uuid_suffix: str = None
+        self,
+        small_blind: int = 10,
+        big_blind: int = 20,
+        initial_chips: int = 2000,
+        uuid_suffix: str = None,
+        headless: bool = False,
+        db_path: str = None,
+        logger: Optional[logging.Logger] = None,
+        seed: Optional[int] = None,
+        history_depth: Optional[int] = DEFAULT_HISTORY_DEPTH,
     ):
+        """
+        Args:
+            headless: True ならシミュレーション専用モード（DBを作らず、
+                ログの整形・出力とゲーム状態のダンプを行わない）
+            db_path: ゲーム履歴DBのパス（None なら db/ 以下に自動作成）
+            logger: ゲームログの出力先（None なら poker_game ロガー）
+            seed: 配札の乱数シード。各ハンドのデッキは hand_seed(seed, hand_number)
+                で初期化されるので、シードとハンド番号から配札を再現できる
+                （None ならランダムに決めてログに出力する）
+            history_depth: アクション履歴に残す終わったハンドの数。あふれた古いハンドは
+                履歴DBの hand_logs に書き出してメモリから捨てる（None なら無制限）
+        """
         self.small_blind = small_blind
         self.big_blind = big_blind
         self.initial_chips = initial_chips
 
         # プレイヤー管理
+        # 座席ごとの状態のビットマスク（players を入れ替えたときと人数が変わったときに seats で作り直す）
+        self._seats = SeatRing()
         self.players: List[Player] = []
         self.dealer_button = 0
         self.current_player_index = 0
 
         # ゲーム状態
-        self.deck = Deck()
+        self.seed = seed if seed is not None else random.SystemRandom().getrandbits(63)
+        self.deck = Deck(self.seed)
         self.community_cards = []
         self.current_phase = GamePhase.PREFLOP
         self.pot = 0
         self.current_bet = 0  # 現在の最高ベット額
         self.hand_number = 0
+        # メインポット/サイドポットの階層（ベットのたびに更新）
+        self.pot_ledger = PotLedger()
 
         # ベッティング管理
         self.betting_round_complete = False
@@ -63,8 +107,15 @@ class PokerGame:
         # このベッティングラウンドでブラインド以外の「ベット/レイズ」が発生したか
         self.has_bet_or_raise_this_round = False
 
-        # アクション履歴
-        self.action_history = []
+        # アクション履歴（ActionEvent をハンドごとに保持。文字列化は必要なときだけ）
+        # 進行中のハンド + 直近 history_depth ハンドのみ保持する
+        self.history_depth = history_depth
+        self.action_log = ActionLog(history_depth, self._archive_hand)
+        # ハンド番号 -> DB の hand_id（アクション履歴に残っているハンドのみ）
+        self._db_hand_ids: Dict[int, int] = {}
+
+        # プレイヤーごとの役の差分評価（ハンドごとに作り直す）
+        self.hand_trackers: Dict[int, HandTracker] = {}
 
         # ゲーム統計
         self.game_stats = {"hands_played": 0, "players_eliminated": []}
@@ -72,15 +123,24 @@ class PokerGame:
         # 最後に実行したショーダウン結果（観戦UI向けに公開するため）
         self.last_showdown_results: Optional[Dict[str, Any]] = None
 
-        # ゲーム履歴データベース
-        self.db = GameHistoryDB(uuid_suffix=uuid_suffix)  # 統一UUID付きで自動作成
+        # ヘッドレスモードでは出力しないロガーを使う
+        self.headless = headless
+        self.logger = headless_logger if headless else (logger or game_logger)
+
+        # ゲーム履歴データベース（ヘッドレスモードでは作成しない）
+        self.db: Optional[GameHistoryDB] = (
+            None
+            if headless
+            else GameHistoryDB(db_path=db_path, uuid_suffix=uuid_suffix)
+        )  # 統一UUID付きで自動作成
         self.current_hand_id: Optional[int] = None
 
-        game_logger.info(
-            "PokerGame initialized with SB=%d, BB=%d, initial_chips=%d",
+        self.logger.info(
+            "PokerGame initialized with SB=%d, BB=%d, initial_chips=%d, seed=%d",
             small_blind,
             big_blind,
             initial_chips,
+            self.seed,
         )
 
     def add_player(self, player: Player):
@@ -89,6 +149,24 @@ class PokerGame:
             raise ValueError("Maximum 10 players allowed")
         self.players.append(player)
 
+    @property
+    def players(self) -> List[Player]:
+        return self._players
+
+    @players.setter
+    def players(self, players: List[Player]):
+        # 同じ人数のプレイヤーに入れ替えた場合も、古いプレイヤーのリングを使わない
+        self._players = players
+        self._seats = SeatRing()
+
+    @property
+    def seats(self) -> SeatRing:
+        """players の SeatRing（players を入れ替えたか人数が変わっていれば作り直す）"""
+        ring = self._seats
+        if ring.size != len(self._players):
+            ring = self._seats = SeatRing(self._players)
+        return ring
+
     def get_player(self, player_id: int) -> Optional[Player]:
         """プレイヤーIDでプレイヤーを取得"""
         for player in self.players:
@@ -96,6 +174,78 @@ class PokerGame:
                 return player
         return None
 
+    def get_hand_tracker(self, player_id: int) -> Optional[HandTracker]:
+        """
+        プレイヤーの現在のハンドの HandTracker を取得
+
+        前回の呼び出し以降に配られたカードだけを追加するため、
+        同じストリート内で何度呼んでも評価は繰り返されない。
+        """
+        player = self.get_player(player_id)
+        if player is None or not player.hole_cards:
+            return None
+        tracker = self.hand_trackers.get(player_id)
+        if tracker is None:
+            tracker = HandTracker(player.hole_cards, self.community_cards)
+        else:
+            tracker = tracker.sync(player.hole_cards, self.community_cards)
+        self.hand_trackers[player_id] = tracker
+        return tracker
+
+    @property
+    def action_history(self) -> ActionHistoryView:
+        """アクション履歴を従来どおり文字列のシーケンスとして読む（要素は遅延で文字列化）"""
+        return ActionHistoryView(self.action_log)
+
+    @action_history.setter
+    def action_history(self, texts: List[str]):
+        self._db_hand_ids = {}
+        self.action_log = ActionLog.from_strings(
+            texts, depth=self.history_depth, on_evict=self._archive_hand
+        )
+
+    def _archive_hand(self, hand_number: int, events: List[ActionEvent]):
+        """アクション履歴からあふれたハンドを履歴DBに書き出す"""
+        hand_id = self._db_hand_ids.pop(hand_number, None)
+        if self.db is None or hand_id is None:
+            return
+        self.db.record_hand_log(
+            hand_id,
+            hand_number,
+            [dict(event.to_dict(), text=event.text) for event in events],
+        )
+
+    def close(self):
+        """
+        ゲームを終える（アクション履歴に残っているハンドを履歴DBに書き出してからDBを閉じる）
+
+        アクション履歴からあふれるまでハンドは DB に書き出されないので、UI やランナーは
+        終了時に必ず呼ぶこと。エージェントのセッション（session_scope="game" なら
+        ゲームの間ずっと使っていたもの）もここで削除する。何度呼んでもよく、
+        閉じた後のハンドは DB に記録されない。
+        """
+        for player in self.players:
+            close_session = getattr(player, "close_session", None)
+            if close_session is not None:
+                close_session()
+        if self.db is None:
+            return
+        self.action_log.flush()
+        if self.action_log.current:
+            # 進行中（または最後に終わった）ハンド
+            self._archive_hand(self.action_log.hand, list(self.action_log.current))
+        self.db.close()
+        self.db = None
+        self.current_hand_id = None
+
+    def _record_event(
+        self, kind: str, player: Optional[int] = None, amount: int = 0, detail: Any = None
+    ) -> ActionEvent:
+        """現在のハンド・フェーズのイベントをアクション履歴に追加"""
+        return self.action_log.add(
+            self.hand_number, self.current_phase.value, kind, player, amount, self.pot, detail
+        )
+
     def setup_default_game(self):
         """デフォルトの4人ゲームをセットアップ"""
         self.add_player(HumanPlayer(0, "You", self.initial_chips))
@@ -144,7 +294,8 @@ class PokerGame:
     def setup_configurable_game_with_models(self, player_configs: List[Dict[str, Any]]):
         """
         カスタマイズ可能なゲームをセットアップ（2〜4人、モデル・Agent指定対応）
-        player_configs: [{"type": "human|random|llm|llm_api", "model": "model_id", "agent_id": str, "user_id": str}, ...] のリスト
+        player_configs: [{"type": "human|random|llm|llm_api|llm_local", "model": "model_id", "agent_id": str, "user_id": str}, ...] のリスト
+        （llm_local は agents/ のエージェントを api_server を介さずプロセス内で実行する）
         """
         if not (2 <= len(player_configs) <= 10):
             raise ValueError("player_configs must be a list of 2 to 10 dictionaries")
@@ -169,19 +320,26 @@ class PokerGame:
                 else:
                     # デフォルトモデルを使用
                     self.add_player(LLMPlayer(i, f"AI{i}", self.initial_chips))
-            elif player_type == "llm_api":
-                # LLMApiPlayerの場合、agentパラメータが必要
+            elif player_type in ("llm_api", "llm_local"):
+                # LLMApiPlayer / LocalAgentPlayer の場合、agentパラメータが必要
                 agent_id = config.get(
                     "agent_id", "team1_agent"
                 )  # デフォルトはteam1_agent
                 user_id = config.get("user_id", f"player_{i}")
+                options = {}
+                if "session_scope" in config:
+                    options["session_scope"] = config["session_scope"]
+                if config.get("hedge_percentile") is not None and player_type == "llm_api":
+                    options["hedge_percentile"] = config["hedge_percentile"]
+                player_class = LLMApiPlayer if player_type == "llm_api" else LocalAgentPlayer
                 self.add_player(
-                    LLMApiPlayer(
+                    player_class(
                         player_id=i,
                         name=f"Agent{i}",
                         app_name=agent_id,
                         user_id=user_id,
                         initial_chips=self.initial_chips,
+                        **options,
                     )
                 )
             else:
@@ -190,13 +348,21 @@ class PokerGame:
         # ディーラーボタンをランダムに決定
         self.dealer_button = random.randint(0, len(self.players) - 1)
 
-    def start_new_hand(self):
-        """新しいハンドを開始"""
+    def start_new_hand(self, prepare_sessions: bool = True):
+        """
+        新しいハンドを開始
+
+        Args:
+            prepare_sessions: エージェントのセッションをここで作成する（非同期ドライバは
+                False にして prepare_sessions_async で作成する）
+        """
         self.hand_number += 1
-        game_logger.info(f"=== STARTING NEW HAND #{self.hand_number} ===")
+        self.logger.info("=== STARTING NEW HAND #%s ===", self.hand_number)
+        self.action_log.start_hand(self.hand_number)
 
-        self.deck.reset()
+        self.deck.reset(hand_seed(self.seed, self.hand_number))
         self.community_cards = []
+        self.hand_trackers = {}
         self.current_phase = GamePhase.PREFLOP
         self.pot = 0
         self.current_bet = 0
@@ -209,62 +375,90 @@ class PokerGame:
         # プレイヤーをリセット
         for player in self.players:
             player.reset_for_new_hand()
+        seats = self.seats
+        seats.small_blind = seats.big_blind = None
+        self.pot_ledger.reset(len(self.players))
 
         # アクティブなプレイヤー数をチェック
-        active_players = [p for p in self.players if p.status != PlayerStatus.BUSTED]
-        game_logger.info(f"Active players for new hand: {len(active_players)}")
+        active_count = seats.size - seats.count(PlayerStatus.BUSTED)
+        self.logger.info("Active players for new hand: %s", active_count)
 
-        if len(active_players) < 2:
-            game_logger.info("Not enough players - setting phase to FINISHED")
+        if active_count < 2:
+            self.logger.info("Not enough players - setting phase to FINISHED")
             self.current_phase = GamePhase.FINISHED
             return
 
+        # セッションのないエージェントの分を並行に作成
+        if prepare_sessions:
+            self.prepare_sessions()
+
         # ディーラーボタンを移動
-        game_logger.info("Moving dealer button")
+        self.logger.info("Moving dealer button")
         self._move_dealer_button()
 
         # ブラインドを設定
-        game_logger.info("Posting blinds")
+        self.logger.info("Posting blinds")
         self._post_blinds()
 
         # カードを配る
-        game_logger.info("Dealing hole cards")
+        self.logger.info("Dealing hole cards")
         self._deal_hole_cards()
 
         # 最初のアクションプレイヤーを設定
-        game_logger.info("Setting first actor for preflop")
+        self.logger.info("Setting first actor for preflop")
         self._set_first_actor_preflop()
 
         # データベースに新しいハンドを記録（player.idを使用）
-        active_player_ids = [
-            p.id for p in self.players if p.status != PlayerStatus.BUSTED
-        ]
-        self.current_hand_id = self.db.start_new_hand(
-            small_blind=self.small_blind,
-            big_blind=self.big_blind,
-            dealer_button=self.players[self.dealer_button].id,
-            player_ids=active_player_ids,
-        )
-        game_logger.info(f"Started new hand in database: hand_id={self.current_hand_id}")
+        if self.db is not None:
+            active_player_ids = [
+                p.id for p in self.players if p.status != PlayerStatus.BUSTED
+            ]
+            self.current_hand_id = self.db.start_new_hand(
+                small_blind=self.small_blind,
+                big_blind=self.big_blind,
+                dealer_button=self.players[self.dealer_button].id,
+                player_ids=active_player_ids,
+            )
+            self._db_hand_ids[self.hand_number] = self.current_hand_id
+            self.logger.info(
+                "Started new hand in database: hand_id=%s", self.current_hand_id
+            )
 
         self._log_game_state("HAND_STARTED")
 
+    def pending_sessions(self) -> List[Player]:
+        """まだセッションを作成していない（バストしていない）エージェント"""
+        return [
+            p
+            for p in self.players
+            if p.status != PlayerStatus.BUSTED and getattr(p, "session_pending", False)
+        ]
+
+    def prepare_sessions(self):
+        """pending_sessions のセッションを並行に作成（各プレイヤーの create_session）"""
+        pending = self.pending_sessions()
+        if len(pending) == 1:
+            pending[0].create_session()
+        elif pending:
+            with cf.ThreadPoolExecutor(max_workers=len(pending)) as executor:
+                list(executor.map(lambda player: player.create_session(), pending))
+        for player in pending:
+            if player.session_pending:
+                self.logger.error("Session creation failed for %s", player.name)
+
     def _move_dealer_button(self):
         """ディーラーボタンを次のアクティブプレイヤーに移動"""
-        active_players = [
-            i for i, p in enumerate(self.players) if p.status != PlayerStatus.BUSTED
-        ]
+        seats = self.seats
+        in_hand = seats.mask(PlayerStatus.ACTIVE, PlayerStatus.ALL_IN, PlayerStatus.FOLDED)
 
-        if not active_players:
+        if not in_hand:
             return
 
-        # 現在のディーラーがアクティブプレイヤーリストにない場合
-        if self.dealer_button not in active_players:
-            self.dealer_button = active_players[0]
+        # 現在のディーラーがアクティブプレイヤーにいない場合は最初の座席
+        if not in_hand >> self.dealer_button & 1:
+            self.dealer_button = seats.first_seat(in_hand)
         else:
-            current_dealer_pos = active_players.index(self.dealer_button)
-            next_dealer_pos = (current_dealer_pos + 1) % len(active_players)
-            self.dealer_button = active_players[next_dealer_pos]
+            self.dealer_button = seats.next_seat(in_hand, self.dealer_button, include_self=True)
 
         # ディーラーフラグを設定
         for i, player in enumerate(self.players):
@@ -272,30 +466,29 @@ class PokerGame:
 
     def _post_blinds(self):
         """ブラインドを投稿"""
-        active_players = [
-            i for i, p in enumerate(self.players) if p.status != PlayerStatus.BUSTED
-        ]
+        seats = self.seats
+        in_hand = seats.mask(PlayerStatus.ACTIVE, PlayerStatus.ALL_IN, PlayerStatus.FOLDED)
 
-        if len(active_players) < 2:
+        if in_hand.bit_count() < 2:
             return
 
-        dealer_pos = active_players.index(self.dealer_button)
-
-        if len(active_players) == 2:
+        if in_hand.bit_count() == 2:
             # ヘッズアップではディーラーがSB、相手がBB
             sb_pos = self.dealer_button
-            other_index = 1 - dealer_pos
-            bb_pos = active_players[other_index]
+            bb_pos = seats.next_seat(in_hand, self.dealer_button)
         else:
             # スモールブラインド（ディーラーの次）
-            sb_pos = active_players[(dealer_pos + 1) % len(active_players)]
+            sb_pos = seats.next_seat(in_hand, self.dealer_button)
             # ビッグブラインド（スモールブラインドの次）
-            bb_pos = active_players[(dealer_pos + 2) % len(active_players)]
+            bb_pos = seats.next_seat(in_hand, sb_pos)
+        seats.small_blind = sb_pos
+        seats.big_blind = bb_pos
 
         self.players[sb_pos].is_small_blind = True
         sb_amount = self.players[sb_pos].bet(self.small_blind)
         self.pot += sb_amount
-        self.action_history.append(f"Player {sb_pos} posted small blind {sb_amount}")
+        self.pot_ledger.add(sb_pos, sb_amount)
+        self._record_event("small_blind", sb_pos, sb_amount)
         
         # データベースにスモールブラインドを記録（player.idを使用）
         if self.current_hand_id is not None:
@@ -311,10 +504,11 @@ class PokerGame:
         self.players[bb_pos].is_big_blind = True
         bb_amount = self.players[bb_pos].bet(self.big_blind)
         self.pot += bb_amount
+        self.pot_ledger.add(bb_pos, bb_amount)
         self.current_bet = bb_amount
         # ビッグブラインドを最後のレイザーとして設定（プリフロップのベッティング制御のため）
         self.last_raiser_index = bb_pos
-        self.action_history.append(f"Player {bb_pos} posted big blind {bb_amount}")
+        self._record_event("big_blind", bb_pos, bb_amount)
         
         # データベースにビッグブラインドを記録（player.idを使用）
         if self.current_hand_id is not None:
@@ -336,31 +530,28 @@ class PokerGame:
 
     def _set_first_actor_preflop(self):
         """プリフロップの最初のアクションプレイヤーを設定"""
-        active_players = [
-            i
-            for i, p in enumerate(self.players)
-            if p.status not in [PlayerStatus.BUSTED, PlayerStatus.FOLDED]
-        ]
+        seats = self.seats
+        in_hand = seats.mask(PlayerStatus.ACTIVE, PlayerStatus.ALL_IN)
 
-        if len(active_players) < 2:
+        if in_hand.bit_count() < 2:
             self.betting_round_complete = True
             return
 
         # ディーラーがアクティブプレイヤーにいない場合の処理
-        if self.dealer_button not in active_players:
-            self.current_player_index = active_players[0]
+        if not in_hand >> self.dealer_button & 1:
+            self.current_player_index = seats.first_seat(in_hand)
             return
 
-        dealer_pos = active_players.index(self.dealer_button)
-
         # ヘッズアップ（2人）の場合、ディーラーが最初にアクション
-        if len(active_players) == 2:
+        if in_hand.bit_count() == 2:
             self.current_player_index = self.dealer_button
         else:
             # 3人以上の場合、ビッグブラインドの次（UTG）がアクション
             # Dealer -> SB -> BB -> UTG（最初のアクション）
-            utg_pos = (dealer_pos + 3) % len(active_players)
-            self.current_player_index = active_players[utg_pos]
+            seat = self.dealer_button
+            for _ in range(3):
+                seat = seats.next_seat(in_hand, seat, include_self=True)
+            self.current_player_index = seat
 
     def get_llm_game_state(self, player_id: int) -> GameState:
         """
@@ -396,7 +587,7 @@ class PokerGame:
         to_call = max(0, self.current_bet - player.current_bet)
 
         # 最近のアクション履歴（最新20件）
-        recent_history = self.action_history[-20:] if self.action_history else []
+        recent_history = self.action_log.tail(20)
 
         return GameState(
             your_id=player_id,
@@ -413,6 +604,7 @@ class PokerGame:
             players=players_info,
             actions=actions,
             history=recent_history,
+            pots=[pot.to_dict() for pot in self.side_pots()],
         )
 
     def _get_available_actions(self, player_id: int) -> List[str]:
@@ -452,12 +644,7 @@ class PokerGame:
             and to_call == 0
             and self.current_bet == self.big_blind
         ):
-            bb_index = None
-            for i, p in enumerate(self.players):
-                if p.is_big_blind:
-                    bb_index = i
-                    break
-            is_big_blind_option = bb_index is not None and player_id == bb_index
+            is_big_blind_option = player_id == self.seats.big_blind
 
         # 最低レイズ（総額）。オープンベット時はBB、既存ベットがある場合は current_bet + BB
         min_raise_total = (
@@ -490,83 +677,99 @@ class PokerGame:
         Returns:
             bool: アクションが正常に処理されたかどうか
         """
-        game_logger.info(
-            f">>> PROCESS_ACTION: Player {player_id} attempts '{action}' with amount {amount}"
+        self.logger.info(
+            ">>> PROCESS_ACTION: Player %s attempts '%s' with amount %s",
+            player_id,
+            action,
+            amount,
         )
         self._log_game_state("BEFORE_ACTION")
 
         if player_id != self.current_player_index:
-            game_logger.warning(
-                f"Player {player_id} tried to act but current player is {self.current_player_index}"
+            self.logger.warning(
+                "Player %s tried to act but current player is %s",
+                player_id,
+                self.current_player_index,
             )
             return False
 
         player = self.get_player(player_id)
         if player is None:
-            game_logger.error(f"Player {player_id} not found")
+            self.logger.error("Player %s not found", player_id)
             return False
         if player.status != PlayerStatus.ACTIVE:
-            game_logger.warning(
-                f"Player {player_id} is not active (status: {player.status})"
+            self.logger.warning(
+                "Player %s is not active (status: %s)", player_id, player.status
             )
             return False
 
-        action_description = ""
+        kind = action
+        event_amount = 0
 
         if action == "fold":
             player.fold()
-            action_description = f"Player {player_id} folded"
 
         elif action == "check":
             if self.current_bet > player.current_bet:
-                game_logger.warning(
-                    f"Player {player_id} cannot check - current bet {self.current_bet} > player bet {player.current_bet}"
+                self.logger.warning(
+                    "Player %s cannot check - current bet %s > player bet %s",
+                    player_id,
+                    self.current_bet,
+                    player.current_bet,
                 )
                 return False  # チェックできない状況
-            action_description = f"Player {player_id} checked"
 
         elif action == "call":
             to_call = self.current_bet - player.current_bet
             # テキサスホールデムでは to_call == 0 のとき、"call" は実質的に "check" と同義
             if to_call <= 0:
-                action_description = f"Player {player_id} checked"
+                kind = "check"
             else:
                 if player.chips < to_call:
-                    game_logger.warning(
-                        f"Player {player_id} cannot call - to_call: {to_call}, chips: {player.chips}"
+                    self.logger.warning(
+                        "Player %s cannot call - to_call: %s, chips: %s",
+                        player_id,
+                        to_call,
+                        player.chips,
                     )
                     return False
 
                 actual_call = player.bet(to_call)
                 self.pot += actual_call
-                action_description = f"Player {player_id} called {actual_call}"
+                self.pot_ledger.add(player_id, actual_call)
+                event_amount = actual_call
 
         elif action == "raise":
             to_call = self.current_bet - player.current_bet
             total_needed = to_call + amount
 
             if player.chips < total_needed:
-                game_logger.warning(
-                    f"Player {player_id} cannot raise - needs {total_needed}, has {player.chips}"
+                self.logger.warning(
+                    "Player %s cannot raise - needs %s, has %s",
+                    player_id,
+                    total_needed,
+                    player.chips,
                 )
                 return False
 
             actual_bet = player.bet(total_needed)
             self.pot += actual_bet
+            self.pot_ledger.add(player_id, actual_bet)
             self.current_bet = player.current_bet
             self.last_raiser_index = player_id
             self.has_bet_or_raise_this_round = True
-            action_description = f"Player {player_id} raised to {self.current_bet}"
+            event_amount = self.current_bet
 
         elif action == "all_in":
             if player.chips <= 0:
-                game_logger.warning(
-                    f"Player {player_id} cannot go all-in - no chips left"
+                self.logger.warning(
+                    "Player %s cannot go all-in - no chips left", player_id
                 )
                 return False
 
             actual_bet = player.bet(player.chips)
             self.pot += actual_bet
+            self.pot_ledger.add(player_id, actual_bet)
 
             # オールイン額が現在のベットを上回る場合はレイズ扱い
             if player.current_bet > self.current_bet:
@@ -575,15 +778,15 @@ class PokerGame:
                 self.has_bet_or_raise_this_round = True
 
             player.status = PlayerStatus.ALL_IN
-            action_description = f"Player {player_id} went all-in with {actual_bet}"
+            event_amount = actual_bet
 
         else:
-            game_logger.error(f"Unknown action: {action}")
+            self.logger.error("Unknown action: %s", action)
             return False
 
-        # アクション履歴に追加
-        self.action_history.append(action_description)
-        game_logger.info(f"ACTION_EXECUTED: {action_description}")
+        # アクション履歴に追加（文字列化はログが有効なときだけ行われる）
+        event = self._record_event(kind, player_id, event_amount)
+        self.logger.info("ACTION_EXECUTED: %s %s", event, EventJson(event))
 
         # データベースにアクションを記録
         if self.current_hand_id is not None:
@@ -598,14 +801,15 @@ class PokerGame:
                 pot_after=self.pot,
             )
 
-        self._log_game_state("AFTER_ACTION", f"Action: {action_description}")
+        if self.logger.isEnabledFor(logging.INFO):
+            self._log_game_state("AFTER_ACTION", f"Action: {event}")
 
         # 次のプレイヤーに移動
-        game_logger.info(">>> ADVANCING to next player")
+        self.logger.info(">>> ADVANCING to next player")
         self._advance_to_next_player()
 
         # ベッティングラウンド完了チェック
-        game_logger.info(">>> CHECKING betting round completion")
+        self.logger.info(">>> CHECKING betting round completion")
         self._check_betting_round_complete()
 
         self._log_game_state(
@@ -616,87 +820,84 @@ class PokerGame:
 
     def _advance_to_next_player(self):
         """次のアクティブプレイヤーに移動（座席順序を維持）"""
-        game_logger.debug("_advance_to_next_player called")
+        self.logger.debug("_advance_to_next_player called")
 
-        # アクティブプレイヤー（アクションが必要なプレイヤー）を確認
-        active_players = [
-            i for i, p in enumerate(self.players) if p.status == PlayerStatus.ACTIVE
-        ]
-
-        game_logger.debug(f"Active players: {active_players}")
-
-        # 座席順序を維持して次のアクティブプレイヤーを探す
+        # 座席順序を維持して次のアクティブプレイヤー（アクションが必要なプレイヤー）を探す
         old_player = self.current_player_index
-        total_players = len(self.players)
-
-        # 現在のプレイヤーの次から順番に探す
-        for i in range(1, total_players + 1):
-            next_index = (self.current_player_index + i) % total_players
-            next_player = self.players[next_index]
-
-            # アクティブなプレイヤーが見つかった場合
-            if next_player.status == PlayerStatus.ACTIVE:
-                self.current_player_index = next_index
-                game_logger.info(
-                    f"Advanced from player {old_player} to player {self.current_player_index} (seat order)"
-                )
-                return
+        next_index = self.seats.next_seat(
+            self.seats.mask(PlayerStatus.ACTIVE), old_player, include_self=True
+        )
+
+        # アクティブなプレイヤーが見つかった場合
+        if next_index is not None:
+            self.current_player_index = next_index
+            self.logger.info(
+                "Advanced from player %s to player %s (seat order)",
+                old_player,
+                self.current_player_index,
+            )
+            return
 
         # ここに到達した場合はアクティブプレイヤーが見つからなかった
-        game_logger.warning(
+        self.logger.warning(
             "No active player found in seat order - marking betting round complete"
         )
         self.betting_round_complete = True
 
     def _check_betting_round_complete(self):
         """ベッティングラウンドが完了したかチェック（座席順序ベース）"""
-        game_logger.debug("_check_betting_round_complete called")
+        self.logger.debug("_check_betting_round_complete called")
 
-        active_players = [p for p in self.players if p.status == PlayerStatus.ACTIVE]
-        all_in_players = [p for p in self.players if p.status == PlayerStatus.ALL_IN]
+        seats = self.seats
+        active_mask = seats.mask(PlayerStatus.ACTIVE)
+        active_count = active_mask.bit_count()
+        all_in_count = seats.count(PlayerStatus.ALL_IN)
 
-        game_logger.debug(
-            f"Active: {len(active_players)}, All-in: {len(all_in_players)}"
-        )
+        self.logger.debug("Active: %s, All-in: %s", active_count, all_in_count)
 
         # 1人しか残っていない場合
-        if len(active_players) + len(all_in_players) <= 1:
-            game_logger.info("Betting complete: Only 1 or fewer players remaining")
+        if active_count + all_in_count <= 1:
+            self.logger.info("Betting complete: Only 1 or fewer players remaining")
             self.betting_round_complete = True
             return
 
         # アクティブプレイヤーがいない場合（全員フォールドまたはオールイン）
-        if len(active_players) == 0:
-            game_logger.info("Betting complete: No active players")
+        if active_count == 0:
+            self.logger.info("Betting complete: No active players")
             self.betting_round_complete = True
             return
 
         # アクティブプレイヤーが1人の場合の特別処理
-        if len(active_players) == 1:
+        if active_count == 1:
             # その1人がまだベットをマッチしていない場合は継続
-            single_player = active_players[0]
+            single_player = self.players[seats.first_seat(active_mask)]
             if single_player.current_bet < self.current_bet:
-                game_logger.debug(
-                    f"Single active player {single_player.name} needs to match bet: {single_player.current_bet} < {self.current_bet}"
+                self.logger.debug(
+                    "Single active player %s needs to match bet: %s < %s",
+                    single_player.name,
+                    single_player.current_bet,
+                    self.current_bet,
                 )
                 return
             else:
                 # ベットをマッチしている場合は終了
-                game_logger.info(
+                self.logger.info(
                     "Betting complete: Single active player has matched the bet"
                 )
                 self.betting_round_complete = True
                 return
 
         # アクティブなプレイヤーが全員同じベット額でない場合は継続
-        player_bets = [p.current_bet for p in active_players]
-        all_same_bet = all(p.current_bet == self.current_bet for p in active_players)
-        game_logger.debug(
-            f"Player bets: {player_bets}, Current bet: {self.current_bet}, All same: {all_same_bet}"
+        players = self.players
+        all_same_bet = all(
+            players[i].current_bet == self.current_bet for i in seats.seats(active_mask)
+        )
+        self.logger.debug(
+            "Current bet: %s, All same: %s", self.current_bet, all_same_bet
         )
 
         if not all_same_bet:
-            game_logger.debug("Betting continues: Not all players have same bet")
+            self.logger.debug("Betting continues: Not all players have same bet")
             return
 
         # 全員が同じベット額の場合、ベッティングラウンド完了の条件をチェック
@@ -704,16 +905,11 @@ class PokerGame:
         if self.last_raiser_index is not None and getattr(
             self, "has_bet_or_raise_this_round", False
         ):
-            game_logger.info("Betting complete: All players matched after a bet/raise")
+            self.logger.info("Betting complete: All players matched after a bet/raise")
             self.betting_round_complete = True
             return
-        active_players_indices = [
-            i for i, p in enumerate(self.players) if p.status == PlayerStatus.ACTIVE
-        ]
-
-        game_logger.debug(f"Active player indices: {active_players_indices}")
-        game_logger.debug(f"Last raiser index: {self.last_raiser_index}")
-        game_logger.debug(f"Current player index: {self.current_player_index}")
+        self.logger.debug("Last raiser index: %s", self.last_raiser_index)
+        self.logger.debug("Current player index: %s", self.current_player_index)
 
         if self.last_raiser_index is None:
             # 誰もレイズしていない場合（全員チェック）、全員が一度アクションしたら終了
@@ -722,22 +918,26 @@ class PokerGame:
             # フロップ以降では、最初のアクター（ディーラーの次）から座席順序で一周した場合に終了
             first_actor_index = self._get_first_actor_for_phase()
 
-            game_logger.debug(f"First actor index: {first_actor_index}")
+            self.logger.debug("First actor index: %s", first_actor_index)
 
             # 現在のプレイヤーが最初のアクターに戻ってきた場合、全員がアクションを完了
             if self.current_player_index == first_actor_index:
-                game_logger.info(
-                    f"Betting complete: Back to first actor {first_actor_index} (all players have acted)"
+                self.logger.info(
+                    "Betting complete: Back to first actor %s (all players have acted)",
+                    first_actor_index,
                 )
                 self.betting_round_complete = True
             else:
-                game_logger.debug(
-                    f"Betting continues: Current player {self.current_player_index} != first actor {first_actor_index}"
+                self.logger.debug(
+                    "Betting continues: Current player %s != first actor %s",
+                    self.current_player_index,
+                    first_actor_index,
                 )
-        elif self.last_raiser_index not in active_players_indices:
+        elif not seats.has(self.last_raiser_index, PlayerStatus.ACTIVE):
             # 最後にレイズしたプレイヤーがもうアクティブでない場合（フォールドまたはオールイン）
-            game_logger.info(
-                f"Betting complete: Last raiser {self.last_raiser_index} is no longer active"
+            self.logger.info(
+                "Betting complete: Last raiser %s is no longer active",
+                self.last_raiser_index,
             )
             self.betting_round_complete = True
         else:
@@ -746,94 +946,72 @@ class PokerGame:
                 self.last_raiser_index
             )
 
-            game_logger.debug(
-                f"Next after last raiser {self.last_raiser_index}: {next_after_raiser_index}"
+            self.logger.debug(
+                "Next after last raiser %s: %s",
+                self.last_raiser_index,
+                next_after_raiser_index,
             )
 
             # 現在のプレイヤーが最後にレイズしたプレイヤーの次のプレイヤーの場合、
             # 最後にレイズしたプレイヤーは既にアクションを完了しているのでベッティング終了
             if self.current_player_index == next_after_raiser_index:
-                game_logger.info(
-                    f"Betting complete: Back to player {next_after_raiser_index} after last raiser {self.last_raiser_index}"
+                self.logger.info(
+                    "Betting complete: Back to player %s after last raiser %s",
+                    next_after_raiser_index,
+                    self.last_raiser_index,
                 )
                 self.betting_round_complete = True
             else:
-                game_logger.debug(
-                    f"Betting continues: Current player {self.current_player_index} != next after raiser {next_after_raiser_index}"
+                self.logger.debug(
+                    "Betting continues: Current player %s != next after raiser %s",
+                    self.current_player_index,
+                    next_after_raiser_index,
                 )
 
     def _get_first_actor_for_phase(self):
         """現在のフェーズでの最初のアクターを取得（座席順序ベース）"""
-        active_players_indices = [
-            i for i, p in enumerate(self.players) if p.status == PlayerStatus.ACTIVE
-        ]
+        seats = self.seats
+        active_mask = seats.mask(PlayerStatus.ACTIVE)
 
         if self.current_phase == GamePhase.PREFLOP:
             # プリフロップでは、ビッグブラインドの次（UTG）が最初のアクター
-            # 座席順序で探す
-            bb_index = None
-            for i, player in enumerate(self.players):
-                if player.is_big_blind:
-                    bb_index = i
-                    break
-
-            if bb_index is not None:
-                # ビッグブラインドの次のアクティブプレイヤーを座席順序で探す
-                for i in range(1, len(self.players)):
-                    next_index = (bb_index + i) % len(self.players)
-                    if next_index in active_players_indices:
-                        return next_index
+            start = seats.big_blind
         else:
             # フロップ以降では、ディーラーの次が最初のアクター
-            # 座席順序で探す
-            for i in range(1, len(self.players)):
-                next_index = (self.dealer_button + i) % len(self.players)
-                if next_index in active_players_indices:
-                    return next_index
+            start = self.dealer_button
+
+        if start is not None:
+            next_index = seats.next_seat(active_mask, start)
+            if next_index is not None:
+                return next_index
 
         # 見つからない場合は最初のアクティブプレイヤー
-        return active_players_indices[0] if active_players_indices else None
+        return seats.first_seat(active_mask)
 
     def _get_next_active_player_from(self, from_player_index):
         """指定されたプレイヤーの次のアクティブプレイヤーを座席順序で取得"""
-        active_players_indices = [
-            i for i, p in enumerate(self.players) if p.status == PlayerStatus.ACTIVE
-        ]
-
         # 座席順序で次のアクティブプレイヤーを探す
-        for i in range(1, len(self.players)):
-            next_index = (from_player_index + i) % len(self.players)
-            if next_index in active_players_indices:
-                return next_index
-
-        return None
+        return self.seats.next_seat(self.seats.mask(PlayerStatus.ACTIVE), from_player_index)
 
     def advance_to_next_phase(self):
         """次のフェーズに進む"""
-        game_logger.info(
-            f">>> ADVANCE_TO_NEXT_PHASE called - Current phase: {self.current_phase.value}"
+        self.logger.info(
+            ">>> ADVANCE_TO_NEXT_PHASE called - Current phase: %s",
+            self.current_phase.value,
         )
-        game_logger.info(f"Betting round complete: {self.betting_round_complete}")
+        self.logger.info("Betting round complete: %s", self.betting_round_complete)
 
         if not self.betting_round_complete:
-            game_logger.warning("Cannot advance phase - betting round not complete")
+            self.logger.warning("Cannot advance phase - betting round not complete")
             return False
 
         # 残りプレイヤーチェック
-        remaining_players = [
-            p
-            for p in self.players
-            if p.status in [PlayerStatus.ACTIVE, PlayerStatus.ALL_IN]
-        ]
+        remaining_count = self.seats.count(PlayerStatus.ACTIVE, PlayerStatus.ALL_IN)
 
-        game_logger.info(f"Remaining players: {len(remaining_players)}")
-        for i, p in enumerate(remaining_players):
-            game_logger.debug(
-                f"  Remaining P{p.id}: {p.name}, status: {p.status.value}"
-            )
+        self.logger.info("Remaining players: %s", remaining_count)
 
-        if len(remaining_players) <= 1:
-            game_logger.info("Going to SHOWDOWN - only 1 or fewer players remaining")
+        if remaining_count <= 1:
+            self.logger.info("Going to SHOWDOWN - only 1 or fewer players remaining")
             self.current_phase = GamePhase.SHOWDOWN
             self._log_game_state("PHASE_CHANGED_TO_SHOWDOWN")
             return True
@@ -843,27 +1021,27 @@ class PokerGame:
         # フェーズを進める
         if self.current_phase == GamePhase.PREFLOP:
             self.current_phase = GamePhase.FLOP
-            game_logger.info("Phase changed: PREFLOP -> FLOP")
+            self.logger.info("Phase changed: PREFLOP -> FLOP")
             self._deal_flop()
         elif self.current_phase == GamePhase.FLOP:
             self.current_phase = GamePhase.TURN
-            game_logger.info("Phase changed: FLOP -> TURN")
+            self.logger.info("Phase changed: FLOP -> TURN")
             self._deal_turn()
         elif self.current_phase == GamePhase.TURN:
             self.current_phase = GamePhase.RIVER
-            game_logger.info("Phase changed: TURN -> RIVER")
+            self.logger.info("Phase changed: TURN -> RIVER")
             self._deal_river()
         elif self.current_phase == GamePhase.RIVER:
             self.current_phase = GamePhase.SHOWDOWN
-            game_logger.info("Phase changed: RIVER -> SHOWDOWN")
+            self.logger.info("Phase changed: RIVER -> SHOWDOWN")
             self._log_game_state("PHASE_CHANGED_TO_SHOWDOWN")
             return True
         else:
-            game_logger.error(f"Cannot advance from phase: {self.current_phase}")
+            self.logger.error("Cannot advance from phase: %s", self.current_phase)
             return False
 
         # 新しいベッティングラウンドを開始
-        game_logger.info("Starting new betting round")
+        self.logger.info("Starting new betting round")
         self._start_new_betting_round()
         self._log_game_state(
             "NEW_BETTING_ROUND_STARTED",
@@ -876,9 +1054,7 @@ class PokerGame:
         self.deck.deal_card()  # バーンカード
         for _ in range(3):
             self.community_cards.append(self.deck.deal_card())
-        self.action_history.append(
-            f"Flop dealt: {', '.join(str(card) for card in self.community_cards)}"
-        )
+        self._record_event("deal", detail=tuple(card.id for card in self.community_cards))
         
         # データベースにコミュニティカードを記録
         if self.current_hand_id is not None:
@@ -892,7 +1068,7 @@ class PokerGame:
         """ターンを配る（1枚）"""
         self.deck.deal_card()  # バーンカード
         self.community_cards.append(self.deck.deal_card())
-        self.action_history.append(f"Turn dealt: {str(self.community_cards[-1])}")
+        self._record_event("deal", detail=tuple(card.id for card in self.community_cards))
         
         # データベースにコミュニティカードを記録
         if self.current_hand_id is not None:
@@ -906,7 +1082,7 @@ class PokerGame:
         """リバーを配る（1枚）"""
         self.deck.deal_card()  # バーンカード
         self.community_cards.append(self.deck.deal_card())
-        self.action_history.append(f"River dealt: {str(self.community_cards[-1])}")
+        self._record_event("deal", detail=tuple(card.id for card in self.community_cards))
         
         # データベースにコミュニティカードを記録
         if self.current_hand_id is not None:
@@ -918,7 +1094,7 @@ class PokerGame:
 
     def _start_new_betting_round(self):
         """新しいベッティングラウンドを開始"""
-        game_logger.debug("_start_new_betting_round called")
+        self.logger.debug("_start_new_betting_round called")
 
         # プレイヤーのベットをリセット
         for player in self.players:
@@ -928,39 +1104,62 @@ class PokerGame:
         self.betting_round_complete = False
         self.last_raiser_index = None
 
-        game_logger.info(
+        self.logger.info(
             "Reset: current_bet=0, betting_round_complete=False, last_raiser_index=None"
         )
 
         # 最初のアクションプレイヤーを設定（フェーズ規則に基づき計算）
         # ALL_INプレイヤーはアクションできないため除外
-        active_players = [
-            i for i, p in enumerate(self.players) if p.status == PlayerStatus.ACTIVE
-        ]
+        active_mask = self.seats.mask(PlayerStatus.ACTIVE)
 
-        game_logger.debug(f"Active players for new betting round: {active_players}")
-        game_logger.debug(f"Dealer button: {self.dealer_button}")
+        self.logger.debug("Dealer button: %s", self.dealer_button)
 
-        if len(active_players) > 0:
+        if active_mask:
             first_actor_index = self._get_first_actor_for_phase()
             if first_actor_index is not None:
                 old_player = self.current_player_index
                 self.current_player_index = first_actor_index
-                game_logger.info(
-                    f"First actor: Player {self.current_player_index} (by phase rule), was {old_player}"
+                self.logger.info(
+                    "First actor: Player %s (by phase rule), was %s",
+                    self.current_player_index,
+                    old_player,
                 )
             else:
                 # 念のためのフォールバック（通常は到達しない）
                 old_player = self.current_player_index
-                self.current_player_index = active_players[0]
-                game_logger.info(
-                    f"First actor: Player {self.current_player_index} (fallback first active), was {old_player}"
+                self.current_player_index = SeatRing.first_seat(active_mask)
+                self.logger.info(
+                    "First actor: Player %s (fallback first active), was %s",
+                    self.current_player_index,
+                    old_player,
                 )
         else:
             # アクティブプレイヤーがいない場合はベッティング終了
-            game_logger.warning("No active players - marking betting complete")
+            self.logger.warning("No active players - marking betting complete")
             self.betting_round_complete = True
 
+    def side_pots(self) -> List[Pot]:
+        """
+        現在のメインポットとサイドポット（メインが先頭）
+
+        サイドポットはオールインしたプレイヤーがいるときだけできる。
+        各ポットの受給資格者はフォールドしていない拠出者。
+        """
+        self._sync_pot_ledger()
+        seats = self.seats
+        return self.pot_ledger.pots(
+            seats.mask(PlayerStatus.ACTIVE, PlayerStatus.ALL_IN), seats.mask(PlayerStatus.ALL_IN)
+        )
+
+    def _sync_pot_ledger(self):
+        """total_bet_this_hand がベット以外の方法で書き換えられていた場合は台帳を作り直す"""
+        ledger = self.pot_ledger
+        players = self.players
+        if len(ledger.totals) != len(players) or any(
+            total != p.total_bet_this_hand for total, p in zip(ledger.totals, players)
+        ):
+            ledger.rebuild([p.total_bet_this_hand for p in players])
+
     def conduct_showdown(self) -> Dict[str, Any]:
         """ショーダウンを実行して勝者を決定"""
         remaining_players = [
@@ -971,14 +1170,14 @@ class PokerGame:
 
         # ログ: ショーダウン開始情報
         try:
-            game_logger.info("=== SHOWDOWN_STARTED ===")
-            game_logger.info(
+            self.logger.info("=== SHOWDOWN_STARTED ===")
+            self.logger.info(
                 "Pot: %d, Community cards: %s",
                 self.pot,
                 [str(card) for card in self.community_cards],
             )
             for p in remaining_players:
-                game_logger.info(
+                self.logger.info(
                     "  Player %d status=%s cards=%s",
                     p.id,
                     p.status.value,
@@ -986,14 +1185,14 @@ class PokerGame:
                 )
         except Exception as e:
             # ログ出力はゲーム進行を止めない
-            game_logger.debug("Showdown logging (start) failed: %s", e)
+            self.logger.debug("Showdown logging (start) failed: %s", e)
 
         if len(remaining_players) == 0:
-            game_logger.warning("Showdown called with no remaining players")
+            self.logger.warning("Showdown called with no remaining players")
             result: Dict[str, Any] = {"winners": [], "results": []}
             self.last_showdown_results = result
             # 履歴にショーダウン結果を追記
-            self.action_history.append("Showdown: no remaining players")
+            self._record_event("showdown_none")
             return result
 
         if len(remaining_players) == 1:
@@ -1001,14 +1200,14 @@ class PokerGame:
             winner = remaining_players[0]
             winner.chips += self.pot
             try:
-                game_logger.info(
+                self.logger.info(
                     "Showdown winner by default: Player %d awarded %d",
                     winner.id,
                     self.pot,
                 )
-                game_logger.info("=== SHOWDOWN_RESULTS_RECORDED ===")
+                self.logger.info("=== SHOWDOWN_RESULTS_RECORDED ===")
             except Exception as e:
-                game_logger.debug("Showdown logging (single winner) failed: %s", e)
+                self.logger.debug("Showdown logging (single winner) failed: %s", e)
             result = {
                 "winners": [winner.id],
                 "results": [
@@ -1021,89 +1220,61 @@ class PokerGame:
             }
             self.last_showdown_results = result
             # 履歴にショーダウン結果を追記
-            self.action_history.append(f"Showdown: Player {winner.id} won {self.pot}")
+            self._record_event("showdown_win", winner.id, self.pot)
             return result
 
         # 複数プレイヤーでのショーダウン
+        # 勝敗判定は整数の強さで行い、HandResult は表示用に1回だけ組み立てる
         player_hands = []
         for player in remaining_players:
-            hand_result = HandEvaluator.evaluate_hand(
-                player.hole_cards, self.community_cards
+            tracker = self.get_hand_tracker(player.id)
+            player_hands.append(
+                {
+                    "player": player,
+                    "hand": tracker.hand_result(),
+                    "strength": tracker.strength,
+                }
             )
-            player_hands.append({"player": player, "hand": hand_result})
 
         # 履歴: ショーダウン参加者のハンド情報を追記
         for ph in player_hands:
-            try:
-                self.action_history.append(
-                    "Showdown: Player "
-                    + str(ph["player"].id)
-                    + " hand="
-                    + str(ph["hand"])
-                    + " cards="
-                    + ", ".join(str(card) for card in ph["player"].hole_cards)
-                )
-            except Exception:
-                # 履歴追記はゲーム進行を止めない
-                pass
+            self._record_event(
+                "showdown_hand",
+                ph["player"].id,
+                detail=(ph["hand"], tuple(card.id for card in ph["player"].hole_cards)),
+            )
 
         # 各プレイヤーの役をログ
         try:
             for ph in player_hands:
-                game_logger.info(
+                self.logger.info(
                     "  Player %d hand=%s cards=%s",
                     ph["player"].id,
                     str(ph["hand"]),
                     [str(card) for card in ph["player"].hole_cards],
                 )
         except Exception as e:
-            game_logger.debug("Showdown logging (hands) failed: %s", e)
+            self.logger.debug("Showdown logging (hands) failed: %s", e)
 
-        # ID -> HandResult のマップ
+        # ID -> HandResult / 強さ のマップ
         hands_by_id = {ph["player"].id: ph["hand"] for ph in player_hands}
+        strength_by_id = {ph["player"].id: ph["strength"] for ph in player_hands}
 
-        # サイドポットを含めたポット階層を構築
-        contributions = {
-            p.id: max(0, int(getattr(p, "total_bet_this_hand", 0)))
-            for p in self.players
-        }
-        # 0 の寄付は除外
-        contributions = {pid: c for pid, c in contributions.items() if c > 0}
-
-        def build_pot_layers(contrib_map: Dict[int, int]) -> List[Dict[str, Any]]:
-            if not contrib_map:
-                return []
-            unique_levels = sorted(set(contrib_map.values()))
-            layers: List[Dict[str, Any]] = []
-            prev = 0
-            for level in unique_levels:
-                width = level - prev
-                if width <= 0:
-                    prev = level
-                    continue
-                eligible_contributors = [
-                    pid for pid, amt in contrib_map.items() if amt >= level
-                ]
-                layer_amount = width * len(eligible_contributors)
-                layers.append(
-                    {
-                        "amount": layer_amount,
-                        "contributors": eligible_contributors,
-                    }
-                )
-                prev = level
-            return layers
-
-        pot_layers = build_pot_layers(contributions)
+        # サイドポットを含めたポット階層（ベットのたびに更新済みの台帳から読む）
+        # 分配は累積額ごとの階層単位で行う（端数の配り方を階層ごとに決めるため）
+        self._sync_pot_ledger()
+        pot_layers = self.pot_ledger.layer_pots(
+            self.seats.mask(PlayerStatus.ACTIVE, PlayerStatus.ALL_IN)
+        )
 
         # レイヤー情報をログ
         try:
             for idx, layer in enumerate(pot_layers):
-                game_logger.info(
+                self.logger.info(
                     "Pot layer %d: amount=%d, contributors=%s",
                     idx,
-                    layer["amount"],
-                    layer["contributors"],
+                    layer.amount,
+                    layer.contributor_seats,
                 )
         except Exception:
             pass
@@ -1112,48 +1283,47 @@ class PokerGame:
         def determine_winner_ids(
             eligible_ids: List[int],
         ) -> Tuple[List[int], Optional[HandResult]]:
-            best: Optional[HandResult] = None
+            best_strength = -1
             winners_local: List[int] = []
             for pid in eligible_ids:
-                hand = hands_by_id.get(pid)
-                if hand is None:
+                strength = strength_by_id.get(pid)
+                if strength is None:
                     continue
-                if best is None:
-                    best = hand
+                if strength > best_strength:
+                    best_strength = strength
                     winners_local = [pid]
-                else:
-                    # hand が best より強い場合
-                    if hand.rank.value > best.rank.value or (
-                        hand.rank.value == best.rank.value
-                        and hand.kickers > best.kickers
-                    ):
-                        best = hand
-                        winners_local = [pid]
-                    elif (
-                        hand.rank.value == best.rank.value
-                        and hand.kickers == best.kickers
-                    ):
-                        winners_local.append(pid)
+                elif strength == best_strength:
+                    winners_local.append(pid)
+            best = hands_by_id[winners_local[0]] if winners_local else None
             return winners_local, best
 
         # 各レイヤーごとに分配
         winnings_map: Dict[int, int] = {}
         total_awarded = 0
 
-        # ショーダウンに参加している（フォールドしていない）プレイヤーID
-        showdown_ids = {p.id for p in remaining_players}
-
         for layer_idx, layer in enumerate(pot_layers):
-            amount = layer["amount"]
+            amount = layer.amount
+            contributors = layer.contributor_seats
             # このレイヤーでの受給資格者（コントリビュータかつショーダウン参加）
-            eligible_ids = [pid for pid in layer["contributors"] if pid in showdown_ids]
+            eligible_ids = layer.eligible_seats
 
             if not eligible_ids:
-                # 受給資格者がいない場合はスキップ（通常は発生しない想定）
-                game_logger.warning(
-                    "No eligible players for pot layer %d; amount=%d is unclaimed",
+                # 受給資格者がいない（コールされずにフォールドしたベット）場合は
+                # 拠出したプレイヤーに返す
+                refund = amount // len(contributors)
+                for pid in contributors:
+                    player = self.get_player(pid)
+                    if player is not None:
+                        player.chips += refund
+                        total_awarded += refund
+                self.logger.info(
+                    "No eligible players for pot layer %d; amount=%d returned to %s",
                     layer_idx,
                     amount,
+                    contributors,
+                )
+                self._record_event(
+                    "pot_return", amount=amount, detail=(layer_idx, contributors)
                 )
                 continue
 
@@ -1171,22 +1341,11 @@ class PokerGame:
                 total_awarded += share
 
             # 履歴用のサマリ
-            try:
-                self.action_history.append(
-                    "Side pot layer "
-                    + str(layer_idx)
-                    + ": amount="
-                    + str(amount)
-                    + ", winners="
-                    + ", ".join(str(pid) for pid in winner_ids_sorted)
-                    + (
-                        " best_hand=" + str(best_hand_in_layer)
-                        if best_hand_in_layer is not None
-                        else ""
-                    )
-                )
-            except Exception:
-                pass
+            self._record_event(
+                "pot_award",
+                amount=amount,
+                detail=(layer_idx, winner_ids_sorted, best_hand_in_layer),
+            )
 
         # 実際にチップを配布し、結果を作成
         results = []
@@ -1209,23 +1368,23 @@ class PokerGame:
 
         # ログ
         try:
-            game_logger.info(
+            self.logger.info(
                 "Showdown total awarded: %d (game.pot=%d)", total_awarded, self.pot
             )
-            game_logger.info(
+            self.logger.info(
                 "Showdown winners (aggregated): %s",
                 [pid for pid in sorted(winnings_map.keys())],
             )
             for r in results:
-                game_logger.info(
+                self.logger.info(
                     "  Awarded %d to Player %d (hand=%s)",
                     r["winnings"],
                     r["player_id"],
                     r["hand"],
                 )
-            game_logger.info("=== SHOWDOWN_RESULTS_RECORDED ===")
+            self.logger.info("=== SHOWDOWN_RESULTS_RECORDED ===")
         except Exception as e:
-            game_logger.debug("Showdown logging (results) failed: %s", e)
+            self.logger.debug("Showdown logging (results) failed: %s", e)
 
         # all_hands 情報
         all_hands_payload = [
@@ -1271,11 +1430,113 @@ class PokerGame:
         
         return result
 
+    def play_hand(self) -> Optional[Dict[str, Any]]:
+        """
+        1ハンドを最後まで自動で進行する（全員が make_decision で意思決定）
+
+        UI を介さないシミュレーション用。無効なアクションはフォールドとして扱う。
+
+        Returns:
+            ショーダウン結果（プレイヤー不足でハンドを開始できない場合は None）
+        """
+        self.start_new_hand()
+        if self.current_phase == GamePhase.FINISHED:
+            return None
+
+        while self.current_phase not in (GamePhase.SHOWDOWN, GamePhase.FINISHED):
+            while not self.betting_round_complete:
+                player = self.players[self.current_player_index]
+                if player.status != PlayerStatus.ACTIVE:
+                    self._advance_to_next_player()
+                    continue
+
+                decision = player.make_decision(self.get_llm_game_state(player.id))
+                if not self.process_player_action(
+                    player.id, decision["action"], decision.get("amount", 0)
+                ):
+                    self.process_player_action(player.id, "fold", 0)
+
+            if not self.advance_to_next_phase():
+                break
+
+        if self.current_phase == GamePhase.SHOWDOWN:
+            return self.conduct_showdown()
+        return None
+
     def is_game_over(self) -> bool:
         """ゲーム終了条件をチェック"""
         active_players = [p for p in self.players if p.chips > 0]
         return len(active_players) <= 1
 
+    def export_state(self) -> TableState:
+        """
+        現在のハンドの進行状況を不変の TableState として取り出す
+
+        プレイヤーIDは座席番号と一致している前提（setup_* で作成した場合は常に一致）。
+        """
+        players = self.players
+        seats = self.seats
+        return TableState(
+            phase=self.current_phase,
+            hand_number=self.hand_number,
+            small_blind=self.small_blind,
+            big_blind=self.big_blind,
+            dealer_button=self.dealer_button,
+            small_blind_seat=seats.small_blind,
+            big_blind_seat=seats.big_blind,
+            current_player=self.current_player_index,
+            pot=self.pot,
+            current_bet=self.current_bet,
+            last_raiser=self.last_raiser_index,
+            has_bet_or_raise=self.has_bet_or_raise_this_round,
+            betting_round_complete=self.betting_round_complete,
+            chips=tuple(p.chips for p in players),
+            bets=tuple(p.current_bet for p in players),
+            total_bets=tuple(p.total_bet_this_hand for p in players),
+            statuses=tuple(p.status for p in players),
+            hole_cards=tuple(tuple(card.id for card in p.hole_cards) for p in players),
+            community=tuple(card.id for card in self.community_cards),
+            deck=tuple(card.id for card in self.deck.cards),
+        )
+
+    def import_state(self, state: TableState):
+        """
+        TableState の局面をこのゲームに反映する
+
+        プレイヤーの構成（人数・順番）は変えない。アクション履歴と DB の記録には触れない。
+        """
+        if state.num_seats != len(self.players):
+            raise ValueError(
+                f"State has {state.num_seats} seats but the game has {len(self.players)} players"
+            )
+        self.current_phase = state.phase
+        self.hand_number = state.hand_number
+        self.small_blind = state.small_blind
+        self.big_blind = state.big_blind
+        self.dealer_button = state.dealer_button
+        self.current_player_index = state.current_player
+        self.pot = state.pot
+        self.current_bet = state.current_bet
+        self.last_raiser_index = state.last_raiser
+        self.has_bet_or_raise_this_round = state.has_bet_or_raise
+        self.betting_round_complete = state.betting_round_complete
+        for seat, player in enumerate(self.players):
+            player.chips = state.chips[seat]
+            player.current_bet = state.bets[seat]
+            player.total_bet_this_hand = state.total_bets[seat]
+            player.status = state.statuses[seat]
+            player.hole_cards = [CARDS[card_id] for card_id in state.hole_cards[seat]]
+            player.is_dealer = seat == state.dealer_button
+            player.is_small_blind = seat == state.small_blind_seat
+            player.is_big_blind = seat == state.big_blind_seat
+        seats = self.seats
+        seats.small_blind = state.small_blind_seat
+        seats.big_blind = state.big_blind_seat
+        self.pot_ledger.rebuild(state.total_bets)
+        self.community_cards = [CARDS[card_id] for card_id in state.community]
+        self.deck.cards[:] = [CARDS[card_id] for card_id in state.deck]
+        self.hand_trackers = {}
+
     def save_game_state(self, filename: str):
         """ゲーム状態をJSONファイルに保存"""
         game_data = {
@@ -1306,7 +1567,7 @@ class PokerGame:
                 }
                 for p in self.players
             ],
-            "action_history": self.action_history,
+            "action_history": list(self.action_history),
             "game_stats": self.game_stats,
         }
 
@@ -1315,6 +1576,9 @@ class PokerGame:
 
     def _log_game_state(self, context: str, extra_info: str = ""):
         """現在のゲーム状態を詳細にログに記録"""
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+
         active_players = [p for p in self.players if p.status == PlayerStatus.ACTIVE]
         all_in_players = [p for p in self.players if p.status == PlayerStatus.ALL_IN]
         folded_players = [p for p in self.players if p.status == PlayerStatus.FOLDED]
@@ -1325,22 +1589,29 @@ class PokerGame:
                 f"P{i}({p.name}): chips={p.chips}, bet={p.current_bet}, status={p.status.value}"
             )
 
-        game_logger.info(f"=== {context} ===")
-        game_logger.info(f"Hand #{self.hand_number}, Phase: {self.current_phase.value}")
-        game_logger.info(
-            f"Current player: {self.current_player_index}, Dealer: {self.dealer_button}"
+        self.logger.info("=== %s ===", context)
+        self.logger.info(
+            "Hand #%s, Phase: %s", self.hand_number, self.current_phase.value
+        )
+        self.logger.info(
+            "Current player: %s, Dealer: %s",
+            self.current_player_index,
+            self.dealer_button,
         )
-        game_logger.info(f"Pot: {self.pot}, Current bet: {self.current_bet}")
-        game_logger.info(f"Last raiser: {self.last_raiser_index}")
-        game_logger.info(f"Betting round complete: {self.betting_round_complete}")
-        game_logger.info(
-            f"Active players: {len(active_players)}, All-in: {len(all_in_players)}, Folded: {len(folded_players)}"
+        self.logger.info("Pot: %s, Current bet: %s", self.pot, self.current_bet)
+        self.logger.info("Last raiser: %s", self.last_raiser_index)
+        self.logger.info("Betting round complete: %s", self.betting_round_complete)
+        self.logger.info(
+            "Active players: %s, All-in: %s, Folded: %s",
+            len(active_players),
+            len(all_in_players),
+            len(folded_players),
         )
-        game_logger.info(
-            f"Community cards: {[str(card) for card in self.community_cards]}"
+        self.logger.info(
+            "Community cards: %s", [str(card) for card in self.community_cards]
         )
         for info in player_info:
-            game_logger.info(f"  {info}")
+            self.logger.info("  %s", info)
         if extra_info:
-            game_logger.info(f"Extra: {extra_info}")
-        game_logger.info("=" * 50)
+            self.logger.info("Extra: %s", extra_info)
+        self.logger.info("=" * 50)
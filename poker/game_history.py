@@ -109,6 +109,17 @@ class GameHistoryDB:
             )
         """)
 
+        # アクション履歴のアーカイブ（メモリから押し出されたハンドの表示用の履歴）
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS hand_logs (
+                hand_id INTEGER PRIMARY KEY,
+                hand_number INTEGER NOT NULL,
+                events TEXT NOT NULL,
+                timestamp TEXT NOT NULL,
+                FOREIGN KEY (hand_id) REFERENCES hands (hand_id)
+            )
+        """)
+
         # インデックスの作成
         cursor.execute("""
             CREATE INDEX IF NOT EXISTS idx_actions_hand_id 
@@ -267,6 +278,36 @@ class GameHistoryDB:
 
         self.conn.commit()
 
+    def record_hand_log(self, hand_id: int, hand_number: int, events: List[Dict[str, Any]]):
+        """
+        1ハンド分のアクション履歴を保存
+
+        Args:
+            hand_id: ハンドID
+            hand_number: ゲーム内のハンド番号
+            events: イベントのリスト（ActionEvent.to_dict に "text" を加えたもの）
+        """
+        cursor = self.conn.cursor()
+        timestamp = datetime.now().isoformat()
+        events_json = json.dumps(events, ensure_ascii=False)
+
+        cursor.execute(
+            """
+            INSERT OR REPLACE INTO hand_logs (hand_id, hand_number, events, timestamp)
+            VALUES (?, ?, ?, ?)
+        """,
+            (hand_id, hand_number, events_json, timestamp),
+        )
+
+        self.conn.commit()
+
+    def get_hand_log(self, hand_id: int) -> List[Dict[str, Any]]:
+        """record_hand_log で保存したアクション履歴を取得（なければ空）"""
+        cursor = self.conn.cursor()
+        cursor.execute("SELECT events FROM hand_logs WHERE hand_id = ?", (hand_id,))
+        row = cursor.fetchone()
+        return json.loads(row["events"]) if row else []
+
     def get_hand_history(self, hand_id: int) -> Optional[Dict[str, Any]]:
         """
         特定ハンドの完全な履歴を取得
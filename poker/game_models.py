@@ -2,10 +2,11 @@
 Poker game models: Card, Deck, Suit classes and game state types
 """
 
+import hashlib
 import random
 from typing import List, Dict, Any, Optional
 from enum import Enum
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 
 class Suit(Enum):
@@ -17,8 +18,20 @@ class Suit(Enum):
     SPADES = "spades"
 
 
+# カードID: card_id = (rank - 2) * 4 + suit_index（0..51）
+SUIT_ORDER = (Suit.HEARTS, Suit.DIAMONDS, Suit.CLUBS, Suit.SPADES)
+SUIT_INDEX = {suit: index for index, suit in enumerate(SUIT_ORDER)}
+
+
 class Card:
-    """トランプカードクラス"""
+    """トランプカードクラス
+
+    52枚のインスタンスはモジュール読み込み時に1度だけ作成され、
+    Card(rank, suit) は常に同じインスタンスを返す。
+    等価比較・ハッシュ・文字列化はすべてカードIDによる表引きで行う。
+    """
+
+    __slots__ = ("id", "rank", "suit")
 
     # スートの記号マップ
     SUIT_SYMBOLS = {
@@ -45,7 +58,7 @@ class Card:
         14: "A",
     }
 
-    def __init__(self, rank: int, suit: Suit):
+    def __new__(cls, rank: int, suit: Suit):
         """
         Args:
             rank: カードのランク（2-14, 11=J, 12=Q, 13=K, 14=A）
@@ -53,8 +66,32 @@ class Card:
         """
         if rank < 2 or rank > 14:
             raise ValueError("Rank must be between 2 and 14")
-        self.rank = rank
-        self.suit = suit
+        suit_index = SUIT_INDEX.get(suit)
+        if suit_index is None:
+            raise ValueError(f"Invalid suit: {suit!r}")
+        return CARDS[(rank - 2) * 4 + suit_index]
+
+    @classmethod
+    def _create(cls, card_id: int) -> "Card":
+        """カードIDからインスタンスを作成（モジュール初期化時のみ使用）"""
+        card = object.__new__(cls)
+        card.id = card_id
+        card.rank = card_id // 4 + 2
+        card.suit = SUIT_ORDER[card_id % 4]
+        return card
+
+    @staticmethod
+    def from_id(card_id: int) -> "Card":
+        """カードID（0..51）からカードを取得"""
+        return CARDS[card_id]
+
+    @staticmethod
+    def from_str(text: str) -> "Card":
+        """文字列からカードを取得（例: "A♠", "10♥", "Td", "AS"）"""
+        card = _CARDS_BY_STR.get(text.strip())
+        if card is None:
+            raise ValueError(f"Invalid card string: {text!r}")
+        return card
 
     @property
     def rank_name(self) -> str:
@@ -68,45 +105,120 @@ class Card:
 
     def __str__(self) -> str:
         """カードの文字列表現（例: A♠）"""
-        return f"{self.rank_name}{self.suit_symbol}"
+        return CARD_STRS[self.id]
 
     def __eq__(self, other) -> bool:
-        if not isinstance(other, Card):
-            return False
-        return self.rank == other.rank and self.suit == other.suit
+        return self is other
 
     def __hash__(self) -> int:
-        return hash((self.rank, self.suit))
+        return self.id
+
+    def __reduce__(self):
+        # pickle/deepcopy でもシングルトンを維持する
+        return (Card.from_id, (self.id,))
+
+    def __copy__(self) -> "Card":
+        return self
+
+    def __deepcopy__(self, memo) -> "Card":
+        return self
 
     def __repr__(self) -> str:
         return f"Card({self.rank_name}, {self.suit.value})"
 
 
+# 52枚のカードと表引き用の配列（index = card_id）
+CARDS = tuple(Card._create(card_id) for card_id in range(52))
+CARD_RANKS = tuple(card.rank for card in CARDS)
+CARD_SUITS = tuple(card_id % 4 for card_id in range(52))
+CARD_MASKS = tuple(1 << card_id for card_id in range(52))
+CARD_STRS = tuple(
+    f"{Card.RANK_NAMES[card.rank]}{Card.SUIT_SYMBOLS[card.suit]}" for card in CARDS
+)
+
+
+def _build_card_lookup() -> Dict[str, Card]:
+    """Card.from_str 用の表記 -> カード辞書を作成（"A♠", "As", "AS", "as", "10♥", "Th" など）"""
+    ascii_suits = {
+        Suit.HEARTS: "h",
+        Suit.DIAMONDS: "d",
+        Suit.CLUBS: "c",
+        Suit.SPADES: "s",
+    }
+    lookup: Dict[str, Card] = {}
+    for card in CARDS:
+        rank_names = {card.rank_name, "T" if card.rank == 10 else card.rank_name}
+        suit_names = (
+            card.suit_symbol,
+            ascii_suits[card.suit],
+            ascii_suits[card.suit].upper(),
+        )
+        for rank_name in rank_names:
+            for suit_name in suit_names:
+                lookup[rank_name + suit_name] = card
+                lookup[rank_name.lower() + suit_name] = card
+    return lookup
+
+
+_CARDS_BY_STR = _build_card_lookup()
+
+
+def hand_seed(run_seed: int, hand_number: int) -> int:
+    """実行全体のシードとハンド番号から、そのハンドのデッキのシードを導出
+
+    同じ (run_seed, hand_number) からは常に同じシードが得られるので、
+    デッキ全体を保存しなくても任意のハンドの配札を再現できる。
+    """
+    digest = hashlib.blake2b(
+        f"{run_seed}:{hand_number}".encode(), digest_size=8
+    ).digest()
+    return int.from_bytes(digest, "little")
+
+
 class Deck:
-    """トランプデッキクラス"""
+    """トランプデッキクラス
+
+    専用の random.Random を持ち、グローバルな random の状態には依存しない。
+    reset() はシャッフルせず、deal_card() のたびに残りのカードから1枚を選ぶ
+    （部分的な Fisher–Yates）。配るカードの分だけ乱数を引き、カードのリストは
+    ハンドをまたいで使い回す。
+    """
+
+    def __init__(self, seed: Optional[int] = None):
+        """
+        標準的な52枚のデッキを作成
 
-    def __init__(self):
-        """標準的な52枚のデッキを作成"""
+        Args:
+            seed: 乱数シード（None ならOSの乱数で初期化）
+        """
+        self.rng = random.Random(seed)
         self.cards: List[Card] = []
         self.reset()
 
-    def reset(self):
-        """デッキをリセットして全カードを追加"""
-        self.cards = []
-        for suit in Suit:
-            for rank in range(2, 15):  # 2-14 (A)
-                self.cards.append(Card(rank, suit))
-        self.shuffle()
+    def reset(self, seed: Optional[int] = None):
+        """
+        デッキをリセットして全カードを戻す（カードは作り直さず共有インスタンスを使う）
+
+        Args:
+            seed: 指定するとこのシードで乱数を初期化し直す（ハンドごとのシード）
+        """
+        if seed is not None:
+            self.rng.seed(seed)
+        self.cards[:] = CARDS
 
     def shuffle(self):
-        """デッキをシャッフル"""
-        random.shuffle(self.cards)
+        """残りのカード全体をシャッフル"""
+        self.rng.shuffle(self.cards)
 
     def deal_card(self) -> Card:
-        """カードを1枚配る"""
-        if not self.cards:
+        """カードを1枚配る（残りのカードから一様に選んで末尾と入れ替える）"""
+        cards = self.cards
+        if not cards:
             raise ValueError("Cannot deal from empty deck")
-        return self.cards.pop()
+        last = len(cards) - 1
+        index = self.rng.randrange(last + 1)
+        cards[index], cards[last] = cards[last], cards[index]
+        return cards.pop()
 
     def cards_remaining(self) -> int:
         """残りカード数を取得"""
@@ -152,6 +264,8 @@ class GameState:
     players: List[PlayerInfo]
     actions: List[str]
     history: List[str]
+    # メインポット/サイドポット（{"amount", "eligible"}。メインが先頭）
+    pots: List[Dict[str, Any]] = field(default_factory=list)
 
     def to_dict(self) -> Dict[str, Any]:
         """辞書形式に変換"""
@@ -178,6 +292,7 @@ class GameState:
             ],
             "actions": self.actions,
             "history": self.history,
+            "pots": self.pots,
         }
 
     @classmethod
@@ -203,4 +318,5 @@ class GameState:
             players=players,
             actions=data.get("actions", []),
             history=data.get("history", []),
+            pots=data.get("pots", []),
         )
@@ -1350,9 +1350,7 @@ class GameUI:
 
                 # 現在の最強ハンドを表示
                 if len(self.game.community_cards) >= 3:
-                    hand_result = HandEvaluator.evaluate_hand(
-                        player.hole_cards, self.game.community_cards
-                    )
+                    hand_result = self.game.get_hand_tracker(player.id).hand_result()
                     hand_desc = HandEvaluator.get_hand_strength_description(hand_result)
                     self.your_cards_row.controls.append(
                         ft.Container(
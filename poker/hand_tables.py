@@ -0,0 +1,209 @@
+"""
+Precomputed lookup tables for fast hand evaluation
+
+ハンドの強さを1つの整数（strength）で表現する。値が大きいほど強いハンド。
+
+    strength = (HandRank.value << 20) | (kicker1 << 16) | (kicker2 << 12) | ...
+
+キッカー列は HandResult.kickers と同じ並びなので、同じ役の中での比較結果も
+HandEvaluator.compare_hands と一致する。
+
+- フラッシュ系: スートごとの13bitランクマスク -> HandTables.flush[mask]
+- それ以外: ランクごとの素数の積（prime product）-> HandTables.nonflush[product]
+
+素数の積はランクの多重集合ごとに一意なので、5〜7枚のどの組み合わせでも
+1回の辞書参照で最強の5枚の強さが得られる。テーブルは初回使用時に構築する。
+"""
+
+from typing import Dict, List, Optional, Sequence
+
+from .game_models import CARD_RANKS, CARD_SUITS
+
+# ランク 2..14 に対応する素数
+PRIMES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+
+# カードID（0..51）ごとの素数とランクビット
+CARD_PRIMES = tuple(PRIMES[rank - 2] for rank in CARD_RANKS)
+CARD_RANK_BITS = tuple(1 << (rank - 2) for rank in CARD_RANKS)
+
+CATEGORY_SHIFT = 20
+KICKER_BITS = 4
+
+# HandRank.value ごとのキッカー数（HandResult.kickers の長さ）
+KICKER_COUNTS = {10: 1, 9: 1, 8: 2, 7: 2, 6: 5, 5: 1, 4: 3, 3: 3, 2: 4, 1: 5}
+
+# 役カテゴリ（evaluator.HandRank と同じ値）
+ROYAL_FLUSH = 10
+STRAIGHT_FLUSH = 9
+FOUR_OF_A_KIND = 8
+FULL_HOUSE = 7
+FLUSH = 6
+STRAIGHT = 5
+THREE_OF_A_KIND = 4
+TWO_PAIR = 3
+ONE_PAIR = 2
+HIGH_CARD = 1
+
+# (最高ランク, ランクマスク) の組。強い順に並べる。マスクの bit i はランク i+2
+STRAIGHT_MASKS = tuple(
+    (high, sum(1 << (r - 2) for r in range(high - 4, high + 1)))
+    for high in range(14, 5, -1)
+) + ((5, (1 << 12) | 0b1111),)  # A-5ストレート
+
+
+def pack_strength(category: int, kickers: Sequence[int]) -> int:
+    """役カテゴリとキッカー列から strength を作成"""
+    strength = category << CATEGORY_SHIFT
+    shift = CATEGORY_SHIFT - KICKER_BITS
+    for kicker in kickers:
+        strength |= kicker << shift
+        shift -= KICKER_BITS
+    return strength
+
+
+def unpack_strength(strength: int) -> tuple:
+    """strength を (役カテゴリ, キッカー列) に分解"""
+    category = strength >> CATEGORY_SHIFT
+    kickers = []
+    shift = CATEGORY_SHIFT - KICKER_BITS
+    for _ in range(KICKER_COUNTS.get(category, 5)):
+        kicker = (strength >> shift) & 0xF
+        if kicker == 0:
+            break
+        kickers.append(kicker)
+        shift -= KICKER_BITS
+    return category, kickers
+
+
+def straight_high(rank_mask: int) -> int:
+    """ランクマスクに含まれる最も高いストレートの最高ランク（なければ0）"""
+    for high, mask in STRAIGHT_MASKS:
+        if rank_mask & mask == mask:
+            return high
+    return 0
+
+
+def _mask_ranks(rank_mask: int) -> List[int]:
+    """ランクマスクを降順のランク列に変換"""
+    return [r for r in range(14, 1, -1) if rank_mask & (1 << (r - 2))]
+
+
+def _flush_strength(rank_mask: int) -> int:
+    """同一スートのランクマスク（5枚以上）から最強の5枚の strength を計算"""
+    high = straight_high(rank_mask)
+    if high == 14:
+        return pack_strength(ROYAL_FLUSH, [14])
+    if high:
+        return pack_strength(STRAIGHT_FLUSH, [high])
+    return pack_strength(FLUSH, _mask_ranks(rank_mask)[:5])
+
+
+def _nonflush_strength(counts: Sequence[int]) -> int:
+    """ランクごとの枚数（index = rank-2）から最強の5枚の strength を計算"""
+    ranks_desc = [r for r in range(14, 1, -1) if counts[r - 2]]
+    quads = [r for r in ranks_desc if counts[r - 2] == 4]
+    trips = [r for r in ranks_desc if counts[r - 2] == 3]
+    pairs = [r for r in ranks_desc if counts[r - 2] == 2]
+
+    if quads:
+        quad = quads[0]
+        kicker = next(r for r in ranks_desc if r != quad)
+        return pack_strength(FOUR_OF_A_KIND, [quad, kicker])
+
+    if trips and (len(trips) >= 2 or pairs):
+        three = trips[0]
+        pair = max(trips[1:] + pairs)
+        return pack_strength(FULL_HOUSE, [three, pair])
+
+    rank_mask = 0
+    for r in ranks_desc:
+        rank_mask |= 1 << (r - 2)
+    high = straight_high(rank_mask)
+    if high:
+        return pack_strength(STRAIGHT, [high])
+
+    if trips:
+        three = trips[0]
+        kickers = [r for r in ranks_desc if r != three][:2]
+        return pack_strength(THREE_OF_A_KIND, [three] + kickers)
+
+    if len(pairs) >= 2:
+        high_pair, low_pair = pairs[0], pairs[1]
+        kicker = next(r for r in ranks_desc if r not in (high_pair, low_pair))
+        return pack_strength(TWO_PAIR, [high_pair, low_pair, kicker])
+
+    if pairs:
+        pair = pairs[0]
+        kickers = [r for r in ranks_desc if r != pair][:3]
+        return pack_strength(ONE_PAIR, [pair] + kickers)
+
+    return pack_strength(HIGH_CARD, ranks_desc[:5])
+
+
+class HandTables:
+    """評価用ルックアップテーブル一式"""
+
+    def __init__(self):
+        # 13bit ランクマスク -> フラッシュ系 strength（5枚未満は0）
+        self.flush: List[int] = [0] * (1 << 13)
+        for mask in range(1 << 13):
+            if bin(mask).count("1") >= 5:
+                self.flush[mask] = _flush_strength(mask)
+
+        # 素数の積 -> 非フラッシュ strength（5〜7枚）
+        self.nonflush: Dict[int, int] = {}
+        counts = [0] * 13
+
+        def visit(index: int, total: int, product: int):
+            if index == 13:
+                if total >= 5:
+                    self.nonflush[product] = _nonflush_strength(counts)
+                return
+            prime = PRIMES[index]
+            for n in range(0, min(4, 7 - total) + 1):
+                counts[index] = n
+                visit(index + 1, total + n, product * prime**n)
+            counts[index] = 0
+
+        visit(0, 0, 1)
+        self._arrays = None
+
+    def numpy_arrays(self) -> dict:
+        """
+        バッチ評価用の NumPy 配列を取得（初回呼び出し時に作成）
+
+        非フラッシュ表は辞書の代わりに、ソート済みの素数の積と強さの配列で持ち、
+        np.searchsorted で参照する。
+        """
+        if self._arrays is None:
+            import numpy as np
+
+            keys = np.array(sorted(self.nonflush), dtype=np.int64)
+            self._arrays = {
+                "flush": np.array(self.flush, dtype=np.int64),
+                "nonflush_keys": keys,
+                "nonflush_values": np.array(
+                    [self.nonflush[key] for key in keys.tolist()], dtype=np.int64
+                ),
+                "card_primes": np.array(CARD_PRIMES, dtype=np.int64),
+                # スートごとに13bitずつずらしたランクビット（合計するとスート別マスクになる）
+                "card_suit_bits": np.array(
+                    [
+                        CARD_RANK_BITS[card_id] << (13 * CARD_SUITS[card_id])
+                        for card_id in range(52)
+                    ],
+                    dtype=np.int64,
+                ),
+            }
+        return self._arrays
+
+
+_tables: Optional[HandTables] = None
+
+
+def get_tables() -> HandTables:
+    """ルックアップテーブルを取得（初回呼び出し時に構築）"""
+    global _tables
+    if _tables is None:
+        _tables = HandTables()
+    return _tables
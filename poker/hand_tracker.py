@@ -0,0 +1,229 @@
+"""
+Incremental street-by-street hand strength tracking
+
+プレイヤー1人・1ハンドにつき1つ HandTracker を作り、カードが配られるたびに
+add() で1枚ずつ追加する。ランク/スートの枚数、スートごとのランクマスク、
+素数の積を保持しているため、追加は O(1) で、現在の役はテーブル参照1回で得られる。
+
+    tracker = HandTracker(player.hole_cards)
+    tracker.add_cards(flop)       # フロップ
+    tracker.add(turn)             # ターン（O(1)）
+    tracker.hand_rank             # HandRank.TWO_PAIR など
+    tracker.outs()                # 役が上がるカードID
+    tracker.is_nuts()             # 現在のボードでナッツかどうか
+"""
+
+from itertools import combinations
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+from .evaluator import HandEvaluator, HandRank, HandResult
+from .game_models import CARDS, CARD_RANKS, CARD_SUITS, Card
+from .hand_tables import (
+    CARD_PRIMES,
+    CARD_RANK_BITS,
+    CATEGORY_SHIFT,
+    get_tables,
+    straight_high,
+)
+
+
+class HandTracker:
+    """1ハンド分のカードを保持し、役を差分更新する評価器"""
+
+    __slots__ = (
+        "card_ids",
+        "num_hole",
+        "rank_counts",
+        "suit_counts",
+        "suit_masks",
+        "rank_mask",
+        "product",
+        "_strength",
+        "_nut_strength",
+    )
+
+    def __init__(self, hole_cards: Sequence[Card] = (), board: Sequence[Card] = ()):
+        self.card_ids: List[int] = []
+        self.num_hole = 0
+        self.rank_counts = [0] * 13  # index = rank-2
+        self.suit_counts = [0] * 4
+        self.suit_masks = [0] * 4  # スートごとの13bitランクマスク
+        self.rank_mask = 0
+        self.product = 1  # ランクの素数の積（非フラッシュ表のキー）
+        self._strength = 0
+        self._nut_strength: Optional[int] = None
+
+        for card in hole_cards:
+            self.add(card)
+        self.num_hole = len(self.card_ids)
+        for card in board:
+            self.add(card)
+
+    def add(self, card: Card):
+        """カードを1枚追加（O(1)）"""
+        card_id = card.id
+        if card_id in self.card_ids:
+            raise ValueError(f"Duplicate card: {card}")
+        if len(self.card_ids) >= 7:
+            raise ValueError("HandTracker holds at most 7 cards")
+
+        rank_index = CARD_RANKS[card_id] - 2
+        suit = CARD_SUITS[card_id]
+        self.card_ids.append(card_id)
+        self.rank_counts[rank_index] += 1
+        self.suit_counts[suit] += 1
+        self.suit_masks[suit] |= CARD_RANK_BITS[card_id]
+        self.rank_mask |= CARD_RANK_BITS[card_id]
+        self.product *= CARD_PRIMES[card_id]
+        self._nut_strength = None
+
+        if len(self.card_ids) < 5:
+            self._strength = HandEvaluator.evaluate_ids(self.card_ids)
+            return
+
+        tables = get_tables()
+        strength = tables.nonflush[self.product]
+        # フラッシュになり得るのは5枚以上あるスートだけ（7枚以下なので高々1つ）
+        for suit_index, count in enumerate(self.suit_counts):
+            if count >= 5:
+                strength = max(strength, tables.flush[self.suit_masks[suit_index]])
+        self._strength = strength
+
+    def add_cards(self, cards: Sequence[Card]):
+        """複数のカードを追加（フロップなど）"""
+        for card in cards:
+            self.add(card)
+
+    def sync(self, hole_cards: Sequence[Card], board: Sequence[Card]) -> "HandTracker":
+        """
+        実際のホールカード/ボードに合わせる
+
+        保持しているカードが先頭部分と一致していれば、増えた分だけを追加する。
+        一致しない場合（別のハンドなど）は作り直した HandTracker を返す。
+        """
+        cards = list(hole_cards) + list(board)
+        held = len(self.card_ids)
+        if (
+            self.num_hole == len(hole_cards)
+            and held <= len(cards)
+            and all(cards[i].id == self.card_ids[i] for i in range(held))
+        ):
+            for card in cards[held:]:
+                self.add(card)
+            return self
+        return HandTracker(hole_cards, board)
+
+    @property
+    def cards(self) -> List[Card]:
+        """保持しているカード（ホールカード、ボードの順）"""
+        return [CARDS[card_id] for card_id in self.card_ids]
+
+    @property
+    def board_ids(self) -> List[int]:
+        """ボードのカードID"""
+        return self.card_ids[self.num_hole :]
+
+    @property
+    def strength(self) -> int:
+        """現在の最強ハンドの強さ（HandEvaluator.evaluate_strength と同じ尺度）"""
+        return self._strength
+
+    @property
+    def hand_rank(self) -> HandRank:
+        """現在の役"""
+        return HandRank(self._strength >> CATEGORY_SHIFT)
+
+    def hand_result(self) -> HandResult:
+        """表示用の HandResult（最強の5枚と説明）"""
+        return HandEvaluator.hand_result_from_strength(self._strength, self.cards)
+
+    def strength_with(self, card_id: int) -> int:
+        """カードを1枚足したときの強さ（自身は変更しない）"""
+        if len(self.card_ids) < 4:
+            return HandEvaluator.evaluate_ids(self.card_ids + [card_id])
+
+        tables = get_tables()
+        strength = tables.nonflush[self.product * CARD_PRIMES[card_id]]
+        suit = CARD_SUITS[card_id]
+        if self.suit_counts[suit] >= 4:
+            mask = self.suit_masks[suit] | CARD_RANK_BITS[card_id]
+            strength = max(strength, tables.flush[mask])
+        for other in range(4):
+            if other != suit and self.suit_counts[other] >= 5:
+                strength = max(strength, tables.flush[self.suit_masks[other]])
+        return strength
+
+    def outs(self, dead: Sequence[int] = ()) -> List[int]:
+        """
+        次の1枚で役のカテゴリが上がるカードIDの一覧
+
+        Args:
+            dead: 見えている他のカード（除外する）
+        """
+        if len(self.card_ids) >= 7:
+            return []
+        category = self._strength >> CATEGORY_SHIFT
+        known = set(self.card_ids) | set(dead)
+        return [
+            card_id
+            for card_id in range(52)
+            if card_id not in known
+            and self.strength_with(card_id) >> CATEGORY_SHIFT > category
+        ]
+
+    @property
+    def flush_draw(self) -> bool:
+        """あと1枚でフラッシュになるスートがあり、ホールカードが関わっているか"""
+        if len(self.card_ids) >= 7 or self.hand_rank.value >= HandRank.FLUSH.value:
+            return False
+        hole_suits = {CARD_SUITS[card_id] for card_id in self.card_ids[: self.num_hole]}
+        return any(self.suit_counts[suit] == 4 for suit in hole_suits)
+
+    def straight_draw_ranks(self) -> List[int]:
+        """1枚でストレートが完成する（またはより高いストレートになる）ランクの一覧"""
+        if len(self.card_ids) >= 7:
+            return []
+        current = straight_high(self.rank_mask)
+        return [
+            rank
+            for rank in range(2, 15)
+            if straight_high(self.rank_mask | (1 << (rank - 2))) > current
+        ]
+
+    def nut_strength(self) -> int:
+        """
+        現在のボードで相手が作り得る最強の強さ（ボード3枚以上）
+
+        自分のカードを除いた残りの2枚の組み合わせをまとめて評価し、
+        次のカードが追加されるまで結果を保持する。
+        """
+        if self._nut_strength is None:
+            board = self.board_ids
+            if len(board) < 3:
+                raise ValueError("nut_strength requires at least 3 board cards")
+            known = set(self.card_ids)
+            remaining = [card_id for card_id in range(52) if card_id not in known]
+            holes = np.array(list(combinations(remaining, 2)), dtype=np.intp)
+            boards = np.broadcast_to(np.array(board, dtype=np.intp), (len(holes), len(board)))
+            self._nut_strength = int(HandEvaluator.evaluate_batch(holes, boards).max())
+        return self._nut_strength
+
+    def is_nuts(self) -> bool:
+        """現在のボードで誰にも負けない（引き分けはあり得る）かどうか"""
+        return self._strength >= self.nut_strength()
+
+    def copy(self) -> "HandTracker":
+        """同じ状態の HandTracker を作成"""
+        other = HandTracker.__new__(HandTracker)
+        other.card_ids = list(self.card_ids)
+        other.num_hole = self.num_hole
+        other.rank_counts = list(self.rank_counts)
+        other.suit_counts = list(self.suit_counts)
+        other.suit_masks = list(self.suit_masks)
+        other.rank_mask = self.rank_mask
+        other.product = self.product
+        other._strength = self._strength
+        other._nut_strength = self._nut_strength
+        return other
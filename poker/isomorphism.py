@@ -0,0 +1,59 @@
+"""
+Suit-isomorphism canonicalization
+
+スートの付け替え（4! = 24通り）で移り合う局面は、エクイティもハンドの強さも等しい。
+canonical_key は (hole, board, dead) をその同値類の代表に写し、キャッシュのキーとして
+使えるようにする。
+
+各スートについて (ホールのランクマスク, ボードのランクマスク, デッドのランクマスク)
+を求め、その降順にスートを振り直す。同じマスクを持つスート同士は入れ替えても
+カード集合が変わらないため、順位の付け方によらず代表は一意に決まる。
+ホール・ボード・デッドはそれぞれ順序を区別しない（ソートして比較する）。
+"""
+
+from typing import Sequence, Tuple
+
+from .equity import CardLike, to_card_ids
+from .game_models import CARD_RANKS, CARD_SUITS
+
+CanonicalKey = Tuple[Tuple[int, ...], ...]
+
+
+def canonical_key(
+    hole: Sequence[CardLike],
+    board: Sequence[CardLike] = (),
+    dead: Sequence[CardLike] = (),
+) -> CanonicalKey:
+    """
+    スート同型な局面で共通になるキーを作成
+
+    Returns:
+        (hole, board, dead) それぞれをスートを振り直したカードIDのソート済みタプルにしたもの
+    """
+    groups = (to_card_ids(hole), to_card_ids(board), to_card_ids(dead))
+
+    signatures = [[0, 0, 0] for _ in range(4)]
+    for index, group in enumerate(groups):
+        for card_id in group:
+            signatures[CARD_SUITS[card_id]][index] |= 1 << CARD_RANKS[card_id]
+
+    order = sorted(range(4), key=signatures.__getitem__, reverse=True)
+    new_suit = [0] * 4
+    for rank, suit in enumerate(order):
+        new_suit[suit] = rank
+
+    # カードID = (rank-2)*4 + スート なので、スート部分だけを置き換える
+    return tuple(
+        tuple(
+            sorted(
+                card_id - CARD_SUITS[card_id] + new_suit[CARD_SUITS[card_id]]
+                for card_id in group
+            )
+        )
+        for group in groups
+    )
+
+
+def canonical_cards(cards: Sequence[CardLike]) -> Tuple[int, ...]:
+    """順序を区別しないカード集合のスート同型な代表（ハンドの強さのキャッシュ用）"""
+    return canonical_key(cards)[0]
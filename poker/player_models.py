@@ -7,23 +7,23 @@ import random
 import logging
 import asyncio
 import json
-import requests
 import uuid
 import re
 import logging
 import time
 import concurrent.futures as cf
+import httpx
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from enum import Enum
 
+from .agent_latency import LatencyTracker, get_tracker
+from .agent_runtime import AgentRuntime, agent_loop, load_agent
+from .agent_transport import AgentTransport, get_transport
 from .game_models import Card, GameState, PlayerInfo
 
 from google.adk.agents import Agent
-from google.adk.runners import Runner
-from google.adk.sessions import InMemorySessionService
-from google.genai import types
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -48,11 +48,24 @@ class Player(ABC):
         self.hole_cards: List[Card] = []
         self.current_bet = 0  # 現在のベッティングラウンドでのベット額
         self.total_bet_this_hand = 0  # このハンドでの累積ベット額
-        self.status = PlayerStatus.ACTIVE
+        # 座っているテーブルの SeatRing（状態の変化を通知する。poker.seat_ring を参照）
+        self._seat_ring = None
+        self._seat = -1
+        self._status = PlayerStatus.ACTIVE
         self.is_dealer = False
         self.is_small_blind = False
         self.is_big_blind = False
 
+    @property
+    def status(self) -> PlayerStatus:
+        return self._status
+
+    @status.setter
+    def status(self, value: PlayerStatus):
+        if self._seat_ring is not None and value is not self._status:
+            self._seat_ring.update(self._seat, self._status, value)
+        self._status = value
+
     def reset_for_new_hand(self):
         """新しいハンド用にリセット"""
         self.hole_cards = []
@@ -122,6 +135,15 @@ class Player(ABC):
         """
         pass
 
+    async def decide(self, game_state: GameState) -> Dict[str, Any]:
+        """
+        make_decision の非同期版（poker.async_driver から呼ばれる）
+
+        既定ではすぐに終わる同期の make_decision をそのまま呼ぶ。ネットワークや
+        人間の入力を待つプレイヤーはこれを上書きし、スレッドを塞がずに await する。
+        """
+        return self.make_decision(game_state)
+
     def _parse_llm_response(
         self, response: str, game_state: GameState, response_type: str = "LLM"
     ) -> Dict[str, Any]:
@@ -131,7 +153,7 @@ class Player(ABC):
         Args:
             response: LLMからの応答文字列
             game_state: ゲーム状態
-            response_type: "LLM" or "LLM API" (ログメッセージ用)
+            response_type: "LLM" / "LLM API" / "In-process agent"（ログメッセージ用）
 
         Returns:
             {"action": "fold|check|call|raise|all_in", "amount": int}
@@ -292,6 +314,9 @@ class Player(ABC):
 class HumanPlayer(Player):
     """人間プレイヤークラス"""
 
+    # decide が待っている (イベントループ, Future)
+    _pending = None
+
     def make_decision(self, game_state: GameState) -> Dict[str, Any]:
         """
         人間プレイヤーの場合、UIから入力を受け取る
@@ -300,6 +325,38 @@ class HumanPlayer(Player):
         # この部分は後でUI層から呼び出される
         raise NotImplementedError("Human player decisions are handled by UI layer")
 
+    async def decide(self, game_state: GameState) -> Dict[str, Any]:
+        """
+        UI から submit_action されるまで待つ（ポーリングしない）
+
+        submit_action は UI のスレッドから呼んでよい。
+        """
+        loop = asyncio.get_running_loop()
+        self._pending = (loop, loop.create_future())
+        try:
+            return await self._pending[1]
+        finally:
+            self._pending = None
+
+    def submit_action(self, action: str, amount: int = 0) -> bool:
+        """
+        UI で選ばれたアクションを decide の待ち手に渡す
+
+        Returns:
+            待っている decide があれば True
+        """
+        pending = self._pending
+        if pending is None:
+            return False
+        loop, future = pending
+
+        def resolve():
+            if not future.done():
+                future.set_result({"action": action, "amount": amount})
+
+        loop.call_soon_threadsafe(resolve)
+        return True
+
 
 class RandomPlayer(Player):
     """ランダムプレイヤークラス（ランダム行動）"""
@@ -358,7 +415,16 @@ class RandomPlayer(Player):
 
 
 class LLMPlayer(Player):
-    """LLMプレイヤークラス（ADK使用）"""
+    """
+    LLMプレイヤークラス（ADK使用）
+
+    Runner・セッションサービス・イベントループ（AgentRuntime）はプレイヤーが
+    存在する間ずっと使い回す。セッションは session_scope ごとに作り、
+    不要になったら削除する（"decision": 意思決定ごと、"hand": ハンドごと、
+    "game": プレイヤーが存在する間ずっと）。
+    """
+
+    SESSION_SCOPES = ("decision", "hand", "game")
 
     def __init__(
         self,
@@ -366,10 +432,19 @@ class LLMPlayer(Player):
         name: str,
         initial_chips: int = 1000,
         model: str = "gemini-2.5-flash-lite",
+        session_scope: str = "decision",
     ):
         super().__init__(player_id, name, initial_chips)
+        if session_scope not in self.SESSION_SCOPES:
+            raise ValueError(
+                f"session_scope must be one of {self.SESSION_SCOPES}: {session_scope}"
+            )
         self.model = model
+        self.session_scope = session_scope
         self._agent = None
+        self._runtime: Optional[AgentRuntime] = None
+        self._session_id: Optional[str] = None
+        self._sessions_created = 0
         self.last_decision_reasoning = ""  # 最後の判断理由を保存
         self._setup_agent()
 
@@ -416,6 +491,9 @@ Consider:
 
 Be strategic and analytical. Provide clear reasoning for every decision.""",
             )
+            self._runtime = AgentRuntime(
+                self._agent, app_name="poker_game", user_id=f"player_{self.id}"
+            )
         except ImportError:
             print("Warning: ADK not available, falling back to random behavior")
             self._agent = None
@@ -444,40 +522,8 @@ Be strategic and analytical. Provide clear reasoning for every decision.""",
             # ロガーを使ってプロンプトをログファイルに出力
             logger.info(f"LLM Prompt for {self.name}: {prompt}")
 
-            # ADKエージェントに問い合わせ
-            session_service = InMemorySessionService()
-            runner = Runner(
-                agent=self._agent,
-                app_name="poker_game",
-                session_service=session_service,
-            )
-
-            async def get_decision():
-                session = await session_service.create_session(
-                    app_name="poker_game",
-                    user_id=f"player_{self.id}",
-                    session_id=f"session_{self.id}",
-                )
-
-                # Content型のメッセージを作成
-                content = types.Content(role="user", parts=[types.Part(text=prompt)])
-
-                # run_asyncはイベントストリームを返すので、最終レスポンスを取得
-                final_response_text = None
-                async for event in runner.run_async(
-                    user_id=f"player_{self.id}",
-                    session_id=session.id,
-                    new_message=content,
-                ):
-                    if event.is_final_response():
-                        if event.content and event.content.parts:
-                            final_response_text = event.content.parts[0].text
-                        break
-
-                return final_response_text
-
-            # 非同期関数を同期的に実行 (Python 3.7+)
-            response_content = asyncio.run(get_decision())
+            # ADKエージェントに問い合わせ（バックグラウンドのループで実行して待つ）
+            response_content = self._runtime.call(self._ask_agent(prompt))
             logger.info(f"LLM Response for {self.name}: {response_content}")
 
             print(f"test: {type(response_content)}")
@@ -491,6 +537,43 @@ Be strategic and analytical. Provide clear reasoning for every decision.""",
             random_player = RandomPlayer(self.id, self.name, self.chips)
             return random_player.make_decision(game_state)
 
+    async def decide(self, game_state: GameState) -> Dict[str, Any]:
+        """make_decision の非同期版（イベントループ上でエージェントの応答を待つ）"""
+        if self._agent is None:
+            return self.make_decision(game_state)
+
+        logger = logging.getLogger("poker_game")
+        try:
+            prompt = self._create_decision_prompt(game_state)
+            logger.info(f"LLM Prompt for {self.name}: {prompt}")
+            response_content = await self._runtime.acall(self._ask_agent(prompt))
+            logger.info(f"LLM Response for {self.name}: {response_content}")
+            return self._parse_llm_response(response_content, game_state)
+        except Exception as e:
+            logger.error(f"LLM decision error for {self.name}: {e}")
+            random_player = RandomPlayer(self.id, self.name, self.chips)
+            return random_player.make_decision(game_state)
+
+    async def _ask_agent(self, prompt: str) -> Optional[str]:
+        """ADKエージェントにプロンプトを送り、最終レスポンスのテキストを返す（エージェントのループで実行）"""
+        session_id = self._session_id
+        if session_id is None:
+            self._sessions_created += 1
+            session_id = f"session_{self.id}_{self._sessions_created}"
+            if self.session_scope != "decision":
+                self._session_id = session_id
+        try:
+            return await self._runtime.ask(prompt, session_id)
+        finally:
+            if self.session_scope == "decision":
+                await self._runtime.delete_session(session_id)
+
+    def close_session(self):
+        """使っているセッションを削除する（次の意思決定で新しく作る）"""
+        session_id, self._session_id = self._session_id, None
+        if session_id is not None and self._runtime is not None:
+            self._runtime.submit(self._runtime.delete_session(session_id))
+
     def _create_decision_prompt(self, game_state: GameState) -> str:
         """LLM用のプロンプトを作成"""
 
@@ -527,9 +610,11 @@ Be strategic and analytical. Provide clear reasoning for every decision.""",
         return super()._parse_llm_response(response, game_state, "LLM")
 
     def reset_for_new_hand(self):
-        """新しいハンド用にリセット（理由もクリア）"""
+        """新しいハンド用にリセット（理由もクリア。ハンドごとのセッションなら削除する）"""
         super().reset_for_new_hand()
         self.last_decision_reasoning = ""
+        if self.session_scope == "hand":
+            self.close_session()
 
     def get_last_reasoning(self) -> str:
         """最後の判断理由を取得"""
@@ -540,8 +625,26 @@ Be strategic and analytical. Provide clear reasoning for every decision.""",
         )
 
 
-class LLMApiPlayer(Player):
-    """adk api_serverを使用し、Localhostに公開されたAgentを使用するプレイヤー"""
+class AgentPlayer(Player):
+    """
+    ADK エージェントに意思決定させるプレイヤーの共通部分（LLMApiPlayer / LocalAgentPlayer）
+
+    ゲーム状態のJSONをエージェントに送り、応答をパースしてアクションにする。同期の
+    make_decision もプロセスで1つのバックグラウンドのループで _request を実行し、
+    DECISION_TIMEOUT 秒で取り消してすぐにフォールドする。エラー時はランダム行動。
+
+    セッションは session_scope ごとに1つ作り、その間の意思決定で使い回す
+    （"game": ゲームの間ずっと、"hand": ハンドごとに作り直す）。PokerGame.close で削除する。
+
+    サブクラスは _request（エージェントへの送信）・_decision_from_reply（応答の解釈）・
+    close_session（セッションの削除）を実装する。
+    """
+
+    # この秒数で応答がなければフォールドする
+    DECISION_TIMEOUT = 40
+    SESSION_SCOPES = ("game", "hand")
+    # 応答のパースやタイムアウトのログに出す経路の名前
+    RESPONSE_LABEL = "LLM"
 
     def __init__(
         self,
@@ -549,18 +652,28 @@ class LLMApiPlayer(Player):
         name: str,
         app_name: str,  # agents内のフォルダ名 (team1_agent)
         user_id: str,
-        url: str = os.getenv("AGENT_SERVER_URL", "http://localhost:8000"),
         initial_chips: int = 1000,
+        session_scope: str = "game",
     ):
         super().__init__(player_id, name, initial_chips)
+        if session_scope not in self.SESSION_SCOPES:
+            raise ValueError(
+                f"session_scope must be one of {self.SESSION_SCOPES}: {session_scope}"
+            )
         self.app_name = app_name
         self.user_id = user_id
-        self.url = url
+        self.session_scope = session_scope
+        self.session_id: Optional[str] = None  # 使っているセッション
         self.last_decision_reasoning = ""  # 最後の判断理由を保存
 
+    @property
+    def agent_available(self) -> bool:
+        """エージェントを使えるか（使えなければランダム行動）"""
+        return True
+
     def make_decision(self, game_state: GameState) -> Dict[str, Any]:
         """
-        LLMを使った意思決定
+        エージェントを使った意思決定
 
         Args:
             game_state: 型安全なゲーム状態オブジェクト
@@ -568,164 +681,111 @@ class LLMApiPlayer(Player):
         Returns:
             {"action": "fold|check|call|raise|all_in", "amount": int}
         """
-
+        logger = logging.getLogger("poker_game")
+        if not self.agent_available:
+            return RandomPlayer(self.id, self.name, self.chips).make_decision(game_state)
         try:
-            logger = logging.getLogger("poker_game")
-            session_id = str(uuid.uuid4())
-
-            # ゲーム状態をJSON文字列に変換
-            input_json = json.dumps(game_state.to_dict(), ensure_ascii=False, indent=2)
-            logger.debug(f"LLM Prompt for {self.name}: {input_json}")
+            input_json = self._input_json(game_state, logger)
 
-            # セッションの作成（短いタイムアウト）
+            # バックグラウンドのループで送り、DECISION_TIMEOUT 秒で取り消す
+            # （応答を待たずにすぐ戻る）
+            future = asyncio.run_coroutine_threadsafe(self._request(input_json), agent_loop())
             try:
-                create_session = requests.post(
-                    f"{self.url}/apps/{self.app_name}/users/{self.user_id}/sessions/{session_id}",
-                    json={},
-                    headers={"Content-Type": "application/json"},
-                    timeout=5,
-                )
-                if create_session.status_code != 200:
-                    logger.error(
-                        f"Session creation failed with status {create_session.status_code}: {create_session.text}"
-                    )
-                else:
-                    logger.debug(f"Create Session: {create_session.json()}")
-            except requests.exceptions.RequestException as e:
-                logger.error(f"Session creation request error for {self.name}: {e}")
-
-            # 実際の実行リクエストを別スレッドで発行し、20秒待機・10秒ごとにログ
-            def run_request():
-                try:
-                    return requests.post(
-                        f"{self.url}/run",
-                        json={
-                            "app_name": self.app_name,
-                            "user_id": self.user_id,
-                            "session_id": session_id,
-                            "new_message": {
-                                "role": "user",
-                                "parts": [{"text": input_json}],
-                            },
-                        },
-                        headers={"Content-Type": "application/json"},
-                        timeout=44,  # スレッド側は44秒でタイムアウト
-                    )
-                except Exception as e:
-                    return e
-
-            start = time.time()
-            logged_10 = False
-            logged_20 = False
-            logged_30 = False
-            with cf.ThreadPoolExecutor(max_workers=1) as executor:
-                future = executor.submit(run_request)
-                response = None
-                while True:
-                    elapsed = time.time() - start
-                    # 10秒ごとのログ出力
-                    if not logged_10 and elapsed >= 10:
-                        logger.info(
-                            f"Waiting for LLM API response for {self.name}... 10 seconds elapsed"
-                        )
-                        logged_10 = True
-                    if not logged_20 and elapsed >= 20:
-                        logger.info(
-                            f"Waiting for LLM API response for {self.name}... 20 seconds elapsed"
-                        )
-                        logged_20 = True
-                    if not logged_30 and elapsed >= 30:
-                        logger.info(
-                            f"Waiting for LLM API response for {self.name}... 30 seconds elapsed"
-                        )
-                        logged_30 = True
-                    try:
-                        # 短い待機でポーリング
-                        response = future.result(timeout=0.2)
-                        break
-                    except cf.TimeoutError:
-                        pass
-                    if elapsed >= 40:
-                        logger.warning(
-                            f"LLM API response timeout for {self.name} after 40 seconds - folding"
-                        )
-                        if hasattr(self, "last_decision_reasoning"):
-                            self.last_decision_reasoning = (
-                                "40秒経過しても応答がないため、フォールドします"
-                            )
-                        return {
-                            "action": "fold",
-                            "amount": 0,
-                            "reasoning": "40秒経過しても応答がないため、フォールドします",
-                        }
-
-            # スレッド結果の処理
-            if isinstance(response, Exception):
-                logger.error(f"LLM decision error for {self.name}: {response}")
-                random_player = RandomPlayer(self.id, self.name, self.chips)
-                return random_player.make_decision(game_state)
-
-            if response is None:
-                logger.error(f"Empty response received for {self.name}")
-                return {
-                    "action": "fold",
-                    "amount": 0,
-                    "reasoning": "20秒経過しても応答がないため、フォールドします",
-                }
-
-            if response.status_code != 200:
-                logger.error(
-                    f"API request failed with status {response.status_code}: {response.text}"
-                )
-                if response.status_code == 422:
-                    logger.error(
-                        f"422 Error details - Request data: {json.dumps({
-                        'app_name': self.app_name,
-                        'user_id': self.user_id,
-                        'session_id': session_id,
-                        'message_preview': input_json[:200] + '...' if len(input_json) > 200 else input_json
-                    }, indent=2)}"
-                    )
-                # 失敗時はフォールドで安全に進行
-                return {
-                    "action": "fold",
-                    "amount": 0,
-                    "reasoning": "20秒経過しても応答がないため、フォールドします",
-                }
-
-            # 正常応答
+                reply = future.result(self.DECISION_TIMEOUT)
+            except cf.TimeoutError:
+                future.cancel()
+                return self._timeout_fold(logger)
+
+            return self._decision_from_reply(reply, game_state, input_json)
+
+        except Exception as e:
+            logger.error(f"LLM decision error for {self.name}: {e}")
+            # エラー時はランダム行動
+            random_player = RandomPlayer(self.id, self.name, self.chips)
+            return random_player.make_decision(game_state)
+
+    async def decide(self, game_state: GameState) -> Dict[str, Any]:
+        """
+        make_decision の非同期版
+
+        呼び出し側のループを塞がずに応答を待ち、その間は10秒ごとにログを出す。
+        DECISION_TIMEOUT 秒で応答がなければフォールドする。
+        """
+        logger = logging.getLogger("poker_game")
+        if not self.agent_available:
+            return RandomPlayer(self.id, self.name, self.chips).make_decision(game_state)
+        try:
+            input_json = self._input_json(game_state, logger)
+
+            progress = asyncio.ensure_future(self._log_waiting(logger))
             try:
-                logger.info(f"LLM raw Response for {self.name}: {response.json()}")
-                logger.debug(
-                    f"LLM [-1]['content']['parts'][0]['text'] for {self.name}:"
-                )
-                logger.debug(response.json()[-1]["content"]["parts"][0]["text"])
-            except Exception:
-                # JSONでない/形式不正でも後続のパースで対応
-                pass
-
-            return self._parse_llm_response(
-                response.json()[-1]["content"]["parts"][0]["text"],
-                game_state,
-            )
+                reply = await asyncio.wait_for(self._request(input_json), self.DECISION_TIMEOUT)
+            except asyncio.TimeoutError:
+                return self._timeout_fold(logger)
+            finally:
+                progress.cancel()
+
+            return self._decision_from_reply(reply, game_state, input_json)
 
         except Exception as e:
-            logger = logging.getLogger("poker_game")
             logger.error(f"LLM decision error for {self.name}: {e}")
             # エラー時はランダム行動
             random_player = RandomPlayer(self.id, self.name, self.chips)
             return random_player.make_decision(game_state)
 
+    def _input_json(self, game_state: GameState, logger: logging.Logger) -> str:
+        """エージェントに送るゲーム状態のJSON"""
+        input_json = json.dumps(game_state.to_dict(), ensure_ascii=False, indent=2)
+        logger.debug(f"LLM Prompt for {self.name}: {input_json}")
+        return input_json
+
+    @abstractmethod
+    async def _request(self, input_json: str) -> Any:
+        """エージェントに input_json を送って応答を返す（取り消されたら送信も取り消す）"""
+
+    @abstractmethod
+    def _decision_from_reply(
+        self, reply: Any, game_state: GameState, input_json: str
+    ) -> Dict[str, Any]:
+        """_request の応答から意思決定を作る"""
+
+    async def _log_waiting(self, logger: logging.Logger):
+        """応答待ちの間、10秒ごとに経過をログに出す"""
+        elapsed = 0
+        while True:
+            await asyncio.sleep(10)
+            elapsed += 10
+            logger.info(
+                f"Waiting for {self.RESPONSE_LABEL} response for {self.name}... "
+                f"{elapsed} seconds elapsed"
+            )
+
+    def _timeout_fold(self, logger: logging.Logger) -> Dict[str, Any]:
+        logger.warning(
+            f"{self.RESPONSE_LABEL} response timeout for {self.name} "
+            f"after {self.DECISION_TIMEOUT} seconds - folding"
+        )
+        self.last_decision_reasoning = (
+            f"{self.DECISION_TIMEOUT}秒経過しても応答がないため、フォールドします"
+        )
+        return {"action": "fold", "amount": 0, "reasoning": self.last_decision_reasoning}
+
     def _parse_llm_response(
         self, response: str, game_state: GameState
     ) -> Dict[str, Any]:
         """LLMの応答をパース（共通実装を使用）"""
-        return super()._parse_llm_response(response, game_state, "LLM API")
+        return super()._parse_llm_response(response, game_state, self.RESPONSE_LABEL)
+
+    @abstractmethod
+    def close_session(self):
+        """使っているセッションを削除する（次の意思決定で新しく作る）"""
 
     def reset_for_new_hand(self):
-        """新しいハンド用にリセット（理由もクリア）"""
+        """新しいハンド用にリセット（理由もクリア。ハンドごとのセッションなら削除する）"""
         super().reset_for_new_hand()
         self.last_decision_reasoning = ""
+        if self.session_scope == "hand":
+            self.close_session()
 
     def get_last_reasoning(self) -> str:
         """最後の判断理由を取得"""
@@ -734,3 +794,340 @@ class LLMApiPlayer(Player):
             if self.last_decision_reasoning
             else "理由が記録されていません"
         )
+
+
+class LLMApiPlayer(AgentPlayer):
+    """
+    adk api_serverを使用し、Localhostに公開されたAgentを使用するプレイヤー
+
+    PokerGame.start_new_hand がまだセッションのないプレイヤーの分を並行に作成する。
+
+    リクエストは同期・非同期どちらの意思決定でも非同期クライアントで送る。
+    hedge_percentile を指定すると、このエージェントの所要時間のその百分位を過ぎても
+    応答がないときに同じ /run をもう1本送り、先に返ってきた応答を使う（ヘッジ）。
+    ヘッジは本来のセッションに同じ発言を重ねないよう、ヘッジ専用のセッションに送る。
+    """
+
+    RESPONSE_LABEL = "LLM API"
+
+    def __init__(
+        self,
+        player_id: int,
+        name: str,
+        app_name: str,  # agents内のフォルダ名 (team1_agent)
+        user_id: str,
+        url: str = os.getenv("AGENT_SERVER_URL", "http://localhost:8000"),
+        initial_chips: int = 1000,
+        transport: Optional[AgentTransport] = None,
+        session_scope: str = os.getenv("AGENT_SESSION_SCOPE", "game"),
+        hedge_percentile: Optional[float] = None,
+    ):
+        super().__init__(player_id, name, app_name, user_id, initial_chips, session_scope)
+        if hedge_percentile is None and os.getenv("AGENT_HEDGE_PERCENTILE"):
+            hedge_percentile = float(os.environ["AGENT_HEDGE_PERCENTILE"])
+        if hedge_percentile is not None and not 0 < hedge_percentile < 100:
+            raise ValueError(f"hedge_percentile must be in (0, 100): {hedge_percentile}")
+        self.url = url
+        # 同じサーバーのプレイヤー同士で keep-alive の接続プールを共有する
+        self.transport = transport or get_transport(url)
+        self.hedge_percentile = hedge_percentile  # None ならヘッジしない
+        self.hedge_session_id: Optional[str] = None  # ヘッジ専用のセッション
+
+    @property
+    def session_pending(self) -> bool:
+        """まだセッションを作成していない"""
+        return self.session_id is None
+
+    @property
+    def latency(self) -> LatencyTracker:
+        """このエージェント（app_name）の所要時間の記録（同じエージェントのプレイヤーで共有）"""
+        return get_tracker(self.app_name)
+
+    def create_session(self) -> bool:
+        """
+        セッションを作成する（失敗したら1回だけ作り直す）
+
+        Returns:
+            作成できたか（できなければ session_id は None のまま）
+        """
+        # /run と同じ接続を使うよう、バックグラウンドのループで作成する
+        return asyncio.run_coroutine_threadsafe(self.acreate_session(), agent_loop()).result()
+
+    async def acreate_session(self) -> bool:
+        """create_session の非同期版"""
+        session_id = await self._new_session()
+        if session_id is None:
+            return False
+        self.session_id = session_id
+        return True
+
+    async def _new_session(self) -> Optional[str]:
+        """サーバーにセッションを作成してそのIDを返す（失敗したら1回だけ作り直し、だめなら None）"""
+        logger = logging.getLogger("poker_game")
+        for attempt in range(2):
+            session_id = str(uuid.uuid4())
+            try:
+                response = await self.transport.apost(
+                    self._session_path(session_id), {}, timeout=5
+                )
+            except httpx.HTTPError as e:
+                response = e
+            if self._session_created(logger, response, attempt):
+                return session_id
+        return None
+
+    async def _request(self, input_json: str) -> Tuple[httpx.Response, str]:
+        """
+        /run を送って (応答, 使ったセッション) を返す（セッションがなければ先に作成する）
+
+        ヘッジする場合は、所要時間の hedge_percentile 百分位を過ぎても応答がなければ
+        ヘッジ専用のセッションに同じ /run を送り、先に 200 で返ってきたほうを使う。
+        取り消されたとき（タイムアウト）は送信中のリクエストも全て取り消す。
+        """
+        # セッションは通常 start_new_hand で作成済み
+        if self.session_pending and not await self.acreate_session():
+            raise RuntimeError("セッションを作成できませんでした")
+
+        tracker = self.latency
+        start = time.perf_counter()
+        primary = asyncio.ensure_future(self._post_run(self.session_id, input_json))
+        hedge = None
+        pending = {primary}
+        try:
+            hedge_after = self._hedge_after(tracker)
+            if hedge_after is not None:
+                done, _ = await asyncio.wait(pending, timeout=hedge_after)
+                if not done:
+                    hedge = asyncio.ensure_future(self._post_hedge(input_json))
+                    pending.add(hedge)
+                    logging.getLogger("poker_game").info(
+                        f"No LLM API response for {self.name} after {hedge_after:.2f}s - hedging"
+                    )
+
+            # 200 の応答が来るか、全てのリクエストが終わるまで待つ
+            result = None
+            while pending and (result is None or not self._succeeded(result)):
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if result is None or self._succeeded(task):
+                        result = task
+        finally:
+            for task in pending:
+                task.cancel()
+
+        if hedge is not None:
+            tracker.record_hedge(won=result is hedge)
+        response, session_id = result.result()
+        if response.status_code == 200:
+            tracker.record(time.perf_counter() - start)
+        return response, session_id
+
+    @staticmethod
+    def _succeeded(task: asyncio.Future) -> bool:
+        return task.exception() is None and task.result()[0].status_code == 200
+
+    def _hedge_after(self, tracker: LatencyTracker) -> Optional[float]:
+        """ヘッジを送るまでの秒数（ヘッジしないなら None）"""
+        if self.hedge_percentile is None:
+            return None
+        delay = tracker.percentile(self.hedge_percentile)
+        if delay is None or delay >= self.DECISION_TIMEOUT:
+            return None
+        return delay
+
+    async def _post_run(self, session_id: str, input_json: str) -> Tuple[httpx.Response, str]:
+        response = await self.transport.apost(
+            "/run",
+            self._run_payload(session_id, input_json),
+            timeout=self.DECISION_TIMEOUT + 4,
+        )
+        return response, session_id
+
+    async def _post_hedge(self, input_json: str) -> Tuple[httpx.Response, str]:
+        """ヘッジ専用のセッション（なければ作成）に同じ /run を送る"""
+        if self.hedge_session_id is None:
+            self.hedge_session_id = await self._new_session()
+            if self.hedge_session_id is None:
+                raise RuntimeError("ヘッジ用のセッションを作成できませんでした")
+        return await self._post_run(self.hedge_session_id, input_json)
+
+    def _timeout_fold(self, logger: logging.Logger) -> Dict[str, Any]:
+        # 打ち切った意思決定も（少なくとも）制限時間かかったものとして分布に含める
+        self.latency.record(self.DECISION_TIMEOUT)
+        return super()._timeout_fold(logger)
+
+    def _session_created(self, logger: logging.Logger, response, attempt: int) -> bool:
+        """セッション作成の応答（または例外）を判定してログに残す"""
+        if isinstance(response, Exception):
+            error = f"Session creation request error for {self.name}: {response}"
+        elif response.status_code not in (200, 201):
+            error = f"Session creation failed with status {response.status_code}: {response.text}"
+        else:
+            logger.debug(f"Create Session: {response.json()}")
+            return True
+        if attempt == 0:
+            logger.warning(f"{error} - retrying once")
+        else:
+            logger.error(error)
+        return False
+
+    def _session_path(self, session_id: str) -> str:
+        return f"/apps/{self.app_name}/users/{self.user_id}/sessions/{session_id}"
+
+    def _run_payload(self, session_id: str, input_json: str) -> Dict[str, Any]:
+        return {
+            "app_name": self.app_name,
+            "user_id": self.user_id,
+            "session_id": session_id,
+            "new_message": {
+                "role": "user",
+                "parts": [{"text": input_json}],
+            },
+        }
+
+    def _decision_from_reply(
+        self, reply: Tuple[httpx.Response, str], game_state: GameState, input_json: str
+    ) -> Dict[str, Any]:
+        """/run の (応答, 使ったセッション) から意思決定を作る"""
+        logger = logging.getLogger("poker_game")
+        response, session_id = reply
+        if response is None:
+            logger.error(f"Empty response received for {self.name}")
+            return {
+                "action": "fold",
+                "amount": 0,
+                "reasoning": "20秒経過しても応答がないため、フォールドします",
+            }
+
+        if response.status_code != 200:
+            logger.error(
+                f"API request failed with status {response.status_code}: {response.text}"
+            )
+            if response.status_code == 404:
+                # サーバーの再起動などでセッションが消えた。次の意思決定で作り直す
+                if session_id == self.session_id:
+                    self.session_id = None
+                elif session_id == self.hedge_session_id:
+                    self.hedge_session_id = None
+            if response.status_code == 422:
+                logger.error(
+                    f"422 Error details - Request data: {json.dumps({
+                    'app_name': self.app_name,
+                    'user_id': self.user_id,
+                    'session_id': session_id,
+                    'message_preview': input_json[:200] + '...' if len(input_json) > 200 else input_json
+                }, indent=2)}"
+                )
+            # 失敗時はフォールドで安全に進行
+            return {
+                "action": "fold",
+                "amount": 0,
+                "reasoning": "20秒経過しても応答がないため、フォールドします",
+            }
+
+        # 正常応答
+        try:
+            logger.info(f"LLM raw Response for {self.name}: {response.json()}")
+            logger.debug(
+                f"LLM [-1]['content']['parts'][0]['text'] for {self.name}:"
+            )
+            logger.debug(response.json()[-1]["content"]["parts"][0]["text"])
+        except Exception:
+            # JSONでない/形式不正でも後続のパースで対応
+            pass
+
+        return self._parse_llm_response(
+            response.json()[-1]["content"]["parts"][0]["text"],
+            game_state,
+        )
+
+    def close_session(self):
+        """
+        使っているセッション（とヘッジ用のセッション）をサーバーから削除する
+
+        削除はバックグラウンドのループで行い、完了を待たない（失敗しても警告を残すだけ）。
+        次の意思決定では新しいセッションを作る。
+        """
+        session_ids = [sid for sid in (self.session_id, self.hedge_session_id) if sid]
+        self.session_id = None
+        self.hedge_session_id = None
+        if session_ids:
+            asyncio.run_coroutine_threadsafe(self._delete_sessions(session_ids), agent_loop())
+
+    async def _delete_sessions(self, session_ids: List[str]):
+        logger = logging.getLogger("poker_game")
+        for session_id in session_ids:
+            try:
+                response = await self.transport.adelete(self._session_path(session_id), timeout=5)
+            except httpx.HTTPError as e:
+                logger.warning(f"Session deletion request error for {self.name}: {e}")
+                continue
+            if response.status_code not in (200, 204, 404):
+                logger.warning(
+                    f"Session deletion failed with status {response.status_code}: {response.text}"
+                )
+
+
+class LocalAgentPlayer(AgentPlayer):
+    """
+    agents/ 以下の ADK エージェント（root_agent）をプロセス内で実行するプレイヤー
+
+    LLMApiPlayer と同じ入力（ゲーム状態のJSON）・同じ応答の解釈・同じタイムアウトと
+    フォールバックで、adk api_server と HTTP を経由せずに AgentRuntime で直接実行する。
+    """
+
+    RESPONSE_LABEL = "In-process agent"
+
+    def __init__(
+        self,
+        player_id: int,
+        name: str,
+        app_name: str,  # agents内のフォルダ名 (team1_agent)
+        user_id: str,
+        initial_chips: int = 1000,
+        agent: Any = None,
+        session_scope: str = os.getenv("AGENT_SESSION_SCOPE", "game"),
+    ):
+        super().__init__(player_id, name, app_name, user_id, initial_chips, session_scope)
+        self._runtime: Optional[AgentRuntime] = None
+        try:
+            self._runtime = AgentRuntime(
+                agent if agent is not None else load_agent(app_name), app_name, user_id
+            )
+        except Exception as e:
+            # 読み込めないエージェントはランダム行動にフォールバック
+            logging.getLogger("poker_game").error(
+                f"Failed to load agent {app_name} for {self.name}: {e}"
+            )
+
+    @property
+    def agent_available(self) -> bool:
+        return self._runtime is not None
+
+    def _session(self) -> str:
+        """今回の意思決定で使うセッション（初回は新しく作る）"""
+        if self.session_id is None:
+            self.session_id = str(uuid.uuid4())
+        return self.session_id
+
+    async def _request(self, input_json: str) -> Optional[str]:
+        """AgentRuntime で実行して最終レスポンスのテキストを返す"""
+        return await self._runtime.acall(self._runtime.ask(input_json, self._session()))
+
+    def _decision_from_reply(
+        self, reply: Optional[str], game_state: GameState, input_json: str
+    ) -> Dict[str, Any]:
+        logger = logging.getLogger("poker_game")
+        logger.info(f"{self.RESPONSE_LABEL} raw Response for {self.name}: {reply}")
+        if reply is None:
+            logger.error(f"Empty response received for {self.name}")
+            return {"action": "fold", "amount": 0, "reasoning": "応答がないため、フォールドします"}
+        return self._parse_llm_response(reply, game_state)
+
+    def close_session(self):
+        """使っているセッションを削除する（次の意思決定で新しく作る）"""
+        session_id, self.session_id = self.session_id, None
+        if session_id is not None and self._runtime is not None:
+            self._runtime.submit(self._runtime.delete_session(session_id))
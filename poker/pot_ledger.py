@@ -0,0 +1,170 @@
+"""
+Incremental pot ledger with side pots
+
+ショーダウンのたびに total_bet_this_hand からポットの階層を組み立て直す代わりに、
+ベット（ブラインド・コール・レイズ・オールイン）のたびに階層を更新しておく。
+階層の境目は各座席の累積ベット額で、階層ごとに「その額以上を出した座席」の
+ビットマスクを持つ。メインポット・サイドポットの額と受給資格者はいつでも
+定数時間に近いコスト（階層数は座席数以下）で読める。
+
+    ledger = PotLedger(4)
+    ledger.add(0, 50)                        # 座席0が50（オールイン）
+    ledger.add(1, 200)
+    ledger.add(2, 200)
+    ledger.pots(live_mask, all_in_mask)      # [Pot(150, ...), Pot(300, ...)]
+
+layers() / layer_pots() の階層の分け方と順番は以前の conduct_showdown と同じ
+（額が 0 の階層は作らない）。ショーダウンはこの階層ごとに分配する。
+pots() は隣り合う階層をまとめ、新しいポットはオールインした座席の累積額でだけ始まる
+（オールインがなければベットの途中でもポットは1つ）。
+"""
+
+from dataclasses import dataclass
+from typing import List, Sequence, Tuple
+
+
+@dataclass(frozen=True)
+class Pot:
+    """
+    メインポットまたはサイドポット
+
+    Attributes:
+        amount: 額
+        contributors: このポットに拠出した座席のビットマスク
+        eligible: 受給資格のある座席（拠出していてフォールドしていない）のビットマスク
+    """
+
+    amount: int
+    contributors: int
+    eligible: int
+
+    @property
+    def contributor_seats(self) -> List[int]:
+        return _seats(self.contributors)
+
+    @property
+    def eligible_seats(self) -> List[int]:
+        return _seats(self.eligible)
+
+    def to_dict(self) -> dict:
+        return {"amount": self.amount, "eligible": self.eligible_seats}
+
+
+def _seats(mask: int) -> List[int]:
+    return [seat for seat in range(mask.bit_length()) if mask >> seat & 1]
+
+
+class PotLedger:
+    """
+    座席ごとの累積ベット額とポットの階層
+
+    階層 i は累積額 tops[i-1]（i=0 なら0）から tops[i] までの幅を持ち、
+    masks[i] は累積額が tops[i] 以上の座席のビットマスク。
+    """
+
+    __slots__ = ("totals", "_tops", "_masks")
+
+    def __init__(self, seats: int = 0):
+        self.totals: List[int] = [0] * seats
+        self._tops: List[int] = []
+        self._masks: List[int] = []
+
+    def reset(self, seats: int):
+        """新しいハンド用に空にする"""
+        self.totals = [0] * seats
+        self._tops = []
+        self._masks = []
+
+    def rebuild(self, totals: Sequence[int]):
+        """累積ベット額の一覧から作り直す（total_bet_this_hand を直接書き換えた場合など）"""
+        self.reset(len(totals))
+        for seat, amount in enumerate(totals):
+            self.add(seat, max(0, int(amount)))
+
+    def add(self, seat: int, amount: int):
+        """座席 seat が amount を追加でベットした"""
+        if amount <= 0:
+            return
+        if seat >= len(self.totals):
+            self.totals.extend([0] * (seat + 1 - len(self.totals)))
+        before = self.totals[seat]
+        after = before + amount
+        self.totals[seat] = after
+        tops = self._tops
+        masks = self._masks
+
+        # after を階層の境目にする（既存の階層の途中なら2つに分ける）
+        index = 0
+        while index < len(tops) and tops[index] < after:
+            index += 1
+        if index == len(tops):
+            tops.append(after)
+            masks.append(0)
+        elif tops[index] != after:
+            tops.insert(index, after)
+            masks.insert(index, masks[index])
+
+        # before より上、after までの階層に座席を加える
+        bit = 1 << seat
+        low = 0
+        for i in range(index, -1, -1):
+            if tops[i] <= before:
+                low = i + 1
+                break
+            masks[i] |= bit
+
+        # before ちょうどの座席がいなくなったら、その境目を消す
+        if before > 0 and low > 0 and tops[low - 1] == before and masks[low - 1] == masks[low]:
+            del tops[low - 1]
+            del masks[low - 1]
+
+    @property
+    def total(self) -> int:
+        """ポットの合計"""
+        return sum(self.totals)
+
+    def layers(self) -> List[Tuple[int, int]]:
+        """階層ごとの (額, 拠出した座席のビットマスク)"""
+        result = []
+        prev = 0
+        for top, mask in zip(self._tops, self._masks):
+            result.append(((top - prev) * mask.bit_count(), mask))
+            prev = top
+        return result
+
+    def layer_pots(self, live: int) -> List[Pot]:
+        """
+        階層ごとの Pot（まとめない。ショーダウンの分配に使う）
+
+        Args:
+            live: フォールドしていない座席のビットマスク（受給資格の判定に使う）
+        """
+        return [Pot(amount, mask, mask & live) for amount, mask in self.layers()]
+
+    def pots(self, live: int, all_in: int) -> List[Pot]:
+        """
+        メインポットとサイドポット（メインが先頭）
+
+        階層はオールインした座席の累積額を境目にしてまとめる。まだコールされていない
+        上の階層は下のポットに含める。受給資格者がいない階層（フォールドした座席の
+        コールされなかったベット）は拠出者に返すので、階層ごとに別のポットにする。
+
+        Args:
+            live: フォールドしていない座席のビットマスク（受給資格の判定に使う）
+            all_in: オールインした座席のビットマスク
+        """
+        levels = {self.totals[seat] for seat in _seats(all_in) if seat < len(self.totals)}
+        pots: List[Pot] = []
+        prev = 0
+        for top, layer in zip(self._tops, self.layer_pots(live)):
+            if pots and layer.eligible and pots[-1].eligible and prev not in levels:
+                last = pots[-1]
+                pots[-1] = Pot(
+                    last.amount + layer.amount,
+                    last.contributors | layer.contributors,
+                    last.eligible | layer.eligible,
+                )
+            else:
+                pots.append(layer)
+            prev = top
+        return pots
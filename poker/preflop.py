@@ -0,0 +1,326 @@
+"""
+Precomputed preflop equity tables
+
+169種類のスターティングハンド（ペア13 / スーテッド78 / オフスート78）について、
+
+- ランダムな相手 1〜8 人に対するエクイティ（169 x 8）
+- ヘッズアップの対戦表（169 x 169、行のハンドから見たエクイティ）
+
+をオフラインで計算し、コンパクトなバイナリファイルに保存する。
+ファイルは初回参照時にメモリマップされ、意思決定時にはシミュレーションを行わない。
+
+テーブルの再生成:
+
+    uv run python -m poker.preflop --output poker/data/preflop_equity.bin
+
+ハンドクラスの並びは 13x13 グリッド（A..2）: 行 == 列 がペア、行 < 列 がスーテッド、
+行 > 列 がオフスート（例: index 1 = "AKs", index 13 = "AKo"）。
+"""
+
+import argparse
+import struct
+import time
+from pathlib import Path
+from typing import List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from .equity import CardLike, monte_carlo_equity, to_card_ids
+from .evaluator import HandEvaluator
+from .game_models import CARD_RANKS, CARD_SUITS
+
+RANK_CHARS = "AKQJT98765432"
+NUM_CLASSES = 169
+MAX_OPPONENTS = 8
+
+DEFAULT_TABLE_PATH = Path(__file__).resolve().parent / "data" / "preflop_equity.bin"
+
+# magic, version, クラス数, 最大相手数, 多人数表の試行数, 対戦表の試行数
+_HEADER = struct.Struct("<4sHHIII")
+_MAGIC = b"PFEQ"
+_VERSION = 1
+# エクイティ [0, 1] を uint16 の固定小数点で保存
+_SCALE = 65535
+
+HandClass = Union[str, int, Sequence[CardLike]]
+
+
+def _class_name(row: int, col: int) -> str:
+    if row == col:
+        return RANK_CHARS[row] * 2
+    if row < col:
+        return RANK_CHARS[row] + RANK_CHARS[col] + "s"
+    return RANK_CHARS[col] + RANK_CHARS[row] + "o"
+
+
+HAND_CLASSES: Tuple[str, ...] = tuple(
+    _class_name(row, col) for row in range(13) for col in range(13)
+)
+_CLASS_INDEX = {name: index for index, name in enumerate(HAND_CLASSES)}
+
+
+def hand_class_index(hand: HandClass) -> int:
+    """ハンドクラス名（"AKs"）/ インデックス / ホールカード2枚からクラスのインデックスを取得"""
+    if isinstance(hand, int):
+        if not 0 <= hand < NUM_CLASSES:
+            raise ValueError(f"Invalid hand class index: {hand}")
+        return hand
+    if isinstance(hand, str):
+        index = _CLASS_INDEX.get(hand)
+        if index is None:
+            raise ValueError(f"Invalid hand class: {hand}")
+        return index
+
+    first, second = to_card_ids(hand) if len(hand) == 2 else (None, None)
+    if first is None or first == second:
+        raise ValueError("hole must contain exactly 2 distinct cards")
+    high = 14 - max(CARD_RANKS[first], CARD_RANKS[second])
+    low = 14 - min(CARD_RANKS[first], CARD_RANKS[second])
+    if CARD_SUITS[first] == CARD_SUITS[second]:
+        return high * 13 + low
+    return low * 13 + high
+
+
+def hand_class(hand: HandClass) -> str:
+    """ホールカード2枚をハンドクラス名（"AA", "AKs", "72o" など）に変換"""
+    return HAND_CLASSES[hand_class_index(hand)]
+
+
+def class_combos(hand: HandClass) -> List[Tuple[int, int]]:
+    """ハンドクラスに属する具体的な組み合わせ（カードIDの組）を列挙"""
+    index = hand_class_index(hand)
+    row, col = divmod(index, 13)
+    high, low = 14 - min(row, col), 14 - max(row, col)
+    ids_high = [card_id for card_id in range(52) if CARD_RANKS[card_id] == high]
+    ids_low = [card_id for card_id in range(52) if CARD_RANKS[card_id] == low]
+    if row == col:
+        return [(a, b) for i, a in enumerate(ids_high) for b in ids_high[i + 1 :]]
+    suited = row < col
+    return [
+        (a, b)
+        for a in ids_high
+        for b in ids_low
+        if (CARD_SUITS[a] == CARD_SUITS[b]) == suited
+    ]
+
+
+class PreflopTable:
+    """メモリマップされたプリフロップエクイティ表"""
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        with open(self.path, "rb") as f:
+            header = f.read(_HEADER.size)
+        if len(header) < _HEADER.size:
+            raise ValueError(f"Invalid preflop table: {self.path}")
+        magic, version, num_classes, max_opponents, multiway_samples, matchup_samples = (
+            _HEADER.unpack(header)
+        )
+        if magic != _MAGIC or version != _VERSION or num_classes != NUM_CLASSES:
+            raise ValueError(f"Invalid preflop table: {self.path}")
+
+        self.max_opponents = max_opponents
+        self.multiway_samples = multiway_samples
+        self.matchup_samples = matchup_samples
+        data = np.memmap(
+            self.path,
+            dtype="<u2",
+            mode="r",
+            offset=_HEADER.size,
+            shape=(NUM_CLASSES * max_opponents + NUM_CLASSES * NUM_CLASSES,),
+        )
+        split = NUM_CLASSES * max_opponents
+        self.multiway = data[:split].reshape(NUM_CLASSES, max_opponents)
+        self.matchups = data[split:].reshape(NUM_CLASSES, NUM_CLASSES)
+
+    def equity(self, hand: HandClass, num_opponents: int = 1) -> float:
+        """ランダムな相手 num_opponents 人に対するエクイティ"""
+        if not 1 <= num_opponents <= self.max_opponents:
+            raise ValueError(
+                f"num_opponents must be between 1 and {self.max_opponents}"
+            )
+        return int(self.multiway[hand_class_index(hand), num_opponents - 1]) / _SCALE
+
+    def matchup(self, hero: HandClass, villain: HandClass) -> float:
+        """ヘッズアップで hero が villain に対して持つエクイティ"""
+        return (
+            int(self.matchups[hand_class_index(hero), hand_class_index(villain)]) / _SCALE
+        )
+
+
+_table: Optional[PreflopTable] = None
+
+
+def get_preflop_table() -> PreflopTable:
+    """同梱のプリフロップ表を取得（初回呼び出し時にメモリマップ）"""
+    global _table
+    if _table is None:
+        _table = PreflopTable(DEFAULT_TABLE_PATH)
+    return _table
+
+
+def preflop_equity(hand: HandClass, num_opponents: int = 1) -> float:
+    """プリフロップでランダムな相手 num_opponents 人（1〜8）に対するエクイティ"""
+    return get_preflop_table().equity(hand, num_opponents)
+
+
+def preflop_matchup(hero: HandClass, villain: HandClass) -> float:
+    """プリフロップのヘッズアップ対戦エクイティ（hero 視点）"""
+    return get_preflop_table().matchup(hero, villain)
+
+
+# ---------------------------------------------------------------------------
+# オフラインでのテーブル構築
+# ---------------------------------------------------------------------------
+
+
+def build_multiway_table(
+    samples: int, max_opponents: int = MAX_OPPONENTS, seed: Optional[int] = None
+) -> np.ndarray:
+    """
+    169クラス x 相手 1〜max_opponents 人のエクイティ表を計算
+
+    ランダムな相手に対するエクイティはスートの付け替えで変わらないため、
+    各クラスの代表となる組み合わせ1つだけを評価する。
+    """
+    seeds = np.random.SeedSequence(seed).spawn(NUM_CLASSES * max_opponents)
+    table = np.zeros((NUM_CLASSES, max_opponents), dtype=np.float64)
+    for index in range(NUM_CLASSES):
+        hole = list(class_combos(index)[0])
+        for opponents in range(1, max_opponents + 1):
+            table[index, opponents - 1] = monte_carlo_equity(
+                hole,
+                num_opponents=opponents,
+                target_std_error=None,
+                max_samples=samples,
+                seed=seeds[index * max_opponents + opponents - 1],
+            ).equity
+    return table
+
+
+def build_matchup_table(
+    samples: int, seed: Optional[int] = None, batch_size: int = 1 << 18
+) -> np.ndarray:
+    """
+    169 x 169 のヘッズアップ対戦表を計算
+
+    各クラスの組について、重複しない組み合わせの対と5枚のボードを一様に抽出する。
+    table[i, j] + table[j, i] == 1 となるよう上三角だけを計算し、同じクラス同士は 0.5。
+    """
+    rng = np.random.default_rng(seed)
+    combos = [np.array(class_combos(index), dtype=np.intp) for index in range(NUM_CLASSES)]
+    pairs = np.array(
+        [(i, j) for i in range(NUM_CLASSES) for j in range(i + 1, NUM_CLASSES)],
+        dtype=np.intp,
+    )
+    # クラスごとの組み合わせを (169, 12, 2) に詰め、組み合わせ数を別に持つ
+    combo_table = np.zeros((NUM_CLASSES, 12, 2), dtype=np.intp)
+    combo_counts = np.array([len(c) for c in combos], dtype=np.intp)
+    for index, combo in enumerate(combos):
+        combo_table[index, : len(combo)] = combo
+
+    shares = np.zeros(len(pairs), dtype=np.float64)
+    pair_index = np.repeat(np.arange(len(pairs)), samples)
+    rows = np.arange(batch_size)
+
+    for start in range(0, len(pair_index), batch_size):
+        chunk = pair_index[start : start + batch_size]
+        size = len(chunk)
+        hero_class, villain_class = pairs[chunk, 0], pairs[chunk, 1]
+
+        # カードが重複しない組み合わせの対を棄却法で抽出
+        hero = np.empty((size, 2), dtype=np.intp)
+        villain = np.empty((size, 2), dtype=np.intp)
+        pending = np.arange(size)
+        while len(pending):
+            h = combo_table[
+                hero_class[pending],
+                rng.integers(0, combo_counts[hero_class[pending]]),
+            ]
+            v = combo_table[
+                villain_class[pending],
+                rng.integers(0, combo_counts[villain_class[pending]]),
+            ]
+            hero[pending], villain[pending] = h, v
+            clash = (h[:, :, None] == v[:, None, :]).any(axis=(1, 2))
+            pending = pending[clash]
+
+        # 使用済みの4枚を除いた残りから5枚のボードを抽出
+        keys = rng.random((size, 52))
+        keys[rows[:size, None], hero] = 2.0
+        keys[rows[:size, None], villain] = 2.0
+        board = np.argpartition(keys, 5, axis=1)[:, :5]
+
+        hero_strength = HandEvaluator.evaluate_batch(hero, board)
+        villain_strength = HandEvaluator.evaluate_batch(villain, board)
+        share = (hero_strength > villain_strength) + 0.5 * (
+            hero_strength == villain_strength
+        )
+        shares += np.bincount(chunk, weights=share, minlength=len(pairs))
+
+    table = np.full((NUM_CLASSES, NUM_CLASSES), 0.5, dtype=np.float64)
+    equity = shares / samples
+    table[pairs[:, 0], pairs[:, 1]] = equity
+    table[pairs[:, 1], pairs[:, 0]] = 1.0 - equity
+    return table
+
+
+def write_preflop_table(
+    path: Union[str, Path],
+    multiway: np.ndarray,
+    matchups: np.ndarray,
+    multiway_samples: int = 0,
+    matchup_samples: int = 0,
+):
+    """計算済みの表をバイナリファイルに書き出す"""
+    multiway = np.asarray(multiway, dtype=np.float64)
+    matchups = np.asarray(matchups, dtype=np.float64)
+    if multiway.shape[0] != NUM_CLASSES or matchups.shape != (NUM_CLASSES, NUM_CLASSES):
+        raise ValueError("table shape does not match the 169 hand classes")
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(
+            _HEADER.pack(
+                _MAGIC,
+                _VERSION,
+                NUM_CLASSES,
+                multiway.shape[1],
+                multiway_samples,
+                matchup_samples,
+            )
+        )
+        for table in (multiway, matchups):
+            f.write(np.rint(np.clip(table, 0.0, 1.0) * _SCALE).astype("<u2").tobytes())
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="プリフロップエクイティ表の生成")
+    parser.add_argument("--output", type=Path, default=DEFAULT_TABLE_PATH)
+    parser.add_argument(
+        "--multiway-samples", type=int, default=100_000, help="クラス x 人数ごとの試行数"
+    )
+    parser.add_argument(
+        "--matchup-samples", type=int, default=20_000, help="対戦の組ごとの試行数"
+    )
+    parser.add_argument("--max-opponents", type=int, default=MAX_OPPONENTS)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    multiway = build_multiway_table(args.multiway_samples, args.max_opponents, args.seed)
+    print(f"multiway table: {time.perf_counter() - start:.1f}s")
+
+    start = time.perf_counter()
+    matchups = build_matchup_table(args.matchup_samples, args.seed + 1)
+    print(f"matchup table: {time.perf_counter() - start:.1f}s")
+
+    write_preflop_table(
+        args.output, multiway, matchups, args.multiway_samples, args.matchup_samples
+    )
+    print(f"wrote {args.output} ({args.output.stat().st_size} bytes)")
+
+
+if __name__ == "__main__":
+    main()
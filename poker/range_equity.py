@@ -0,0 +1,218 @@
+"""
+Equity versus weighted ranges
+
+相手ごとのレンジ（poker.ranges.Range）に対するエクイティを計算する。
+
+- 自分のホールカード・ボード・デッドカードを含む組み合わせはレンジから除く（カードリムーバル）
+- 相手1人で組み合わせ x ランアウトが exact_limit 以下（ターン・リバー）なら重み付きで全列挙
+- それ以外は各相手の組み合わせを重みに比例して抽出し、NumPy のバッチ評価で Monte Carlo
+  （標準誤差が目標値を下回るか、time_budget 秒を使い切った時点で打ち切る）
+
+    from poker.range_equity import range_equity
+
+    range_equity(["A♠", "K♠"], ["QQ+, AKs", "22+, A2s+"], board=["2♥", "7♦", "K♣"])
+"""
+
+import time
+from itertools import combinations
+from math import comb
+from typing import List, Optional, Sequence, Union
+
+import numpy as np
+
+from .equity import (
+    DEFAULT_BATCH_SIZE,
+    CardLike,
+    EquityResult,
+    _Tally,
+    to_card_ids,
+)
+from .evaluator import HandEvaluator
+from .ranges import COMBOS, Range, parse_range
+
+# 全列挙を選ぶ評価回数の上限（約50msの予算に収まる大きさ）
+DEFAULT_RANGE_EXACT_LIMIT = 100_000
+# 相手同士のカード重複による再抽出の上限回数
+_MAX_REDRAWS = 100
+
+RangeLike = Union[Range, str]
+
+
+def _to_range(villain_range: RangeLike) -> Range:
+    if isinstance(villain_range, Range):
+        return villain_range
+    return parse_range(villain_range)
+
+
+def _prepare(
+    hole: Sequence[CardLike],
+    villain_ranges: Union[RangeLike, Sequence[RangeLike]],
+    board: Sequence[CardLike],
+    dead: Sequence[CardLike],
+):
+    """入力を検証し、カードリムーバル済みの (combo index, 確率) を相手ごとに作る"""
+    hole_ids, board_ids, dead_ids = to_card_ids(hole), to_card_ids(board), to_card_ids(dead)
+    if len(hole_ids) != 2:
+        raise ValueError("hole must contain exactly 2 cards")
+    if len(board_ids) > 5:
+        raise ValueError("board must contain at most 5 cards")
+    known = hole_ids + board_ids + dead_ids
+    if len(set(known)) != len(known):
+        raise ValueError("duplicate cards in hole/board/dead")
+
+    if isinstance(villain_ranges, (Range, str)):
+        villain_ranges = [villain_ranges]
+    if not villain_ranges:
+        raise ValueError("at least one villain range is required")
+
+    villains = []
+    for villain_range in villain_ranges:
+        weights = _to_range(villain_range).remove_dead(known).weights
+        indices = np.flatnonzero(weights)
+        if len(indices) == 0:
+            raise ValueError("villain range is empty after card removal")
+        villains.append((indices, weights[indices] / weights[indices].sum()))
+    return hole_ids, board_ids, known, villains
+
+
+def _enumerate_range(
+    hole: List[int],
+    board: List[int],
+    known: List[int],
+    indices: np.ndarray,
+    probs: np.ndarray,
+) -> _Tally:
+    """相手1人のレンジとランアウトを全列挙し、組み合わせの重みで集計"""
+    remaining = [card_id for card_id in range(52) if card_id not in set(known)]
+    runout_size = 5 - len(board)
+    runouts = np.array(
+        list(combinations(remaining, runout_size)), dtype=np.intp
+    ).reshape(comb(len(remaining), runout_size), runout_size)
+    boards = np.concatenate(
+        [np.broadcast_to(np.array(board, dtype=np.intp), (len(runouts), len(board))), runouts],
+        axis=1,
+    )
+    hero = HandEvaluator.evaluate_batch(
+        np.broadcast_to(np.array(hole, dtype=np.intp), (len(runouts), 2)), boards
+    )
+
+    villain_cards = COMBOS[indices]
+    # [組み合わせ, ランアウト] の全ペアのうち、カードが重ならないものだけを評価
+    combo_rows = np.repeat(np.arange(len(indices)), len(runouts))
+    runout_rows = np.tile(np.arange(len(runouts)), len(indices))
+    valid = ~(
+        villain_cards[combo_rows][:, :, None] == runouts[runout_rows][:, None, :]
+    ).any(axis=(1, 2))
+    combo_rows, runout_rows = combo_rows[valid], runout_rows[valid]
+    villain = HandEvaluator.evaluate_batch(villain_cards[combo_rows], boards[runout_rows])
+
+    tally = _Tally()
+    tally.add(hero[runout_rows], villain[:, None], probs[combo_rows])
+    return tally
+
+
+def _sample_villains(
+    rng: np.random.Generator, villains, size: int
+) -> np.ndarray:
+    """各相手の組み合わせを重みに比例して抽出（[size, 相手数, 2] のカードID）"""
+    cumulative = [np.cumsum(probs) for _, probs in villains]
+
+    def draw(v: int, n: int) -> np.ndarray:
+        indices, _ = villains[v]
+        picks = np.searchsorted(cumulative[v], rng.random(n) * cumulative[v][-1], side="right")
+        return COMBOS[indices[np.minimum(picks, len(indices) - 1)]]
+
+    cards = np.stack([draw(v, size) for v in range(len(villains))], axis=1)
+    if len(villains) == 1:
+        return cards
+
+    # 相手同士でカードが重なった行だけ引き直す（重なりのない組み合わせの条件付き分布になる）
+    for _ in range(_MAX_REDRAWS):
+        flat = cards.reshape(size, -1)
+        sorted_cards = np.sort(flat, axis=1)
+        clash = np.flatnonzero((sorted_cards[:, 1:] == sorted_cards[:, :-1]).any(axis=1))
+        if len(clash) == 0:
+            return cards
+        cards[clash] = np.stack(
+            [draw(v, len(clash)) for v in range(len(villains))], axis=1
+        )
+    raise ValueError("villain ranges cannot be dealt without overlapping cards")
+
+
+def range_equity(
+    hole: Sequence[CardLike],
+    villain_ranges: Union[RangeLike, Sequence[RangeLike]],
+    board: Sequence[CardLike] = (),
+    dead: Sequence[CardLike] = (),
+    target_std_error: Optional[float] = 0.005,
+    min_samples: int = 1_000,
+    max_samples: int = 200_000,
+    time_budget: Optional[float] = 0.05,
+    exact_limit: int = DEFAULT_RANGE_EXACT_LIMIT,
+    seed: Optional[int] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> EquityResult:
+    """
+    重み付きレンジを持つ相手（1人以上）に対するエクイティを計算
+
+    Args:
+        hole: 自分のホールカード（2枚）
+        villain_ranges: 相手ごとのレンジ（Range またはレンジ表記）。1つだけなら相手1人
+        board: コミュニティカード（0〜5枚）
+        dead: 除外するカード
+        target_std_error: Monte Carlo の打ち切りに使う標準誤差
+        min_samples: 打ち切り判定を始める最小試行数
+        max_samples: 最大試行数
+        time_budget: Monte Carlo に使う最大秒数（None なら制限なし）
+        exact_limit: 相手1人で全列挙を選ぶ評価回数の上限
+        seed: 乱数シード
+
+    Returns:
+        EquityResult: win/tie/lose の割合と equity（全列挙なら exact=True）
+    """
+    hole_ids, board_ids, known, villains = _prepare(hole, villain_ranges, board, dead)
+    runout_size = 5 - len(board_ids)
+
+    if len(villains) == 1:
+        runouts = comb(52 - len(known), runout_size)
+        if len(villains[0][0]) * runouts <= exact_limit:
+            indices, probs = villains[0]
+            return _enumerate_range(hole_ids, board_ids, known, indices, probs).result(
+                exact=True
+            )
+
+    rng = np.random.default_rng(seed)
+    deadline = None if time_budget is None else time.perf_counter() + time_budget
+    hole_arr = np.array(hole_ids, dtype=np.intp)
+    board_arr = np.array(board_ids, dtype=np.intp)
+    tally = _Tally()
+
+    while tally.count < max_samples:
+        size = min(batch_size, max_samples - tally.count)
+        villain_cards = _sample_villains(rng, villains, size)
+
+        # 使用済みのカードを除いた残りからランアウトを抽出
+        keys = rng.random((size, 52))
+        keys[:, known] = 2.0
+        keys[np.arange(size)[:, None], villain_cards.reshape(size, -1)] = 2.0
+        runouts = np.argpartition(keys, runout_size, axis=1)[:, :runout_size]
+        boards = np.concatenate(
+            [np.broadcast_to(board_arr, (size, len(board_ids))), runouts], axis=1
+        )
+
+        hero = HandEvaluator.evaluate_batch(np.broadcast_to(hole_arr, (size, 2)), boards)
+        villain = np.stack(
+            [
+                HandEvaluator.evaluate_batch(villain_cards[:, v], boards)
+                for v in range(len(villains))
+            ],
+            axis=1,
+        )
+        tally.add(hero, villain)
+
+        if tally.count >= min_samples and (
+            (target_std_error is not None and tally.std_error < target_std_error)
+            or (deadline is not None and time.perf_counter() > deadline)
+        ):
+            break
+    return tally.result(exact=False)
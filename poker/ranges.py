@@ -0,0 +1,285 @@
+"""
+Preflop range notation and weighted combo arrays
+
+レンジを 1326 通りのホールカードの組み合わせ（combo）ごとの重み配列で表現する。
+メンバーシップ判定は配列の添字参照1回、和・積・デッドカード除去は配列演算で行う。
+
+    from poker.ranges import parse_range
+
+    opening = parse_range("TT+, AJs+, KQo, 76s-54s")
+    ["A♠", "K♠"] in opening      # True（ホールカード）
+    "AKs" in opening             # True（ハンドクラス）
+    opening.num_combos           # 重み付きの組み合わせ数
+    opening.remove_dead(["A♥"])  # A♥ を含む組み合わせを除いたレンジ
+
+表記:
+    "AA", "AKs", "AKo", "AK"（s/o両方）, "AsKd"（特定の組み合わせ）
+    "TT+"（TT〜AA）, "AJs+"（AJs〜AKs）, "22-55", "A2s-A5s", "76s-54s"
+    "AKs:0.5" のように ":重み" を付けると、その組み合わせの重みになる
+"""
+
+import re
+from typing import Iterable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from .equity import CardLike, to_card_ids
+from .preflop import HAND_CLASSES, NUM_CLASSES, class_combos, hand_class_index
+
+NUM_COMBOS = 1326
+RANK_CHARS = "23456789TJQKA"
+
+# combo index -> カードID の組（小さい方が先）
+COMBOS: np.ndarray = np.array(
+    [(a, b) for a in range(52) for b in range(a + 1, 52)], dtype=np.intp
+)
+
+# カードID 2枚 -> combo index（52 x 52 の対称表）
+COMBO_INDEX: np.ndarray = np.full((52, 52), -1, dtype=np.intp)
+COMBO_INDEX[COMBOS[:, 0], COMBOS[:, 1]] = np.arange(NUM_COMBOS)
+COMBO_INDEX[COMBOS[:, 1], COMBOS[:, 0]] = np.arange(NUM_COMBOS)
+_COMBO_INDEX_LIST = COMBO_INDEX.tolist()
+
+# ハンドクラス -> 属する combo index の配列
+CLASS_COMBOS: Tuple[np.ndarray, ...] = tuple(
+    np.array([_COMBO_INDEX_LIST[a][b] for a, b in class_combos(index)], dtype=np.intp)
+    for index in range(NUM_CLASSES)
+)
+
+# カードIDごとに、そのカードを含む combo のマスク
+CARD_COMBO_MASKS: np.ndarray = np.zeros((52, NUM_COMBOS), dtype=bool)
+CARD_COMBO_MASKS[COMBOS[:, 0], np.arange(NUM_COMBOS)] = True
+CARD_COMBO_MASKS[COMBOS[:, 1], np.arange(NUM_COMBOS)] = True
+
+_TOKEN = re.compile(
+    r"^(?P<hand>[2-9TJQKA]{2}[so]?|(?:[2-9TJQKA][shdc]){2})"
+    r"(?:(?P<plus>\+)|-(?P<end>[2-9TJQKA]{2}[so]?))?"
+    r"(?::(?P<weight>[0-9]*\.?[0-9]+))?$"
+)
+
+HandLike = Union[str, Sequence[CardLike]]
+
+
+def combo_index(first: CardLike, second: CardLike) -> int:
+    """ホールカード2枚の combo index（0..1325）"""
+    a, b = to_card_ids((first, second))
+    index = _COMBO_INDEX_LIST[a][b]
+    if index < 0:
+        raise ValueError("hole must contain 2 distinct cards")
+    return index
+
+
+def _rank_value(char: str) -> int:
+    return RANK_CHARS.index(char) + 2
+
+
+def _class_name(high: int, low: int, suffix: str) -> str:
+    if high == low:
+        return RANK_CHARS[high - 2] * 2
+    return RANK_CHARS[high - 2] + RANK_CHARS[low - 2] + suffix
+
+
+def _expand_token(token: str) -> List[Union[str, int]]:
+    """1つの表記をハンドクラス名（または combo index）のリストに展開"""
+    match = _TOKEN.match(token)
+    if match is None:
+        raise ValueError(f"Invalid range notation: {token}")
+    hand, end = match.group("hand"), match.group("end")
+
+    if len(hand) == 4:  # "AsKd"
+        if match.group("plus") or end:
+            raise ValueError(f"Invalid range notation: {token}")
+        return [combo_index(hand[:2], hand[2:])]
+
+    high, low = _rank_value(hand[0]), _rank_value(hand[1])
+    if high < low:
+        high, low = low, high
+    suffixes = [hand[2]] if len(hand) == 3 else ["s", "o"]
+    if high == low and len(hand) == 3:
+        raise ValueError(f"Invalid range notation: {token}")
+
+    if match.group("plus"):
+        if high == low:  # "TT+"
+            pairs = range(high, 15)
+            return [_class_name(r, r, "") for r in pairs]
+        # "AJs+": キッカーを1つ下のランクまで上げる
+        return [_class_name(high, k, s) for k in range(low, high) for s in suffixes]
+
+    if end:
+        end_high, end_low = _rank_value(end[0]), _rank_value(end[1])
+        if end_high < end_low:
+            end_high, end_low = end_low, end_high
+        end_suffixes = [end[2]] if len(end) == 3 else ["s", "o"]
+        if end_suffixes != suffixes and high != low:
+            raise ValueError(f"Invalid range notation: {token}")
+        if high == low and end_high == end_low:  # "22-55"
+            lo, hi = sorted((high, end_high))
+            return [_class_name(r, r, "") for r in range(lo, hi + 1)]
+        if high == end_high:  # "A2s-A5s"
+            lo, hi = sorted((low, end_low))
+            return [_class_name(high, k, s) for k in range(lo, hi + 1) for s in suffixes]
+        if high - low == end_high - end_low:  # "76s-54s"
+            gap = high - low
+            lo, hi = sorted((high, end_high))
+            return [_class_name(r, r - gap, s) for r in range(lo, hi + 1) for s in suffixes]
+        raise ValueError(f"Invalid range notation: {token}")
+
+    return [_class_name(high, low, s) for s in suffixes] if high != low else [hand]
+
+
+class Range:
+    """1326 通りの組み合わせごとの重み（0.0〜1.0）で表したレンジ"""
+
+    __slots__ = ("weights",)
+
+    def __init__(self, weights: Optional[np.ndarray] = None):
+        if weights is None:
+            weights = np.zeros(NUM_COMBOS, dtype=np.float64)
+        weights = np.asarray(weights, dtype=np.float64)
+        if weights.shape != (NUM_COMBOS,):
+            raise ValueError(f"weights must have shape ({NUM_COMBOS},)")
+        self.weights = weights
+
+    @classmethod
+    def full(cls) -> "Range":
+        """全ての組み合わせを含むレンジ（ランダムハンド）"""
+        return cls(np.ones(NUM_COMBOS, dtype=np.float64))
+
+    @classmethod
+    def from_hands(cls, hands: Iterable[str], weight: float = 1.0) -> "Range":
+        """ハンドクラス名（"AKs", "TT" など）の集合からレンジを作成"""
+        weights = np.zeros(NUM_COMBOS, dtype=np.float64)
+        for hand in hands:
+            weights[CLASS_COMBOS[hand_class_index(hand)]] = weight
+        return cls(weights)
+
+    @classmethod
+    def from_combos(
+        cls, combos: Iterable[Sequence[CardLike]], weight: float = 1.0
+    ) -> "Range":
+        """具体的なホールカードの組の集合からレンジを作成"""
+        weights = np.zeros(NUM_COMBOS, dtype=np.float64)
+        for first, second in combos:
+            weights[combo_index(first, second)] = weight
+        return cls(weights)
+
+    def copy(self) -> "Range":
+        return Range(self.weights.copy())
+
+    def _index_of(self, hand: HandLike) -> Optional[Union[int, np.ndarray]]:
+        """ハンドクラス名なら combo index の配列、ホールカードなら combo index"""
+        if isinstance(hand, str):
+            if len(hand) == 4 and hand[1] in "shdc":
+                return combo_index(hand[:2], hand[2:])
+            return CLASS_COMBOS[hand_class_index(hand)]
+        if len(hand) != 2:
+            raise ValueError("hole must contain exactly 2 cards")
+        return combo_index(hand[0], hand[1])
+
+    def weight(self, hand: HandLike) -> float:
+        """ハンドの重み（ハンドクラスの場合は属する組み合わせの平均）"""
+        index = self._index_of(hand)
+        if isinstance(index, np.ndarray):
+            return float(self.weights[index].mean())
+        return float(self.weights[index])
+
+    def __contains__(self, hand: HandLike) -> bool:
+        """
+        ホールカード / "AsKd" / ハンドクラス名がレンジに含まれるか
+
+        ハンドクラスは1つでも重みのある組み合わせがあれば含まれるとみなす。
+        不正な表記は（set と同じく）含まれないものとして False を返す。
+        """
+        try:
+            index = self._index_of(hand)
+        except (TypeError, ValueError):
+            return False
+        if isinstance(index, np.ndarray):
+            return bool(self.weights[index].any())
+        return self.weights[index] > 0.0
+
+    def __or__(self, other: "Range") -> "Range":
+        """和（重みは大きい方）"""
+        return Range(np.maximum(self.weights, other.weights))
+
+    def __and__(self, other: "Range") -> "Range":
+        """積（重みは小さい方）"""
+        return Range(np.minimum(self.weights, other.weights))
+
+    def __sub__(self, other: "Range") -> "Range":
+        """差（other に含まれる組み合わせを除く）"""
+        return Range(np.where(other.weights > 0.0, 0.0, self.weights))
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, Range) and np.array_equal(self.weights, other.weights)
+
+    def __len__(self) -> int:
+        """重みが正の組み合わせの数"""
+        return int(np.count_nonzero(self.weights))
+
+    def __repr__(self) -> str:
+        return f"Range({self.num_combos:g} combos)"
+
+    @property
+    def num_combos(self) -> float:
+        """重み付きの組み合わせ数"""
+        return float(self.weights.sum())
+
+    @property
+    def mask(self) -> np.ndarray:
+        """重みが正の組み合わせのブール配列"""
+        return self.weights > 0.0
+
+    def to_bitmask(self) -> int:
+        """重みが正の組み合わせを bit i = combo index i の整数に変換"""
+        packed = np.packbits(self.mask, bitorder="little")
+        return int.from_bytes(packed.tobytes(), "little")
+
+    @classmethod
+    def from_bitmask(cls, bitmask: int) -> "Range":
+        """to_bitmask の逆変換（重みは 1.0）"""
+        raw = np.frombuffer(bitmask.to_bytes((NUM_COMBOS + 7) // 8, "little"), dtype=np.uint8)
+        bits = np.unpackbits(raw, bitorder="little")[:NUM_COMBOS]
+        return cls(bits.astype(np.float64))
+
+    def remove_dead(self, dead: Sequence[CardLike]) -> "Range":
+        """デッドカード（自分のホールカードやボード）を含む組み合わせを除いたレンジ"""
+        ids = to_card_ids(dead)
+        if not ids:
+            return self.copy()
+        blocked = CARD_COMBO_MASKS[ids].any(axis=0)
+        return Range(np.where(blocked, 0.0, self.weights))
+
+    def combos(self) -> List[Tuple[int, int]]:
+        """重みが正の組み合わせ（カードIDの組）"""
+        return [tuple(pair) for pair in COMBOS[self.mask].tolist()]
+
+    def hand_classes(self) -> List[str]:
+        """1つでも組み合わせを含むハンドクラス名"""
+        return [
+            HAND_CLASSES[index]
+            for index in range(NUM_CLASSES)
+            if self.weights[CLASS_COMBOS[index]].any()
+        ]
+
+
+def parse_range(text: str) -> Range:
+    """
+    レンジ表記（カンマ/空白区切り）を Range に変換
+
+    同じ組み合わせが複数の表記に含まれる場合は後の表記の重みが優先される。
+    """
+    weights = np.zeros(NUM_COMBOS, dtype=np.float64)
+    for token in re.split(r"[,\s]+", text.strip()):
+        if not token:
+            continue
+        match = _TOKEN.match(token)
+        weight = float(match.group("weight")) if match and match.group("weight") else 1.0
+        if not 0.0 <= weight <= 1.0:
+            raise ValueError(f"Range weight must be between 0 and 1: {token}")
+        for hand in _expand_token(token):
+            if isinstance(hand, int):
+                weights[hand] = weight
+            else:
+                weights[CLASS_COMBOS[hand_class_index(hand)]] = weight
+    return Range(weights)
@@ -0,0 +1,419 @@
+"""
+Multi-process table runner
+
+独立したテーブルを N 個、プロセスプールで並列に実行して結果をまとめる。
+各テーブルは専用のシード・DBシャード・ログファイルを持ち、終わったテーブルから
+順に結果を親プロセスへ返す。親はエージェントごとのチップ収支を集計し、
+出力ディレクトリの summary.json に保存する。
+
+    uv run python -m poker.runner --tables 16 --hands 10000 --seats random:4
+    uv run python -m poker.runner --tables 8 --hands 2000 --seats "team1_agent:2,random:2"
+    uv run python -m poker.runner --tables 16 --hands 100000 --headless   # DB/ログなし
+
+出力（results/runner_<timestamp>_<uuid>/）:
+    table_000.sqlite3, table_000.log, ...  テーブルごとのDBシャードとログ
+    summary.json                           全テーブルの集計
+"""
+
+import argparse
+import json
+import logging
+import os
+import random
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from .game import PokerGame
+from .player_models import PlayerStatus
+
+DEFAULT_SEATS = "random:4"
+
+
+def parse_seats(spec: str, in_process: bool = False) -> List[Dict[str, Any]]:
+    """
+    座席の指定（"team1_agent:2,random:2" など）をプレイヤー設定のリストに変換
+
+    "random" は RandomPlayer、それ以外の名前は LLMApiPlayer（in_process なら
+    LocalAgentPlayer）のエージェント名として扱う。
+    """
+    player_configs: List[Dict[str, Any]] = []
+    for item in spec.split(","):
+        item = item.strip()
+        if not item:
+            continue
+        name, _, count_str = item.partition(":")
+        try:
+            count = int(count_str) if count_str else 1
+        except ValueError:
+            raise ValueError(f"無効な座席数: {item}")
+        if count <= 0:
+            raise ValueError(f"座席数は1以上である必要があります: {item}")
+        for _ in range(count):
+            seat = len(player_configs)
+            if name == "random":
+                player_configs.append({"type": "random", "agent_id": "random"})
+            else:
+                player_configs.append(
+                    {
+                        "type": "llm_local" if in_process else "llm_api",
+                        "agent_id": name,
+                        "user_id": f"player_{seat}",
+                    }
+                )
+    if not 2 <= len(player_configs) <= 10:
+        raise ValueError("座席数は2〜10人である必要があります")
+    return player_configs
+
+
+def table_seeds(seed: int, tables: int) -> List[int]:
+    """実行全体のシードから各テーブルのシードを決定的に導出"""
+    rng = random.Random(seed)
+    return [rng.getrandbits(63) for _ in range(tables)]
+
+
+class HandTally:
+    """
+    連続して進めるハンドの数・ゲーム数・プレイヤーごとの累計収支
+
+    play_hands と poker.async_driver.play_hands_async の共通の記録。
+    誰かのチップが尽きてゲームが終わったら、収支を精算して全員のチップを初期値に戻す。
+    """
+
+    def __init__(self, game: PokerGame):
+        self.game = game
+        self.initial_chips = game.initial_chips
+        self.net_chips = {player.id: 0 for player in game.players}
+        self.hands = 0
+        self.games = 1
+
+    def start_hand(self):
+        """次のハンドの前に呼ぶ（ゲームが終わっていれば次のゲームを始める）"""
+        if self.game.is_game_over():
+            # 全員のチップを初期値に戻して次のゲームへ
+            self.settle()
+            for player in self.game.players:
+                player.chips = self.initial_chips
+                player.status = PlayerStatus.ACTIVE
+            self.games += 1
+
+    def settle(self):
+        """現在のチップを累計収支に加える（ゲームの終わりと最後に1回ずつ）"""
+        for player in self.game.players:
+            self.net_chips[player.id] += player.chips - self.initial_chips
+
+    def result(self) -> Dict[str, Any]:
+        return {"hands": self.hands, "games": self.games, "net_chips": self.net_chips}
+
+
+def play_hands(game: PokerGame, max_hands: int) -> Dict[str, Any]:
+    """
+    max_hands ハンドを自動で進行する
+
+    誰かのチップが尽きてゲームが終わった場合は全員のチップを初期値に戻して続ける。
+
+    Returns:
+        hands, games, net_chips（player.id -> 累計収支）
+    """
+    tally = HandTally(game)
+    try:
+        while tally.hands < max_hands:
+            tally.start_hand()
+            game.play_hand()
+            tally.hands += 1
+    finally:
+        tally.settle()
+    return tally.result()
+
+
+def _table_logger(index: int, log_path: str) -> logging.Logger:
+    """テーブル専用のファイルロガー（親の poker_game ロガーには流さない）"""
+    logger = logging.getLogger(f"poker_game.table{index:03d}")
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+        handler.close()
+    handler = logging.FileHandler(log_path, encoding="utf-8")
+    handler.setFormatter(
+        logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    )
+    logger.addHandler(handler)
+    return logger
+
+
+def run_table(
+    index: int,
+    player_configs: List[Dict[str, Any]],
+    hands: int,
+    seed: int,
+    out_dir: Optional[str] = None,
+    headless: bool = False,
+    small_blind: int = 10,
+    big_blind: int = 20,
+    initial_chips: int = 2000,
+) -> Dict[str, Any]:
+    """
+    1テーブル分のハンドを実行（ワーカープロセスで呼ばれる）
+
+    Args:
+        index: テーブル番号（DB/ログのファイル名に使う）
+        player_configs: parse_seats の結果
+        hands: このテーブルで実行するハンド数
+        seed: このテーブルの乱数シード
+        out_dir: DBシャードとログの出力先（headless なら不要）
+        headless: True なら DB・ログなしで実行
+    """
+    # 配札は PokerGame の seed から決まる。RandomPlayer の行動とボタン位置は
+    # グローバルな random を使うため、こちらも同じシードで初期化する
+    random.seed(seed)
+
+    game = open_table(
+        index, player_configs, seed, out_dir, headless, small_blind, big_blind, initial_chips
+    )
+    start = time.perf_counter()
+    try:
+        played = play_hands(game, hands)
+    finally:
+        close_table(game)
+    elapsed = time.perf_counter() - start
+    return table_result(index, game, player_configs, played, elapsed, out_dir)
+
+
+def _table_paths(index: int, out_dir: Optional[str], headless: bool):
+    """テーブル index の DBシャードとログのパス（headless なら両方 None）"""
+    if headless:
+        return None, None
+    return (
+        os.path.join(out_dir, f"table_{index:03d}.sqlite3"),
+        os.path.join(out_dir, f"table_{index:03d}.log"),
+    )
+
+
+def open_table(
+    index: int,
+    player_configs: List[Dict[str, Any]],
+    seed: int,
+    out_dir: Optional[str] = None,
+    headless: bool = False,
+    small_blind: int = 10,
+    big_blind: int = 20,
+    initial_chips: int = 2000,
+) -> PokerGame:
+    """テーブル番号 index の PokerGame を作る（headless でなければ専用のDBシャードとログを持つ）"""
+    db_path, log_path = _table_paths(index, out_dir, headless)
+    logger = _table_logger(index, log_path) if log_path else None
+
+    game = PokerGame(
+        small_blind=small_blind,
+        big_blind=big_blind,
+        initial_chips=initial_chips,
+        headless=headless,
+        db_path=db_path,
+        logger=logger,
+        seed=seed,
+    )
+    game.setup_configurable_game_with_models(player_configs)
+    return game
+
+
+def close_table(game: PokerGame):
+    """open_table で開いたDBとログを閉じる"""
+    game.close()
+    if not game.headless:
+        for handler in list(game.logger.handlers):
+            game.logger.removeHandler(handler)
+            handler.close()
+
+
+def table_result(
+    index: int,
+    game: PokerGame,
+    player_configs: List[Dict[str, Any]],
+    played: Dict[str, Any],
+    elapsed: float,
+    out_dir: Optional[str] = None,
+) -> Dict[str, Any]:
+    """1テーブル分の結果（merge_results の入力）"""
+    db_path, log_path = _table_paths(index, out_dir, game.headless)
+    return {
+        "table": index,
+        "seed": game.seed,
+        "hands": played["hands"],
+        "games": played["games"],
+        "elapsed": elapsed,
+        "db_path": db_path,
+        "log_path": log_path,
+        "seats": [
+            {
+                "seat": player.id,
+                "name": player.name,
+                "agent": player_configs[player.id].get("agent_id", "unknown"),
+                "chip_delta": played["net_chips"][player.id],
+            }
+            for player in game.players
+        ],
+    }
+
+
+def merge_results(table_results: List[Dict[str, Any]], big_blind: int) -> Dict[str, Any]:
+    """テーブルごとの結果をエージェント別のチップ収支にまとめる"""
+    agents: Dict[str, Dict[str, Any]] = {}
+    for result in table_results:
+        for seat in result["seats"]:
+            stats = agents.setdefault(
+                seat["agent"], {"seats": 0, "hands": 0, "chip_delta": 0}
+            )
+            stats["seats"] += 1
+            stats["hands"] += result["hands"]
+            stats["chip_delta"] += seat["chip_delta"]
+    for stats in agents.values():
+        # 1座席・100ハンドあたりのビッグブラインド収支
+        stats["bb_per_100"] = (
+            stats["chip_delta"] / big_blind / stats["hands"] * 100 if stats["hands"] else 0.0
+        )
+    return {
+        "hands": sum(result["hands"] for result in table_results),
+        "agents": dict(sorted(agents.items(), key=lambda item: -item[1]["chip_delta"])),
+        "tables": sorted(table_results, key=lambda result: result["table"]),
+    }
+
+
+def _default_out_dir() -> str:
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    return os.path.join("results", f"runner_{timestamp}_{str(uuid.uuid4())[:4]}")
+
+
+def run_tables(
+    seats: str = DEFAULT_SEATS,
+    tables: int = 4,
+    hands: int = 1000,
+    processes: Optional[int] = None,
+    seed: int = 0,
+    out_dir: Optional[str] = None,
+    headless: bool = False,
+    small_blind: int = 10,
+    big_blind: int = 20,
+    initial_chips: int = 2000,
+    on_result: Optional[Callable[[Dict[str, Any]], None]] = None,
+    in_process: bool = False,
+) -> Dict[str, Any]:
+    """
+    テーブルを並列に実行し、結果を集計する
+
+    Args:
+        seats: 各テーブルの座席（parse_seats の形式。全テーブル共通）
+        tables: テーブル数
+        hands: 全テーブル合計のハンド数（テーブルごとに均等に割り振る）
+        processes: ワーカープロセス数（None なら CPU 数、1 ならこのプロセスで実行）
+        seed: 実行全体の乱数シード
+        out_dir: 出力ディレクトリ（None なら results/runner_<timestamp>_<uuid>）
+        headless: True なら DB・ログなしで実行（summary.json も保存しない）
+        on_result: テーブルが終わるたびに結果を受け取るコールバック
+        in_process: エージェントを api_server を介さずプロセス内で実行する
+
+    Returns:
+        hands, elapsed, hands_per_sec, agents（エージェント別の収支）, tables など
+    """
+    if tables < 1:
+        raise ValueError("tables must be at least 1")
+    player_configs = parse_seats(seats, in_process)
+    if not headless:
+        out_dir = out_dir or _default_out_dir()
+        Path(out_dir).mkdir(parents=True, exist_ok=True)
+
+    per_table = [hands // tables + (1 if i < hands % tables else 0) for i in range(tables)]
+    seeds = table_seeds(seed, tables)
+    jobs = [
+        (i, player_configs, per_table[i], seeds[i], out_dir, headless, small_blind, big_blind, initial_chips)
+        for i in range(tables)
+    ]
+
+    start = time.perf_counter()
+    table_results: List[Dict[str, Any]] = []
+    processes = min(processes or os.cpu_count() or 1, tables)
+    if processes == 1:
+        for job in jobs:
+            table_results.append(run_table(*job))
+            if on_result:
+                on_result(table_results[-1])
+    else:
+        with ProcessPoolExecutor(max_workers=processes) as pool:
+            futures = [pool.submit(run_table, *job) for job in jobs]
+            for future in as_completed(futures):
+                table_results.append(future.result())
+                if on_result:
+                    on_result(table_results[-1])
+    elapsed = time.perf_counter() - start
+
+    summary = merge_results(table_results, big_blind)
+    summary.update(
+        {
+            "seats": seats,
+            "seed": seed,
+            "processes": processes,
+            "elapsed": elapsed,
+            "hands_per_sec": summary["hands"] / elapsed if elapsed > 0 else 0.0,
+            "out_dir": out_dir,
+        }
+    )
+    if out_dir is not None:
+        with open(os.path.join(out_dir, "summary.json"), "w", encoding="utf-8") as f:
+            json.dump(summary, f, ensure_ascii=False, indent=2)
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description="複数テーブルの並列実行")
+    parser.add_argument(
+        "--seats",
+        type=str,
+        default=DEFAULT_SEATS,
+        help='各テーブルの座席（例: "team1_agent:2,random:2"。デフォルト: random:4）',
+    )
+    parser.add_argument("--tables", type=int, default=os.cpu_count() or 1, help="テーブル数（デフォルト: CPU数）")
+    parser.add_argument("--hands", type=int, default=10000, help="全テーブル合計のハンド数")
+    parser.add_argument("--processes", type=int, default=None, help="ワーカープロセス数（デフォルト: CPU数）")
+    parser.add_argument("--seed", type=int, default=0, help="乱数シード")
+    parser.add_argument("--out-dir", type=str, default=None, help="出力ディレクトリ")
+    parser.add_argument("--headless", action="store_true", help="DB・ログなしで実行（最速）")
+    parser.add_argument(
+        "--in-process", action="store_true", help="エージェントを api_server を介さずプロセス内で実行"
+    )
+    args = parser.parse_args()
+
+    # scheduler は runner を import しているので、ここで読み込む
+    from .scheduler import report_table
+
+    summary = run_tables(
+        seats=args.seats,
+        tables=args.tables,
+        hands=args.hands,
+        processes=args.processes,
+        seed=args.seed,
+        out_dir=args.out_dir,
+        headless=args.headless,
+        on_result=report_table,
+        in_process=args.in_process,
+    )
+
+    print("\n=== 集計 ===")
+    print(
+        f"{summary['hands']}ハンド / {len(summary['tables'])}テーブル / "
+        f"{summary['processes']}プロセス: {summary['elapsed']:.1f}秒 "
+        f"({summary['hands_per_sec']:,.0f} hands/sec)"
+    )
+    for agent, stats in summary["agents"].items():
+        print(
+            f"  {agent}: {stats['chip_delta']:+d}チップ "
+            f"({stats['bb_per_100']:+.1f} bb/100, {stats['seats']}座席)"
+        )
+    if summary["out_dir"]:
+        print(f"\n結果を保存しました: {os.path.join(summary['out_dir'], 'summary.json')}")
+
+
+if __name__ == "__main__":
+    main()
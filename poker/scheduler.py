@@ -0,0 +1,323 @@
+"""
+Concurrent multi-table scheduler
+
+エージェントの意思決定は1回 5〜40 秒かかるため、テーブルを1つずつ進めると
+待ち時間がそのまま積み上がる。このスケジューラは1プロセスのイベントループで
+多数の PokerGame を同時に進め、各テーブルで手番が来ているエージェントへの
+リクエストをまとめて並行に出す。各テーブルのハンドとアクションの順番は
+そのテーブルの中では逐次のまま変わらない。
+
+ADK api_server を守るため、エージェント（app_name）ごとに同時に投げる
+リクエストの数を AgentLimiter で制限する。枠が空くまで待つ時間は
+decision_timeout に含めない。
+
+    uv run python -m poker.scheduler --tables 20 --hands-per-table 30 \\
+        --seats "team1_agent:2,team2_agent:2" --max-concurrency 8
+    uv run python main.py --cli --agent-only --tables 20 --max-hands 30
+
+出力は poker.runner と同じ（テーブルごとの DBシャード・ログと summary.json）。
+hedge_percentile を指定すると、LLMApiPlayer はエージェントの所要時間のその百分位を
+過ぎても応答がないリクエストをもう1本送る（ヘッジ）。集計にはエージェント別の
+p50 / p95 / p99 とヘッジの回数が入る。
+
+RandomPlayer は全テーブルで同じグローバルな random を使うので、テーブルが
+並行に進む場合は行動の並びまでは再現されない（配札は各テーブルの seed で決まる）。
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import time
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from .agent_latency import latency_stats
+from .async_driver import play_hands_async
+from .player_models import AgentPlayer, LLMPlayer
+from .runner import (
+    DEFAULT_SEATS,
+    _default_out_dir,
+    close_table,
+    merge_results,
+    open_table,
+    parse_seats,
+    table_result,
+    table_seeds,
+)
+
+DEFAULT_MAX_CONCURRENCY = 8
+
+
+def agent_key(player: Any) -> Optional[str]:
+    """
+    同時実行数を数える単位（AgentPlayer は app_name、LLMPlayer はモデル名）
+
+    None のプレイヤー（RandomPlayer など）は制限しない。
+    """
+    if isinstance(player, AgentPlayer):
+        return player.app_name
+    if isinstance(player, LLMPlayer):
+        return player.model
+    return None
+
+
+class AgentLimiter:
+    """
+    エージェントごとの同時リクエスト数の上限
+
+    Args:
+        max_concurrency: 既定の上限（None なら無制限）
+        caps: エージェント別の上限（{"team1_agent": 4} など。max_concurrency より優先）
+    """
+
+    def __init__(
+        self,
+        max_concurrency: Optional[int] = DEFAULT_MAX_CONCURRENCY,
+        caps: Optional[Dict[str, int]] = None,
+    ):
+        for cap in [max_concurrency, *(caps or {}).values()]:
+            if cap is not None and cap < 1:
+                raise ValueError("concurrency cap must be at least 1")
+        self.max_concurrency = max_concurrency
+        self.caps = dict(caps or {})
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+        self.in_flight: Dict[str, int] = {}
+        self.peak: Dict[str, int] = {}
+
+    def cap(self, key: str) -> Optional[int]:
+        return self.caps.get(key, self.max_concurrency)
+
+    @asynccontextmanager
+    async def slot(self, player: Any):
+        """player のエージェントの枠を1つ確保する"""
+        key = agent_key(player)
+        cap = self.cap(key) if key is not None else None
+        if cap is None:
+            yield
+            return
+        semaphore = self._semaphores.get(key)
+        if semaphore is None:
+            semaphore = self._semaphores[key] = asyncio.Semaphore(cap)
+        async with semaphore:
+            self.in_flight[key] = self.in_flight.get(key, 0) + 1
+            self.peak[key] = max(self.peak.get(key, 0), self.in_flight[key])
+            try:
+                yield
+            finally:
+                self.in_flight[key] -= 1
+
+
+def parse_caps(spec: Optional[str]) -> Dict[str, int]:
+    """エージェント別の上限（"team1_agent:4,team2_agent:2"）を辞書に変換"""
+    caps: Dict[str, int] = {}
+    for item in (spec or "").split(","):
+        item = item.strip()
+        if not item:
+            continue
+        name, _, cap_str = item.partition(":")
+        try:
+            caps[name] = int(cap_str)
+        except ValueError:
+            raise ValueError(f"無効な同時実行数: {item}")
+    return caps
+
+
+async def run_tables_async(
+    seats: str = DEFAULT_SEATS,
+    tables: int = 20,
+    hands_per_table: int = 30,
+    seed: int = 0,
+    out_dir: Optional[str] = None,
+    headless: bool = False,
+    small_blind: int = 10,
+    big_blind: int = 20,
+    initial_chips: int = 2000,
+    max_concurrency: Optional[int] = DEFAULT_MAX_CONCURRENCY,
+    agent_caps: Optional[Dict[str, int]] = None,
+    decision_timeout: Optional[float] = None,
+    on_result: Optional[Callable[[Dict[str, Any]], None]] = None,
+    in_process: bool = False,
+    hedge_percentile: Optional[float] = None,
+) -> Dict[str, Any]:
+    """
+    テーブルを同じイベントループで同時に進め、結果を集計する
+
+    Args:
+        seats: 各テーブルの座席（poker.runner.parse_seats の形式。全テーブル共通）
+        tables: テーブル数
+        hands_per_table: テーブルごとのハンド数
+        max_concurrency: エージェントごとの同時リクエスト数の既定の上限（None なら無制限）
+        agent_caps: エージェント別の上限
+        decision_timeout: 1回の意思決定の制限時間（秒。枠の待ち時間は含まない）
+        on_result: テーブルが終わるたびに結果を受け取るコールバック
+        in_process: エージェントを api_server を介さずプロセス内で実行する
+        hedge_percentile: LLMApiPlayer がヘッジする所要時間の百分位（None ならヘッジしない）
+        その他は poker.runner.run_tables と同じ
+
+    Returns:
+        poker.runner.run_tables と同じ集計に max_concurrency と
+        peak_in_flight（エージェント別の同時リクエスト数の最大値）、
+        latency（エージェント別の所要時間の p50 / p95 / p99 とヘッジの回数）を加えたもの
+    """
+    if tables < 1:
+        raise ValueError("tables must be at least 1")
+    player_configs = parse_seats(seats, in_process)
+    if hedge_percentile is not None:
+        for config in player_configs:
+            if config["type"] == "llm_api":
+                config["hedge_percentile"] = hedge_percentile
+    if not headless:
+        out_dir = out_dir or _default_out_dir()
+        Path(out_dir).mkdir(parents=True, exist_ok=True)
+
+    limiter = AgentLimiter(max_concurrency, agent_caps)
+    random.seed(seed)
+
+    async def run_one(index: int, table_seed: int) -> Dict[str, Any]:
+        game = open_table(
+            index, player_configs, table_seed, out_dir, headless,
+            small_blind, big_blind, initial_chips,
+        )
+        table_start = time.perf_counter()
+        try:
+            played = await play_hands_async(
+                game, hands_per_table, decision_timeout, limiter=limiter
+            )
+        finally:
+            close_table(game)
+        result = table_result(
+            index, game, player_configs, played, time.perf_counter() - table_start, out_dir
+        )
+        if on_result:
+            on_result(result)
+        return result
+
+    start = time.perf_counter()
+    table_results: List[Dict[str, Any]] = list(
+        await asyncio.gather(
+            *(run_one(i, table_seed) for i, table_seed in enumerate(table_seeds(seed, tables)))
+        )
+    )
+    elapsed = time.perf_counter() - start
+
+    summary = merge_results(table_results, big_blind)
+    summary.update(
+        {
+            "seats": seats,
+            "seed": seed,
+            "max_concurrency": max_concurrency,
+            "agent_caps": dict(agent_caps or {}),
+            "peak_in_flight": dict(limiter.peak),
+            "hedge_percentile": hedge_percentile,
+            "latency": {
+                agent: stats
+                for agent, stats in latency_stats().items()
+                if agent in summary["agents"]
+            },
+            "elapsed": elapsed,
+            "hands_per_sec": summary["hands"] / elapsed if elapsed > 0 else 0.0,
+            "out_dir": out_dir,
+        }
+    )
+    if out_dir is not None:
+        with open(os.path.join(out_dir, "summary.json"), "w", encoding="utf-8") as f:
+            json.dump(summary, f, ensure_ascii=False, indent=2)
+    return summary
+
+
+def run_scheduled_tables(**kwargs) -> Dict[str, Any]:
+    """run_tables_async を新しいイベントループで実行する（引数は同じ）"""
+    return asyncio.run(run_tables_async(**kwargs))
+
+
+def report_table(result: Dict[str, Any]):
+    """テーブルの結果を1行で表示"""
+    deltas = ", ".join(
+        f"{seat['name']}({seat['agent']}) {seat['chip_delta']:+d}" for seat in result["seats"]
+    )
+    print(
+        f"テーブル {result['table']:3d}: {result['hands']}ハンド "
+        f"{result['elapsed']:.1f}秒 | {deltas}"
+    )
+
+
+def report_summary(summary: Dict[str, Any]):
+    """集計を表示"""
+    print("\n=== 集計 ===")
+    print(
+        f"{summary['hands']}ハンド / {len(summary['tables'])}テーブル: "
+        f"{summary['elapsed']:.1f}秒 ({summary['hands_per_sec']:,.1f} hands/sec)"
+    )
+    for agent, peak in summary["peak_in_flight"].items():
+        print(f"  {agent}: 同時リクエスト最大 {peak}")
+    for agent, stats in summary["latency"].items():
+        if stats["count"]:
+            print(
+                f"  {agent}: p50 {stats['p50']:.2f}秒 / p95 {stats['p95']:.2f}秒 / "
+                f"p99 {stats['p99']:.2f}秒 (ヘッジ {stats['hedged']}回、うち先着 {stats['hedge_wins']}回)"
+            )
+    for agent, stats in summary["agents"].items():
+        print(
+            f"  {agent}: {stats['chip_delta']:+d}チップ "
+            f"({stats['bb_per_100']:+.1f} bb/100, {stats['seats']}座席)"
+        )
+    if summary["out_dir"]:
+        print(f"\n結果を保存しました: {os.path.join(summary['out_dir'], 'summary.json')}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="複数テーブルの同時実行（エージェントの応答待ちを重ねる）")
+    parser.add_argument(
+        "--seats",
+        type=str,
+        default=DEFAULT_SEATS,
+        help='各テーブルの座席（例: "team1_agent:2,team2_agent:2"。デフォルト: random:4）',
+    )
+    parser.add_argument("--tables", type=int, default=20, help="テーブル数（デフォルト: 20）")
+    parser.add_argument("--hands-per-table", type=int, default=30, help="テーブルごとのハンド数（デフォルト: 30）")
+    parser.add_argument(
+        "--max-concurrency",
+        type=int,
+        default=DEFAULT_MAX_CONCURRENCY,
+        help=f"エージェントごとの同時リクエスト数の上限（デフォルト: {DEFAULT_MAX_CONCURRENCY}）",
+    )
+    parser.add_argument(
+        "--agent-caps", type=str, default=None, help='エージェント別の上限（例: "team1_agent:4,team2_agent:2"）'
+    )
+    parser.add_argument("--decision-timeout", type=float, default=None, help="1回の意思決定の制限時間（秒）")
+    parser.add_argument(
+        "--hedge-percentile",
+        type=float,
+        default=None,
+        help="所要時間のこの百分位を過ぎても応答がなければ同じリクエストをもう1本送る（例: 95）",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="乱数シード")
+    parser.add_argument("--out-dir", type=str, default=None, help="出力ディレクトリ")
+    parser.add_argument("--headless", action="store_true", help="DB・ログなしで実行")
+    parser.add_argument(
+        "--in-process", action="store_true", help="エージェントを api_server を介さずプロセス内で実行"
+    )
+    args = parser.parse_args()
+
+    summary = run_scheduled_tables(
+        seats=args.seats,
+        tables=args.tables,
+        hands_per_table=args.hands_per_table,
+        seed=args.seed,
+        out_dir=args.out_dir,
+        headless=args.headless,
+        max_concurrency=args.max_concurrency,
+        agent_caps=parse_caps(args.agent_caps),
+        decision_timeout=args.decision_timeout,
+        on_result=report_table,
+        in_process=args.in_process,
+        hedge_percentile=args.hedge_percentile,
+    )
+    report_summary(summary)
+
+
+if __name__ == "__main__":
+    main()
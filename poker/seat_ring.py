@@ -0,0 +1,99 @@
+"""
+Seat ring with per-status bitmasks
+
+ベッティングの進行では「次のアクティブなプレイヤー」「残っている人数」などを
+アクションごとに何度も調べる。毎回 players を走査してリストを作る代わりに、
+状態（PlayerStatus）ごとに座席のビットマスクを持ち、Player.status が
+変わったときにだけ更新する。座席は最大10なので、次の座席や人数の検索は
+ビット演算だけで済む（定数時間）。
+
+    ring = SeatRing(players)                 # Player.status の変更を購読する
+    ring.count(PlayerStatus.ACTIVE)          # アクティブな人数
+    ring.next_seat(ring.mask(PlayerStatus.ACTIVE), 3)   # 座席3の次のアクティブな座席
+"""
+
+from typing import Iterable, Iterator, List, Optional
+
+from .player_models import Player, PlayerStatus
+
+
+class SeatRing:
+    """
+    座席順のリングと状態ごとのビットマスク
+
+    座席番号は PokerGame.players のインデックス。ブラインドの座席も保持する。
+    """
+
+    __slots__ = ("size", "_masks", "small_blind", "big_blind")
+
+    def __init__(self, players: Iterable[Player] = ()):
+        self.size = 0
+        self._masks = {status: 0 for status in PlayerStatus}
+        self.small_blind: Optional[int] = None
+        self.big_blind: Optional[int] = None
+        for player in players:
+            self.attach(player)
+
+    def attach(self, player: Player) -> int:
+        """次の座席にプレイヤーを座らせ、以後の状態変化を受け取る"""
+        seat = self.size
+        self.size += 1
+        player._seat_ring = self
+        player._seat = seat
+        self._masks[player.status] |= 1 << seat
+        return seat
+
+    def update(self, seat: int, old: PlayerStatus, new: PlayerStatus):
+        """座席の状態が old から new に変わった（Player.status の setter から呼ばれる）"""
+        bit = 1 << seat
+        self._masks[old] &= ~bit
+        self._masks[new] |= bit
+
+    def mask(self, *statuses: PlayerStatus) -> int:
+        """指定した状態のいずれかにある座席のビットマスク"""
+        mask = 0
+        for status in statuses:
+            mask |= self._masks[status]
+        return mask
+
+    def count(self, *statuses: PlayerStatus) -> int:
+        """指定した状態のいずれかにある座席の数"""
+        return self.mask(*statuses).bit_count()
+
+    def has(self, seat: Optional[int], status: PlayerStatus) -> bool:
+        """座席 seat が status か"""
+        return seat is not None and bool(self._masks[status] >> seat & 1)
+
+    @staticmethod
+    def next_seat(mask: int, from_seat: int, include_self: bool = False) -> Optional[int]:
+        """
+        座席順で from_seat の次にある mask の座席（なければ None）
+
+        include_self が True なら一周して from_seat 自身に戻るのも可とする。
+        """
+        if not mask:
+            return None
+        above = mask >> (from_seat + 1) << (from_seat + 1)
+        if above:
+            return (above & -above).bit_length() - 1
+        lowest = (mask & -mask).bit_length() - 1
+        if lowest == from_seat and not include_self:
+            return None
+        return lowest
+
+    @staticmethod
+    def first_seat(mask: int) -> Optional[int]:
+        """mask の最も小さい座席（なければ None）"""
+        return (mask & -mask).bit_length() - 1 if mask else None
+
+    @staticmethod
+    def seats(mask: int) -> List[int]:
+        """mask の座席のリスト（座席順）"""
+        return list(_iter_seats(mask))
+
+
+def _iter_seats(mask: int) -> Iterator[int]:
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
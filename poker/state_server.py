@@ -11,7 +11,11 @@ from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from typing import Any, Dict, List, Tuple
 
 from .shared_state import get_current_game
-from .player_models import PlayerStatus, LLMApiPlayer
+from .player_models import PlayerStatus, AgentPlayer
+
+# Max number of action history lines sent per /state poll (keeps the payload size
+# independent of how long the session has been running)
+VIEWER_HISTORY_LIMIT = 100
 
 
 def _card_to_str(card) -> str:
@@ -37,7 +41,7 @@ def _build_viewer_state() -> Dict[str, Any]:
         - Otherwise, use p.name
         """
         try:
-            if isinstance(p, LLMApiPlayer):
+            if isinstance(p, AgentPlayer):
                 app = str(getattr(p, "app_name", "") or "")
                 if app:
                     cleaned = app.replace("_", " ").strip()
@@ -47,37 +51,14 @@ def _build_viewer_state() -> Dict[str, Any]:
         return getattr(p, "name", "Player")
 
     def _latest_action_for_player(player_id: int) -> Tuple[str, int]:
-        """Parse the game's action_history to find the latest action by player.
+        """Look up the latest betting action of a player in the game's action log.
 
         Returns (action_label, amount). action_label examples: 'fold', 'check', 'call', 'raise', 'all_in', ''.
         """
-        history: List[str] = list(getattr(game, "action_history", []))
-        for entry in reversed(history):
-            # Expected formats
-            # 'Player {id} folded'
-            # 'Player {id} checked'
-            # 'Player {id} called {amt}'
-            # 'Player {id} raised to {amt}'
-            # 'Player {id} went all-in with {amt}'
-            try:
-                if entry.startswith(f"Player {player_id} "):
-                    rest = entry.split(" ", 2)[2]
-                    if rest.startswith("folded"):
-                        return ("fold", 0)
-                    if rest.startswith("checked"):
-                        return ("check", 0)
-                    if rest.startswith("called"):
-                        amt = int(rest.split(" ")[1])
-                        return ("call", amt)
-                    if rest.startswith("raised to"):
-                        amt = int(rest.split(" ")[-1])
-                        return ("raise", amt)
-                    if rest.startswith("went all-in with"):
-                        amt = int(rest.split(" ")[-1])
-                        return ("all_in", amt)
-            except Exception:
-                continue
-        return ("", 0)
+        event = game.action_log.latest_for_player(player_id)
+        if event is None:
+            return ("", 0)
+        return (event.kind, event.amount)
 
     players: List[Dict[str, Any]] = []
     llm_api_agents: List[Dict[str, Any]] = []
@@ -100,7 +81,7 @@ def _build_viewer_state() -> Dict[str, Any]:
         )
 
         # Collect LLM API agent info (latest action + last reasoning)
-        if isinstance(p, LLMApiPlayer):
+        if isinstance(p, AgentPlayer):
             action, amount = _latest_action_for_player(p.id)
             reasoning = getattr(p, "last_decision_reasoning", "")
             llm_api_agents.append(
@@ -125,7 +106,9 @@ def _build_viewer_state() -> Dict[str, Any]:
         "current_turn": game.current_player_index,
         "community_cards": [_card_to_str(c) for c in game.community_cards],
         "players": players,
-        "action_history": list(game.action_history),
+        "action_history": game.action_log.tail(VIEWER_HISTORY_LIMIT),
+        # メインポット/サイドポット（{"amount", "eligible"}。メインが先頭）
+        "pots": [pot.to_dict() for pot in game.side_pots()],
         "llm_api_agents": llm_api_agents,
         # ショーダウン結果（存在する場合のみ）
         "showdown_results": getattr(game, "last_showdown_results", None),
@@ -0,0 +1,417 @@
+"""
+Immutable table snapshots and side-effect-free state transitions
+
+PokerGame は DB 接続・ロガー・Player オブジェクトを持つため、先読みのために
+丸ごと複製するのは重い。TableState は1ハンドの進行に必要な値だけを
+タプルで持つ不変のスナップショットで、step() は新しい TableState を返すだけで
+SQLite・ログ・Player には一切触れない。ベッティングの規則は PokerGame と同じ。
+
+    state = game.export_state()
+    for action in legal_actions(state):
+        child = step(state, action, 20 if action == "raise" else 0)
+        ...
+    game.import_state(state)                # 局面を PokerGame に戻す
+
+カードはすべてカードID（0..51）で保持する。deck は残りのカードで、
+step() が新しいストリートを配るときは末尾から取る（バーン1枚を含む）。
+ロールアウトごとに違うボードを引くには shuffle_deck() で並べ替えてから進める。
+"""
+
+import random
+from dataclasses import dataclass, replace
+from typing import List, Optional, Tuple
+
+from .evaluator import HandEvaluator
+from .game_models import GamePhase
+from .player_models import PlayerStatus
+
+ACTIONS = ("fold", "check", "call", "raise", "all_in")
+
+# ベッティングが終わったあと新しいストリートで配るカード枚数
+_STREET_CARDS = {GamePhase.PREFLOP: 3, GamePhase.FLOP: 1, GamePhase.TURN: 1}
+_NEXT_PHASE = {
+    GamePhase.PREFLOP: GamePhase.FLOP,
+    GamePhase.FLOP: GamePhase.TURN,
+    GamePhase.TURN: GamePhase.RIVER,
+    GamePhase.RIVER: GamePhase.SHOWDOWN,
+}
+
+
+@dataclass(frozen=True, slots=True)
+class TableState:
+    """
+    1ハンドの進行状況の不変スナップショット
+
+    座席ごとの値は座席番号（= player.id）順のタプルで持つ。
+    """
+
+    phase: GamePhase
+    hand_number: int
+    small_blind: int
+    big_blind: int
+    dealer_button: int
+    small_blind_seat: Optional[int]
+    big_blind_seat: Optional[int]
+    current_player: int
+    pot: int
+    current_bet: int
+    last_raiser: Optional[int]
+    has_bet_or_raise: bool
+    betting_round_complete: bool
+    chips: Tuple[int, ...]
+    bets: Tuple[int, ...]  # このベッティングラウンドのベット額
+    total_bets: Tuple[int, ...]  # このハンドの累積ベット額
+    statuses: Tuple[PlayerStatus, ...]
+    hole_cards: Tuple[Tuple[int, ...], ...]
+    community: Tuple[int, ...]
+    deck: Tuple[int, ...]
+
+    @property
+    def num_seats(self) -> int:
+        return len(self.chips)
+
+    @property
+    def is_terminal(self) -> bool:
+        """ハンドが終わり、ショーダウン（または終了）を待つ状態か"""
+        return self.phase in (GamePhase.SHOWDOWN, GamePhase.FINISHED)
+
+    def to_call(self, seat: int) -> int:
+        """座席 seat がコールに必要な額"""
+        return max(0, self.current_bet - self.bets[seat])
+
+
+class _Table:
+    """step() の作業用の可変コピー（PokerGame の該当メソッドと同じ手順で更新する）"""
+
+    __slots__ = (
+        "state",
+        "phase",
+        "current_player",
+        "pot",
+        "current_bet",
+        "last_raiser",
+        "has_bet_or_raise",
+        "complete",
+        "chips",
+        "bets",
+        "total_bets",
+        "statuses",
+        "community",
+        "deck",
+    )
+
+    def __init__(self, state: TableState):
+        self.state = state
+        self.phase = state.phase
+        self.current_player = state.current_player
+        self.pot = state.pot
+        self.current_bet = state.current_bet
+        self.last_raiser = state.last_raiser
+        self.has_bet_or_raise = state.has_bet_or_raise
+        self.complete = state.betting_round_complete
+        self.chips = list(state.chips)
+        self.bets = list(state.bets)
+        self.total_bets = list(state.total_bets)
+        self.statuses = list(state.statuses)
+        self.community = state.community
+        self.deck = state.deck
+
+    def freeze(self) -> TableState:
+        state = self.state
+        return TableState(
+            phase=self.phase,
+            hand_number=state.hand_number,
+            small_blind=state.small_blind,
+            big_blind=state.big_blind,
+            dealer_button=state.dealer_button,
+            small_blind_seat=state.small_blind_seat,
+            big_blind_seat=state.big_blind_seat,
+            current_player=self.current_player,
+            pot=self.pot,
+            current_bet=self.current_bet,
+            last_raiser=self.last_raiser,
+            has_bet_or_raise=self.has_bet_or_raise,
+            betting_round_complete=self.complete,
+            chips=tuple(self.chips),
+            bets=tuple(self.bets),
+            total_bets=tuple(self.total_bets),
+            statuses=tuple(self.statuses),
+            hole_cards=state.hole_cards,
+            community=self.community,
+            deck=self.deck,
+        )
+
+    def _bet(self, seat: int, amount: int) -> int:
+        """Player.bet と同じ（チップが足りなければオールイン）"""
+        if amount <= 0:
+            return 0
+        actual = min(amount, self.chips[seat])
+        self.chips[seat] -= actual
+        self.bets[seat] += actual
+        self.total_bets[seat] += actual
+        if self.chips[seat] == 0:
+            self.statuses[seat] = PlayerStatus.ALL_IN
+        return actual
+
+    def apply(self, seat: int, action: str, amount: int):
+        """PokerGame.process_player_action と同じ規則でアクションを適用"""
+        if self.statuses[seat] != PlayerStatus.ACTIVE:
+            raise ValueError(f"Player {seat} is not active")
+
+        if action == "fold":
+            self.statuses[seat] = PlayerStatus.FOLDED
+        elif action == "check":
+            if self.current_bet > self.bets[seat]:
+                raise ValueError(f"Player {seat} cannot check")
+        elif action == "call":
+            to_call = self.current_bet - self.bets[seat]
+            if to_call > 0:
+                if self.chips[seat] < to_call:
+                    raise ValueError(f"Player {seat} cannot call")
+                self.pot += self._bet(seat, to_call)
+        elif action == "raise":
+            total_needed = self.current_bet - self.bets[seat] + amount
+            if self.chips[seat] < total_needed:
+                raise ValueError(f"Player {seat} cannot raise")
+            self.pot += self._bet(seat, total_needed)
+            self.current_bet = self.bets[seat]
+            self.last_raiser = seat
+            self.has_bet_or_raise = True
+        elif action == "all_in":
+            if self.chips[seat] <= 0:
+                raise ValueError(f"Player {seat} cannot go all-in")
+            self.pot += self._bet(seat, self.chips[seat])
+            if self.bets[seat] > self.current_bet:
+                self.current_bet = self.bets[seat]
+                self.last_raiser = seat
+                self.has_bet_or_raise = True
+            self.statuses[seat] = PlayerStatus.ALL_IN
+        else:
+            raise ValueError(f"Unknown action: {action}")
+
+        self.advance_to_next_player()
+        self.check_betting_round_complete()
+
+    def active_seats(self) -> List[int]:
+        return [i for i, status in enumerate(self.statuses) if status == PlayerStatus.ACTIVE]
+
+    def advance_to_next_player(self):
+        n = len(self.statuses)
+        for i in range(1, n + 1):
+            next_index = (self.current_player + i) % n
+            if self.statuses[next_index] == PlayerStatus.ACTIVE:
+                self.current_player = next_index
+                return
+        self.complete = True
+
+    def next_active_from(self, from_index: int) -> Optional[int]:
+        n = len(self.statuses)
+        for i in range(1, n):
+            next_index = (from_index + i) % n
+            if self.statuses[next_index] == PlayerStatus.ACTIVE:
+                return next_index
+        return None
+
+    def first_actor_for_phase(self) -> Optional[int]:
+        active = self.active_seats()
+        n = len(self.statuses)
+        if self.phase == GamePhase.PREFLOP:
+            start = self.state.big_blind_seat
+        else:
+            start = self.state.dealer_button
+        if start is not None:
+            for i in range(1, n):
+                next_index = (start + i) % n
+                if self.statuses[next_index] == PlayerStatus.ACTIVE:
+                    return next_index
+        return active[0] if active else None
+
+    def check_betting_round_complete(self):
+        active = self.active_seats()
+        all_in = sum(1 for status in self.statuses if status == PlayerStatus.ALL_IN)
+
+        if len(active) + all_in <= 1 or not active:
+            self.complete = True
+            return
+
+        if len(active) == 1:
+            if self.bets[active[0]] >= self.current_bet:
+                self.complete = True
+            return
+
+        if any(self.bets[i] != self.current_bet for i in active):
+            return
+
+        if self.last_raiser is not None and self.has_bet_or_raise:
+            self.complete = True
+        elif self.last_raiser is None:
+            if self.current_player == self.first_actor_for_phase():
+                self.complete = True
+        elif self.last_raiser not in active:
+            self.complete = True
+        elif self.current_player == self.next_active_from(self.last_raiser):
+            self.complete = True
+
+    def advance_phase(self):
+        """PokerGame.advance_to_next_phase と同じ（カードは deck の末尾から配る）"""
+        remaining = sum(
+            1
+            for status in self.statuses
+            if status in (PlayerStatus.ACTIVE, PlayerStatus.ALL_IN)
+        )
+        if remaining <= 1 or self.phase == GamePhase.RIVER:
+            self.phase = GamePhase.SHOWDOWN
+            return
+
+        count = _STREET_CARDS[self.phase]
+        deck = self.deck
+        if len(deck) < count + 1:
+            raise ValueError("Not enough cards left in the deck")
+        # 末尾の1枚をバーンし、続く count 枚を配る
+        dealt = deck[-count - 1 : -1][::-1]
+        self.deck = deck[: -count - 1]
+        self.community = self.community + dealt
+        self.phase = _NEXT_PHASE[self.phase]
+
+        # _start_new_betting_round
+        self.bets = [0] * len(self.bets)
+        self.current_bet = 0
+        self.complete = False
+        self.last_raiser = None
+        if self.active_seats():
+            self.current_player = self.first_actor_for_phase()
+        else:
+            self.complete = True
+
+    def settle_turn(self):
+        """次に意思決定が必要な座席まで（またはショーダウンまで）進める"""
+        while self.phase not in (GamePhase.SHOWDOWN, GamePhase.FINISHED):
+            if self.complete:
+                self.advance_phase()
+            elif self.statuses[self.current_player] != PlayerStatus.ACTIVE:
+                self.advance_to_next_player()
+            else:
+                return
+
+
+def legal_actions(state: TableState) -> Tuple[str, ...]:
+    """
+    手番の座席が step() に渡せるアクション名（PokerGame._get_available_actions と同じ条件）
+
+    "raise" の amount はコール額に上乗せする額（PokerGame と同じく最低額は検証しない。
+    _get_available_actions が提示する最低レイズはビッグブラインド分の上乗せ）。
+    """
+    if state.is_terminal:
+        return ()
+    seat = state.current_player
+    if state.statuses[seat] != PlayerStatus.ACTIVE:
+        return ()
+    chips = state.chips[seat]
+    to_call = state.to_call(seat)
+    actions = ["fold"]
+    if to_call == 0:
+        actions.append("check")
+    if to_call > 0 and chips >= to_call:
+        actions.append("call")
+
+    can_open_bet = state.current_bet == 0
+    can_raise = to_call > 0
+    is_big_blind_option = (
+        state.phase == GamePhase.PREFLOP
+        and not state.has_bet_or_raise
+        and to_call == 0
+        and state.current_bet == state.big_blind
+        and seat == state.big_blind_seat
+    )
+    min_raise_total = state.big_blind if can_open_bet else state.current_bet + state.big_blind
+    may_raise = can_open_bet or can_raise or is_big_blind_option
+    if may_raise and chips >= min_raise_total and to_call < chips:
+        actions.append("raise")
+    if chips > 0 and (may_raise or (to_call > 0 and chips < to_call)):
+        actions.append("all_in")
+    return tuple(actions)
+
+
+def step(state: TableState, action: str, amount: int = 0) -> TableState:
+    """
+    手番の座席がアクションした後の新しい TableState を返す（state は変更しない）
+
+    ベッティングラウンドが終わると次のストリートを配り、次に意思決定が必要な
+    座席かショーダウンまで進める。
+
+    Args:
+        state: 現在の局面
+        action: "fold" / "check" / "call" / "raise" / "all_in"
+        amount: "raise" のときのコール額への上乗せ額（process_player_action と同じ）
+
+    Raises:
+        ValueError: その局面で実行できないアクションの場合
+    """
+    if state.is_terminal:
+        raise ValueError(f"Hand is over (phase: {state.phase.value})")
+    table = _Table(state)
+    table.settle_turn()
+    if table.phase in (GamePhase.SHOWDOWN, GamePhase.FINISHED):
+        raise ValueError("No player is left to act")
+    table.apply(table.current_player, action, amount)
+    table.settle_turn()
+    return table.freeze()
+
+
+def shuffle_deck(state: TableState, rng: Optional[random.Random] = None) -> TableState:
+    """残りのデッキを並べ替えた TableState を返す（ロールアウトごとに違うボードを引く）"""
+    deck = list(state.deck)
+    (rng or random).shuffle(deck)
+    return replace(state, deck=tuple(deck))
+
+
+def payouts(state: TableState) -> Tuple[int, ...]:
+    """ショーダウンで各座席が受け取るチップ（PokerGame.conduct_showdown と同じ分配）"""
+    if not state.is_terminal:
+        raise ValueError(f"Hand is not over (phase: {state.phase.value})")
+    won = [0] * state.num_seats
+    remaining = [
+        i
+        for i, status in enumerate(state.statuses)
+        if status in (PlayerStatus.ACTIVE, PlayerStatus.ALL_IN)
+    ]
+    if not remaining:
+        return tuple(won)
+    if len(remaining) == 1:
+        won[remaining[0]] = state.pot
+        return tuple(won)
+
+    strengths = {
+        seat: HandEvaluator.evaluate_ids(state.hole_cards[seat] + state.community)
+        for seat in remaining
+    }
+
+    # サイドポットを含めたポット階層ごとに分配
+    contributions = {seat: bet for seat, bet in enumerate(state.total_bets) if bet > 0}
+    prev = 0
+    for level in sorted(set(contributions.values())):
+        contributors = [seat for seat, bet in contributions.items() if bet >= level]
+        amount = (level - prev) * len(contributors)
+        prev = level
+        eligible = [seat for seat in contributors if seat in strengths]
+        if not eligible:
+            # コールされずにフォールドしたベットは拠出したプレイヤーに返す
+            for seat in contributors:
+                won[seat] += amount // len(contributors)
+            continue
+        best = max(strengths[seat] for seat in eligible)
+        winners = [seat for seat in eligible if strengths[seat] == best]
+        share, remainder = divmod(amount, len(winners))
+        for i, seat in enumerate(winners):
+            won[seat] += share + (1 if i < remainder else 0)
+    return tuple(won)
+
+
+def settle_showdown(state: TableState) -> TableState:
+    """payouts() をチップに反映し、ポットから配った分を引いた TableState を返す"""
+    won = payouts(state)
+    return replace(
+        state,
+        chips=tuple(chips + amount for chips, amount in zip(state.chips, won)),
+        pot=max(0, state.pot - sum(won)),
+    )
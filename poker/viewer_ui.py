@@ -1092,7 +1092,14 @@ class PokerViewerUI:
         if self.pot_text:
             pot = state.get("pot", 0)
             current_bet = state.get("current_bet", 0)
-            self.pot_text.value = f"💰 Pot: {pot:,}   💵 Bet: {current_bet:,}"
+            pot_text = f"💰 Pot: {pot:,}   💵 Bet: {current_bet:,}"
+            # サイドポットがある場合は内訳も表示
+            side_pots = state.get("pots", [])[1:]
+            if side_pots:
+                pot_text += "   " + "  ".join(
+                    f"Side pot {i}: {side['amount']:,}" for i, side in enumerate(side_pots, 1)
+                )
+            self.pot_text.value = pot_text
 
         # Header status
         if self.table_status_text:
@@ -0,0 +1,245 @@
+"""
+Tests for poker.action_log module
+"""
+
+import json
+import logging
+import random
+import sqlite3
+
+import pytest
+
+from poker.action_log import ActionHistoryView, ActionLog, EventJson
+from poker.game import PokerGame
+from poker.game_models import Card
+from poker.shared_state import set_current_game
+from poker.state_server import _build_viewer_state
+
+
+class TestActionLog:
+    """ActionLog のテスト"""
+
+    def test_render_matches_legacy_strings(self):
+        log = ActionLog()
+        log.start_hand(1)
+        log.add(1, "preflop", "small_blind", player=1, amount=10)
+        log.add(1, "preflop", "big_blind", player=2, amount=20)
+        log.add(1, "preflop", "raise", player=3, amount=120)
+        log.add(1, "preflop", "call", player=0, amount=120)
+        log.add(1, "preflop", "fold", player=1)
+        log.add(1, "flop", "deal", detail=(0, 4, 51))
+        log.add(1, "flop", "check", player=0)
+        log.add(1, "flop", "all_in", player=3, amount=880)
+        log.add(1, "turn", "deal", detail=(0, 4, 51, 8))
+        assert [event.text for event in log] == [
+            "Player 1 posted small blind 10",
+            "Player 2 posted big blind 20",
+            "Player 3 raised to 120",
+            "Player 0 called 120",
+            "Player 1 folded",
+            f"Flop dealt: {Card.from_id(0)}, {Card.from_id(4)}, {Card.from_id(51)}",
+            "Player 0 checked",
+            "Player 3 went all-in with 880",
+            f"Turn dealt: {Card.from_id(8)}",
+        ]
+
+    def test_latest_for_player_skips_blinds(self):
+        log = ActionLog()
+        log.start_hand(1)
+        log.add(1, "preflop", "big_blind", player=2, amount=20)
+        assert log.latest_for_player(2) is None
+        log.add(1, "preflop", "raise", player=2, amount=60)
+        log.start_hand(2)
+        log.add(2, "preflop", "small_blind", player=2, amount=10)
+        event = log.latest_for_player(2)
+        assert (event.kind, event.amount, event.hand) == ("raise", 60, 1)
+        assert [e.kind for e in log.events_for_player(2)] == ["big_blind", "raise", "small_blind"]
+
+    def test_rendering_is_lazy(self):
+        log = ActionLog()
+        event = log.add(1, "preflop", "call", player=0, amount=20)
+        assert event._text is None
+        assert str(event) == "Player 0 called 20"
+        assert event._text is not None
+
+    def test_tail_spans_hands(self):
+        log = ActionLog()
+        for hand in (1, 2):
+            log.start_hand(hand)
+            for player in range(3):
+                log.add(hand, "preflop", "fold", player=player)
+        assert len(log) == 6
+        assert log.tail(4) == [
+            "Player 2 folded",
+            "Player 0 folded",
+            "Player 1 folded",
+            "Player 2 folded",
+        ]
+        assert len(log.tail(100)) == 6
+
+    def test_archive_is_a_ring_buffer(self):
+        evicted = []
+        log = ActionLog(depth=2, on_evict=lambda hand, events: evicted.append((hand, events)))
+        for hand in range(1, 6):
+            log.start_hand(hand)
+            log.add(hand, "preflop", "raise", player=hand % 2, amount=hand * 20)
+            log.add(hand, "preflop", "fold", player=2)
+        assert [hand for hand, _ in log.archive] == [3, 4]
+        assert [hand for hand, _ in evicted] == [1, 2]
+        assert len(log) == 6 and len(list(log)) == 6
+        assert log.hand_events(1) == [] and len(log.hand_events(5)) == 2
+        assert [e.hand for e in log.events_for_player(2)] == [3, 4, 5]
+        assert [e.hand for e in log.events_for_player(1)] == [3, 5]
+        assert log.latest_for_player(0).amount == 80
+        assert log.tail(3) == ["Player 2 folded", "Player 1 raised to 100", "Player 2 folded"]
+        log.flush()
+        assert [hand for hand, _ in evicted] == [1, 2, 3, 4]
+        assert len(log) == 2 and len(log.events_for_player(2)) == 1
+
+    def test_view_indexing_across_hands(self):
+        log = ActionLog(depth=2)
+        for hand in range(1, 5):
+            log.start_hand(hand)
+            for player in range(hand):
+                log.add(hand, "preflop", "call", player=player, amount=10 * hand)
+        view = ActionHistoryView(log)
+        expected = [event.text for event in log.events()]
+        assert len(view) == len(expected) == 9
+        assert [view[i] for i in range(-9, 9)] == expected + expected
+        assert view[1:6:2] == expected[1:6:2] and view[2:4] == expected[2:4]
+        assert view[::-1] == expected[::-1]
+        assert list(reversed(view)) == expected[::-1]
+        with pytest.raises(IndexError):
+            view[9]
+
+    def test_depth_zero_keeps_only_current_hand(self):
+        log = ActionLog(depth=0)
+        for hand in (1, 2):
+            log.start_hand(hand)
+            log.add(hand, "preflop", "check", player=0)
+        assert len(log) == 1 and not log.archive
+        assert log.latest_for_player(0).hand == 2
+
+    def test_event_json(self):
+        log = ActionLog()
+        event = log.add(3, "turn", "raise", player=1, amount=80, pot_after=200)
+        assert json.loads(str(EventJson(event))) == {
+            "seq": 1,
+            "hand": 3,
+            "phase": "turn",
+            "player": 1,
+            "kind": "raise",
+            "amount": 80,
+            "pot_after": 200,
+        }
+
+
+class TestGameActionLog:
+    """PokerGame との連携のテスト"""
+
+    def test_action_history_view(self):
+        game = PokerGame(headless=True, seed=1)
+        game.setup_cpu_only_game()
+        assert game.action_history == []
+        random.seed(1)
+        game.play_hand()
+        history = game.action_history
+        assert len(history) == len(game.action_log)
+        assert history[0].startswith("Player ") and "blind" in history[0]
+        assert history[-2:] == list(history)[-2:]
+        assert list(reversed(history))[0] == history[-1]
+        assert all(event.hand == 1 for event in game.action_log.hand_events(1))
+
+    def test_events_are_typed(self):
+        game = PokerGame(headless=True, seed=2)
+        game.setup_cpu_only_game()
+        game.start_new_hand()
+        player_id = game.current_player_index
+        to_call = game.current_bet - game.players[player_id].current_bet
+        game.process_player_action(player_id, "call")
+        event = game.action_log.latest_for_player(player_id)
+        assert (event.kind, event.amount, event.phase) == ("call", to_call, "preflop")
+        assert event.pot_after == game.pot
+
+    def test_viewer_uses_player_index(self):
+        game = PokerGame(headless=True, seed=3)
+        game.setup_configurable_game_with_models(
+            [
+                {"type": "random"},
+                {"type": "llm_api", "agent_id": "team1_agent", "user_id": "u1"},
+                {"type": "random"},
+            ]
+        )
+        game.start_new_hand()
+        set_current_game(game)
+        try:
+            while game.current_player_index != 1:
+                game.process_player_action(game.current_player_index, "call")
+            game.process_player_action(1, "raise", 40)
+            state = _build_viewer_state()
+        finally:
+            set_current_game(None)
+        agent = state["llm_api_agents"][0]
+        assert (agent["action"], agent["amount"]) == ("raise", game.current_bet)
+        assert state["action_history"][-1] == f"Player 1 raised to {game.current_bet}"
+
+    def test_history_is_bounded_and_flushed_to_db(self):
+        game = PokerGame(headless=False, db_path=":memory:", seed=4, history_depth=3)
+        game.setup_cpu_only_game()
+        random.seed(4)
+        set_current_game(game)
+        try:
+            sizes = []
+            for _ in range(30):
+                game.play_hand()
+                if game.is_game_over():
+                    break
+                sizes.append(len(json.dumps(_build_viewer_state()["action_history"])))
+        finally:
+            set_current_game(None)
+        hands = game.hand_number
+        assert [hand for hand, _ in game.action_log.archive] == list(range(hands - 3, hands))
+        assert len(game.action_history) == sum(
+            len(game.action_log.hand_events(h)) for h in range(hands - 3, hands + 1)
+        )
+        assert max(sizes) < 8000
+        # 押し出されたハンドは DB に同じ表記で残っている
+        rows = game.db.conn.execute("SELECT hand_id, hand_number FROM hand_logs ORDER BY hand_number")
+        rows = [tuple(row) for row in rows]
+        assert [number for _, number in rows] == list(range(1, hands - 3))
+        events = game.db.get_hand_log(rows[0][0])
+        assert events[0]["hand"] == 1 and "blind" in events[0]["text"]
+
+    def test_close_writes_the_remaining_hands(self, tmp_path):
+        db_path = str(tmp_path / "history.sqlite3")
+        game = PokerGame(headless=False, db_path=db_path, seed=5)
+        game.setup_cpu_only_game()
+        random.seed(5)
+        for _ in range(4):
+            game.play_hand()
+        hands = game.hand_number
+        assert hands < game.history_depth
+        game.close()
+        game.close()
+        assert game.db is None
+        conn = sqlite3.connect(db_path)
+        try:
+            numbers = [row[0] for row in conn.execute("SELECT hand_number FROM hand_logs ORDER BY hand_number")]
+            hand_rows = conn.execute("SELECT COUNT(*) FROM hands").fetchone()[0]
+        finally:
+            conn.close()
+        # 履歴からあふれていないハンドも全て書き出されている
+        assert numbers == list(range(1, hands + 1))
+        assert hand_rows == hands
+
+    def test_action_executed_log_has_json(self, caplog):
+        logger = logging.getLogger("poker_game.test_action_log")
+        game = PokerGame(headless=False, db_path=":memory:", logger=logger)
+        game.setup_cpu_only_game()
+        game.start_new_hand()
+        with caplog.at_level(logging.INFO, logger=logger.name):
+            game.process_player_action(game.current_player_index, "fold")
+        message = next(r.getMessage() for r in caplog.records if "ACTION_EXECUTED" in r.getMessage())
+        record = json.loads(message[message.index("{"):])
+        assert record["kind"] == "fold"
+        assert message.startswith(f"ACTION_EXECUTED: Player {record['player']} folded")
@@ -0,0 +1,134 @@
+"""
+Tests for LLMApiPlayer latency tracking, hedging and cancellation
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from benchmarks.stub_agent import StubAgentServer
+from poker.agent_latency import LatencyTracker, get_tracker, latency_stats, reset_latency
+from poker.agent_transport import AgentTransport
+from poker.game import PokerGame
+from poker.player_models import LLMApiPlayer, RandomPlayer
+
+
+_transports = []
+
+
+@pytest.fixture(autouse=True)
+def clean_state():
+    reset_latency()
+    yield
+    # keep-alive の接続を閉じてスタブのスレッドを終わらせる
+    while _transports:
+        _transports.pop().close()
+    reset_latency()
+
+
+def make_player(url, **options):
+    transport = AgentTransport(url)
+    _transports.append(transport)
+    player = LLMApiPlayer(0, "Agent", "team1_agent", "u0", url=url, transport=transport, **options)
+    game = PokerGame(headless=True, seed=4)
+    game.add_player(player)
+    game.add_player(RandomPlayer(1, "CPU1", 1000))
+    game.start_new_hand()
+    return player, game.get_llm_game_state(0)
+
+
+def timed_decisions(player, state, count):
+    times = []
+    for _ in range(count):
+        start = time.perf_counter()
+        assert player.make_decision(state)["action"] in ("check", "fold")
+        times.append(time.perf_counter() - start)
+    return times
+
+
+class TestLatencyTracker:
+    """LatencyTracker のテスト"""
+
+    def test_percentiles(self):
+        tracker = LatencyTracker(window=100)
+        assert tracker.percentile(50) is None
+        for ms in range(1, 101):
+            tracker.record(ms / 1000)
+        assert tracker.percentile(50) == pytest.approx(0.050)
+        assert tracker.percentile(95) == pytest.approx(0.095)
+        assert tracker.percentile(99) == pytest.approx(0.099)
+        # 古い記録は window からあふれる
+        tracker.record(1.0)
+        assert tracker.count == 100
+        assert tracker.percentile(100) == 1.0
+        with pytest.raises(ValueError):
+            tracker.percentile(0)
+
+    def test_shared_per_agent(self):
+        assert get_tracker("team1_agent") is get_tracker("team1_agent")
+        assert get_tracker("team2_agent") is not get_tracker("team1_agent")
+        get_tracker("team1_agent").record(0.5)
+        stats = latency_stats()["team1_agent"]
+        assert stats["count"] == 1 and stats["p50"] == stats["p99"] == 0.5
+
+
+class TestHedging:
+    """ヘッジと取り消しのテスト"""
+
+    def test_decisions_are_recorded(self):
+        with StubAgentServer(delay=0.01) as server:
+            player, state = make_player(server.url)
+            timed_decisions(player, state, 5)
+        stats = latency_stats()["team1_agent"]
+        assert stats["count"] == 5
+        assert 0.01 <= stats["p50"] < 0.5
+        assert stats["hedged"] == 0
+
+    def test_slow_request_is_hedged(self):
+        with StubAgentServer(delay=0.01, slow_every=25, slow_delay=2.0) as server:
+            player, state = make_player(server.url, hedge_percentile=90)
+            times = timed_decisions(player, state, 50)
+            hedge_session = player.hedge_session_id
+        tracker = get_tracker("team1_agent")
+        # 25回目と50回目の /run が遅いが、ヘッジのほうが先に返る
+        assert tracker.hedged >= 2 and tracker.hedge_wins >= 2
+        assert max(times) < 1.0
+        # ヘッジは本来のセッションとは別のセッションに送られる
+        assert hedge_session is not None and hedge_session != player.session_id
+        assert hedge_session in server.sessions
+
+    def test_no_hedge_without_enough_samples(self):
+        with StubAgentServer(delay=0.01, slow_every=3, slow_delay=0.3) as server:
+            player, state = make_player(server.url, hedge_percentile=50)
+            times = timed_decisions(player, state, 3)
+        assert get_tracker("team1_agent").hedged == 0
+        assert times[-1] >= 0.3
+
+    def test_timeout_returns_at_the_deadline(self):
+        with StubAgentServer(delay=2.0) as slow:
+            player, state = make_player(slow.url)
+            player.DECISION_TIMEOUT = 0.2
+            start = time.perf_counter()
+            assert player.make_decision(state)["action"] == "fold"
+            sync_elapsed = time.perf_counter() - start
+            start = time.perf_counter()
+            assert asyncio.run(player.decide(state))["action"] == "fold"
+            async_elapsed = time.perf_counter() - start
+        assert sync_elapsed < 0.6 and async_elapsed < 0.6
+        # 打ち切った意思決定は制限時間として記録される
+        assert get_tracker("team1_agent").percentile(50, min_samples=1) == 0.2
+
+    def test_percentile_from_player_config(self):
+        game = PokerGame(headless=True, seed=1)
+        game.setup_configurable_game_with_models(
+            [
+                {"type": "llm_api", "agent_id": "team1_agent", "hedge_percentile": 95},
+                {"type": "llm_api", "agent_id": "team2_agent"},
+            ]
+        )
+        assert [player.hedge_percentile for player in game.players] == [95, None]
+
+    def test_invalid_percentile(self):
+        with pytest.raises(ValueError):
+            LLMApiPlayer(0, "A", "team1_agent", "u0", hedge_percentile=100)
@@ -0,0 +1,118 @@
+"""
+Tests for poker.agent_runtime module
+"""
+
+import asyncio
+import json
+import random
+import time
+
+import pytest
+from google.adk.agents import BaseAgent
+from google.adk.events import Event
+from google.genai import types
+
+from poker.agent_runtime import AgentRuntime
+from poker.async_driver import play_hand_async
+from poker.game import PokerGame
+from poker.player_models import LLMPlayer, RandomPlayer
+
+
+class CheckAgent(BaseAgent):
+    """check（できなければ call）を返すだけのエージェント。呼ばれたループと履歴の長さを記録する"""
+
+    calls: list = []
+    delay: float = 0.0
+
+    async def _run_async_impl(self, ctx):
+        self.calls.append((asyncio.get_running_loop(), ctx.session.id, len(ctx.session.events)))
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        prompt = ctx.user_content.parts[0].text
+        action = "check" if "'check'" in prompt else "call"
+        text = json.dumps({"action": action, "amount": 0})
+        yield Event(
+            author=self.name,
+            invocation_id=ctx.invocation_id,
+            content=types.Content(role="model", parts=[types.Part(text=text)]),
+        )
+
+
+def make_player(player_id=0, session_scope="decision"):
+    player = LLMPlayer(player_id, f"LLM{player_id}", 1000, session_scope=session_scope)
+    player._agent = CheckAgent(name=f"check_{player_id}", calls=[])
+    player._runtime = AgentRuntime(player._agent, "poker_game", f"player_{player_id}")
+    return player
+
+
+def make_game(player):
+    game = PokerGame(headless=True, seed=8)
+    game.add_player(player)
+    game.add_player(RandomPlayer(1, "CPU1", 1000))
+    return game
+
+
+class TestAgentRuntime:
+    """AgentRuntime と LLMPlayer のテスト"""
+
+    def test_runner_and_loop_are_reused(self):
+        random.seed(0)
+        player = make_player()
+        runner = player._runtime.runner
+        game = make_game(player)
+        for _ in range(5):
+            game.play_hand()
+        asyncio.run(play_hand_async(game))
+        calls = player._agent.calls
+        assert calls
+        assert player._runtime.runner is runner
+        # 同期・非同期どちらの呼び出しも同じバックグラウンドのループで動く
+        assert len({loop for loop, _, _ in calls}) == 1
+        # 意思決定ごとのセッションは使い終わったら削除される
+        assert len({session for _, session, _ in calls}) == len(calls)
+        assert player._runtime.session_count == 0
+
+    def test_game_scope_keeps_history(self):
+        player = make_player(session_scope="game")
+        game = make_game(player)
+        for _ in range(4):
+            game.play_hand()
+        calls = player._agent.calls
+        assert len({session for _, session, _ in calls}) == 1
+        assert [events for _, _, events in calls] == sorted(events for _, _, events in calls)
+        assert calls[-1][2] > 0
+        assert player._runtime.session_count == 1
+
+    def test_hand_scope_leaves_no_sessions_behind(self):
+        player = make_player(session_scope="hand")
+        game = make_game(player)
+        for _ in range(30):
+            if game.is_game_over():
+                break
+            game.play_hand()
+        player.reset_for_new_hand()
+        # 削除はバックグラウンドのループで行われる
+        player._runtime.call(asyncio.sleep(0))
+        sessions = player._runtime.call(
+            player._runtime.session_service.list_sessions(
+                app_name="poker_game", user_id="player_0"
+            )
+        )
+        assert sessions.sessions == []
+        assert player._runtime.session_count == 0
+
+    def test_timeout_cancels_the_request(self):
+        player = make_player()
+        player._agent.delay = 1.0
+        state = make_game(player)
+        state.start_new_hand()
+        start = time.perf_counter()
+        with pytest.raises(TimeoutError):
+            player._runtime.call(
+                player._ask_agent(player._create_decision_prompt(state.get_llm_game_state(0))),
+                timeout=0.05,
+            )
+        assert time.perf_counter() - start < 0.5
+        # 取り消された意思決定のセッションも残らない
+        player._runtime.call(asyncio.sleep(0.01))
+        assert player._runtime.session_count == 0
@@ -0,0 +1,138 @@
+"""
+Tests for LLMApiPlayer session reuse
+"""
+
+import asyncio
+import random
+import time
+
+import pytest
+
+from benchmarks.stub_agent import StubAgentServer
+from poker.agent_transport import AgentTransport
+from poker.async_driver import play_hand_async
+from poker.game import PokerGame
+from poker.player_models import LLMApiPlayer
+
+
+_transports = []
+
+
+@pytest.fixture(autouse=True)
+def close_transports():
+    yield
+    # keep-alive の接続を閉じてスタブのスレッドを終わらせる
+    while _transports:
+        _transports.pop().close()
+
+
+def make_game(url, seats=3, session_scope="game"):
+    transport = AgentTransport(url)
+    _transports.append(transport)
+    game = PokerGame(headless=True, seed=6)
+    for i in range(seats):
+        game.add_player(
+            LLMApiPlayer(
+                i, f"Agent{i}", "team1_agent", f"u{i}", url=url,
+                transport=transport, session_scope=session_scope,
+            )
+        )
+    return game
+
+
+def session_posts(server):
+    return [path for path in server.paths if "/sessions/" in path]
+
+
+class TestSessions:
+    """セッションの作成と使い回しのテスト"""
+
+    def test_one_session_per_player_per_game(self):
+        with StubAgentServer() as server:
+            game = make_game(server.url)
+            for _ in range(4):
+                game.play_hand()
+        assert len(session_posts(server)) == 3
+        assert {player.session_id for player in game.players} == server.sessions
+        # /run は必ず作成済みのセッションに向く
+        assert server.runs and set(server.runs) <= server.sessions
+
+    def test_session_per_hand(self):
+        with StubAgentServer() as server:
+            game = make_game(server.url, seats=2, session_scope="hand")
+            for _ in range(3):
+                game.play_hand()
+            for player in game.players:
+                player.reset_for_new_hand()
+            # 削除はバックグラウンドで送られる
+            deadline = time.perf_counter() + 2
+            while len(server.deleted) < 6 and time.perf_counter() < deadline:
+                time.sleep(0.01)
+        # 2人×3ハンドのセッションを作り、使い終わったものはサーバーから削除する
+        assert len(set(server.deleted)) == 6
+        assert set(server.runs) <= set(server.deleted)
+        assert server.sessions == set()
+
+    def test_close_deletes_game_sessions(self):
+        with StubAgentServer() as server:
+            game = make_game(server.url)
+            for _ in range(2):
+                game.play_hand()
+            game.close()
+            game.close()
+            deadline = time.perf_counter() + 2
+            while len(server.deleted) < 3 and time.perf_counter() < deadline:
+                time.sleep(0.01)
+        # ゲームの間使い回したセッションはゲームを閉じると削除される
+        assert len(server.deleted) == 3
+        assert server.sessions == set()
+        assert all(player.session_id is None for player in game.players)
+
+    def test_sessions_are_created_concurrently(self):
+        with StubAgentServer(session_delay=0.2) as server:
+            game = make_game(server.url, seats=4)
+            start = time.perf_counter()
+            game.start_new_hand()
+            elapsed = time.perf_counter() - start
+            assert len(server.sessions) == 4
+            assert elapsed < 0.6
+
+            asyncio.run(play_hand_async(make_game(server.url, seats=4)))
+            assert len(server.sessions) == 8
+
+    def test_failed_creation_is_retried_once(self):
+        with StubAgentServer(fail_sessions=1) as server:
+            game = make_game(server.url, seats=2)
+            game.start_new_hand()
+        assert len(session_posts(server)) == 3
+        assert all(player.session_id in server.sessions for player in game.players)
+
+    def test_no_run_without_a_session(self):
+        with StubAgentServer(fail_sessions=100) as server:
+            game = make_game(server.url, seats=2)
+            game.start_new_hand()
+            player = game.players[game.current_player_index]
+            random.seed(0)
+            decision = player.make_decision(game.get_llm_game_state(player.id))
+        # start_new_hand で2人×2回、意思決定の前にもう2回。/run は送らない
+        assert len(session_posts(server)) == 6
+        assert server.runs == []
+        # ランダム行動にフォールバック
+        assert decision["action"] in ("fold", "check", "call", "raise", "all_in")
+        assert player.session_pending
+
+    def test_lost_session_is_recreated(self):
+        with StubAgentServer() as server:
+            game = make_game(server.url, seats=2)
+            game.start_new_hand()
+            player = game.players[game.current_player_index]
+            state = game.get_llm_game_state(player.id)
+            server.sessions.clear()  # サーバーの再起動
+            assert player.make_decision(state)["action"] == "fold"
+            assert player.session_pending
+            player.make_decision(state)
+        assert player.session_id in server.sessions
+
+    def test_invalid_scope(self):
+        with pytest.raises(ValueError):
+            LLMApiPlayer(0, "A", "team1_agent", "u0", session_scope="decision")
@@ -0,0 +1,77 @@
+"""
+Tests for poker.agent_transport module
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from benchmarks.stub_agent import StubAgentServer
+from poker.agent_transport import AgentTransport, get_transport
+from poker.game import PokerGame
+from poker.player_models import LLMApiPlayer, RandomPlayer
+
+
+@pytest.fixture
+def server():
+    with StubAgentServer() as stub:
+        yield stub
+
+
+def make_player(url, transport=None):
+    player = LLMApiPlayer(0, "Agent", "team1_agent", "u0", url=url, transport=transport)
+    game = PokerGame(headless=True, seed=4)
+    game.add_player(player)
+    game.add_player(RandomPlayer(1, "CPU1", 1000))
+    game.start_new_hand()
+    return player, game.get_llm_game_state(0)
+
+
+class TestAgentTransport:
+    """AgentTransport のテスト"""
+
+    def test_shared_per_url(self):
+        transport = get_transport("http://agents.example:8000/")
+        assert get_transport("http://agents.example:8000") is transport
+        assert get_transport("http://other.example:8000") is not transport
+        player = LLMApiPlayer(0, "A", "team1_agent", "u0", url="http://agents.example:8000")
+        assert player.transport is transport
+        with pytest.raises(ValueError):
+            AgentTransport("http://agents.example:8000", pool_size=0)
+
+    def test_sync_decisions_reuse_one_connection(self, server):
+        transport = AgentTransport(server.url)
+        player, state = make_player(server.url, transport)
+        for _ in range(5):
+            assert player.make_decision(state)["action"] in ("check", "fold")
+        transport.close()
+        # セッション作成（start_new_hand）1回と /run 5回
+        assert server.requests == 6
+        assert server.connections == 1
+
+    def test_async_decisions_stay_within_pool(self, server):
+        transport = AgentTransport(server.url, pool_size=2)
+        player, state = make_player(server.url, transport)
+        # start_new_hand のセッション作成は同期クライアントの接続を使う
+        sync_connections = server.connections
+
+        async def run_all():
+            for _ in range(3):
+                await asyncio.gather(*(player.decide(state) for _ in range(4)))
+            await transport.aclose()
+
+        asyncio.run(run_all())
+        assert server.requests == 13
+        assert server.connections - sync_connections <= 2
+
+    def test_timeout_folds(self):
+        with StubAgentServer(delay=1.0) as slow:
+            transport = AgentTransport(slow.url)
+            player, state = make_player(slow.url, transport)
+            player.DECISION_TIMEOUT = 0.1
+            start = time.perf_counter()
+            decision = player.make_decision(state)
+            transport.close()
+        assert decision["action"] == "fold"
+        assert time.perf_counter() - start < 0.9
@@ -0,0 +1,134 @@
+"""
+Tests for poker.async_driver module
+"""
+
+import asyncio
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from poker.action_log import BETTING_KINDS
+from poker.async_driver import (
+    AsyncPlayer,
+    decide,
+    play_hand_async,
+    run_games_async,
+)
+from poker.game import PokerGame
+from poker.player_models import HumanPlayer, LLMApiPlayer, RandomPlayer
+
+
+class SlowCaller(RandomPlayer):
+    """応答に時間のかかるエージェントの代わり（待ちの間はイベントループを手放す）"""
+
+    delay = 0.02
+
+    async def decide(self, game_state):
+        await asyncio.sleep(self.delay)
+        return {"action": "check" if "check" in game_state.actions else "call", "amount": 0}
+
+
+def make_game(seed, players):
+    game = PokerGame(headless=True, seed=seed)
+    for player in players:
+        game.add_player(player)
+    return game
+
+
+class TestAsyncDriver:
+    """非同期ドライバのテスト"""
+
+    def test_matches_sync_play_hand(self):
+        results = []
+        for driver in ("sync", "async"):
+            random.seed(11)
+            game = PokerGame(headless=True, seed=11)
+            game.setup_configurable_game(["random"] * 4)
+            for _ in range(20):
+                if game.is_game_over():
+                    break
+                if driver == "sync":
+                    game.play_hand()
+                else:
+                    asyncio.run(play_hand_async(game))
+            results.append([p.chips for p in game.players])
+        assert results[0] == results[1]
+
+    def test_tables_wait_concurrently(self):
+        games = [
+            make_game(seed, [SlowCaller(i, f"CPU{i}", 1000) for i in range(3)])
+            for seed in range(8)
+        ]
+        start = time.perf_counter()
+        results = asyncio.run(run_games_async(games, hands=2))
+        elapsed = time.perf_counter() - start
+        decisions = sum(
+            1 for game in games for event in game.action_log if event.kind in BETTING_KINDS
+        )
+        assert [r["hands"] for r in results] == [2] * 8
+        # 全テーブルの待ち時間を直列に足した時間より十分短い
+        assert elapsed < decisions * SlowCaller.delay / 3
+        assert isinstance(games[0].players[0], AsyncPlayer)
+
+    def test_timeout_folds(self):
+        player = SlowCaller(0, "CPU0", 1000)
+        player.delay = 1.0
+        game = make_game(1, [player, RandomPlayer(1, "CPU1", 1000)])
+        game.start_new_hand()
+        state = game.get_llm_game_state(0)
+        assert asyncio.run(decide(player, state, timeout=0.01)) == {"action": "fold", "amount": 0}
+
+    def test_human_input_is_awaited(self):
+        human = HumanPlayer(0, "You", 1000)
+        game = make_game(2, [human, RandomPlayer(1, "CPU1", 1000)])
+        game.start_new_hand()
+        state = game.get_llm_game_state(0)
+
+        async def wait_for_human():
+            task = asyncio.ensure_future(human.decide(state))
+            await asyncio.sleep(0)
+            # UI スレッドからの入力
+            threading.Thread(target=human.submit_action, args=("call", 0)).start()
+            return await task
+
+        assert asyncio.run(wait_for_human()) == {"action": "call", "amount": 0}
+        assert human.submit_action("fold") is False
+
+
+class _StubAgentHandler(BaseHTTPRequestHandler):
+    def do_POST(self):  # noqa: N802
+        length = int(self.headers.get("Content-Length", 0))
+        body = json.loads(self.rfile.read(length) or b"{}")
+        if self.path == "/run":
+            state = json.loads(body["new_message"]["parts"][0]["text"])
+            action = "check" if "check" in state["actions"] else "fold"
+            payload = [{"content": {"parts": [{"text": json.dumps({"action": action, "amount": 0})}]}}]
+        else:
+            payload = {"id": self.path.rsplit("/", 1)[-1]}
+        data = json.dumps(payload).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def test_llm_api_player_decide_uses_async_http():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubAgentHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        url = f"http://127.0.0.1:{server.server_address[1]}"
+        player = LLMApiPlayer(0, "Agent", "team1_agent", "u0", url=url)
+        game = make_game(3, [player, RandomPlayer(1, "CPU1", 1000)])
+        game.start_new_hand()
+        decision = asyncio.run(player.decide(game.get_llm_game_state(0)))
+        expected = "check" if "check" in game.get_llm_game_state(0).actions else "fold"
+        assert decision == {"action": expected, "amount": 0}
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,125 @@
+"""
+Tests for poker.isomorphism and poker.cache modules
+"""
+
+import pytest
+import random
+
+pytest.importorskip("numpy")
+
+from poker.cache import LRUCache, cached_equity, cached_strength
+from poker.evaluator import HandEvaluator
+from poker.isomorphism import canonical_key
+
+
+def _permute_suits(card_ids, perm):
+    return [card_id - card_id % 4 + perm[card_id % 4] for card_id in card_ids]
+
+
+class TestCanonicalKey:
+    """スート同型キーのテスト"""
+
+    def test_suit_permutation_invariant(self):
+        """スートを付け替えても同じキーになる"""
+        rng = random.Random(0)
+        for _ in range(500):
+            cards = rng.sample(range(52), 7)
+            hole, board = cards[:2], cards[2 : 2 + rng.choice([0, 3, 4, 5])]
+            perm = rng.sample(range(4), 4)
+            assert canonical_key(hole, board) == canonical_key(
+                _permute_suits(hole, perm), _permute_suits(board, perm)
+            )
+
+    def test_order_independent(self):
+        """カードの並び順はキーに影響しない"""
+        assert canonical_key(["A♥", "K♥"], ["2♥", "7♦", "9♣"]) == canonical_key(
+            ["K♠", "A♠"], ["9♦", "2♠", "7♣"]
+        )
+
+    def test_distinguishes_non_isomorphic(self):
+        """スーテッドとオフスートは区別する"""
+        assert canonical_key(["A♥", "K♥"], ["2♥", "7♦", "9♣"]) != canonical_key(
+            ["A♥", "K♦"], ["2♥", "7♦", "9♣"]
+        )
+
+    def test_groups_are_distinct(self):
+        """同じカードでもホールとボードの割り当てが違えば別のキー"""
+        assert canonical_key(["A♥", "K♥"], ["Q♥"]) != canonical_key(
+            ["A♥", "Q♥"], ["K♥"]
+        )
+
+
+class TestLRUCache:
+    """LRUCache のテスト"""
+
+    def test_hit_miss_counters(self):
+        """ヒット/ミスを数える"""
+        cache = LRUCache(2)
+        assert cache.get("a") is None
+        cache.put("a", 1)
+        assert cache.get("a") == 1
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+        assert cache.stats()["hit_rate"] == 0.5
+
+    def test_evicts_least_recently_used(self):
+        """最も長く参照されていないエントリから削除する"""
+        cache = LRUCache(2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+        assert "a" in cache
+        assert "b" not in cache
+        assert len(cache) == 2
+        assert cache.evictions == 1
+
+    def test_get_or_compute(self):
+        """2回目は計算しない"""
+        cache = LRUCache(4)
+        calls = []
+        for _ in range(3):
+            assert cache.get_or_compute("k", lambda: calls.append(1) or 42) == 42
+        assert len(calls) == 1
+
+    def test_clear(self):
+        """clear でエントリと統計をリセット"""
+        cache = LRUCache(1)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.clear()
+        assert cache.stats()["size"] == 0
+        assert cache.stats()["evictions"] == 0
+
+    def test_invalid_size(self):
+        """上限は正の数"""
+        with pytest.raises(ValueError):
+            LRUCache(0)
+
+
+class TestCachedResults:
+    """共有キャッシュ経由の計算テスト"""
+
+    def test_equity_shared_across_suits(self):
+        """スート違いの同じフロップはキャッシュにヒットする"""
+        cache = LRUCache(8)
+        first = cached_equity(["A♥", "K♥"], ["2♥", "7♦", "9♣"], cache=cache)
+        second = cached_equity(["A♠", "K♠"], ["2♠", "7♣", "9♦"], cache=cache)
+        assert second is first
+        assert cache.hits == 1
+        assert cache.misses == 1
+
+    def test_equity_keyed_by_opponents(self):
+        """相手人数が違えば別のエントリ"""
+        cache = LRUCache(8)
+        cached_equity(["A♥", "K♥"], ["2♥", "7♦", "9♣", "T♠"], 1, cache=cache)
+        cached_equity(["A♥", "K♥"], ["2♥", "7♦", "9♣", "T♠"], 2, cache=cache)
+        assert cache.misses == 2
+
+    def test_strength_matches_evaluator(self):
+        """キャッシュ経由でも strength は変わらない"""
+        cache = LRUCache(1024)
+        rng = random.Random(1)
+        for _ in range(200):
+            cards = rng.sample(range(52), 7)
+            assert cached_strength(cards, cache) == HandEvaluator.evaluate_ids(cards)
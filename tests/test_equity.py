@@ -0,0 +1,119 @@
+"""
+Tests for poker.equity module
+"""
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from poker.game_models import Card, Suit
+from poker.equity import (
+    calculate_equity,
+    enumerate_equity,
+    exact_evaluation_count,
+    monte_carlo_equity,
+    to_card_ids,
+)
+
+
+class TestCardConversion:
+    """カード指定の変換テスト"""
+
+    def test_mixed_inputs(self):
+        """Card / ID / 文字列を同じIDに変換できることを確認"""
+        ace = Card(14, Suit.SPADES)
+        assert to_card_ids([ace, ace.id, "A♠", "As"]) == [ace.id] * 4
+
+
+class TestEnumerateEquity:
+    """厳密計算のテスト"""
+
+    def test_river_locked_nuts(self):
+        """リバーでロイヤルフラッシュなら必ず勝つ"""
+        result = enumerate_equity(["A♠", "K♠"], ["Q♠", "J♠", "T♠", "2♥", "3♦"])
+        assert result.exact
+        assert result.win == 1.0
+        assert result.equity == 1.0
+        assert result.samples == 990  # C(45, 2)
+
+    def test_river_board_plays(self):
+        """ボードのストレートフラッシュを全員で分け合う"""
+        result = enumerate_equity(["2♥", "3♦"], ["A♠", "K♠", "Q♠", "J♠", "T♠"])
+        assert result.tie == 1.0
+        assert result.equity == pytest.approx(0.5)
+
+    def test_turn_sample_count(self):
+        """ターンの列挙数が評価回数の見積もりと一致する"""
+        result = enumerate_equity(["A♥", "A♦"], ["K♠", "7♣", "2♦", "9♥"])
+        assert result.samples == exact_evaluation_count(4)
+        assert result.win + result.tie + result.lose == pytest.approx(1.0)
+        assert result.std_error == 0.0
+
+    def test_dead_cards_removed(self):
+        """デッドカードは相手ハンドとランアウトから除外される"""
+        result = enumerate_equity(
+            ["A♥", "A♦"], ["K♠", "7♣", "2♦", "9♥"], dead=["3♣", "4♣"]
+        )
+        assert result.samples == 44 * (43 * 42 // 2)
+
+
+class TestMonteCarloEquity:
+    """モンテカルロ計算のテスト"""
+
+    def test_aces_preflop(self):
+        """AA のヘッズアップ勝率は約85%"""
+        result = monte_carlo_equity(["A♠", "A♥"], seed=1)
+        assert result.equity == pytest.approx(0.85, abs=0.02)
+        assert not result.exact
+
+    def test_stops_at_target_std_error(self):
+        """目標の標準誤差に達したら打ち切る"""
+        result = monte_carlo_equity(
+            ["7♠", "2♥"], target_std_error=0.01, max_samples=200_000, seed=2
+        )
+        assert result.std_error <= 0.01
+        assert result.samples < 200_000
+
+    def test_seed_is_reproducible(self):
+        """同じシードなら同じ結果になる"""
+        a = monte_carlo_equity(["K♠", "Q♠"], ["2♥", "7♦", "J♠"], num_opponents=2, seed=3)
+        b = monte_carlo_equity(["K♠", "Q♠"], ["2♥", "7♦", "J♠"], num_opponents=2, seed=3)
+        assert a.to_dict() == b.to_dict()
+
+    def test_more_opponents_lower_equity(self):
+        """相手が増えるほどエクイティは下がる"""
+        one = monte_carlo_equity(["A♠", "A♥"], num_opponents=1, seed=4)
+        three = monte_carlo_equity(["A♠", "A♥"], num_opponents=3, seed=4)
+        assert three.equity < one.equity
+
+
+class TestCalculateEquity:
+    """calculate_equity のテスト"""
+
+    def test_matches_exact_on_river(self):
+        """リバーでは厳密計算を使う"""
+        hole, board = ["A♠", "K♠"], ["Q♥", "J♦", "2♣", "7♠", "9♥"]
+        result = calculate_equity(hole, board)
+        assert result.exact
+        assert result.to_dict() == enumerate_equity(hole, board).to_dict()
+
+    def test_preflop_uses_sampling(self):
+        """プリフロップはサンプリングで近似する"""
+        result = calculate_equity(["A♠", "K♠"], seed=5)
+        assert not result.exact
+        assert result.equity == pytest.approx(0.67, abs=0.02)
+
+    @pytest.mark.parametrize(
+        "hole, board, opponents",
+        [
+            (["A♠"], [], 1),
+            (["A♠", "A♠"], [], 1),
+            (["A♠", "K♠"], ["2♥", "3♥", "4♥", "5♥", "6♥", "7♥"], 1),
+            (["A♠", "K♠"], [], 0),
+            (["A♠", "K♠"], [], 30),
+        ],
+    )
+    def test_invalid_input(self, hole, board, opponents):
+        """不正な入力は ValueError"""
+        with pytest.raises(ValueError):
+            calculate_equity(hole, board, num_opponents=opponents)
@@ -3,6 +3,7 @@ Tests for poker.evaluator module
 """
 
 import pytest
+import random
 from poker.game_models import Card, Suit
 from poker.evaluator import HandRank, HandResult, HandEvaluator
 
@@ -390,3 +391,103 @@ class TestHandEvaluator:
 
         with pytest.raises(ValueError, match="Must evaluate exactly 5 cards"):
             HandEvaluator._evaluate_five_cards(cards)
+
+
+class TestHandStrength:
+    """整数の強さによる評価のテスト"""
+
+    ALL_CARDS = [Card(rank, suit) for suit in Suit for rank in range(2, 15)]
+
+    def test_strength_matches_hand_rank(self):
+        """強さから役が復元できることを確認"""
+        hole_cards = [Card(14, Suit.SPADES), Card(13, Suit.SPADES)]
+        community_cards = [
+            Card(12, Suit.SPADES),
+            Card(11, Suit.SPADES),
+            Card(10, Suit.SPADES),
+            Card(2, Suit.HEARTS),
+            Card(3, Suit.CLUBS),
+        ]
+
+        strength = HandEvaluator.evaluate_strength(hole_cards, community_cards)
+
+        assert HandEvaluator.hand_rank_of(strength) == HandRank.ROYAL_FLUSH
+
+    def test_wheel_is_lowest_straight(self):
+        """A-5ストレートが6-highストレートより弱いことを確認"""
+        wheel = HandEvaluator.evaluate_strength(
+            [Card(14, Suit.SPADES), Card(2, Suit.HEARTS)],
+            [Card(3, Suit.CLUBS), Card(4, Suit.DIAMONDS), Card(5, Suit.SPADES)],
+        )
+        six_high = HandEvaluator.evaluate_strength(
+            [Card(6, Suit.SPADES), Card(2, Suit.HEARTS)],
+            [Card(3, Suit.CLUBS), Card(4, Suit.DIAMONDS), Card(5, Suit.SPADES)],
+        )
+
+        assert HandEvaluator.hand_rank_of(wheel) == HandRank.STRAIGHT
+        assert wheel < six_high
+
+    def test_strength_equals_hand_result_strength(self):
+        """HandResult.strength と evaluate_strength が一致することを確認"""
+        rng = random.Random(1)
+        for _ in range(200):
+            cards = rng.sample(self.ALL_CARDS, 7)
+            result = HandEvaluator.evaluate_hand(cards[:2], cards[2:])
+            assert result.strength == HandEvaluator.evaluate_strength(
+                cards[:2], cards[2:]
+            )
+
+    @pytest.mark.parametrize("card_count", [5, 6, 7])
+    def test_matches_reference_evaluator(self, card_count):
+        """ルックアップテーブル版が総当たりの参照実装と一致することを確認"""
+        rng = random.Random(card_count)
+        for _ in range(2000):
+            cards = rng.sample(self.ALL_CARDS, card_count)
+            fast = HandEvaluator.evaluate_hand(cards[:2], cards[2:])
+            reference = HandEvaluator._evaluate_hand_reference(cards[:2], cards[2:])
+
+            assert fast.rank == reference.rank
+            assert fast.kickers == reference.kickers
+            assert fast.cards == reference.cards
+            assert fast.description == reference.description
+
+    def test_ordering_matches_compare_hands(self):
+        """強さの大小関係が compare_hands と一致することを確認"""
+        rng = random.Random(42)
+        for _ in range(1000):
+            board = rng.sample(self.ALL_CARDS, 9)
+            hand1 = HandEvaluator._evaluate_hand_reference(board[:2], board[4:])
+            hand2 = HandEvaluator._evaluate_hand_reference(board[2:4], board[4:])
+            strength1 = HandEvaluator.evaluate_strength(board[:2], board[4:])
+            strength2 = HandEvaluator.evaluate_strength(board[2:4], board[4:])
+
+            expected = HandEvaluator.compare_hands(hand1, hand2)
+            actual = (strength1 > strength2) - (strength1 < strength2)
+            assert actual == expected
+
+
+class TestEvaluateBatch:
+    """バッチ評価のテスト"""
+
+    def test_matches_scalar_evaluator(self):
+        """バッチ評価がスカラー評価と一致することを確認"""
+        np = pytest.importorskip("numpy")
+        rng = np.random.default_rng(0)
+        cards = np.argsort(rng.random((5000, 52)), axis=1)[:, :7]
+
+        for board_size in (3, 4, 5):
+            batch = HandEvaluator.evaluate_batch(
+                cards[:, :2], cards[:, 2 : 2 + board_size]
+            )
+            scalar = [
+                HandEvaluator.evaluate_ids(row[: 2 + board_size])
+                for row in cards.tolist()
+            ]
+            assert batch.tolist() == scalar
+
+    def test_invalid_card_count(self):
+        """5枚未満のカードでのエラーテスト"""
+        np = pytest.importorskip("numpy")
+
+        with pytest.raises(ValueError, match="5 to 7 cards"):
+            HandEvaluator.evaluate_batch(np.array([[0, 1]]), np.array([[2, 3]]))
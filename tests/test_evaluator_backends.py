@@ -0,0 +1,140 @@
+"""
+Tests for poker.evaluator_backends module
+"""
+
+import os
+import random
+import subprocess
+import sys
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from poker import evaluator_backends
+from poker.evaluator import HandEvaluator
+from poker.evaluator_backends import LookupBackend, get_backend
+from poker.game_models import Card
+
+
+def cards(*names):
+    return [Card.from_str(name) for name in names]
+
+
+@pytest.fixture
+def restore_backend():
+    backend = HandEvaluator.backend
+    yield
+    HandEvaluator.backend = backend
+
+
+class TestBackends:
+    """各バックエンドの結果が一致するかのテスト"""
+
+    @pytest.mark.parametrize("name", ["reference", "treys"])
+    def test_matches_lookup(self, name):
+        """ランダムな5〜7枚で lookup と同じ strength を返す"""
+        if name == "treys":
+            pytest.importorskip("treys")
+        rng = random.Random(0)
+        lookup, backend = get_backend("lookup"), get_backend(name)
+        for _ in range(2000):
+            row = rng.sample(range(52), rng.choice((5, 6, 7)))
+            assert backend.evaluate_ids(row) == lookup.evaluate_ids(row)
+
+    def test_steel_wheel_is_straight_flush(self):
+        """A-5 のストレートフラッシュはロイヤルフラッシュではない"""
+        row = [card.id for card in cards("A♠", "2♠", "3♠", "4♠", "5♠")]
+        assert get_backend("reference").evaluate_ids(row) == get_backend("lookup").evaluate_ids(row)
+        assert HandEvaluator.hand_rank_of(get_backend("reference").evaluate_ids(row)).name == "STRAIGHT_FLUSH"
+
+    def test_treys_mapping_is_monotonic(self):
+        """treys の評価値 1〜7462 は strength の降順に対応する"""
+        pytest.importorskip("treys")
+        backend = get_backend("treys")
+        backend.evaluate_ids(list(range(5)))
+        strengths = backend._strengths[1:]
+        assert len(set(strengths)) == 7462
+        assert strengths == sorted(strengths, reverse=True)
+
+    def test_pokerkit_ordering(self):
+        """pokerkit は順位だけを返す（大小関係は lookup と同じ）"""
+        pytest.importorskip("pokerkit")
+        backend = get_backend("pokerkit")
+        royal = [card.id for card in cards("A♠", "K♠", "Q♠", "J♠", "10♠", "2♦", "3♣")]
+        quads = [card.id for card in cards("A♠", "A♥", "A♦", "A♣", "K♠", "2♦", "3♣")]
+        assert backend.evaluate_ids(royal) > backend.evaluate_ids(quads)
+        assert not backend.strength_scale
+
+    def test_unknown_backend(self):
+        with pytest.raises(ValueError):
+            get_backend("nope")
+
+
+class TestSetBackend:
+    """HandEvaluator のバックエンド切り替えのテスト"""
+
+    def test_switch_backend(self, restore_backend):
+        """切り替え後も evaluate_strength / evaluate_batch の結果は同じ"""
+        hole, board = cards("A♠", "K♠"), cards("Q♠", "J♠", "10♠", "2♦", "3♣")
+        expected = HandEvaluator.evaluate_strength(hole, board)
+        HandEvaluator.set_backend("reference")
+        assert HandEvaluator.backend.name == "reference"
+        assert HandEvaluator.evaluate_strength(hole, board) == expected
+        batch = HandEvaluator.evaluate_batch([[c.id for c in hole]], [[c.id for c in board]])
+        assert batch.tolist() == [expected]
+
+    def test_order_only_backend_is_rejected(self, restore_backend):
+        """strength の尺度でないバックエンドは HandEvaluator に設定できない"""
+        pytest.importorskip("pokerkit")
+        with pytest.raises(ValueError):
+            HandEvaluator.set_backend("pokerkit")
+        assert HandEvaluator.backend.strength_scale
+
+    def test_env_var(self):
+        """POKER_EVALUATOR_BACKEND で起動時のバックエンドを指定できる"""
+        env = dict(os.environ, POKER_EVALUATOR_BACKEND="reference")
+        output = subprocess.run(
+            [sys.executable, "-c", "from poker.evaluator import HandEvaluator; print(HandEvaluator.backend.name)"],
+            env=env,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        assert output.stdout.strip() == "reference"
+
+
+class _OffByOneBackend(LookupBackend):
+    """ワンペア同士のキッカーを無視する壊れたバックエンド（差分検証のテスト用）"""
+
+    name = "broken"
+
+    def evaluate_ids(self, card_ids):
+        strength = super().evaluate_ids(card_ids)
+        if strength >> 20 == 2:
+            return strength & ~0xFFF
+        return strength
+
+
+class TestDifferentialHarness:
+    """benchmarks.diff_evaluators のテスト"""
+
+    def test_backends_agree(self):
+        pytest.importorskip("treys")
+        from benchmarks.diff_evaluators import run_differential
+
+        summary = run_differential(5000, ["lookup", "treys"], processes=1, chunk_size=2500)
+        assert summary["treys"]["hands"] == 5000
+        assert summary["treys"]["ordering_disagreements"] == 0
+        assert summary["treys"]["value_mismatches"] == 0
+        assert summary["lookup"]["hands_per_sec"] > 0
+
+    def test_reports_disagreements(self, monkeypatch):
+        from benchmarks.diff_evaluators import run_differential
+
+        monkeypatch.setitem(evaluator_backends.BACKENDS, "broken", _OffByOneBackend)
+        monkeypatch.setattr(evaluator_backends, "_instances", {})
+        summary = run_differential(5000, ["lookup", "broken"], processes=1)
+        assert summary["broken"]["ordering_disagreements"] > 0
+        assert summary["broken"]["value_mismatches"] > 0
+        assert summary["broken"]["examples"]
@@ -383,3 +383,55 @@ class TestPokerGame:
         # 全プレイヤーのチップが初期値
         for player in game.players:
             assert player.chips == game.initial_chips
+
+
+class TestHeadlessGame:
+    """ヘッドレスモード（ターボ）のテスト"""
+
+    def test_headless_has_no_db(self):
+        """ヘッドレスモードではDBを作らない"""
+        game = PokerGame(headless=True)
+        assert game.db is None
+        assert game.headless is True
+
+    def test_play_hand_conserves_chips(self):
+        """play_hand を繰り返してもチップの合計は変わらない"""
+        game = PokerGame(headless=True)
+        game.setup_cpu_only_game()
+        total = sum(p.chips for p in game.players)
+        for _ in range(200):
+            if game.is_game_over():
+                break
+            game.play_hand()
+            assert game.current_phase in (GamePhase.SHOWDOWN, GamePhase.FINISHED)
+            assert game.current_hand_id is None
+            assert sum(p.chips for p in game.players) == total
+
+    def test_headless_does_not_log(self, caplog):
+        """ヘッドレスモードではゲームログを出力しない"""
+        game = PokerGame(headless=True)
+        game.setup_cpu_only_game()
+        with caplog.at_level("DEBUG"):
+            game.play_hand()
+        assert not [r for r in caplog.records if r.name.startswith("poker_game")]
+
+    def test_seeded_game_deals_reproducibly(self):
+        """同じシードのゲームは同じハンド番号で同じカードを配る"""
+
+        def deal(seed):
+            game = PokerGame(headless=True, seed=seed)
+            game.setup_cpu_only_game()
+            game.start_new_hand()
+            return [list(p.hole_cards) for p in game.players]
+
+        assert deal(11) == deal(11)
+        assert deal(11) != deal(12)
+
+    def test_turbo_mode(self):
+        """ターボモードは指定ハンド数を実行して hands/sec を返す"""
+        from poker.cli_ui import PokerUI
+
+        stats = PokerUI().run_turbo_game(max_hands=300)
+        assert stats["hands"] == 300
+        assert stats["hands_per_sec"] > 0
+        assert sum(stats["net_chips"].values()) == 0
@@ -0,0 +1,89 @@
+"""
+Tests for poker.hand_tracker module
+"""
+
+import pytest
+import random
+
+pytest.importorskip("numpy")
+
+from poker.game_models import Card, CARDS
+from poker.evaluator import HandEvaluator, HandRank
+from poker.hand_tracker import HandTracker
+
+
+def cards(*names):
+    return [Card.from_str(name) for name in names]
+
+
+class TestHandTracker:
+    """HandTracker のテスト"""
+
+    def test_matches_evaluator_street_by_street(self):
+        """各ストリートで evaluate_strength と一致する"""
+        rng = random.Random(0)
+        for _ in range(300):
+            deal = [CARDS[i] for i in rng.sample(range(52), 7)]
+            tracker = HandTracker(deal[:2])
+            for size in (3, 4, 5):
+                tracker.add_cards(deal[2 + len(tracker.board_ids) : 2 + size])
+                assert tracker.strength == HandEvaluator.evaluate_strength(
+                    deal[:2], deal[2 : 2 + size]
+                )
+
+    def test_hand_result_matches_evaluate_hand(self):
+        """HandResult も evaluate_hand と同じ"""
+        hole, board = cards("A♠", "K♠"), cards("A♥", "K♦", "2♣", "K♣", "7♥")
+        tracker = HandTracker(hole, board)
+        expected = HandEvaluator.evaluate_hand(hole, board)
+        result = tracker.hand_result()
+        assert tracker.hand_rank == HandRank.FULL_HOUSE
+        assert result.description == expected.description
+        assert result.cards == expected.cards
+
+    def test_duplicate_card(self):
+        """同じカードは追加できない"""
+        tracker = HandTracker(cards("A♠", "K♠"))
+        with pytest.raises(ValueError):
+            tracker.add(Card.from_str("A♠"))
+
+    def test_flush_draw_outs(self):
+        """フラッシュドローのアウツは残りの同じスート9枚（＋ペア/ストレート）"""
+        tracker = HandTracker(cards("A♠", "5♠"), cards("K♠", "9♠", "2♦"))
+        assert tracker.flush_draw
+        outs = tracker.outs()
+        spades = [c for c in outs if CARDS[c].suit == Card.from_str("2♠").suit]
+        assert len(spades) == 9
+        # ハイカードなので A/5/K/9/2 のペアになるカードもカテゴリが上がる
+        assert len(outs) == 9 + 3 + 3 + 3 + 3 + 2
+
+    def test_straight_draw(self):
+        """オープンエンドは2ランク、ガットショットは1ランク"""
+        open_ended = HandTracker(cards("8♠", "7♥"), cards("6♦", "5♣", "K♠"))
+        assert open_ended.straight_draw_ranks() == [4, 9]
+        gutshot = HandTracker(cards("8♠", "7♥"), cards("5♦", "4♣", "K♠"))
+        assert gutshot.straight_draw_ranks() == [6]
+
+    def test_nuts(self):
+        """ナッツ判定はボード更新時に再計算される"""
+        tracker = HandTracker(cards("A♠", "K♠"), cards("Q♠", "J♠", "2♦"))
+        assert not tracker.is_nuts()
+        tracker.add(Card.from_str("T♠"))
+        assert tracker.hand_rank == HandRank.ROYAL_FLUSH
+        assert tracker.is_nuts()
+
+    def test_nut_strength_requires_flop(self):
+        """ボードが3枚未満なら ValueError"""
+        with pytest.raises(ValueError):
+            HandTracker(cards("A♠", "K♠")).nut_strength()
+
+    def test_sync_is_incremental(self):
+        """先頭が一致していれば同じオブジェクトに差分だけ追加する"""
+        hole, board = cards("A♠", "K♠"), cards("Q♥", "J♦", "2♣", "7♠")
+        tracker = HandTracker(hole, board[:3])
+        assert tracker.sync(hole, board) is tracker
+        assert len(tracker.board_ids) == 4
+
+        other = tracker.sync(cards("2♥", "3♥"), board)
+        assert other is not tracker
+        assert other.strength == HandEvaluator.evaluate_strength(cards("2♥", "3♥"), board)
@@ -0,0 +1,114 @@
+"""
+Tests for LocalAgentPlayer (in-process agent execution)
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from benchmarks.stub_agent import CheckAgent, StubAgentServer
+from poker.agent_transport import AgentTransport
+from poker.async_driver import play_hand_async
+from poker.game import PokerGame
+from poker.player_models import LLMApiPlayer, LocalAgentPlayer, RandomPlayer
+from poker.runner import parse_seats
+
+
+class SlowCheckAgent(CheckAgent):
+    """応答までに delay 秒かかる CheckAgent"""
+
+    delay: float = 1.0
+
+    async def _run_async_impl(self, ctx):
+        await asyncio.sleep(self.delay)
+        async for event in super()._run_async_impl(ctx):
+            yield event
+
+
+def make_game(player, seed=3):
+    game = PokerGame(headless=True, seed=seed)
+    game.add_player(player)
+    game.add_player(RandomPlayer(1, "CPU1", 1000))
+    return game
+
+
+def first_state(player):
+    game = make_game(player)
+    game.start_new_hand()
+    return game.get_llm_game_state(0)
+
+
+class TestLocalAgentPlayer:
+    """LocalAgentPlayer のテスト"""
+
+    def test_same_decision_as_http(self):
+        agent = CheckAgent(name="check_agent")
+        local = LocalAgentPlayer(0, "Agent0", "check", "u0", agent=agent)
+        with StubAgentServer(agent=agent) as server:
+            transport = AgentTransport(server.url)
+            remote = LLMApiPlayer(0, "Agent0", "check", "u0", url=server.url, transport=transport)
+            remote_decision = remote.make_decision(first_state(remote))
+            transport.close()
+        local_decision = local.make_decision(first_state(local))
+        assert local_decision == remote_decision
+        assert local_decision["action"] in ("check", "fold")
+        assert local.get_last_reasoning() == remote.get_last_reasoning()
+
+    def test_plays_sync_and_async_hands(self):
+        player = LocalAgentPlayer(0, "Agent0", "check", "u0", agent=CheckAgent(name="check_agent"))
+        game = make_game(player)
+        for _ in range(3):
+            game.play_hand()
+        asyncio.run(play_hand_async(game))
+        # 1ゲームで1つのセッションを使い回す
+        assert player._runtime.session_count == 1
+
+    def test_timeout_folds(self, caplog):
+        player = LocalAgentPlayer(
+            0, "Agent0", "slow", "u0", agent=SlowCheckAgent(name="slow_agent")
+        )
+        player.DECISION_TIMEOUT = 0.1
+        state = first_state(player)
+        start = time.perf_counter()
+        with caplog.at_level("WARNING", logger="poker_game"):
+            assert player.make_decision(state)["action"] == "fold"
+            assert asyncio.run(player.decide(state))["action"] == "fold"
+        assert time.perf_counter() - start < 0.9
+        # ログは HTTP 経由ではなくプロセス内の経路として出る
+        assert "In-process agent response timeout" in caplog.text
+        assert "LLM API" not in caplog.text
+
+    def test_missing_agent_falls_back_to_random(self):
+        player = LocalAgentPlayer(0, "Agent0", "no_such_agent", "u0")
+        assert player._runtime is None
+        decision = player.make_decision(first_state(player))
+        assert decision["action"] in ("fold", "check", "call", "raise", "all_in")
+
+    def test_hand_scope_deletes_sessions(self):
+        player = LocalAgentPlayer(
+            0, "Agent0", "check", "u0", agent=CheckAgent(name="check_agent"), session_scope="hand"
+        )
+        game = make_game(player)
+        for _ in range(3):
+            game.play_hand()
+        player.reset_for_new_hand()
+        # 削除はバックグラウンドのループで行われる
+        player._runtime.call(asyncio.sleep(0))
+        assert player._runtime.session_count == 0
+        with pytest.raises(ValueError):
+            LocalAgentPlayer(0, "Agent0", "check", "u0", agent=CheckAgent(name="a"), session_scope="decision")
+
+    def test_close_deletes_the_game_session(self):
+        player = LocalAgentPlayer(0, "Agent0", "check", "u0", agent=CheckAgent(name="check_agent"))
+        game = make_game(player)
+        game.play_hand()
+        assert player._runtime.session_count == 1
+        game.close()
+        player._runtime.call(asyncio.sleep(0))
+        assert player._runtime.session_count == 0
+
+    def test_parse_seats_in_process(self):
+        seats = parse_seats("team1_agent,team2_agent", in_process=True)
+        assert [seat["type"] for seat in seats] == ["llm_local", "llm_local"]
+        assert [seat["type"] for seat in parse_seats("team1_agent:2")] == ["llm_api", "llm_api"]
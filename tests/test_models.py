@@ -4,7 +4,7 @@ Tests for poker.models module
 
 import pytest
 import random
-from poker.game_models import Suit, Card, Deck
+from poker.game_models import Suit, Card, Deck, hand_seed
 from poker.player_models import (
     PlayerStatus,
     Player,
@@ -94,6 +94,36 @@ class TestCard:
         card = Card(14, Suit.SPADES)
         assert repr(card) == "Card(A, spades)"
 
+    def test_cards_are_singletons(self):
+        """同じランク・スートのカードは同一インスタンスであることを確認"""
+        assert Card(14, Suit.SPADES) is Card(14, Suit.SPADES)
+        assert Card.from_id(Card(10, Suit.HEARTS).id) is Card(10, Suit.HEARTS)
+
+    def test_card_ids_are_unique(self):
+        """52枚のカードIDが0..51で重複しないことを確認"""
+        ids = {Card(rank, suit).id for suit in Suit for rank in range(2, 15)}
+        assert ids == set(range(52))
+
+    def test_from_str(self):
+        """文字列からのカード取得テスト"""
+        assert Card.from_str("A♠") is Card(14, Suit.SPADES)
+        assert Card.from_str("10♥") is Card(10, Suit.HEARTS)
+        assert Card.from_str("Td") is Card(10, Suit.DIAMONDS)
+        assert Card.from_str("KC") is Card(13, Suit.CLUBS)
+        assert str(Card.from_str("Q♦")) == "Q♦"
+
+    def test_from_str_invalid(self):
+        """不正な文字列でのエラーテスト"""
+        with pytest.raises(ValueError, match="Invalid card string"):
+            Card.from_str("1♠")
+
+    def test_pickle_keeps_singleton(self):
+        """pickle後も同一インスタンスであることを確認"""
+        import pickle
+
+        card = Card(7, Suit.CLUBS)
+        assert pickle.loads(pickle.dumps(card)) is card
+
 
 class TestDeck:
     """Deckクラスのテスト"""
@@ -173,6 +203,52 @@ class TestDeck:
 
         assert different, "Shuffle should change card order"
 
+    def test_seeded_deck_is_reproducible(self):
+        """同じシードのデッキは同じ順に配る"""
+        deck1 = Deck(seed=42)
+        deck2 = Deck(seed=42)
+        dealt1 = [deck1.deal_card() for _ in range(9)]
+        dealt2 = [deck2.deal_card() for _ in range(9)]
+        assert dealt1 == dealt2
+        assert len(set(dealt1)) == 9
+
+    def test_seeded_deck_uses_own_rng(self):
+        """グローバルな random の状態に影響されない"""
+        deck1 = Deck(seed=7)
+        random.seed(1)
+        card1 = deck1.deal_card()
+        deck2 = Deck(seed=7)
+        random.seed(2)
+        assert deck2.deal_card() is card1
+
+    def test_reset_with_hand_seed(self):
+        """ハンドごとのシードでリセットすると、そのハンドの配札を再現できる"""
+        deck = Deck(seed=0)
+        deck.reset(hand_seed(123, 1))
+        first = [deck.deal_card() for _ in range(5)]
+        deck.reset(hand_seed(123, 2))
+        second = [deck.deal_card() for _ in range(5)]
+        assert first != second
+
+        replay = Deck()
+        replay.reset(hand_seed(123, 1))
+        assert [replay.deal_card() for _ in range(5)] == first
+
+    def test_hand_seed_is_deterministic(self):
+        """hand_seed は実行シードとハンド番号だけで決まる"""
+        assert hand_seed(1, 5) == hand_seed(1, 5)
+        assert hand_seed(1, 5) != hand_seed(1, 6)
+        assert hand_seed(1, 5) != hand_seed(2, 5)
+
+    def test_deal_is_uniform(self):
+        """1枚目に配られるカードは52枚から一様に選ばれる（統計的テスト）"""
+        deck = Deck(seed=2024)
+        counts = [0] * 52
+        for _ in range(52 * 200):
+            deck.reset()
+            counts[deck.deal_card().id] += 1
+        assert min(counts) > 120 and max(counts) < 280
+
 
 class TestPlayerStatus:
     """PlayerStatusクラスのテスト"""
@@ -0,0 +1,182 @@
+"""
+Tests for poker.pot_ledger module
+"""
+
+import random
+
+from poker.game import PokerGame
+from poker.player_models import PlayerStatus
+from poker.pot_ledger import PotLedger
+
+
+def reference_layers(totals):
+    """累積ベット額から階層を組み立てる（以前の conduct_showdown と同じ手順）"""
+    contrib = {seat: amount for seat, amount in enumerate(totals) if amount > 0}
+    layers = []
+    prev = 0
+    for level in sorted(set(contrib.values())):
+        contributors = [seat for seat, amount in contrib.items() if amount >= level]
+        layers.append(((level - prev) * len(contributors), contributors))
+        prev = level
+    return layers
+
+
+def reference_pots(totals, all_in, live):
+    """
+    階層をポットにまとめる（オールインした座席の累積額でだけ新しいポットを始める）
+
+    受給資格者のいない階層はそれぞれ別のポットのまま。
+    """
+    levels = {totals[seat] for seat in all_in}
+    pots = []
+    prev = 0
+    for amount, contributors in reference_layers(totals):
+        eligible = [seat for seat in contributors if seat in live]
+        if pots and eligible and pots[-1][2] and prev not in levels:
+            last = pots[-1]
+            pots[-1] = (last[0] + amount, sorted(set(last[1]) | set(contributors)), last[2])
+        else:
+            pots.append((amount, contributors, eligible))
+        prev += amount // len(contributors)
+    return pots
+
+
+def pot_tuples(pots):
+    return [(pot.amount, pot.contributor_seats, pot.eligible_seats) for pot in pots]
+
+
+class TestPotLedger:
+    """PotLedger のテスト"""
+
+    def test_main_and_side_pots(self):
+        ledger = PotLedger(4)
+        ledger.add(0, 50)
+        for seat in (1, 2, 3):
+            ledger.add(seat, 200)
+        pots = ledger.pots(0b1111, 0b0001)  # 誰もフォールドしていない。座席0はオールイン
+        assert [(pot.amount, pot.eligible_seats) for pot in pots] == [
+            (200, [0, 1, 2, 3]),
+            (450, [1, 2, 3]),
+        ]
+        ledger.add(3, 100)
+        pots = ledger.pots(0b0111, 0b0001)  # 座席3はフォールド
+        assert pot_tuples(pots) == [
+            (200, [0, 1, 2, 3], [0, 1, 2]),
+            (450, [1, 2, 3], [1, 2]),
+            (100, [3], []),
+        ]
+        assert ledger.total == sum(pot.amount for pot in pots)
+
+    def test_matches_reference_for_random_bets(self):
+        rng = random.Random(0)
+        for _ in range(300):
+            seats = rng.randint(2, 9)
+            ledger = PotLedger(seats)
+            totals = [0] * seats
+            for _ in range(rng.randint(1, 25)):
+                seat = rng.randrange(seats)
+                amount = rng.choice((10, 20, 40, 50, 100, rng.randint(1, 300)))
+                ledger.add(seat, amount)
+                totals[seat] += amount
+                layers = [
+                    (amount, [s for s in range(seats) if mask >> s & 1])
+                    for amount, mask in ledger.layers()
+                ]
+                assert layers == reference_layers(totals)
+            live = {seat for seat in range(seats) if rng.random() < 0.7}
+            all_in = {seat for seat in live if rng.random() < 0.3}
+            pots = ledger.pots(
+                sum(1 << seat for seat in live), sum(1 << seat for seat in all_in)
+            )
+            assert pot_tuples(pots) == reference_pots(totals, all_in, live)
+            assert sum(pot.amount for pot in pots) == ledger.total
+
+    def test_uncalled_bets_stay_in_one_pot(self):
+        ledger = PotLedger(3)
+        ledger.add(1, 10)
+        ledger.add(2, 20)
+        assert pot_tuples(ledger.pots(0b111, 0)) == [(30, [1, 2], [1, 2])]
+        ledger.add(0, 60)
+        assert pot_tuples(ledger.pots(0b111, 0)) == [(90, [0, 1, 2], [0, 1, 2])]
+        # オールインの額より上だけが別のポットになる
+        assert pot_tuples(ledger.pots(0b111, 0b100)) == [
+            (50, [0, 1, 2], [0, 1, 2]),
+            (40, [0], [0]),
+        ]
+
+
+def live_and_all_in(game):
+    live = {p.id for p in game.players if p.status in (PlayerStatus.ACTIVE, PlayerStatus.ALL_IN)}
+    all_in = {p.id for p in game.players if p.status == PlayerStatus.ALL_IN}
+    return all_in, live
+
+
+class TestGamePotLedger:
+    """PokerGame との連携のテスト"""
+
+    def test_one_pot_without_all_in(self):
+        game = PokerGame(headless=True, seed=5)
+        game.setup_configurable_game(["random"] * 4)
+        game.start_new_hand()
+        # ブラインドだけ（受給資格者はまだブラインドを出した2人）
+        pots = game.side_pots()
+        assert len(pots) == 1
+        assert pots[0].amount == game.pot
+        assert len(pots[0].eligible_seats) == 2
+        game.process_player_action(game.current_player_index, "raise", 60)
+        game.process_player_action(game.current_player_index, "call")
+        game.process_player_action(game.current_player_index, "fold")
+        pots = game.side_pots()
+        assert len(pots) == 1
+        assert pots[0].amount == game.pot
+        assert len(pots[0].eligible_seats) == 3
+        assert game.get_llm_game_state(game.current_player_index).pots == [pots[0].to_dict()]
+
+    def test_side_pot_is_live_during_betting(self):
+        game = PokerGame(headless=True, seed=5)
+        game.setup_configurable_game(["random"] * 3)
+        game.players[0].chips = 100
+        game.start_new_hand()
+        while game.current_player_index != 0:
+            game.process_player_action(game.current_player_index, "call")
+        game.process_player_action(0, "all_in")
+        first = game.current_player_index
+        game.process_player_action(first, "raise", 200)
+        pots = game.side_pots()
+        totals = [p.total_bet_this_hand for p in game.players]
+        assert pot_tuples(pots) == reference_pots(totals, *live_and_all_in(game))
+        # オールインした座席0の額までがメインポット、その上のレイズがサイドポット
+        assert len(pots) == 2
+        assert sum(pot.amount for pot in pots) == game.pot
+        assert 0 in pots[0].eligible_seats
+        assert 0 not in pots[1].contributor_seats
+        state = game.get_llm_game_state(first)
+        assert state.pots == [pot.to_dict() for pot in pots]
+
+    def test_showdown_matches_side_pots(self):
+        random.seed(3)
+        game = PokerGame(headless=True, seed=3)
+        game.setup_configurable_game(["random"] * 5)
+        for _ in range(60):
+            if game.is_game_over():
+                break
+            game.start_new_hand()
+            while game.current_phase.value not in ("showdown", "finished"):
+                if game.betting_round_complete:
+                    game.advance_to_next_phase()
+                    continue
+                player = game.players[game.current_player_index]
+                if player.status != PlayerStatus.ACTIVE:
+                    game._advance_to_next_player()
+                    continue
+                action = random.choice(["call", "all_in", "fold", "check"])
+                if not game.process_player_action(player.id, action):
+                    game.process_player_action(player.id, "fold")
+            totals = [p.total_bet_this_hand for p in game.players]
+            pots = game.side_pots()
+            assert pot_tuples(pots) == reference_pots(totals, *live_and_all_in(game))
+            assert sum(pot.amount for pot in pots) == game.pot
+            # ショーダウンはまとめる前の階層ごとに分配する
+            layers = game.pot_ledger.layer_pots(0)
+            assert [(pot.amount, pot.contributor_seats) for pot in layers] == reference_layers(totals)
+            game.conduct_showdown()
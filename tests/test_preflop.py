@@ -0,0 +1,122 @@
+"""
+Tests for poker.preflop module
+"""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from poker.preflop import (
+    HAND_CLASSES,
+    NUM_CLASSES,
+    PreflopTable,
+    class_combos,
+    hand_class,
+    hand_class_index,
+    preflop_equity,
+    preflop_matchup,
+    write_preflop_table,
+)
+
+
+class TestHandClasses:
+    """ハンドクラスの変換テスト"""
+
+    def test_class_count(self):
+        """169クラスがすべて異なる名前を持つ"""
+        assert len(HAND_CLASSES) == NUM_CLASSES
+        assert len(set(HAND_CLASSES)) == NUM_CLASSES
+
+    @pytest.mark.parametrize(
+        "cards, expected",
+        [
+            (["A♠", "A♥"], "AA"),
+            (["K♠", "A♠"], "AKs"),
+            (["A♦", "K♣"], "AKo"),
+            (["7♥", "2♥"], "72s"),
+            (["10♥", "9♣"], "T9o"),
+        ],
+    )
+    def test_hand_class(self, cards, expected):
+        """ホールカードからクラス名への変換"""
+        assert hand_class(cards) == expected
+
+    def test_combos_cover_all_hands(self):
+        """全クラスの組み合わせで1326通りを重複なく網羅する"""
+        combos = [frozenset(c) for i in range(NUM_CLASSES) for c in class_combos(i)]
+        assert len(combos) == 1326
+        assert len(set(combos)) == 1326
+        assert len(class_combos("QQ")) == 6
+        assert len(class_combos("QJs")) == 4
+        assert len(class_combos("QJo")) == 12
+
+    def test_combos_roundtrip(self):
+        """各組み合わせが元のクラスに戻る"""
+        for index in range(NUM_CLASSES):
+            for combo in class_combos(index):
+                assert hand_class_index(list(combo)) == index
+
+    @pytest.mark.parametrize("hand", ["AKx", "KAs", 169, ["A♠"], ["A♠", "A♠"]])
+    def test_invalid_hand(self, hand):
+        """不正な指定は ValueError"""
+        with pytest.raises(ValueError):
+            hand_class_index(hand)
+
+
+class TestPreflopTableFile:
+    """バイナリファイルの読み書きテスト"""
+
+    def test_roundtrip(self, tmp_path):
+        """書き出した表をメモリマップで読み戻せる"""
+        multiway = np.linspace(0.0, 1.0, NUM_CLASSES * 3).reshape(NUM_CLASSES, 3)
+        matchups = np.full((NUM_CLASSES, NUM_CLASSES), 0.25)
+        path = tmp_path / "table.bin"
+        write_preflop_table(path, multiway, matchups, 10, 20)
+
+        table = PreflopTable(path)
+        assert table.max_opponents == 3
+        assert table.multiway_samples == 10
+        assert table.matchup_samples == 20
+        assert table.equity(0, 1) == 0.0
+        assert table.equity(NUM_CLASSES - 1, 3) == 1.0
+        assert table.matchup("AA", "KK") == pytest.approx(0.25, abs=1e-4)
+        assert path.stat().st_size == 20 + 2 * (NUM_CLASSES * 3 + NUM_CLASSES**2)
+
+    def test_opponent_count_out_of_range(self, tmp_path):
+        """表にない人数は ValueError"""
+        path = tmp_path / "table.bin"
+        write_preflop_table(
+            path, np.zeros((NUM_CLASSES, 2)), np.zeros((NUM_CLASSES, NUM_CLASSES))
+        )
+        with pytest.raises(ValueError):
+            PreflopTable(path).equity("AA", 3)
+
+    def test_invalid_file(self, tmp_path):
+        """ヘッダが不正なファイルは読み込まない"""
+        path = tmp_path / "table.bin"
+        path.write_bytes(b"not a table")
+        with pytest.raises(ValueError):
+            PreflopTable(path)
+
+
+class TestBundledTable:
+    """同梱のプリフロップ表の妥当性"""
+
+    def test_known_equities(self):
+        """よく知られたエクイティに近い値を持つ"""
+        assert preflop_equity("AA", 1) == pytest.approx(0.852, abs=0.01)
+        assert preflop_equity("72o", 1) == pytest.approx(0.346, abs=0.01)
+        assert preflop_equity(["A♠", "K♠"], 1) == pytest.approx(0.670, abs=0.01)
+        assert preflop_matchup("AA", "KK") == pytest.approx(0.82, abs=0.01)
+
+    def test_equity_decreases_with_opponents(self):
+        """相手が増えるほどエクイティは下がる"""
+        values = [preflop_equity("AA", n) for n in range(1, 9)]
+        assert values == sorted(values, reverse=True)
+
+    def test_matchups_are_complementary(self):
+        """対戦表は table[i, j] + table[j, i] == 1"""
+        assert preflop_matchup("AKo", "QQ") + preflop_matchup("QQ", "AKo") == (
+            pytest.approx(1.0, abs=1e-4)
+        )
+        assert preflop_matchup("JTs", "JTs") == pytest.approx(0.5, abs=1e-4)
@@ -0,0 +1,79 @@
+"""
+Tests for poker.range_equity module
+"""
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from poker.range_equity import range_equity
+from poker.ranges import Range, parse_range
+
+
+class TestRangeEquity:
+    """レンジに対するエクイティのテスト"""
+
+    def test_single_combo_on_turn(self):
+        """1組み合わせのレンジはリバー44枚の全列挙になる"""
+        board = ["2♥", "7♦", "K♣", "9♠"]
+        result = range_equity(["A♠", "K♠"], "QhQd", board=board)
+        assert result.exact
+        assert result.samples == 44
+        # 相手が勝つのは残りのQ2枚だけ
+        assert result.equity == pytest.approx(42 / 44)
+
+    def test_preflop_matchup(self):
+        """AA vs KK は約82%"""
+        result = range_equity(["A♠", "A♥"], "KK", seed=1, target_std_error=0.003, time_budget=None)
+        assert not result.exact
+        assert result.equity == pytest.approx(0.82, abs=0.015)
+
+    def test_card_removal(self):
+        """自分のカードと重なる組み合わせは除かれる"""
+        # A♠A♥ を持っていれば相手の AA は A♦A♣ の1通りだけ
+        result = range_equity(["A♠", "A♥"], "AA", board=["2♣", "7♦", "9♥", "J♠", "4♦"])
+        assert result.exact
+        assert result.samples == 1
+        assert result.tie == pytest.approx(1.0)
+
+    def test_weights(self):
+        """重み付きの組み合わせは重みに比例して数えられる"""
+        board = ["2♣", "7♦", "9♥", "J♠", "4♦"]
+        # QQ（負け）と 33（勝ち）を 1:0.5 の重みで持つ相手
+        result = range_equity(["K♠", "K♥"], "AA, 33:0.5", board=board)
+        assert result.exact
+        assert result.equity == pytest.approx(0.5 * 6 / (6 + 0.5 * 6))
+
+    def test_empty_after_card_removal(self):
+        """カードリムーバルでレンジが空になれば ValueError"""
+        with pytest.raises(ValueError):
+            range_equity(["A♠", "K♠"], "AsKs")
+        with pytest.raises(ValueError):
+            range_equity(["A♠", "K♠"], Range())
+
+    def test_multiple_villains(self):
+        """相手が複数なら相手ごとのレンジから同時に配る"""
+        heads_up = range_equity(["A♠", "A♥"], Range.full(), seed=2, time_budget=None)
+        three_way = range_equity(
+            ["A♠", "A♥"], [Range.full(), Range.full()], seed=2, time_budget=None
+        )
+        assert heads_up.equity == pytest.approx(0.852, abs=0.015)
+        assert three_way.equity == pytest.approx(0.735, abs=0.015)
+
+    def test_overlapping_villain_ranges(self):
+        """相手同士で同じカードしか持てない場合は ValueError"""
+        with pytest.raises(ValueError):
+            range_equity(["2♠", "3♠"], ["AsAh", "AsAh"])
+
+    def test_time_budget(self):
+        """time_budget で Monte Carlo を打ち切る"""
+        result = range_equity(
+            ["A♠", "K♠"],
+            [parse_range("22+, A2s+, KTo+"), Range.full()],
+            board=["2♥", "7♦", "K♣"],
+            target_std_error=None,
+            time_budget=0.01,
+            seed=3,
+        )
+        assert not result.exact
+        assert 1000 <= result.samples < 200_000
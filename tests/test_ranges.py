@@ -0,0 +1,106 @@
+"""
+Tests for poker.ranges module
+"""
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from poker.game_models import Card
+from poker.ranges import NUM_COMBOS, Range, combo_index, parse_range
+
+
+class TestParseRange:
+    """レンジ表記のパーステスト"""
+
+    @pytest.mark.parametrize(
+        "text, expected",
+        [
+            ("TT+", ["AA", "KK", "QQ", "JJ", "TT"]),
+            ("AJs+", ["AKs", "AQs", "AJs"]),
+            ("KQo", ["KQo"]),
+            ("AK", ["AKs", "AKo"]),
+            ("22-44", ["44", "33", "22"]),
+            ("A2s-A4s", ["A4s", "A3s", "A2s"]),
+            ("76s-54s", ["76s", "65s", "54s"]),
+            ("KA", ["AKs", "AKo"]),
+        ],
+    )
+    def test_notation(self, text, expected):
+        """各表記が正しいハンドクラスに展開される"""
+        assert sorted(parse_range(text).hand_classes()) == sorted(expected)
+
+    def test_combo_counts(self):
+        """ペア6通り、スーテッド4通り、オフスート12通り"""
+        assert parse_range("AA").num_combos == 6
+        assert parse_range("AKs").num_combos == 4
+        assert parse_range("AKo").num_combos == 12
+        assert parse_range("TT+, AJs+, KQo, 76s-54s").num_combos == 30 + 12 + 12 + 12
+
+    def test_specific_combo_and_weight(self):
+        """特定の組み合わせと重み付き表記"""
+        rng = parse_range("AsKd, QQ:0.5")
+        assert len(rng) == 7
+        assert rng.num_combos == pytest.approx(1 + 3)
+        assert rng.weight(["A♠", "K♦"]) == 1.0
+        assert rng.weight("QQ") == 0.5
+
+    @pytest.mark.parametrize("text", ["AX", "AAs", "AKs-T8s", "AKs-76o", "AKs:1.5", "AsKd+"])
+    def test_invalid(self, text):
+        """不正な表記は ValueError"""
+        with pytest.raises(ValueError):
+            parse_range(text)
+
+
+class TestRange:
+    """Range のテスト"""
+
+    def test_membership(self):
+        """ホールカード / 組み合わせ文字列 / ハンドクラスで判定できる"""
+        rng = parse_range("AKs, 99")
+        assert [Card.from_str("K♥"), Card.from_str("A♥")] in rng
+        assert ["9♠", "9♦"] in rng
+        assert "AsKs" in rng
+        assert "AKs" in rng
+        assert "AKo" not in rng
+        assert ["A♠", "K♦"] not in rng
+
+    def test_invalid_membership_is_false(self):
+        """不正な入力は set と同じく False"""
+        rng = Range.full()
+        assert None not in rng
+        assert ["A♠", "A♠"] not in rng
+        assert ["A♠", "X♠"] not in rng
+        assert "ZZ" not in rng
+
+    def test_set_operations(self):
+        """和・積・差"""
+        a, b = parse_range("TT+"), parse_range("88-JJ")
+        assert sorted((a | b).hand_classes()) == sorted(parse_range("88+").hand_classes())
+        assert sorted((a & b).hand_classes()) == ["JJ", "TT"]
+        assert sorted((a - b).hand_classes()) == ["AA", "KK", "QQ"]
+
+    def test_remove_dead(self):
+        """デッドカードを含む組み合わせを除く"""
+        rng = parse_range("AA, AKs").remove_dead(["A♠", "K♥"])
+        assert rng.num_combos == 3 + 2
+        assert ["A♠", "A♥"] not in rng
+        assert ["A♥", "A♦"] in rng
+
+    def test_full_range(self):
+        """ランダムハンドは1326通り"""
+        assert Range.full().num_combos == NUM_COMBOS
+        assert len(Range.full().remove_dead(["2♣", "3♣"])) == 1326 - 101
+
+    def test_bitmask_roundtrip(self):
+        """ビットマスクとの相互変換"""
+        rng = parse_range("TT+, AJs+, KQo")
+        bitmask = rng.to_bitmask()
+        assert bin(bitmask).count("1") == len(rng)
+        assert bitmask >> combo_index("A♠", "A♥") & 1
+        assert Range.from_bitmask(bitmask) == rng
+
+    def test_from_hands_and_combos(self):
+        """ハンドクラスや組み合わせの集合から作成"""
+        assert Range.from_hands({"AA", "KQo"}) == parse_range("AA, KQo")
+        assert Range.from_combos([("A♠", "K♦")]) == parse_range("AsKd")
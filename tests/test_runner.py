@@ -0,0 +1,64 @@
+"""
+Tests for poker.runner module
+"""
+
+import json
+
+import pytest
+
+from poker.runner import parse_seats, run_tables, table_seeds
+
+
+class TestParseSeats:
+    """座席指定のパースのテスト"""
+
+    def test_mixed_seats(self):
+        configs = parse_seats("team1_agent:2,random:2")
+        assert [c["type"] for c in configs] == ["llm_api", "llm_api", "random", "random"]
+        assert configs[0]["agent_id"] == "team1_agent"
+        assert configs[1]["user_id"] == "player_1"
+
+    def test_count_defaults_to_one(self):
+        assert len(parse_seats("random,random")) == 2
+
+    @pytest.mark.parametrize("spec", ["random:1", "random:11", "random:x", "random:0"])
+    def test_invalid(self, spec):
+        with pytest.raises(ValueError):
+            parse_seats(spec)
+
+
+class TestRunTables:
+    """複数テーブル実行のテスト"""
+
+    def test_table_seeds_are_deterministic(self):
+        assert table_seeds(7, 4) == table_seeds(7, 4)
+        assert len(set(table_seeds(7, 4))) == 4
+
+    def test_headless_in_process(self):
+        streamed = []
+        summary = run_tables(
+            tables=3, hands=100, processes=1, seed=1, headless=True, on_result=streamed.append
+        )
+        assert summary["hands"] == 100
+        assert [t["hands"] for t in summary["tables"]] == [34, 33, 33]
+        assert len(streamed) == 3
+        # 各テーブルのチップ収支はゼロサム
+        for table in summary["tables"]:
+            assert sum(seat["chip_delta"] for seat in table["seats"]) == 0
+        assert summary["agents"]["random"]["seats"] == 12
+        assert summary["out_dir"] is None
+
+    def test_same_seed_same_result(self):
+        first = run_tables(tables=2, hands=60, processes=1, seed=3, headless=True)
+        second = run_tables(tables=2, hands=60, processes=1, seed=3, headless=True)
+        assert [t["seats"] for t in first["tables"]] == [t["seats"] for t in second["tables"]]
+
+    def test_process_pool_writes_shards(self, tmp_path):
+        summary = run_tables(tables=2, hands=20, processes=2, seed=5, out_dir=str(tmp_path))
+        assert summary["processes"] == 2
+        for index in range(2):
+            assert (tmp_path / f"table_{index:03d}.sqlite3").exists()
+            assert (tmp_path / f"table_{index:03d}.log").stat().st_size > 0
+        saved = json.loads((tmp_path / "summary.json").read_text(encoding="utf-8"))
+        assert saved["hands"] == 20
+        assert [t["table"] for t in saved["tables"]] == [0, 1]
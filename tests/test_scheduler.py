@@ -0,0 +1,114 @@
+"""
+Tests for poker.scheduler module
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from poker.player_models import LLMApiPlayer, RandomPlayer
+from poker.scheduler import AgentLimiter, parse_caps, run_scheduled_tables
+
+
+@pytest.fixture
+def slow_agents(monkeypatch):
+    """LLMApiPlayer の応答を、時間のかかる決定的な応答に置き換える"""
+    calls = {"count": 0, "in_flight": {}, "peak": {}}
+
+    async def decide(self, game_state):
+        calls["count"] += 1
+        in_flight = calls["in_flight"]
+        in_flight[self.app_name] = in_flight.get(self.app_name, 0) + 1
+        calls["peak"][self.app_name] = max(
+            calls["peak"].get(self.app_name, 0), in_flight[self.app_name]
+        )
+        try:
+            await asyncio.sleep(0.01)
+        finally:
+            in_flight[self.app_name] -= 1
+        return {"action": "check" if "check" in game_state.actions else "call", "amount": 0}
+
+    monkeypatch.setattr(LLMApiPlayer, "decide", decide)
+    return calls
+
+
+class TestAgentLimiter:
+    """AgentLimiter のテスト"""
+
+    def test_caps_each_agent(self):
+        limiter = AgentLimiter(3, {"team2_agent": 1})
+        players = [LLMApiPlayer(i, f"P{i}", "team1_agent", f"u{i}") for i in range(6)]
+        players += [LLMApiPlayer(6 + i, f"Q{i}", "team2_agent", f"v{i}") for i in range(4)]
+        players += [RandomPlayer(10 + i, f"CPU{i}", 1000) for i in range(5)]
+
+        async def request(player):
+            async with limiter.slot(player):
+                await asyncio.sleep(0.01)
+
+        async def run_all():
+            await asyncio.gather(*(request(player) for player in players))
+
+        asyncio.run(run_all())
+        assert limiter.peak == {"team1_agent": 3, "team2_agent": 1}
+        assert limiter.in_flight == {"team1_agent": 0, "team2_agent": 0}
+
+    def test_parse_caps(self):
+        assert parse_caps("team1_agent:4, team2_agent:2") == {"team1_agent": 4, "team2_agent": 2}
+        assert parse_caps(None) == {}
+        with pytest.raises(ValueError):
+            parse_caps("team1_agent:many")
+        with pytest.raises(ValueError):
+            AgentLimiter(0)
+
+
+class TestScheduler:
+    """run_tables_async のテスト"""
+
+    def test_tables_overlap_agent_waits(self, slow_agents):
+        start = time.perf_counter()
+        summary = run_scheduled_tables(
+            seats="team1_agent:2,team2_agent:2",
+            tables=20,
+            hands_per_table=3,
+            headless=True,
+            max_concurrency=4,
+        )
+        elapsed = time.perf_counter() - start
+        assert [table["hands"] for table in summary["tables"]] == [3] * 20
+        assert summary["hands"] == 60
+        # 上限を超えず、上限いっぱいまで重なっている
+        assert summary["peak_in_flight"] == {"team1_agent": 4, "team2_agent": 4}
+        assert slow_agents["peak"] == summary["peak_in_flight"]
+        # 全リクエストを直列に待つ時間より十分短い
+        assert elapsed < slow_agents["count"] * 0.01 / 3
+
+    def test_each_table_keeps_its_own_order(self, slow_agents):
+        results = [
+            run_scheduled_tables(
+                seats="team1_agent:3",
+                tables=5,
+                hands_per_table=4,
+                seed=9,
+                headless=True,
+                max_concurrency=cap,
+            )
+            for cap in (1, 8)
+        ]
+        serial, concurrent = (
+            [[seat["chip_delta"] for seat in table["seats"]] for table in result["tables"]]
+            for result in results
+        )
+        assert serial == concurrent
+
+    def test_writes_shards_and_summary(self, slow_agents, tmp_path):
+        summary = run_scheduled_tables(
+            seats="team1_agent:1,random:1",
+            tables=2,
+            hands_per_table=2,
+            out_dir=str(tmp_path),
+        )
+        assert (tmp_path / "summary.json").exists()
+        for table in summary["tables"]:
+            assert table["db_path"].endswith(f"table_{table['table']:03d}.sqlite3")
+            assert (tmp_path / f"table_{table['table']:03d}.log").exists()
@@ -0,0 +1,84 @@
+"""
+Tests for poker.seat_ring module
+"""
+
+import random
+
+from poker.game import PokerGame
+from poker.player_models import PlayerStatus, RandomPlayer
+from poker.seat_ring import SeatRing
+
+
+def make_players(count):
+    return [RandomPlayer(i, f"CPU{i}", 1000) for i in range(count)]
+
+
+class TestSeatRing:
+    """SeatRing のテスト"""
+
+    def test_status_changes_update_masks(self):
+        players = make_players(4)
+        ring = SeatRing(players)
+        assert ring.count(PlayerStatus.ACTIVE) == 4
+        players[1].fold()
+        players[2].bet(5000)
+        assert ring.seats(ring.mask(PlayerStatus.ACTIVE)) == [0, 3]
+        assert ring.has(1, PlayerStatus.FOLDED) and ring.has(2, PlayerStatus.ALL_IN)
+        assert ring.count(PlayerStatus.ACTIVE, PlayerStatus.ALL_IN) == 3
+        players[2].chips = 0
+        players[2].reset_for_new_hand()
+        players[1].reset_for_new_hand()
+        assert ring.seats(ring.mask(PlayerStatus.BUSTED)) == [2]
+        assert ring.count(PlayerStatus.ACTIVE) == 3
+
+    def test_next_seat_wraps_around(self):
+        mask = 0b1001010  # 座席 1, 3, 6
+        assert SeatRing.next_seat(mask, 1) == 3
+        assert SeatRing.next_seat(mask, 6) == 1
+        assert SeatRing.next_seat(mask, 4) == 6
+        assert SeatRing.next_seat(0b100, 2) is None
+        assert SeatRing.next_seat(0b100, 2, include_self=True) == 2
+        assert SeatRing.next_seat(0, 0, include_self=True) is None
+        assert SeatRing.first_seat(mask) == 1
+
+    def test_matches_player_statuses_during_play(self):
+        random.seed(7)
+        game = PokerGame(headless=True, seed=7)
+        game.setup_configurable_game(["random"] * 6)
+        for _ in range(40):
+            if game.is_game_over():
+                break
+            game.play_hand()
+            seats = game.seats
+            for status in PlayerStatus:
+                expected = [i for i, p in enumerate(game.players) if p.status == status]
+                assert seats.seats(seats.mask(status)) == expected
+            assert game.players[seats.big_blind].is_big_blind
+
+    def test_rebuilt_when_players_change(self):
+        game = PokerGame(headless=True, seed=1)
+        game.setup_configurable_game(["random"] * 3)
+        assert game.seats.size == 3
+        game.setup_configurable_game(["random"] * 5)
+        assert game.seats.size == 5
+        game.players[4].fold()
+        assert game.seats.count(PlayerStatus.ACTIVE) == 4
+
+    def test_rebuilt_when_players_are_replaced_with_the_same_count(self):
+        game = PokerGame(headless=True, seed=2)
+        game.setup_configurable_game(["random"] * 3)
+        game.start_new_hand()
+        old_ring = game.seats
+        players = make_players(3)
+        players[2].chips = 0
+        game.players = players
+        game.start_new_hand()
+        # 新しいプレイヤーのリングで、チップのない座席は配られない
+        assert game.seats is not old_ring
+        assert game.seats.count(PlayerStatus.BUSTED) == 1
+        assert players[2].status == PlayerStatus.BUSTED and not players[2].hole_cards
+        # setup_* をやり直した場合も同じ
+        game.setup_configurable_game(["random"] * 3)
+        ring = game.seats
+        assert all(player._seat_ring is ring for player in game.players)
+        assert ring.count(PlayerStatus.BUSTED) == 0
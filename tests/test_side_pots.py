@@ -272,3 +272,48 @@ def test_side_pot_tie_split_remainder_by_id():
     assert pid_to_win.get(2, 0) == 0
     assert pid_to_win.get(3, 0) == 0
     assert game.pot == 0
+
+
+def test_uncalled_bet_of_folded_player_is_returned():
+    """A layer only a folded player contributed to is returned, not lost.
+
+    Scenario (found by the headless turbo mode):
+    - P0, P1 all-in for 100
+    - P2 calls 100, then bets 60 more with nobody left to call, and folds
+    Expected:
+      main pot 300 goes to the best of P0/P1
+      P2's uncalled 60 goes back to P2
+    """
+
+    game = PokerGame(headless=True)
+    p0 = RandomPlayer(0, "P0", 0)
+    p1 = RandomPlayer(1, "P1", 0)
+    p2 = RandomPlayer(2, "P2", 0)
+    for p in (p0, p1, p2):
+        game.add_player(p)
+
+    game.community_cards = [
+        Card(14, Suit.CLUBS),
+        Card(13, Suit.DIAMONDS),
+        Card(12, Suit.HEARTS),
+        Card(2, Suit.SPADES),
+        Card(3, Suit.SPADES),
+    ]
+    p0.hole_cards = [Card(14, Suit.DIAMONDS), Card(14, Suit.HEARTS)]  # Trips A
+    p1.hole_cards = [Card(9, Suit.CLUBS), Card(9, Suit.DIAMONDS)]  # Pair 9
+    p2.hole_cards = [Card(8, Suit.CLUBS), Card(7, Suit.DIAMONDS)]
+
+    p0.status = p1.status = PlayerStatus.ALL_IN
+    p2.status = PlayerStatus.FOLDED
+    p0.total_bet_this_hand = p1.total_bet_this_hand = 100
+    p2.total_bet_this_hand = 160
+    game.pot = 360
+
+    game.current_phase = GamePhase.SHOWDOWN
+    results = game.conduct_showdown()
+
+    pid_to_win = {r["player_id"]: r["winnings"] for r in results["results"]}
+    assert pid_to_win == {0: 300}
+    assert p0.chips == 300
+    assert p2.chips == 60
+    assert game.pot == 0
@@ -0,0 +1,138 @@
+"""
+Tests for poker.table_state module
+"""
+
+import random
+
+import pytest
+
+from poker.game import GamePhase, PokerGame
+from poker.player_models import PlayerStatus
+from poker.table_state import (
+    legal_actions,
+    payouts,
+    settle_showdown,
+    shuffle_deck,
+    step,
+)
+
+
+def make_game(seed, players=4):
+    random.seed(seed)
+    game = PokerGame(headless=True, seed=seed)
+    game.setup_configurable_game(["random"] * players)
+    # step() と同じく残りのデッキの末尾から配るようにして比較できるようにする
+    game.deck.deal_card = game.deck.cards.pop
+    return game
+
+
+def settle_game(game):
+    """PokerGame を step() と同じく次の意思決定かショーダウンまで進める"""
+    while game.current_phase not in (GamePhase.SHOWDOWN, GamePhase.FINISHED):
+        if game.betting_round_complete:
+            game.advance_to_next_phase()
+        elif game.players[game.current_player_index].status != PlayerStatus.ACTIVE:
+            game._advance_to_next_player()
+        else:
+            return
+
+
+def available_names(game, player_id):
+    return tuple(
+        action.split(" ")[0].replace("all-in", "all_in")
+        for action in game._get_available_actions(player_id)
+    )
+
+
+class TestStepMatchesGame:
+    """step() が PokerGame と同じ局面に進むことを確認（差分テスト）"""
+
+    @pytest.mark.parametrize("players", [2, 3, 6])
+    def test_random_hands(self, players):
+        for seed in range(40):
+            game = make_game(seed, players)
+            for _ in range(5):
+                if game.is_game_over():
+                    break
+                game.start_new_hand()
+                settle_game(game)
+                state = game.export_state()
+                while not state.is_terminal:
+                    player = game.players[state.current_player]
+                    assert legal_actions(state) == available_names(game, player.id)
+                    decision = player.make_decision(game.get_llm_game_state(player.id))
+                    action, amount = decision["action"], decision.get("amount", 0)
+                    if not game.process_player_action(player.id, action, amount):
+                        with pytest.raises(ValueError):
+                            step(state, action, amount)
+                        action, amount = "fold", 0
+                        game.process_player_action(player.id, action, amount)
+                    settle_game(game)
+                    state = step(state, action, amount)
+                    assert state == game.export_state()
+
+                expected = settle_showdown(state)
+                game.conduct_showdown()
+                assert expected.chips == tuple(p.chips for p in game.players)
+
+
+class TestTableState:
+    """TableState のテスト"""
+
+    def test_step_does_not_modify_state_or_game(self):
+        game = make_game(1)
+        game.start_new_hand()
+        state = game.export_state()
+        before = (game.pot, [p.chips for p in game.players], list(game.action_history))
+        child = step(state, "call")
+        assert child is not state
+        assert state == game.export_state()
+        assert before == (game.pot, [p.chips for p in game.players], game.action_history)
+        with pytest.raises(Exception):
+            state.pot = 0
+
+    def test_branching_from_the_same_state(self):
+        game = make_game(2)
+        game.start_new_hand()
+        state = game.export_state()
+        folded = step(state, "fold")
+        raised = step(state, "raise", 40)
+        assert folded.statuses[state.current_player] == PlayerStatus.FOLDED
+        assert raised.current_bet == state.current_bet + 40
+        assert raised.pot == state.pot + state.to_call(state.current_player) + 40
+
+    def test_invalid_action(self):
+        game = make_game(3)
+        game.start_new_hand()
+        state = game.export_state()
+        with pytest.raises(ValueError):
+            step(state, "check")
+        with pytest.raises(ValueError):
+            step(state, "bet")
+
+    def test_import_restores_game(self):
+        game = make_game(4)
+        game.start_new_hand()
+        state = game.export_state()
+        while not game.betting_round_complete:
+            player_id = game.current_player_index
+            game.process_player_action(player_id, "call")
+        assert game.export_state() != state
+        game.import_state(state)
+        assert game.export_state() == state
+
+    def test_rollout_to_showdown(self):
+        game = make_game(5, players=3)
+        game.start_new_hand()
+        state = game.export_state()
+        rng = random.Random(0)
+        total = sum(state.chips) + state.pot
+        for _ in range(50):
+            node = shuffle_deck(state, rng)
+            while not node.is_terminal:
+                actions = legal_actions(node)
+                node = step(node, "call" if "call" in actions else "check")
+            assert len(node.community) == 5
+            final = settle_showdown(node)
+            assert sum(final.chips) + final.pot == total
+            assert sum(payouts(node)) == node.pot